@@ -22,6 +22,8 @@ from app.features.chat.routers.websocket_router import router as chat_websocket_
 from app.features.follow.routers.follow_router import router as follow_router
 # Locations router
 from app.features.locations.routers.location_router import router as locations_router
+# Uploads router
+from app.features.uploads.routers.upload_router import router as uploads_router
 # Notifications router
 from app.features.notifications.routers.notification_router import (
     router as notifications_router,
@@ -121,6 +123,9 @@ for router in chain.from_iterable([
     # 신고 관련 라우터 (features/reports)
     [reports_router],
 
+    # 직접 업로드 관련 라우터 (features/uploads)
+    [uploads_router],
+
     # 채팅 라우터 (chat)
     [chat_router, chat_websocket_router],
 
@@ -65,17 +65,58 @@ class AppConfig(BaseSettings):
     debug: bool
 
 
+class DataBasePoolConfig(BaseSettings):
+    """커넥션 풀 설정 (워크로드별)"""
+
+    pool_size: int = 10  # 유지하는 기본 연결 수
+    max_overflow: int = 10  # pool_size를 넘어 추가로 열 수 있는 연결 수
+    pool_recycle: int = 1800  # 연결 재사용 최대 시간 (초, MySQL wait_timeout보다 짧게)
+    pool_pre_ping: bool = True  # 체크아웃 시 연결 상태 확인
+    pool_timeout: float = 10.0  # 풀에서 연결을 기다리는 최대 시간 (초)
+
+
+class DataBasePoolsConfig(BaseSettings):
+    """워크로드별 커넥션 풀 (서로의 연결을 빼앗지 않도록 엔진을 분리)"""
+
+    interactive: DataBasePoolConfig = DataBasePoolConfig()  # HTTP API 요청
+    websocket: DataBasePoolConfig = DataBasePoolConfig(
+        pool_size=5, max_overflow=5, pool_timeout=5.0
+    )  # WebSocket 메시지 처리
+    batch: DataBasePoolConfig = DataBasePoolConfig(
+        pool_size=3, max_overflow=2, pool_timeout=30.0
+    )  # 스케줄러 작업
+
+
+class DataBaseReplicaConfig(BaseSettings):
+    """읽기 전용 복제본 설정 (host가 없으면 모든 조회를 primary에서 처리)"""
+
+    host: str | None = None
+    port: int = 3306
+    max_lag_seconds: float = 2.0  # 이보다 지연되면 primary로 우회
+    lag_check_interval: float = 5.0  # 복제 지연 확인 주기 (초)
+    sticky_seconds: float = 5.0  # 사용자가 쓰기 후 primary에서 읽는 시간 (초)
+    pool: DataBasePoolConfig = DataBasePoolConfig()
+
+
 class DataBaseConfig(BaseSettings):
     host: str
     port: int
     name: str
     user: str
     password: str = os.getenv("MYSQL_PASSWORD")
+    pools: DataBasePoolsConfig = DataBasePoolsConfig()
+    replica: DataBaseReplicaConfig = DataBaseReplicaConfig()
 
     def get_url(self):
         encoded_password = urllib.parse.quote(self.password, safe="")
         return f"mysql+aiomysql://{self.user}:{encoded_password}@{self.host}:{self.port}/{self.name}"
 
+    def get_replica_url(self) -> str | None:
+        if not self.replica.host:
+            return None
+        encoded_password = urllib.parse.quote(self.password, safe="")
+        return f"mysql+aiomysql://{self.user}:{encoded_password}@{self.replica.host}:{self.replica.port}/{self.name}"
+
 
 class JwtConfig(BaseSettings):
     secret_key: str = os.getenv("SECRET_KEY")  # Infisical에서 주입
@@ -87,11 +128,29 @@ class RedisConfig(BaseSettings):
     host: str
     port: int
     db: int
+    max_connections: int = 50  # 요청/응답용 풀 크기
+    pool_timeout: float = 2.0  # 풀에서 연결을 기다리는 최대 시간 (초)
+    socket_timeout: float = 5.0  # 명령 응답 대기 (초)
+    socket_connect_timeout: float = 2.0
+    health_check_interval: int = 30  # 유휴 연결 재사용 전 PING 주기 (초)
+    pubsub_max_connections: int = 10  # pub/sub 구독 전용 풀 크기
 
     def get_url(self):
         return f"redis://{self.host}:{self.port}/{self.db}"
 
 
+class HttpClientConfig(BaseSettings):
+    """외부 API(OAuth 등) 호출용 공용 HTTP 클라이언트 설정"""
+
+    timeout: float = 10.0  # 읽기/쓰기/풀 대기 타임아웃 (초)
+    connect_timeout: float = 5.0
+    max_connections: int = 50  # 전체 동시 연결 상한
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    retries: int = 2  # 연결 실패 시 재시도 횟수 (요청 전송 전 오류만)
+    http2: bool = True  # h2 패키지가 설치된 경우에만 사용
+
+
 class LoggingConfig(BaseSettings):
     level: str
     console: bool
@@ -100,6 +159,84 @@ class LoggingConfig(BaseSettings):
     max_file_size: str
 
 
+class RequestLoggingConfig(BaseSettings):
+    """API 요청 로깅 미들웨어 설정"""
+
+    body_max_bytes: int = 4096  # 요청 본문은 앞부분만 기록
+    body_content_types: list[str] = [
+        "application/json",
+        "application/x-www-form-urlencoded",
+        "text/plain",
+    ]  # 이외(multipart 이미지 업로드 등)는 본문을 기록하지 않음
+    success_sample_rate: float = 1.0  # 성공(2xx/3xx) 요청 기록 비율 (0~1)
+    slow_request_seconds: float = 1.0  # 이보다 느린 요청은 샘플링과 무관하게 기록
+    redact_headers: list[str] = [
+        "authorization",
+        "cookie",
+        "set-cookie",
+        "x-refresh-token",
+    ]
+    skip_paths: list[str] = ["/metrics", "/api/v1/health", "/api/v1/ping"]
+
+
+class UploadConfig(BaseSettings):
+    """파일 업로드 설정"""
+
+    max_bytes: int = 10 * 1024 * 1024  # 업로드 파일 크기 상한 (10MB)
+    # multipart 요청 본문 전체 상한 (여러 장 업로드 포함, 본문을 받기 전에 Content-Length로 거절)
+    max_request_bytes: int = 50 * 1024 * 1024
+    chunk_size: int = 1024 * 1024  # 한 번에 읽는 크기 (요청당 메모리 사용량 상한)
+    # 참조되지 않는 저장소 파일도 이 시간 안에 쓰였거나 재사용됐으면 삭제하지 않음
+    orphan_grace_seconds: int = 24 * 60 * 60
+    # 업로드 파일 서빙 방식 (로컬 저장소)
+    # - app: 앱이 StaticFiles로 서빙 (로컬 개발)
+    # - nginx: nginx가 UPLOADS_DIR을 직접 서빙, 앱은 마운트하지 않음
+    #   (scripts/generate_nginx_uploads_conf.py로 location 설정 생성)
+    serve_mode: str = "app"
+    mutable_max_age: int = 60 * 60  # 내용 주소(cas/)가 아닌 파일의 캐시 시간
+
+
+class StorageS3Config(BaseSettings):
+    """S3 호환 오브젝트 스토리지 설정 (AWS S3, MinIO 등)"""
+
+    endpoint_url: str  # 예: https://s3.ap-northeast-2.amazonaws.com, http://minio:9000
+    bucket: str
+    region: str = "us-east-1"
+    access_key: str | None = os.getenv("S3_ACCESS_KEY")  # Infisical에서 주입
+    secret_key: str | None = os.getenv("S3_SECRET_KEY")  # Infisical에서 주입
+    public_base_url: str | None = None  # CDN 주소 (없으면 {endpoint_url}/{bucket})
+    timeout: float = 30.0
+
+
+class StorageConfig(BaseSettings):
+    """업로드 파일 저장소 설정"""
+
+    backend: str = "local"  # local / s3
+    presign_expires_seconds: int = 15 * 60  # 직접 업로드 URL 유효 시간
+    s3: StorageS3Config | None = None
+
+
+class ImageRenditionConfig(BaseSettings):
+    """이미지 렌디션 (긴 변 기준으로 비율을 유지하며 축소)"""
+
+    max_width: int
+    max_height: int
+    quality: int = 85
+
+
+class ImageConfig(BaseSettings):
+    """이미지 처리 파이프라인 설정"""
+
+    process_workers: int = 2  # 디코딩/인코딩용 프로세스 풀 크기
+    formats: list[str] = ["jpeg", "webp"]  # 렌디션마다 생성할 포맷 (jpeg 필수)
+    # thumbnail 렌디션은 파티 썸네일(thumbnail_url)로 사용하므로 필수
+    renditions: dict[str, ImageRenditionConfig] = {
+        "thumbnail": ImageRenditionConfig(max_width=300, max_height=300, quality=85),
+        "feed": ImageRenditionConfig(max_width=720, max_height=720, quality=82),
+        "full": ImageRenditionConfig(max_width=1920, max_height=1920, quality=85),
+    }
+
+
 class ChatConfig(BaseSettings):
     use_websocket: bool
 
@@ -117,6 +254,11 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     database: DataBaseConfig | None = None  # MySQL 데이터베이스 설정
     redis: RedisConfig | None = None  # MARK: - Redis
+    http_client: HttpClientConfig = HttpClientConfig()  # MARK: - HTTP Client
+    request_logging: RequestLoggingConfig = RequestLoggingConfig()
+    upload: UploadConfig = UploadConfig()  # MARK: - Upload
+    storage: StorageConfig = StorageConfig()  # MARK: - Storage
+    image: ImageConfig = ImageConfig()  # MARK: - Image Pipeline
     jwt: JwtConfig | None = None  # MARK: - JWT
     app: AppConfig | None = None  # MARK: - App, Server
     logging: LoggingConfig | None = None
@@ -25,6 +25,7 @@ from app.core.containers.application_container import (
     ReportFeatureContainer,
     SessionFeatureContainer,
     TendencyFeatureContainer,
+    UploadFeatureContainer,
     UserFeatureContainer,
     container,
 )
@@ -42,6 +43,7 @@ __all__ = [
     "SessionFeatureContainer",
     "LocationFeatureContainer",
     "FollowFeatureContainer",
+    "UploadFeatureContainer",
     # Feature Containers (Level 2)
     "NotificationFeatureContainer",
     "PodFeatureContainer",
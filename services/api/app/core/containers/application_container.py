@@ -1,7 +1,7 @@
 """Application Container - 모든 Feature Container 조립
 
 레벨 구조:
-- Level 1: Core만 의존 (Tendency, Artist, Session, Location, Follow)
+- Level 1: Core만 의존 (Tendency, Artist, Session, Location, Follow, Upload)
 - Level 2: Core + Level1 의존 (Notification, Pod, Chat)
 - Level 3: 여러 Feature 의존 (User)
 - Level 4: User 의존 (Auth, Report) - user 관련 provider를 직접 주입받음
@@ -17,9 +17,11 @@ from app.features.auth.use_cases.session_use_case import SessionUseCase
 from dependency_injector import containers, providers
 
 from app.core.containers.core_container import CoreContainer
+from app.core.containers.request_scope import scoped
 from app.features.artists.repositories.artist_repository import ArtistRepository
 from app.features.artists.use_cases.artist_schedule_use_cases import (
     GetScheduleByIdUseCase,
+    GetScheduleMonthsUseCase,
     GetSchedulesUseCase,
 )
 from app.features.artists.use_cases.artist_suggestion_use_cases import (
@@ -53,6 +55,7 @@ from app.features.follow.services.follow_notification_service import (
 )
 from app.features.follow.use_cases.follow_use_case import FollowUseCase
 from app.features.locations.repositories.location_repository import LocationRepository
+from app.features.locations.services.pod_location_service import PodLocationService
 from app.features.locations.use_cases.location_use_case import LocationUseCase
 from app.features.notifications.repositories.notification_repository import (
     NotificationRepository,
@@ -87,12 +90,16 @@ from app.features.pods.use_cases.like_use_case import LikeUseCase
 from app.features.pods.use_cases.pod_query_use_case import PodQueryUseCase
 from app.features.pods.use_cases.pod_use_case import PodUseCase
 from app.features.pods.use_cases.review_use_case import ReviewUseCase
+from app.features.reminders.services.reminder_queue_service import (
+    ReminderQueueService,
+)
 from app.features.reports.use_cases.report_use_case import ReportUseCase
 from app.features.tendencies.repositories.tendency_repository import TendencyRepository
 from app.features.tendencies.services.tendency_calculation_service import (
     TendencyCalculationService,
 )
 from app.features.tendencies.use_cases.tendency_use_case import TendencyUseCase
+from app.features.uploads.use_cases.upload_use_case import UploadUseCase
 from app.features.users.repositories import (
     BlockUserRepository,
     UserNotificationRepository,
@@ -116,8 +123,8 @@ class TendencyFeatureContainer(containers.DeclarativeContainer):
 
     core: CoreContainer = providers.DependenciesContainer()
 
-    tendency_repo = providers.Factory(TendencyRepository, session=core.session)
-    calculation_service = providers.Factory(TendencyCalculationService)
+    tendency_repo = providers.Callable(scoped, TendencyRepository, session=core.session)
+    calculation_service = providers.Singleton(TendencyCalculationService)
     tendency_use_case = providers.Factory(
         TendencyUseCase,
         session=core.session,
@@ -131,7 +138,7 @@ class ArtistFeatureContainer(containers.DeclarativeContainer):
 
     core: CoreContainer = providers.DependenciesContainer()
 
-    artist_repo = providers.Factory(ArtistRepository, session=core.session)
+    artist_repo = providers.Callable(scoped, ArtistRepository, session=core.session)
 
     # UseCase들
     get_artist_use_case = providers.Factory(GetArtistUseCase, session=core.session)
@@ -140,6 +147,9 @@ class ArtistFeatureContainer(containers.DeclarativeContainer):
         GetScheduleByIdUseCase, session=core.session
     )
     get_schedules_use_case = providers.Factory(GetSchedulesUseCase, session=core.session)
+    get_schedule_months_use_case = providers.Factory(
+        GetScheduleMonthsUseCase, session=core.session
+    )
     create_artist_suggestion_use_case = providers.Factory(
         CreateArtistSuggestionUseCase, session=core.session
     )
@@ -162,7 +172,7 @@ class SessionFeatureContainer(containers.DeclarativeContainer):
 
     core: CoreContainer = providers.DependenciesContainer()
 
-    session_repo = providers.Factory(SessionRepository, session=core.session)
+    session_repo = providers.Callable(scoped, SessionRepository, session=core.session)
     session_use_case = providers.Factory(
         SessionUseCase,
         session=core.session,
@@ -175,7 +185,7 @@ class LocationFeatureContainer(containers.DeclarativeContainer):
 
     core: CoreContainer = providers.DependenciesContainer()
 
-    location_repo = providers.Factory(LocationRepository, session=core.session)
+    location_repo = providers.Callable(scoped, LocationRepository, session=core.session)
     location_use_case = providers.Factory(
         LocationUseCase,
         session=core.session,
@@ -183,23 +193,37 @@ class LocationFeatureContainer(containers.DeclarativeContainer):
     )
 
 
+class UploadFeatureContainer(containers.DeclarativeContainer):
+    """업로드 Feature 컨테이너"""
+
+    core: CoreContainer = providers.DependenciesContainer()
+
+    upload_use_case = providers.Factory(UploadUseCase, storage=core.storage)
+
+
 class FollowFeatureContainer(containers.DeclarativeContainer):
     """팔로우 Feature 컨테이너"""
 
     core: CoreContainer = providers.DependenciesContainer()
 
     # Repositories
-    follow_repo = providers.Factory(FollowRepository, session=core.session)
-    follow_list_repo = providers.Factory(FollowListRepository, session=core.session)
-    follow_stats_repo = providers.Factory(FollowStatsRepository, session=core.session)
-    follow_notification_repo = providers.Factory(
-        FollowNotificationRepository, session=core.session
-    )
-    follow_pod_repo = providers.Factory(FollowPodRepository, session=core.session)
-    pod_repo = providers.Factory(PodRepository, session=core.session)
-    like_repo = providers.Factory(PodLikeRepository, session=core.session)
-    review_repo = providers.Factory(PodReviewRepository, session=core.session)
-    user_repo = providers.Factory(UserRepository, session=core.session)
+    follow_repo = providers.Callable(scoped, FollowRepository, session=core.session)
+    follow_list_repo = providers.Callable(
+        scoped, FollowListRepository, session=core.session
+    )
+    follow_stats_repo = providers.Callable(
+        scoped, FollowStatsRepository, session=core.session
+    )
+    follow_notification_repo = providers.Callable(
+        scoped, FollowNotificationRepository, session=core.session
+    )
+    follow_pod_repo = providers.Callable(
+        scoped, FollowPodRepository, session=core.session
+    )
+    pod_repo = providers.Callable(scoped, PodRepository, session=core.session)
+    like_repo = providers.Callable(scoped, PodLikeRepository, session=core.session)
+    review_repo = providers.Callable(scoped, PodReviewRepository, session=core.session)
+    user_repo = providers.Callable(scoped, UserRepository, session=core.session)
 
     # Services
     follow_notification_service = providers.Factory(
@@ -237,7 +261,9 @@ class NotificationFeatureContainer(containers.DeclarativeContainer):
     core: CoreContainer = providers.DependenciesContainer()
     tendency_repo = providers.Dependency()  # Level 1에서 주입 (개별 provider)
 
-    notification_repo = providers.Factory(NotificationRepository, session=core.session)
+    notification_repo = providers.Callable(
+        scoped, NotificationRepository, session=core.session
+    )
     notification_dto_service = providers.Factory(
         NotificationDtoService, tendency_repo=tendency_repo
     )
@@ -257,13 +283,22 @@ class PodFeatureContainer(containers.DeclarativeContainer):
     follow_use_case = providers.Dependency()  # Level 1에서 주입 (개별 provider)
 
     # Repositories
-    pod_repo = providers.Factory(PodRepository, session=core.session)
-    application_repo = providers.Factory(ApplicationRepository, session=core.session)
-    pod_like_repo = providers.Factory(PodLikeRepository, session=core.session)
-    pod_review_repo = providers.Factory(PodReviewRepository, session=core.session)
-    user_repo = providers.Factory(UserRepository, session=core.session)
+    pod_repo = providers.Callable(scoped, PodRepository, session=core.session)
+    application_repo = providers.Callable(
+        scoped, ApplicationRepository, session=core.session
+    )
+    pod_like_repo = providers.Callable(scoped, PodLikeRepository, session=core.session)
+    pod_review_repo = providers.Callable(
+        scoped, PodReviewRepository, session=core.session
+    )
+    user_repo = providers.Callable(scoped, UserRepository, session=core.session)
+    location_repo = providers.Callable(scoped, LocationRepository, session=core.session)
 
     # Services
+    reminder_queue = providers.Factory(ReminderQueueService, redis=core.redis)
+    pod_location_service = providers.Factory(
+        PodLocationService, location_repo=location_repo
+    )
     review_dto_service = providers.Factory(
         ReviewDtoService, session=core.session, user_repo=user_repo
     )
@@ -349,6 +384,8 @@ class PodFeatureContainer(containers.DeclarativeContainer):
         enrichment_service=pod_enrichment_service,
         notification_service=pod_notification_service,
         follow_use_case=follow_use_case,
+        reminder_queue=reminder_queue,
+        pod_location_service=pod_location_service,
     )
 
 
@@ -358,12 +395,14 @@ class ChatFeatureContainer(containers.DeclarativeContainer):
     core: CoreContainer = providers.DependenciesContainer()
 
     # Repositories
-    chat_repo = providers.Factory(
-        ChatRepository, session=core.session, redis=core.redis
+    chat_repo = providers.Callable(
+        scoped, ChatRepository, session=core.session, redis=core.redis
+    )
+    chat_room_repo = providers.Callable(
+        scoped, ChatRoomRepository, session=core.session
     )
-    chat_room_repo = providers.Factory(ChatRoomRepository, session=core.session)
-    user_repo = providers.Factory(UserRepository, session=core.session)
-    pod_repo = providers.Factory(PodRepository, session=core.session)
+    user_repo = providers.Callable(scoped, UserRepository, session=core.session)
+    pod_repo = providers.Callable(scoped, PodRepository, session=core.session)
 
     # Services
     message_service = providers.Factory(
@@ -414,17 +453,25 @@ class UserFeatureContainer(containers.DeclarativeContainer):
     notification_dto_service = providers.Dependency()  # Level 2에서 주입 (개별 provider)
 
     # Repositories
-    user_repo = providers.Factory(UserRepository, session=core.session)
-    user_artist_repo = providers.Factory(UserArtistRepository, session=core.session)
-    block_user_repo = providers.Factory(BlockUserRepository, session=core.session)
-    user_notification_repo = providers.Factory(
-        UserNotificationRepository, session=core.session
-    )
-    user_report_repo = providers.Factory(UserReportRepository, session=core.session)
-    artist_repo = providers.Factory(ArtistRepository, session=core.session)
-    pod_repo = providers.Factory(PodRepository, session=core.session)
-    application_repo = providers.Factory(ApplicationRepository, session=core.session)
-    pod_like_repo = providers.Factory(PodLikeRepository, session=core.session)
+    user_repo = providers.Callable(scoped, UserRepository, session=core.session)
+    user_artist_repo = providers.Callable(
+        scoped, UserArtistRepository, session=core.session
+    )
+    block_user_repo = providers.Callable(
+        scoped, BlockUserRepository, session=core.session
+    )
+    user_notification_repo = providers.Callable(
+        scoped, UserNotificationRepository, session=core.session
+    )
+    user_report_repo = providers.Callable(
+        scoped, UserReportRepository, session=core.session
+    )
+    artist_repo = providers.Callable(scoped, ArtistRepository, session=core.session)
+    pod_repo = providers.Callable(scoped, PodRepository, session=core.session)
+    application_repo = providers.Callable(
+        scoped, ApplicationRepository, session=core.session
+    )
+    pod_like_repo = providers.Callable(scoped, PodLikeRepository, session=core.session)
 
     # Services
     user_dto_service = providers.Singleton(UserDtoService)
@@ -479,9 +526,15 @@ class AuthFeatureContainer(containers.DeclarativeContainer):
 
     # Services
     auth_service = providers.Factory(AuthService, session=core.session)
-    kakao_oauth_service = providers.Singleton(KakaoOAuthService)
-    google_oauth_service = providers.Singleton(GoogleOAuthService)
-    apple_oauth_service = providers.Singleton(AppleOAuthService)
+    kakao_oauth_service = providers.Singleton(
+        KakaoOAuthService, http_client=core.http_client
+    )
+    google_oauth_service = providers.Singleton(
+        GoogleOAuthService, http_client=core.http_client
+    )
+    apple_oauth_service = providers.Singleton(
+        AppleOAuthService, http_client=core.http_client
+    )
 
     # UseCase
     oauth_use_case = providers.Factory(
@@ -504,8 +557,12 @@ class ReportFeatureContainer(containers.DeclarativeContainer):
     follow_repo = providers.Dependency()  # FollowFeature에서 주입 (개별 provider)
 
     # Repositories
-    user_report_repo = providers.Factory(UserReportRepository, session=core.session)
-    block_user_repo = providers.Factory(BlockUserRepository, session=core.session)
+    user_report_repo = providers.Callable(
+        scoped, UserReportRepository, session=core.session
+    )
+    block_user_repo = providers.Callable(
+        scoped, BlockUserRepository, session=core.session
+    )
 
     # UseCase
     report_use_case = providers.Factory(
@@ -548,6 +605,9 @@ class ApplicationContainer(containers.DeclarativeContainer):
     follow_feature: FollowFeatureContainer = providers.Container(
         FollowFeatureContainer, core=core
     )
+    upload_feature: UploadFeatureContainer = providers.Container(
+        UploadFeatureContainer, core=core
+    )
 
     # Level 2: Core + Level 1 의존
     notification_feature: NotificationFeatureContainer = providers.Container(
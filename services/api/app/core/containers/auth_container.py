@@ -31,25 +31,41 @@ class AuthServiceContainer(containers.DeclarativeContainer):
 class KakaoOAuthServiceContainer(containers.DeclarativeContainer):
     """카카오 OAuth Service 컨테이너"""
 
-    kakao_oauth_service = providers.Singleton(KakaoOAuthService)
+    core: CoreContainer = providers.DependenciesContainer()
+
+    kakao_oauth_service = providers.Singleton(
+        KakaoOAuthService, http_client=core.http_client
+    )
 
 
 class GoogleOAuthServiceContainer(containers.DeclarativeContainer):
     """구글 OAuth Service 컨테이너"""
 
-    google_oauth_service = providers.Singleton(GoogleOAuthService)
+    core: CoreContainer = providers.DependenciesContainer()
+
+    google_oauth_service = providers.Singleton(
+        GoogleOAuthService, http_client=core.http_client
+    )
 
 
 class AppleOAuthServiceContainer(containers.DeclarativeContainer):
     """애플 OAuth Service 컨테이너"""
 
-    apple_oauth_service = providers.Singleton(AppleOAuthService)
+    core: CoreContainer = providers.DependenciesContainer()
+
+    apple_oauth_service = providers.Singleton(
+        AppleOAuthService, http_client=core.http_client
+    )
 
 
 class NaverOAuthServiceContainer(containers.DeclarativeContainer):
     """네이버 OAuth Service 컨테이너"""
 
-    naver_oauth_service = providers.Singleton(NaverOAuthService)
+    core: CoreContainer = providers.DependenciesContainer()
+
+    naver_oauth_service = providers.Singleton(
+        NaverOAuthService, http_client=core.http_client
+    )
 
 
 # MARK: - UseCase Containers
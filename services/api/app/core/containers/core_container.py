@@ -5,10 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from dependency_injector import containers, providers
-from redis.asyncio import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.containers.request_scope import current_redis, current_session
+from app.core.http_client import get_http_client
+from app.core.storage import get_storage
 from app.features.notifications.services.fcm_service import FCMService
 from app.features.users.services.random_profile_image_service import (
     RandomProfileImageService,
@@ -34,8 +35,15 @@ class CoreContainer(containers.DeclarativeContainer):
     config = providers.Configuration()
 
     # MARK: - External Dependencies
-    session = providers.Dependency(instance_of=AsyncSession)
-    redis = providers.Dependency(instance_of=Redis)
+    # 요청 스코프(RequestScope)에 바인딩된 세션/Redis
+    session = providers.Callable(current_session)
+    redis = providers.Callable(current_redis)
+
+    # MARK: - Infrastructure
+    # 공용 HTTP 클라이언트 (lifespan 종료 시 close_http_client로 정리)
+    http_client = providers.Callable(get_http_client)
+    # 업로드 저장소 (로컬/S3, lifespan 종료 시 close_storage로 정리)
+    storage = providers.Callable(get_storage)
 
     # MARK: - Services
     fcm_service = providers.Singleton(FCMService)
@@ -24,6 +24,9 @@ from app.features.pods.use_cases.like_use_case import LikeUseCase
 from app.features.pods.use_cases.pod_query_use_case import PodQueryUseCase
 from app.features.pods.use_cases.pod_use_case import PodUseCase
 from app.features.pods.use_cases.review_use_case import ReviewUseCase
+from app.features.reminders.services.reminder_queue_service import (
+    ReminderQueueService,
+)
 from app.features.users.repositories import UserRepository
 
 
@@ -270,6 +273,7 @@ class PodUseCaseContainer(containers.DeclarativeContainer):
     notification_service: PodNotificationServiceContainer = providers.DependenciesContainer()
     follow_use_case: FollowUseCaseContainer = providers.DependenciesContainer()
 
+    reminder_queue = providers.Factory(ReminderQueueService, redis=core.redis)
     pod_use_case = providers.Factory(
         PodUseCase,
         session=core.session,
@@ -277,6 +281,7 @@ class PodUseCaseContainer(containers.DeclarativeContainer):
         enrichment_service=enrichment_service.pod_enrichment_service,
         notification_service=notification_service.pod_notification_service,
         follow_use_case=follow_use_case.follow_use_case,
+        reminder_queue=reminder_queue,
     )
 
 
@@ -0,0 +1,81 @@
+"""요청 스코프 (세션/Redis 바인딩)
+
+요청마다 전역 컨테이너의 provider를 override/reset 하는 대신
+ContextVar에 세션과 Redis를 바인딩하고 CoreContainer가 이를 읽어 주입합니다.
+- override는 컨테이너 전역 상태라 동시에 처리되는 요청끼리 세션이 섞일 수 있음
+- ContextVar는 요청(태스크)마다 독립적이고 set/reset 비용이 작음
+
+스코프 안에서 scoped()로 만든 객체(레포지토리)는 그래프 전체에서 한 번만 생성해 공유합니다.
+
+사용법:
+    with RequestScope(session, redis):
+        use_case = container.pod_feature.pod_use_case()
+"""
+
+from contextvars import ContextVar
+from typing import Any, Callable, Dict
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_session: ContextVar[AsyncSession | None] = ContextVar("request_session", default=None)
+_redis: ContextVar[Redis | None] = ContextVar("request_redis", default=None)
+_instances: ContextVar[Dict[Any, Any] | None] = ContextVar(
+    "request_instances", default=None
+)
+
+
+class RequestScope:
+    """요청 세션/Redis를 바인딩하는 컨텍스트 매니저"""
+
+    __slots__ = ("_session", "_redis", "_tokens")
+
+    def __init__(self, session: AsyncSession, redis: Redis | None = None):
+        self._session = session
+        self._redis = redis
+        self._tokens = None
+
+    def __enter__(self) -> "RequestScope":
+        self._tokens = (
+            _session.set(self._session),
+            _redis.set(self._redis),
+            _instances.set({}),
+        )
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        session_token, redis_token, instances_token = self._tokens
+        _instances.reset(instances_token)
+        _redis.reset(redis_token)
+        _session.reset(session_token)
+
+
+def current_session() -> AsyncSession:
+    """현재 스코프의 세션"""
+    session = _session.get()
+    if session is None:
+        raise RuntimeError(
+            "요청 세션이 바인딩되지 않았습니다 (RequestScope 안에서 resolve 하세요)"
+        )
+    return session
+
+
+def current_redis() -> Redis:
+    """현재 스코프의 Redis 클라이언트"""
+    redis = _redis.get()
+    if redis is None:
+        raise RuntimeError(
+            "Redis가 바인딩되지 않았습니다 (RequestScope(session, redis)로 resolve 하세요)"
+        )
+    return redis
+
+
+def scoped(factory: Callable[..., Any], *args, **kwargs) -> Any:
+    """스코프 안에서 factory 당 한 번만 생성 (스코프 밖에서는 매번 생성)"""
+    instances = _instances.get()
+    if instances is None:
+        return factory(*args, **kwargs)
+    instance = instances.get(factory)
+    if instance is None:
+        instance = instances[factory] = factory(*args, **kwargs)
+    return instance
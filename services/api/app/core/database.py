@@ -1,25 +1,131 @@
 import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from .config import settings
+from .config import DataBasePoolConfig, settings
+from .metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUTS,
+    DB_POOL_WAIT_SECONDS,
+)
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-# 비동기 엔진 생성 (개발 환경에서만 SQL 로그 출력)
-engine = create_async_engine(settings.DATABASE_URL, echo=False)  # SQL 로그 비활성화
+
+# MARK: - Engine / Pool
+
+
+def _instrumented_pool_class(workload: str) -> type[AsyncAdaptedQueuePool]:
+    """체크아웃 대기 시간을 기록하는 풀 클래스 생성"""
+
+    class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                return super()._do_get()
+            except PoolTimeoutError:
+                DB_POOL_TIMEOUTS.labels(workload=workload).inc()
+                raise
+            finally:
+                DB_POOL_WAIT_SECONDS.labels(workload=workload).observe(
+                    time.perf_counter() - started
+                )
+
+    InstrumentedQueuePool.__name__ = f"InstrumentedQueuePool[{workload}]"
+    return InstrumentedQueuePool
+
+
+def _create_engine(
+    workload: str, pool: DataBasePoolConfig, url: str | None = None
+) -> AsyncEngine:
+    """워크로드별 엔진 생성 및 풀 지표 등록"""
+    async_engine = create_async_engine(
+        url or settings.DATABASE_URL,
+        echo=False,  # SQL 로그 비활성화
+        poolclass=_instrumented_pool_class(workload),
+        pool_size=pool.pool_size,
+        max_overflow=pool.max_overflow,
+        pool_recycle=pool.pool_recycle,
+        pool_pre_ping=pool.pool_pre_ping,
+        pool_timeout=pool.pool_timeout,
+    )
+
+    sync_pool = async_engine.sync_engine.pool
+    DB_POOL_SIZE.labels(workload=workload).set(pool.pool_size)
+    DB_POOL_CHECKED_OUT.labels(workload=workload).set_function(sync_pool.checkedout)
+    DB_POOL_OVERFLOW.labels(workload=workload).set_function(
+        lambda: max(sync_pool.overflow(), 0)
+    )
+    return async_engine
+
+
+_pools = settings.database.pools
+
+# HTTP API 요청용 (기본)
+engine = _create_engine("interactive", _pools.interactive)
+# WebSocket 메시지 처리용 (API 요청과 풀을 공유하지 않음)
+websocket_engine = _create_engine("websocket", _pools.websocket)
+# 스케줄러 등 배치 작업용
+batch_engine = _create_engine("batch", _pools.batch)
+# 읽기 전용 복제본 (설정된 경우에만)
+_replica_url = settings.database.get_replica_url()
+replica_engine = (
+    _create_engine("replica", settings.database.replica.pool, url=_replica_url)
+    if _replica_url
+    else None
+)
 
 # 세션 팩토리 생성 (비동기용)
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
+WebSocketSessionLocal = async_sessionmaker(
+    websocket_engine, class_=AsyncSession, expire_on_commit=False
+)
+BatchSessionLocal = async_sessionmaker(
+    batch_engine, class_=AsyncSession, expire_on_commit=False
+)
+ReplicaSessionLocal = (
+    async_sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+    if replica_engine is not None
+    else None
+)
 
 # Base 클래스 생성
 Base = declarative_base()
 
 
+# MARK: - 쓰기 추적 (read-your-writes)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state):
+    # session.execute(update(...)) 등 flush를 거치지 않는 쓰기
+    state = orm_execute_state
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["has_writes"] = True
+
+
 # 데이터베이스 세션 의존성
 async def get_session():
     async with AsyncSessionLocal() as session:
@@ -33,14 +139,64 @@ async def get_session():
         finally:
             await session.close()
 
+        if session.info.pop("has_writes", False):
+            # 직후 조회는 복제본 대신 primary에서 읽도록 표시
+            from .read_replica import read_replica_router
+
+            await read_replica_router.record_write()
+
+
+# 배치 작업용 세션 (스케줄러)
+async def get_batch_session():
+    async with BatchSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+# 워커 간 배타 실행 (MySQL GET_LOCK)
+@asynccontextmanager
+async def named_lock(name: str, timeout: int = 0) -> AsyncIterator[bool]:
+    """이름 있는 락을 획득 (timeout초 안에 얻지 못하면 False)
+
+    GET_LOCK은 연결 단위이므로 전용 배치 연결에서 획득/해제합니다.
+    세션은 커밋 후 연결을 반납하므로 세션으로 잡으면 해제하지 못할 수 있습니다.
+    """
+    async with batch_engine.connect() as conn:
+        locked = await conn.scalar(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": name, "timeout": timeout},
+        )
+        try:
+            yield locked == 1
+        finally:
+            if locked == 1:
+                await conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": name})
+
 
 # 데이터베이스 초기화 (개발 환경에서만 테이블 생성)
 async def init_db():
     # 개발 환경에서만 테이블 자동 생성
+    from .schema_migrations import apply_schema_migrations
+
     try:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            # 기존 테이블에 추가된 컬럼/인덱스 반영
+            await apply_schema_migrations(conn)
         logger.info("Database tables created successfully!")
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
         raise
+
+
+# 엔진 종료 (애플리케이션 종료 시)
+async def dispose_engines():
+    for async_engine in (engine, websocket_engine, batch_engine, replica_engine):
+        if async_engine is not None:
+            await async_engine.dispose()
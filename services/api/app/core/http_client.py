@@ -0,0 +1,56 @@
+"""외부 API 호출용 공용 HTTP 클라이언트
+
+OAuth 제공자(카카오/구글/애플/네이버)와 S3 저장소 호출에 하나의 커넥션 풀을 공유하여
+요청마다 TCP/TLS 연결을 새로 맺지 않도록 합니다.
+애플리케이션 lifespan 종료 시 close_http_client()로 정리합니다.
+"""
+
+import importlib.util
+import logging
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    config = settings.http_client
+    # HTTP/2는 h2 패키지가 있을 때만 활성화 (서버가 지원하지 않으면 HTTP/1.1로 협상)
+    http2 = config.http2 and importlib.util.find_spec("h2") is not None
+
+    # transport를 직접 넘기면 클라이언트의 limits/http2는 무시되므로 transport에 지정
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        # 연결 단계 오류만 재시도하므로 POST(토큰 교환)도 중복 전송되지 않음
+        retries=config.retries,
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공용 HTTP 클라이언트 반환 (최초 호출 시 생성)"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _create_http_client()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """공용 HTTP 클라이언트 종료"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("HTTP 클라이언트 종료")
@@ -1,11 +1,14 @@
+import atexit
+import copy
 import gzip
 import json
 import logging
 import os
+import queue
 import shutil
 import sys
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict
 
@@ -85,9 +88,11 @@ class JSONFormatter(logging.Formatter):
         if user_agent is not None:
             log_entry["user_agent"] = user_agent
 
-        # 예외 정보가 있으면 포함
+        # 예외 정보가 있으면 포함 (큐를 거친 레코드는 exc_text로 전달됨)
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_entry["exception"] = record.exc_text
 
         return json.dumps(log_entry, ensure_ascii=False)
 
@@ -128,8 +133,45 @@ class CompressedTimedRotatingFileHandler(TimedRotatingFileHandler):
                     logging.warning(f"로그 파일 압축 실패: {log_file}, 오류: {e}")
 
 
+class _RecordQueueHandler(QueueHandler):
+    """레코드를 큐에 넣는 핸들러 (포맷/파일 쓰기는 리스너 스레드에서 수행)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 메시지 인자와 예외만 미리 문자열로 만들고 extra 필드는 그대로 전달
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_exception_formatter = logging.Formatter()
+_queue_listener: QueueListener | None = None
+
+
+def stop_logging():
+    """큐에 남은 로그를 모두 기록하고 리스너 스레드 종료"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+# 프로세스 종료 시 큐에 남은 로그 기록
+atexit.register(stop_logging)
+
+
 def setup_logging():
-    """개선된 로깅 설정"""
+    """개선된 로깅 설정
+
+    이벤트 루프에서는 레코드를 큐에 넣기만 하고,
+    JSON 포맷과 파일 쓰기는 QueueListener 스레드에서 처리합니다.
+    """
+    global _queue_listener
+    stop_logging()
+
     # 기존 핸들러 제거 (중복 방지)
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
@@ -177,11 +219,18 @@ def setup_logging():
     api_handler.setLevel(logging.INFO)
     api_handler.setFormatter(JSONFormatter())
 
-    # 핸들러 추가
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(app_handler)
-    root_logger.addHandler(error_handler)
-    root_logger.addHandler(api_handler)
+    # 핸들러는 리스너 스레드에서 실행 (각 핸들러의 레벨 유지)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = QueueListener(
+        log_queue,
+        console_handler,
+        app_handler,
+        error_handler,
+        api_handler,
+        respect_handler_level=True,
+    )
+    _queue_listener.start()
+    root_logger.addHandler(_RecordQueueHandler(log_queue))
 
     # 외부 라이브러리 로그 레벨 조정
     logging.getLogger("uvicorn").setLevel(logging.INFO)
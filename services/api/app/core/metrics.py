@@ -0,0 +1,140 @@
+"""Prometheus 커스텀 메트릭 정의
+
+prometheus_fastapi_instrumentator가 노출하는 /metrics 엔드포인트는
+기본 레지스트리를 사용하므로, 여기서 정의한 메트릭도 함께 수집됩니다.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# MARK: - Scheduler
+
+SCHEDULER_TASK_DURATION = Histogram(
+    "podpod_scheduler_task_duration_seconds",
+    "스케줄러 작업 실행 시간 (초)",
+    labelnames=("schedule", "task"),
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 240, 300),
+)
+
+SCHEDULER_TASK_FAILURES = Counter(
+    "podpod_scheduler_task_failures_total",
+    "스케줄러 작업 실패 횟수",
+    labelnames=("schedule", "task", "reason"),
+)
+
+# MARK: - Auth
+
+AUTH_TOKEN_CACHE_REQUESTS = Counter(
+    "podpod_auth_token_cache_requests_total",
+    "검증된 액세스 토큰 캐시 조회 횟수",
+    labelnames=("result",),  # hit / miss
+)
+
+AUTH_BLACKLIST_CHECK_FAILURES = Counter(
+    "podpod_auth_blacklist_check_failures_total",
+    "Redis 오류로 블랙리스트를 확인하지 못하고 통과시킨 액세스 토큰 검증 횟수",
+)
+
+AUTH_LIVE_REFRESH_TOKENS = Gauge(
+    "podpod_auth_live_refresh_tokens",
+    "만료되지 않은 리프레시 토큰 수 (정리 작업 시점 기준)",
+)
+
+AUTH_REFRESH_TOKEN_USERS = Gauge(
+    "podpod_auth_refresh_token_users",
+    "리프레시 토큰을 보유한 사용자 수",
+)
+
+AUTH_MAX_REFRESH_TOKENS_PER_USER = Gauge(
+    "podpod_auth_max_refresh_tokens_per_user",
+    "사용자 1명이 보유한 리프레시 토큰 수의 최댓값",
+)
+
+# MARK: - Database
+
+DB_POOL_SIZE = Gauge(
+    "podpod_db_pool_size",
+    "커넥션 풀 기본 크기 (설정값)",
+    labelnames=("workload",),
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "podpod_db_pool_checked_out",
+    "사용 중인(체크아웃된) 커넥션 수",
+    labelnames=("workload",),
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "podpod_db_pool_overflow",
+    "pool_size를 넘어 추가로 열린 커넥션 수",
+    labelnames=("workload",),
+)
+
+DB_POOL_WAIT_SECONDS = Histogram(
+    "podpod_db_pool_wait_seconds",
+    "커넥션 체크아웃 대기 시간 (초)",
+    labelnames=("workload",),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+DB_POOL_TIMEOUTS = Counter(
+    "podpod_db_pool_timeouts_total",
+    "커넥션 체크아웃 타임아웃 횟수",
+    labelnames=("workload",),
+)
+
+DB_REPLICA_LAG_SECONDS = Gauge(
+    "podpod_db_replica_lag_seconds",
+    "읽기 전용 복제본의 복제 지연 (초, 확인 실패 시 -1)",
+)
+
+DB_READ_ROUTES = Counter(
+    "podpod_db_read_routes_total",
+    "읽기 전용 요청의 라우팅 결과",
+    labelnames=("target", "reason"),  # replica / primary
+)
+
+# MARK: - Redis
+
+REDIS_POOL_IN_USE = Gauge(
+    "podpod_redis_pool_in_use",
+    "사용 중인 Redis 연결 수",
+    labelnames=("pool",),
+)
+
+REDIS_POOL_WAIT_SECONDS = Histogram(
+    "podpod_redis_pool_wait_seconds",
+    "Redis 연결 획득 대기 시간 (초)",
+    labelnames=("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
+)
+
+REDIS_POOL_TIMEOUTS = Counter(
+    "podpod_redis_pool_timeouts_total",
+    "Redis 연결 획득 타임아웃 횟수",
+    labelnames=("pool",),
+)
+
+# MARK: - Image
+
+IMAGE_PROCESS_SECONDS = Histogram(
+    "podpod_image_process_seconds",
+    "이미지 디코딩/렌디션 인코딩 시간 (프로세스 풀 대기 포함, 초)",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+
+IMAGE_PROCESS_FAILURES = Counter(
+    "podpod_image_process_failures_total",
+    "이미지 처리 실패 횟수",
+    labelnames=("reason",),  # invalid / pool_broken
+)
+
+CONTENT_STORE_DEDUP_HITS = Counter(
+    "podpod_content_store_dedup_hits_total",
+    "이미 저장된 같은 내용을 재사용한 횟수",
+    labelnames=("kind",),  # original / rendition
+)
+
+CONTENT_STORE_SWEPT_FILES = Counter(
+    "podpod_content_store_swept_files_total",
+    "참조되지 않아 삭제한 저장소 파일 수",
+)
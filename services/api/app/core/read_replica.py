@@ -0,0 +1,125 @@
+"""읽기 전용 복제본 라우팅
+
+조회 전용 유스케이스(파티 목록, 팔로우 목록, 아티스트/스케줄, 알림 목록)는
+가능하면 복제본에서 처리하고, 아래의 경우에는 primary에서 읽습니다.
+- 복제본이 설정되지 않았거나 복제 지연이 max_lag_seconds를 넘는 경우
+- 사용자가 방금 쓰기를 한 경우 (sticky_seconds 동안, read-your-writes 보장)
+"""
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, ReplicaSessionLocal, replica_engine
+from app.core.metrics import DB_READ_ROUTES, DB_REPLICA_LAG_SECONDS
+from app.deps.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 요청을 보낸 사용자 (인증 의존성에서 설정)
+current_user_id: ContextVar[int | None] = ContextVar("current_user_id", default=None)
+
+STICKY_KEY_PREFIX = "db:recent_write"
+
+
+class ReplicaLagGuard:
+    """복제 지연 확인 (lag_check_interval 동안 결과 재사용)"""
+
+    def __init__(self, max_lag_seconds: float, check_interval: float):
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval = check_interval
+        self._lag: float | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def is_available(self) -> bool:
+        if time.monotonic() - self._checked_at >= self._check_interval:
+            async with self._lock:
+                if time.monotonic() - self._checked_at >= self._check_interval:
+                    self._lag = await self._fetch_lag()
+                    self._checked_at = time.monotonic()
+                    DB_REPLICA_LAG_SECONDS.set(
+                        -1 if self._lag is None else self._lag
+                    )
+        return self._lag is not None and self._lag <= self._max_lag_seconds
+
+    async def _fetch_lag(self) -> float | None:
+        """복제 지연(초) 조회, 복제가 멈췄거나 확인할 수 없으면 None"""
+        try:
+            async with replica_engine.connect() as conn:
+                try:
+                    result = await conn.exec_driver_sql("SHOW REPLICA STATUS")
+                except Exception:
+                    # MySQL 8.0.22 미만
+                    result = await conn.exec_driver_sql("SHOW SLAVE STATUS")
+                row = result.mappings().first()
+        except Exception as e:
+            logger.warning(f"복제본 상태 확인 실패, primary 사용: {e}")
+            return None
+
+        if row is None:
+            logger.warning("복제본에 복제 설정이 없음, primary 사용")
+            return None
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        return float(lag) if lag is not None else None
+
+
+class ReadReplicaRouter:
+    """조회 세션을 복제본 / primary 중 어디서 열지 결정"""
+
+    def __init__(self):
+        config = settings.database.replica
+        self._sticky_seconds = config.sticky_seconds
+        self._lag_guard = (
+            ReplicaLagGuard(config.max_lag_seconds, config.lag_check_interval)
+            if replica_engine is not None
+            else None
+        )
+
+    def _sticky_key(self, user_id: int) -> str:
+        return f"{STICKY_KEY_PREFIX}:{user_id}"
+
+    # - MARK: 쓰기 기록
+    async def record_write(self) -> None:
+        """현재 사용자가 쓰기를 했음을 기록 (커밋 이후 호출)"""
+        user_id = current_user_id.get()
+        if self._lag_guard is None or user_id is None:
+            return
+        try:
+            redis = await get_redis_client()
+            await redis.set(
+                self._sticky_key(user_id), "1", px=int(self._sticky_seconds * 1000)
+            )
+        except Exception as e:
+            logger.warning(f"쓰기 기록 실패: user_id={user_id}, error={e}")
+
+    async def _has_recent_write(self, user_id: int) -> bool:
+        try:
+            redis = await get_redis_client()
+            return await redis.exists(self._sticky_key(user_id)) > 0
+        except Exception:
+            # 확인할 수 없으면 안전하게 primary
+            return True
+
+    # - MARK: 세션 팩토리 선택
+    async def session_factory(self, user_id: int | None) -> async_sessionmaker:
+        if self._lag_guard is None:
+            return AsyncSessionLocal
+
+        if user_id is not None and await self._has_recent_write(user_id):
+            DB_READ_ROUTES.labels(target="primary", reason="recent_write").inc()
+            return AsyncSessionLocal
+
+        if not await self._lag_guard.is_available():
+            DB_READ_ROUTES.labels(target="primary", reason="replica_lag").inc()
+            return AsyncSessionLocal
+
+        DB_READ_ROUTES.labels(target="replica", reason="ok").inc()
+        return ReplicaSessionLocal
+
+
+read_replica_router = ReadReplicaRouter()
@@ -7,16 +7,26 @@
     from app.core.scheduler import Scheduler
 
     scheduler = Scheduler()
-    scheduler.register_daily_task(my_daily_task)
-    scheduler.register_frequent_task(my_5min_task)
+    scheduler.register_daily_task(my_daily_task, group="review")
+    scheduler.register_frequent_task(my_5min_task, timeout=60)
     await scheduler.start()
+
+같은 그룹(group)의 작업은 등록 순서대로 순차 실행되고,
+서로 다른 그룹은 세마포어로 제한된 범위 안에서 동시에 실행됩니다.
+세마포어는 주기(일일/시간별/5분/1분)마다 따로 두어, 오래 걸리는 일일 작업이
+1분 작업의 실행 슬롯을 차지하지 않도록 합니다.
 """
 
 import asyncio
 import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Awaitable, Callable
 
+from app.core.metrics import SCHEDULER_TASK_DURATION, SCHEDULER_TASK_FAILURES
+
 logger = logging.getLogger(__name__)
 
 # 타입 정의
@@ -29,11 +39,30 @@ class SchedulerConfig:
     DAILY_HOUR = 10  # 일일 스케줄러 실행 시간 (오전 10시)
     HOURLY_INTERVAL = 60 * 60  # 1시간 (초)
     FIVE_MIN_INTERVAL = 5 * 60  # 5분 (초)
+    MINUTE_INTERVAL = 60  # 1분 (초)
 
     # 에러 발생 시 재시도 간격
     DAILY_RETRY_INTERVAL = 60 * 60  # 1시간
     HOURLY_RETRY_INTERVAL = 10 * 60  # 10분
     FIVE_MIN_RETRY_INTERVAL = 2 * 60  # 2분
+    MINUTE_RETRY_INTERVAL = 30  # 30초
+
+    # 작업 실행 제한
+    MAX_CONCURRENT_TASKS = 4  # 주기별로 동시에 실행할 수 있는 그룹 수
+    DEFAULT_TASK_TIMEOUT = 4 * 60  # 작업별 기본 타임아웃 (5분 주기 안에 끝나도록)
+
+
+@dataclass(frozen=True)
+class ScheduledTask:
+    """스케줄러에 등록된 작업"""
+
+    callback: TaskCallback
+    group: str
+    timeout: float | None
+
+    @property
+    def name(self) -> str:
+        return self.callback.__name__
 
 
 class Scheduler:
@@ -44,36 +73,81 @@ class Scheduler:
 
     def __init__(self, config: SchedulerConfig | None = None):
         self.config = config or SchedulerConfig()
-        self._daily_tasks: list[TaskCallback] = []
-        self._hourly_tasks: list[TaskCallback] = []
-        self._frequent_tasks: list[TaskCallback] = []
-
-    def register_daily_task(self, task: TaskCallback) -> None:
+        self._daily_tasks: list[ScheduledTask] = []
+        self._hourly_tasks: list[ScheduledTask] = []
+        self._frequent_tasks: list[ScheduledTask] = []
+        self._minutely_tasks: list[ScheduledTask] = []
+        self._semaphores = {
+            schedule: asyncio.Semaphore(self.config.MAX_CONCURRENT_TASKS)
+            for schedule in ("daily", "hourly", "frequent", "minutely")
+        }
+
+    def register_daily_task(
+        self,
+        task: TaskCallback,
+        group: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
         """일일 작업 등록 (매일 오전 10시)"""
-        self._daily_tasks.append(task)
+        self._daily_tasks.append(self._build_task(task, group, timeout))
         logger.debug(f"일일 작업 등록: {task.__name__}")
 
-    def register_hourly_task(self, task: TaskCallback) -> None:
+    def register_hourly_task(
+        self,
+        task: TaskCallback,
+        group: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
         """시간별 작업 등록 (1시간마다)"""
-        self._hourly_tasks.append(task)
+        self._hourly_tasks.append(self._build_task(task, group, timeout))
         logger.debug(f"시간별 작업 등록: {task.__name__}")
 
-    def register_frequent_task(self, task: TaskCallback) -> None:
+    def register_frequent_task(
+        self,
+        task: TaskCallback,
+        group: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
         """빈번한 작업 등록 (5분마다)"""
-        self._frequent_tasks.append(task)
+        self._frequent_tasks.append(self._build_task(task, group, timeout))
         logger.debug(f"5분 작업 등록: {task.__name__}")
 
+    def register_minutely_task(
+        self,
+        task: TaskCallback,
+        group: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """1분 작업 등록 (예약 큐 폴링 등 가벼운 작업용)"""
+        self._minutely_tasks.append(self._build_task(task, group, timeout))
+        logger.debug(f"1분 작업 등록: {task.__name__}")
+
+    def _build_task(
+        self, task: TaskCallback, group: str | None, timeout: float | None
+    ) -> ScheduledTask:
+        """등록 정보로 ScheduledTask 생성
+
+        그룹을 지정하지 않으면 작업 이름을 그룹으로 사용하여 단독 실행됩니다.
+        """
+        return ScheduledTask(
+            callback=task,
+            group=group or task.__name__,
+            timeout=timeout if timeout is not None else self.config.DEFAULT_TASK_TIMEOUT,
+        )
+
     async def start(self) -> None:
         """스케줄러 시작"""
         logger.info("스케줄러 시작:")
         logger.info(f"- 매일 오전 {self.config.DAILY_HOUR}시: {len(self._daily_tasks)}개 작업")
         logger.info(f"- 5분마다: {len(self._frequent_tasks)}개 작업")
         logger.info(f"- 1시간마다: {len(self._hourly_tasks)}개 작업")
+        logger.info(f"- 1분마다: {len(self._minutely_tasks)}개 작업")
 
         await asyncio.gather(
             self._run_daily_loop(),
             self._run_frequent_loop(),
             self._run_hourly_loop(),
+            self._run_minutely_loop(),
         )
 
     # ==================== 스케줄러 루프 ====================
@@ -85,7 +159,7 @@ class Scheduler:
                 await self._wait_until_hour(self.config.DAILY_HOUR)
 
                 logger.info("일일 스케줄러 실행 시작")
-                await self._execute_tasks(self._daily_tasks)
+                await self._execute_tasks(self._daily_tasks, "daily")
                 logger.info("일일 스케줄러 실행 완료")
 
             except Exception as e:
@@ -97,7 +171,7 @@ class Scheduler:
         while True:
             try:
                 logger.info("시간별 스케줄러 실행 시작")
-                await self._execute_tasks(self._hourly_tasks)
+                await self._execute_tasks(self._hourly_tasks, "hourly")
                 logger.info("시간별 스케줄러 실행 완료")
 
                 await asyncio.sleep(self.config.HOURLY_INTERVAL)
@@ -111,7 +185,7 @@ class Scheduler:
         while True:
             try:
                 logger.info("5분 스케줄러 실행 시작")
-                await self._execute_tasks(self._frequent_tasks)
+                await self._execute_tasks(self._frequent_tasks, "frequent")
                 logger.info("5분 스케줄러 실행 완료")
 
                 await asyncio.sleep(self.config.FIVE_MIN_INTERVAL)
@@ -120,15 +194,57 @@ class Scheduler:
                 logger.error(f"5분 스케줄러 실행 중 오류: {e}")
                 await asyncio.sleep(self.config.FIVE_MIN_RETRY_INTERVAL)
 
+    async def _run_minutely_loop(self) -> None:
+        """1분마다 실행되는 루프"""
+        while True:
+            try:
+                await self._execute_tasks(self._minutely_tasks, "minutely")
+                await asyncio.sleep(self.config.MINUTE_INTERVAL)
+
+            except Exception as e:
+                logger.error(f"1분 스케줄러 실행 중 오류: {e}")
+                await asyncio.sleep(self.config.MINUTE_RETRY_INTERVAL)
+
     # ==================== 유틸리티 ====================
 
-    async def _execute_tasks(self, tasks: list[TaskCallback]) -> None:
-        """등록된 작업들 순차 실행"""
+    async def _execute_tasks(self, tasks: list[ScheduledTask], schedule: str) -> None:
+        """등록된 작업들을 그룹 단위로 동시 실행
+
+        같은 그룹의 작업은 순차 실행되고, 그룹 간에는 주기별 세마포어 한도 내에서
+        병렬로 실행됩니다. 개별 작업의 실패/타임아웃은 다른 작업에 영향을 주지 않습니다.
+        """
+        groups: dict[str, list[ScheduledTask]] = defaultdict(list)
         for task in tasks:
-            try:
-                await task()
-            except Exception as e:
-                logger.error(f"작업 실행 중 오류 ({task.__name__}): {e}")
+            groups[task.group].append(task)
+
+        await asyncio.gather(
+            *(
+                self._execute_group(group_tasks, schedule)
+                for group_tasks in groups.values()
+            )
+        )
+
+    async def _execute_group(self, tasks: list[ScheduledTask], schedule: str) -> None:
+        """한 그룹의 작업들을 순차 실행"""
+        async with self._semaphores[schedule]:
+            for task in tasks:
+                await self._execute_task(task, schedule)
+
+    async def _execute_task(self, task: ScheduledTask, schedule: str) -> None:
+        """단일 작업 실행 (타임아웃 적용 및 실행 시간 기록)"""
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(task.callback(), timeout=task.timeout)
+        except asyncio.TimeoutError:
+            SCHEDULER_TASK_FAILURES.labels(schedule, task.name, "timeout").inc()
+            logger.error(f"작업 타임아웃 ({task.name}): {task.timeout}초 초과")
+        except Exception as e:
+            SCHEDULER_TASK_FAILURES.labels(schedule, task.name, "error").inc()
+            logger.error(f"작업 실행 중 오류 ({task.name}): {e}")
+        finally:
+            elapsed = time.perf_counter() - started_at
+            SCHEDULER_TASK_DURATION.labels(schedule, task.name).observe(elapsed)
+            logger.info(f"작업 실행 시간 ({schedule}/{task.name}): {elapsed:.2f}초")
 
     async def _wait_until_hour(self, target_hour: int) -> None:
         """지정된 시간까지 대기"""
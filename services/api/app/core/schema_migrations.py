@@ -0,0 +1,179 @@
+"""기존 테이블 스키마 보정 (create_all 이후 실행)
+
+create_all은 없는 테이블만 만들고 이미 있는 테이블에는 컬럼/인덱스를 추가하지 않습니다.
+기존 테이블의 모델에 컬럼/인덱스를 추가하면 SCHEMA_STEPS에 DDL을 함께 등록합니다.
+- 각 단계는 information_schema로 적용 여부를 확인하므로 여러 번 실행해도 안전
+- 여러 워커가 동시에 시작해도 MySQL 네임드 락으로 한 번만 적용
+- backfill은 해당 단계를 새로 적용한 경우에만 실행 (기존 행 채우기)
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Literal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+# 네임드 락 이름 / 대기 시간 (초)
+SCHEMA_LOCK_NAME = "schema_migrations"
+SCHEMA_LOCK_TIMEOUT = 60
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaStep:
+    """컬럼 또는 인덱스 하나를 추가하는 단계 (name: 컬럼/인덱스 이름)"""
+
+    table: str
+    kind: Literal["column", "index"]
+    name: str
+    ddl: str
+    backfill: Callable[[AsyncConnection], Awaitable[int]] | None = None
+
+
+# MARK: - backfill
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+async def backfill_pod_geohash(conn: AsyncConnection) -> int:
+    """좌표는 있지만 geohash가 없는 파티 채우기 (저장 시와 같은 encode_geohash 사용)
+
+    Returns:
+        채운 행 수
+    """
+    from app.utils.geo import encode_geohash
+
+    result = await conn.execute(
+        text(
+            "SELECT pod_id, x, y FROM pod_details "
+            "WHERE geohash IS NULL AND x IS NOT NULL AND y IS NOT NULL"
+        )
+    )
+    rows = [
+        {"pod_id": pod_id, "geohash": encode_geohash(y, x)}
+        for pod_id, x, y in result.all()
+    ]
+    update = text("UPDATE pod_details SET geohash = :geohash WHERE pod_id = :pod_id")
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        await conn.execute(update, rows[start : start + BACKFILL_BATCH_SIZE])
+    return len(rows)
+
+
+# MARK: - 등록된 단계 (적용 순서대로)
+
+SCHEMA_STEPS: list[SchemaStep] = [
+    # 알림함 표시용 비정규화 필드
+    SchemaStep(
+        table="notifications",
+        kind="column",
+        name="related_user_nickname",
+        ddl="ALTER TABLE notifications "
+        "ADD COLUMN related_user_nickname VARCHAR(50) NULL",
+    ),
+    SchemaStep(
+        table="notifications",
+        kind="column",
+        name="related_user_profile_image",
+        ddl="ALTER TABLE notifications "
+        "ADD COLUMN related_user_profile_image VARCHAR(500) NULL",
+    ),
+    SchemaStep(
+        table="notifications",
+        kind="column",
+        name="related_pod_title",
+        ddl="ALTER TABLE notifications ADD COLUMN related_pod_title VARCHAR(100) NULL",
+    ),
+    # 아티스트별 월 범위 스케줄 조회
+    SchemaStep(
+        table="artist_schedules",
+        kind="index",
+        name="ix_artist_schedules_artist_id_start_time",
+        ddl="CREATE INDEX ix_artist_schedules_artist_id_start_time "
+        "ON artist_schedules (artist_id, start_time)",
+    ),
+    # 파티 지역 태그 (기존 파티는 scripts/rebuild_location_popularity.py 또는 일일 작업이 태깅)
+    SchemaStep(
+        table="pod_details",
+        kind="column",
+        name="location_id",
+        ddl="ALTER TABLE pod_details "
+        "ADD COLUMN location_id INT NULL COMMENT '지역 ID', "
+        "ADD INDEX ix_pod_details_location_id (location_id), "
+        "ADD FOREIGN KEY (location_id) REFERENCES locations (id) ON DELETE SET NULL",
+    ),
+    SchemaStep(
+        table="pod_details",
+        kind="column",
+        name="sub_location",
+        ddl="ALTER TABLE pod_details "
+        "ADD COLUMN sub_location VARCHAR(100) NULL COMMENT '매칭된 세부 지역'",
+    ),
+    # 파티 좌표 geohash (반경/지도 영역 검색)
+    SchemaStep(
+        table="pod_details",
+        kind="column",
+        name="geohash",
+        ddl="ALTER TABLE pod_details "
+        "ADD COLUMN geohash VARCHAR(12) NULL COMMENT '좌표 geohash', "
+        "ADD INDEX ix_pod_details_geohash (geohash)",
+        backfill=backfill_pod_geohash,
+    ),
+]
+
+
+# MARK: - 적용
+
+
+async def _exists(conn: AsyncConnection, step: SchemaStep) -> bool:
+    if step.kind == "column":
+        query = text(
+            "SELECT 1 FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+            "AND COLUMN_NAME = :name LIMIT 1"
+        )
+    else:
+        query = text(
+            "SELECT 1 FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+            "AND INDEX_NAME = :name LIMIT 1"
+        )
+    result = await conn.execute(query, {"table": step.table, "name": step.name})
+    return result.first() is not None
+
+
+async def apply_schema_migrations(conn: AsyncConnection) -> list[str]:
+    """적용되지 않은 단계를 순서대로 적용
+
+    Returns:
+        새로 적용한 단계 목록 ("테이블.이름")
+    """
+    locked = await conn.scalar(
+        text("SELECT GET_LOCK(:name, :timeout)"),
+        {"name": SCHEMA_LOCK_NAME, "timeout": SCHEMA_LOCK_TIMEOUT},
+    )
+    if locked != 1:
+        raise RuntimeError("스키마 마이그레이션 락을 얻지 못했습니다")
+
+    applied: list[str] = []
+    try:
+        for step in SCHEMA_STEPS:
+            if await _exists(conn, step):
+                continue
+
+            started = time.perf_counter()
+            await conn.execute(text(step.ddl))
+            filled = await step.backfill(conn) if step.backfill else 0
+            applied.append(f"{step.table}.{step.name}")
+            logger.info(
+                f"스키마 마이그레이션 적용: {step.table}.{step.name} "
+                f"(backfill {filled}건, "
+                f"{(time.perf_counter() - started) * 1000:.0f}ms)"
+            )
+    finally:
+        await conn.execute(
+            text("SELECT RELEASE_LOCK(:name)"), {"name": SCHEMA_LOCK_NAME}
+        )
+    return applied
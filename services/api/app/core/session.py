@@ -1,15 +1,28 @@
 """세션 및 토큰 관리 (Redis 기반)"""
 
+import hashlib
+import logging
 import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from typing import NamedTuple
 
 from jose import ExpiredSignatureError, JWTError, jwt
 from pydantic import BaseModel
+from redis.exceptions import RedisError
 
 from app.deps.redis import get_redis_client
 from .config import settings
+from .metrics import (
+    AUTH_BLACKLIST_CHECK_FAILURES,
+    AUTH_LIVE_REFRESH_TOKENS,
+    AUTH_MAX_REFRESH_TOKENS_PER_USER,
+    AUTH_REFRESH_TOKEN_USERS,
+    AUTH_TOKEN_CACHE_REQUESTS,
+)
+from .token_blacklist import token_blacklist
 from .exceptions.token_exception import (
     TokenInvalidError,
     TokenExpiredError,
@@ -17,6 +30,8 @@ from .exceptions.token_exception import (
     TokenBlacklistedError
 )
 
+logger = logging.getLogger(__name__)
+
 
 class TokenType(str, Enum):
     """ 토큰 타입 """
@@ -32,37 +47,126 @@ class _TokenPayload(BaseModel):
     type: TokenType  # 토큰 타입
 
 
+# - MARK: 검증된 액세스 토큰 캐시
+
+
+class _VerifiedToken(NamedTuple):
+    user_id: int
+    jti: str | None
+    exp: float
+
+
+class _VerifiedTokenCache:
+    """서명 검증을 마친 액세스 토큰 LRU (만료 시각까지 유효)
+
+    키는 토큰 전체(헤더.페이로드.서명)의 SHA-256입니다. 서명만으로 키를 만들면
+    헤더/페이로드를 바꾸고 서명을 재사용한 토큰이 검증 없이 통과하므로 토큰 전체를 사용합니다.
+    """
+
+    def __init__(self, max_size: int = 50_000):
+        self._max_size = max_size
+        self._entries: OrderedDict[str, _VerifiedToken] = OrderedDict()
+
+    def get(self, key: str) -> _VerifiedToken | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: _VerifiedToken) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+_verified_tokens = _VerifiedTokenCache()
+
+
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 # - MARK: 블랙리스트 관리
 
 
 async def add_token_to_blacklist(token: str, ttl_seconds: int = 3600):
-    """토큰을 블랙리스트에 추가 (Redis)"""
-    redis = await get_redis_client()
-    await redis.setex(f"blacklist:{token}", ttl_seconds, "1")
+    """토큰을 블랙리스트에 추가 (jti 기준, 토큰 만료 시각까지 유지)"""
+    try:
+        claims = jwt.get_unverified_claims(token)
+    except JWTError:
+        return
+
+    jti: str | None = claims.get("jti")
+    if not jti:
+        return
+
+    exp = claims.get("exp")
+    if exp is not None:
+        ttl_seconds = int(exp - time.time())
+        if ttl_seconds <= 0:
+            return  # 이미 만료된 토큰
+
+    _verified_tokens.delete(_token_cache_key(token))
+    await token_blacklist.add(jti, ttl_seconds)
 
 
 async def is_token_blacklisted(token: str) -> bool:
-    """토큰이 블랙리스트에 있는지 확인 (Redis)"""
-    redis = await get_redis_client()
-    result = await redis.get(f"blacklist:{token}")
-    return result is not None
+    """토큰이 블랙리스트에 있는지 확인 (jti 기준)"""
+    try:
+        jti: str | None = jwt.get_unverified_claims(token).get("jti")
+    except JWTError:
+        return False
+    return bool(jti) and await token_blacklist.contains(jti)
+
+
+# - MARK: 리프레시 토큰 저장소
+
+REFRESH_TOKEN_KEY_PREFIX = "refresh_token"
+# 사용자별 발급된 리프레시 토큰 (member: jti, score: 만료 시각) - 정리/지표용
+REFRESH_TOKEN_USER_KEY_PREFIX = "refresh_tokens:user"
+
+# 기존 토큰 소비 + 새 토큰 저장을 원자적으로 수행
+# KEYS: [기존 토큰 키, 새 토큰 키, 사용자 인덱스 키]
+# ARGV: [user_id, TTL(초), 새 토큰 만료 시각, 기존 jti, 새 jti]
+# 반환: 1 성공 / 0 없음(이미 사용·무효화) / -1 사용자 불일치
+_ROTATE_REFRESH_TOKEN_SCRIPT = """
+local stored = redis.call('GET', KEYS[1])
+if not stored then
+    return 0
+end
+if stored ~= ARGV[1] then
+    return -1
+end
+redis.call('DEL', KEYS[1])
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[2])
+redis.call('ZREM', KEYS[3], ARGV[4])
+redis.call('ZADD', KEYS[3], ARGV[3], ARGV[5])
+redis.call('EXPIRE', KEYS[3], ARGV[2])
+return 1
+"""
+
+
+def _refresh_token_key(jti: str) -> str:
+    return f"{REFRESH_TOKEN_KEY_PREFIX}:{jti}"
+
+
+def _refresh_token_user_key(user_id: int | str) -> str:
+    return f"{REFRESH_TOKEN_USER_KEY_PREFIX}:{user_id}"
 
 
 class TokenManager:
     DEFAULT_ACCESS_TOKEN_EXPIRE_MINUTES = 30  # 30분
     DEFAULT_REFRESH_TOKEN_EXPIRE_MINUTES = 7 * 24 * 60  # 7일 (분 단위)
+    REFRESH_TOKEN_TTL_SECONDS = DEFAULT_REFRESH_TOKEN_EXPIRE_MINUTES * 60
 
     def __init__(self):
         self.secret_key = settings.jwt.secret_key
         self.algorithm = settings.jwt.algorithm
 
-        self._access_expire_time = datetime.now(timezone.utc) + timedelta(
-            minutes=self.DEFAULT_ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-        self._refresh_expire_time = datetime.now(timezone.utc) + timedelta(
-            minutes=self.DEFAULT_REFRESH_TOKEN_EXPIRE_MINUTES
-        )
-
     def _generate_token(self, payload: _TokenPayload):
         return jwt.encode(
             payload.model_dump(),
@@ -72,32 +176,87 @@ class TokenManager:
 
     def create_access_token(self, user_id: int) -> str:
         """액세스 토큰 생성"""
+        # 만료 시각은 발급 시점 기준 (인스턴스가 오래 살아 있어도 일정하게 유지)
         return self._generate_token(
             _TokenPayload(
                 sub=str(user_id),
                 iat=time.time(),
-                exp=self._access_expire_time,
+                exp=datetime.now(timezone.utc)
+                + timedelta(minutes=self.DEFAULT_ACCESS_TOKEN_EXPIRE_MINUTES),
                 jti=str(uuid.uuid4()),
                 type=TokenType.ACCESS,
             ))
 
-    async def create_refresh_token(self, user_id: int) -> str:
-        """리프레시 토큰 생성 및 Redis에 저장"""
-        _paylaod = _TokenPayload(
+    def _new_refresh_payload(self, user_id: int) -> _TokenPayload:
+        return _TokenPayload(
             sub=str(user_id),
             iat=time.time(),
-            exp=self._refresh_expire_time,
+            exp=datetime.now(timezone.utc)
+            + timedelta(seconds=self.REFRESH_TOKEN_TTL_SECONDS),
             jti=str(uuid.uuid4()),
             type=TokenType.REFRESH,
         )
+
+    async def create_refresh_token(self, user_id: int) -> str:
+        """리프레시 토큰 생성 및 Redis에 저장"""
+        payload = self._new_refresh_payload(user_id)
+
         # Redis에 저장 (key: refresh_token:{jti}, value: user_id, TTL: 7일)
         redis = await get_redis_client()
+        user_key = _refresh_token_user_key(user_id)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.setex(
+                _refresh_token_key(payload.jti),
+                self.REFRESH_TOKEN_TTL_SECONDS,
+                str(user_id),
+            )
+            pipe.zadd(user_key, {payload.jti: payload.exp.timestamp()})
+            pipe.expire(user_key, self.REFRESH_TOKEN_TTL_SECONDS)
+            await pipe.execute()
+
+        return self._generate_token(payload)
+
+    async def rotate_refresh_token(self, user_id: int, jti: str) -> str:
+        """리프레시 토큰 교체 (기존 토큰 소비 + 새 토큰 발급을 한 번의 Redis 호출로 처리)
+
+        같은 리프레시 토큰으로 동시에 요청해도 한 요청만 성공합니다.
+
+        Raises:
+            TokenInvalidError: 이미 사용/무효화되었거나 사용자가 일치하지 않는 경우
+        """
+        payload = self._new_refresh_payload(user_id)
+
+        redis = await get_redis_client()
+        result = await redis.eval(
+            _ROTATE_REFRESH_TOKEN_SCRIPT,
+            3,
+            _refresh_token_key(jti),
+            _refresh_token_key(payload.jti),
+            _refresh_token_user_key(user_id),
+            str(user_id),
+            self.REFRESH_TOKEN_TTL_SECONDS,
+            payload.exp.timestamp(),
+            jti,
+            payload.jti,
+        )
+        if int(result) != 1:
+            raise TokenInvalidError()
 
-        ttl_seconds = int(self._refresh_expire_time.timestamp())
+        return self._generate_token(payload)
 
-        await redis.setex(f"refresh_token:{_paylaod.jti}", ttl_seconds, str(user_id))
+    def decode_refresh_token(self, token: str) -> tuple[int, str]:
+        """리프레시 토큰 서명/만료/타입 검증 (Redis 조회 없음)
 
-        return self._generate_token(_paylaod)
+        Returns:
+            (user_id, jti)
+        """
+        payload = self._decode(token)
+        if payload.get("type") != TokenType.REFRESH.value:
+            raise TokenInvalidError()
+        jti: str | None = payload.get("jti")
+        if not jti:
+            raise TokenInvalidError()
+        return self._subject(payload), jti
 
     async def revoke_refresh_token(self, token: str) -> None:
         """리프레시 토큰 무효화 (Redis에서 삭제)"""
@@ -108,7 +267,10 @@ class TokenManager:
             jti: str | None = payload.get("jti")
             if jti:
                 redis = await get_redis_client()
-                await redis.delete(f"refresh_token:{jti}")
+                async with redis.pipeline(transaction=False) as pipe:
+                    pipe.delete(_refresh_token_key(jti))
+                    pipe.zrem(_refresh_token_user_key(payload.get("sub")), jti)
+                    await pipe.execute()
         except Exception:
             pass  # 토큰 디코드 실패해도 무시
 
@@ -116,40 +278,85 @@ class TokenManager:
         """리프레시 토큰 전용 검증"""
         return await self.verify_token(token, TokenType.REFRESH.value)
 
+    # - MARK: 액세스 토큰 검증 (캐시)
+    async def verify_access_token(self, token: str) -> int:
+        """액세스 토큰 검증 후 user_id 리턴
+
+        한 번 검증한 토큰은 만료 전까지 서명/클레임 검증을 생략하고,
+        블랙리스트는 jti로 매번 확인합니다 (대부분 워커 내 블룸 필터에서 판정).
+
+        Redis 오류로 블랙리스트를 확인할 수 없으면 fail open합니다. 모든 API가 500이 되지 않도록
+        서명/만료 검증만으로 통과시키며, 그동안 로그아웃한 토큰도 만료(최대 30분) 전까지 통과할 수 있습니다.
+        """
+        cache_key = _token_cache_key(token)
+        verified = _verified_tokens.get(cache_key)
+
+        if verified is None:
+            AUTH_TOKEN_CACHE_REQUESTS.labels(result="miss").inc()
+            payload = self._decode(token)
+            if payload.get("type") != TokenType.ACCESS.value:
+                raise TokenInvalidError()
+            verified = _VerifiedToken(
+                user_id=self._subject(payload),
+                jti=payload.get("jti"),
+                exp=float(payload["exp"]),
+            )
+            _verified_tokens.set(cache_key, verified)
+        else:
+            AUTH_TOKEN_CACHE_REQUESTS.labels(result="hit").inc()
+            if verified.exp <= time.time():
+                _verified_tokens.delete(cache_key)
+                raise TokenExpiredError()
+
+        if verified.jti and await self._is_access_token_blacklisted(verified.jti):
+            raise TokenBlacklistedError()
+
+        return verified.user_id
+
+    @staticmethod
+    async def _is_access_token_blacklisted(jti: str) -> bool:
+        """액세스 토큰 블랙리스트 확인 (Redis 오류 시 로깅 후 False)"""
+        try:
+            return await token_blacklist.contains(jti)
+        except RedisError as e:
+            AUTH_BLACKLIST_CHECK_FAILURES.inc()
+            logger.warning(
+                f"토큰 블랙리스트 확인 실패, 서명/만료 검증만으로 통과: jti={jti}, error={e}"
+            )
+            return False
+
     # - MARK: 토큰 검증
     async def verify_token(self, token: str, token_type: str | None = None) -> int:
         """토큰 검증 후 user_id 리턴, 실패시 도메인 에러 발생"""
+        payload = self._decode(token)
+        user_id = self._subject(payload)
+        jti: str | None = payload.get("jti")
+
         # 블랙리스트 확인
-        if await is_token_blacklisted(token):
+        if jti and await token_blacklist.contains(jti):
             raise TokenBlacklistedError()
 
-        try:
-            payload = jwt.decode(
-                token, settings.jwt.secret_key, algorithms=[settings.jwt.algorithm]
-            )
-            user_id: str | None = payload.get("sub")
-            jti: str | None = payload.get("jti")
-
-            if not user_id:
+        # 토큰 타입 검증 (지정된 경우)
+        if token_type:
+            actual_type = payload.get("type")
+            if actual_type != token_type:
                 raise TokenInvalidError()
 
-            # 토큰 타입 검증 (지정된 경우)
-            if token_type:
-                actual_type = payload.get("type")
-                if actual_type != token_type:
-                    raise TokenInvalidError()
-
-                # 리프레시 토큰인 경우 Redis에서 확인
-                if token_type == "refresh" and jti:
-                    redis = await get_redis_client()
-                    stored_user_id = await redis.get(f"refresh_token:{jti}")
-                    if stored_user_id is None:
-                        raise TokenInvalidError()  # Redis에 없으면 무효화된 토큰
-                    if stored_user_id != user_id:
-                        raise TokenInvalidError()  # user_id 불일치
+            # 리프레시 토큰인 경우 Redis에서 확인
+            if token_type == "refresh" and jti:
+                redis = await get_redis_client()
+                stored_user_id = await redis.get(_refresh_token_key(jti))
+                if stored_user_id is None:
+                    raise TokenInvalidError()  # Redis에 없으면 무효화된 토큰
+                if stored_user_id != str(user_id):
+                    raise TokenInvalidError()  # user_id 불일치
 
-            return int(user_id)
+        return user_id
 
+    def _decode(self, token: str) -> dict:
+        """서명 및 만료 검증 후 클레임 반환"""
+        try:
+            return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
         except ExpiredSignatureError:
             raise TokenExpiredError()
         except JWTError:
@@ -157,6 +364,66 @@ class TokenManager:
         except Exception:
             raise TokenDecodeError()
 
+    @staticmethod
+    def _subject(payload: dict) -> int:
+        """클레임에서 user_id 추출"""
+        user_id: str | None = payload.get("sub")
+        if not user_id:
+            raise TokenInvalidError()
+        try:
+            return int(user_id)
+        except (TypeError, ValueError):
+            raise TokenDecodeError()
+
+
+# - MARK: 리프레시 토큰 정리
+
+
+async def sweep_refresh_tokens() -> int:
+    """만료된 리프레시 토큰 인덱스를 정리하고 사용자별 보유 수 지표 갱신
+
+    이전 버전에서 TTL이 절대 시각(초)으로 저장되어 사실상 만료되지 않는
+    refresh_token:* 키도 최대 보관 기간으로 TTL을 보정합니다.
+
+    Returns:
+        살아 있는 리프레시 토큰 수
+    """
+    redis = await get_redis_client()
+    now = time.time()
+    max_ttl = TokenManager.REFRESH_TOKEN_TTL_SECONDS
+
+    total = 0
+    users = 0
+    max_per_user = 0
+    async for user_key in redis.scan_iter(
+        match=f"{REFRESH_TOKEN_USER_KEY_PREFIX}:*", count=500
+    ):
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(user_key, "-inf", now)
+            pipe.zcard(user_key)
+            _, count = await pipe.execute()
+        if count:
+            total += count
+            users += 1
+            max_per_user = max(max_per_user, count)
+
+    fixed = 0
+    async for token_key in redis.scan_iter(
+        match=f"{REFRESH_TOKEN_KEY_PREFIX}:*", count=500
+    ):
+        if await redis.ttl(token_key) > max_ttl:
+            await redis.expire(token_key, max_ttl)
+            fixed += 1
+
+    AUTH_LIVE_REFRESH_TOKENS.set(total)
+    AUTH_REFRESH_TOKEN_USERS.set(users)
+    AUTH_MAX_REFRESH_TOKENS_PER_USER.set(max_per_user)
+    logger.info(
+        f"리프레시 토큰 정리: live={total}, users={users}, "
+        f"max_per_user={max_per_user}, ttl_fixed={fixed}"
+    )
+    return total
+
 
 # - MARK: OAuth State 관리
 
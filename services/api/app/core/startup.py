@@ -11,15 +11,44 @@ async def startup_events():
     """애플리케이션 시작 시 실행되는 이벤트들"""
     print("애플리케이션 시작 이벤트 실행 중...")
 
+    # Redis 연결 확인 (풀 설정 오류를 첫 요청 전에 발견)
+    from app.deps.redis import ping_redis
+
+    await ping_redis()
+
     # WebSocketService에 Redis 설정
     await initialize_websocket_redis()
 
+    # 토큰 블랙리스트 필터 동기화 (Redis pub/sub)
+    # 이전 버전 키(blacklist:{token})는 요청을 받기 전에 jti 키로 이전
+    from app.core.token_blacklist import token_blacklist
+
+    await token_blacklist.migrate_legacy_entries()
+    asyncio.create_task(token_blacklist.run_sync())
+
+    # 아티스트 카탈로그 적재 및 버전 확인 (적재 전에는 DB에서 조회)
+    from app.features.artists.services.artist_catalog import artist_catalog
+
+    asyncio.create_task(artist_catalog.run_sync())
+
     # 스케줄러 설정 및 시작
     from app.core.scheduler import get_scheduler, start_scheduler
+    from app.features.auth.tasks import (
+        register_scheduler_tasks as register_auth_tasks,
+    )
+    from app.features.locations.tasks import (
+        register_scheduler_tasks as register_location_tasks,
+    )
     from app.features.reminders import register_scheduler_tasks
+    from app.features.system.tasks import (
+        register_scheduler_tasks as register_system_tasks,
+    )
 
     scheduler = get_scheduler()
     register_scheduler_tasks(scheduler)
+    register_auth_tasks(scheduler)
+    register_location_tasks(scheduler)
+    register_system_tasks(scheduler)
 
     asyncio.create_task(start_scheduler())
     print("스케줄러 시작됨:")
@@ -0,0 +1,63 @@
+"""업로드 파일 저장소
+
+settings.storage.backend에 따라 로컬 파일시스템 또는 S3 호환 스토리지를 사용합니다.
+애플리케이션 lifespan 종료 시 close_storage()로 정리합니다.
+"""
+
+import logging
+
+from app.core.config import settings
+from app.core.storage.base import (
+    PresignedUpload,
+    StorageBackend,
+    StorageError,
+    StorageObjectNotFoundError,
+    StoredObject,
+)
+from app.core.storage.local import LocalStorage
+
+logger = logging.getLogger(__name__)
+
+_storage: StorageBackend | None = None
+
+
+def _create_storage() -> StorageBackend:
+    config = settings.storage
+    if config.backend == "local":
+        return LocalStorage(settings.UPLOADS_DIR)
+    if config.backend == "s3":
+        if config.s3 is None:
+            raise ValueError("storage.backend가 s3이지만 storage.s3 설정이 없습니다")
+        from app.core.storage.s3 import S3Storage
+
+        return S3Storage(config.s3)
+    raise ValueError(f"지원하지 않는 저장소: {config.backend}")
+
+
+def get_storage() -> StorageBackend:
+    """저장소 반환 (최초 호출 시 생성)"""
+    global _storage
+    if _storage is None:
+        _storage = _create_storage()
+        logger.info(f"업로드 저장소: {_storage.name}")
+    return _storage
+
+
+async def close_storage() -> None:
+    """저장소 연결 종료"""
+    global _storage
+    if _storage is not None:
+        await _storage.close()
+        _storage = None
+
+
+__all__ = [
+    "LocalStorage",
+    "PresignedUpload",
+    "StorageBackend",
+    "StorageError",
+    "StorageObjectNotFoundError",
+    "StoredObject",
+    "close_storage",
+    "get_storage",
+]
@@ -0,0 +1,93 @@
+"""저장소 백엔드 인터페이스
+
+키는 저장소 루트 기준의 상대 경로입니다 (예: "cas/ab/ab12....jpg").
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+
+class StorageError(Exception):
+    """저장소 요청 실패"""
+
+
+class StorageObjectNotFoundError(StorageError):
+    """요청한 객체가 없음"""
+
+
+@dataclass
+class StoredObject:
+    """저장된 객체 정보"""
+
+    key: str
+    size: int
+    modified_at: datetime
+
+
+@dataclass
+class PresignedUpload:
+    """클라이언트 직접 업로드용 URL (method로 본문을 그대로 전송)"""
+
+    url: str
+    method: str = "PUT"
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class StorageBackend(ABC):
+    """업로드 파일 저장소"""
+
+    name: str
+
+    @abstractmethod
+    async def put_file(
+        self, key: str, path: Path, content_type: str | None = None
+    ) -> None:
+        """로컬 파일을 저장 (저장 후 원본 파일은 삭제될 수 있음)"""
+
+    @abstractmethod
+    async def put_bytes(
+        self, key: str, data: bytes, content_type: str | None = None
+    ) -> None:
+        """바이트를 저장"""
+
+    @abstractmethod
+    async def get_file(self, key: str, destination: Path, max_bytes: int) -> int:
+        """객체를 로컬 파일로 내려받고 크기 반환
+
+        객체가 없으면 StorageObjectNotFoundError, max_bytes 초과 시 ValueError.
+        """
+
+    @abstractmethod
+    async def stat(self, key: str) -> StoredObject | None:
+        """객체 정보 조회 (없으면 None)"""
+
+    @abstractmethod
+    async def touch(self, key: str) -> bool:
+        """수정 시각 갱신 (객체가 없으면 False)"""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """객체 삭제 (없으면 무시)"""
+
+    @abstractmethod
+    def list(self, prefix: str) -> AsyncIterator[StoredObject]:
+        """prefix로 시작하는 객체 목록"""
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """클라이언트가 객체를 받아갈 URL"""
+
+    @abstractmethod
+    def presign_put(
+        self, key: str, content_type: str, size: int, expires_in: int
+    ) -> PresignedUpload:
+        """클라이언트가 객체를 직접 올릴 수 있는 서명된 URL
+
+        선언한 크기(size)도 서명에 포함하므로 다른 크기의 본문은 거부됩니다.
+        """
+
+    async def close(self) -> None:
+        """연결 정리"""
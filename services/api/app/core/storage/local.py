@@ -0,0 +1,193 @@
+"""로컬 파일시스템 저장소
+
+UPLOADS_DIR 아래에 저장하고 nginx(/uploads, /stg/uploads)가 서빙합니다.
+직접 업로드는 S3의 pre-signed PUT을 흉내 내어 API 서버의 서명된 URL로 받습니다.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import os
+import time
+import urllib.parse
+import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.storage.base import (
+    PresignedUpload,
+    StorageBackend,
+    StorageObjectNotFoundError,
+    StoredObject,
+)
+
+# 직접 업로드 엔드포인트 (app.features.uploads.routers.upload_router)
+DIRECT_UPLOAD_PATH = "/api/v1/uploads/direct"
+
+
+def url_prefix() -> str:
+    """환경별 업로드 URL 경로 (staging: /stg/uploads, 그 외: /uploads)
+
+    앱의 StaticFiles 마운트와 nginx location 설정도 이 경로를 사용합니다.
+    """
+    if settings.ENVIRONMENT in ["staging", "stg"]:
+        return "/stg/uploads"
+    return "/uploads"
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 rename (서빙 중 반쯤 쓰인 파일이 보이지 않도록)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _move_file(source: Path, destination: Path) -> None:
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(source, destination)
+
+
+def _copy_file(source: Path, destination: Path, max_bytes: int) -> int:
+    try:
+        size = source.stat().st_size
+    except FileNotFoundError:
+        raise StorageObjectNotFoundError(f"객체가 없습니다: {source.name}")
+    if size > max_bytes:
+        raise ValueError("파일 크기가 제한을 초과했습니다")
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        while chunk := src.read(settings.upload.chunk_size):
+            dst.write(chunk)
+    return size
+
+
+def _stat(key: str, path: Path) -> StoredObject | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return StoredObject(
+        key=key,
+        size=stat.st_size,
+        modified_at=datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+    )
+
+
+def _touch(path: Path) -> bool:
+    try:
+        os.utime(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _scan(root: Path, prefix: str) -> list[StoredObject]:
+    objects: list[StoredObject] = []
+    base = root / prefix
+    if not base.exists():
+        return objects
+    for dirpath, _, filenames in os.walk(base):
+        for filename in filenames:
+            # 쓰는 중인 임시 파일(.xxx.tmp)은 제외
+            if filename.startswith("."):
+                continue
+            path = Path(dirpath) / filename
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            objects.append(
+                StoredObject(
+                    key=path.relative_to(root).as_posix(),
+                    size=stat.st_size,
+                    modified_at=datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+                )
+            )
+    return objects
+
+
+class LocalStorage(StorageBackend):
+    """로컬 파일시스템 저장소"""
+
+    name = "local"
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def path(self, key: str) -> Path:
+        """키에 해당하는 파일 경로 (루트 밖을 가리키는 키는 거부)"""
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"잘못된 저장소 키: {key}")
+        return path
+
+    async def put_file(
+        self, key: str, path: Path, content_type: str | None = None
+    ) -> None:
+        # 같은 파일시스템이면 복사 없이 rename
+        await asyncio.to_thread(_move_file, path, self.path(key))
+
+    async def put_bytes(
+        self, key: str, data: bytes, content_type: str | None = None
+    ) -> None:
+        await asyncio.to_thread(_write_file, self.path(key), data)
+
+    async def get_file(self, key: str, destination: Path, max_bytes: int) -> int:
+        return await asyncio.to_thread(
+            _copy_file, self.path(key), destination, max_bytes
+        )
+
+    async def stat(self, key: str) -> StoredObject | None:
+        return await asyncio.to_thread(_stat, key, self.path(key))
+
+    async def touch(self, key: str) -> bool:
+        return await asyncio.to_thread(_touch, self.path(key))
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self.path(key).unlink, True)
+
+    async def list(self, prefix: str) -> AsyncIterator[StoredObject]:
+        for stored in await asyncio.to_thread(_scan, self.root, prefix):
+            yield stored
+
+    def url(self, key: str) -> str:
+        return f"{url_prefix()}/{key}"
+
+    # MARK: - 직접 업로드 (서명된 URL)
+    def presign_put(
+        self, key: str, content_type: str, size: int, expires_in: int
+    ) -> PresignedUpload:
+        expires = int(time.time()) + expires_in
+        query = urllib.parse.urlencode(
+            {
+                "key": key,
+                "size": size,
+                "expires": expires,
+                "signature": self._signature(key, content_type, size, expires),
+            }
+        )
+        return PresignedUpload(
+            url=f"{settings.app.base_url}{DIRECT_UPLOAD_PATH}?{query}",
+            headers={"Content-Type": content_type, "Content-Length": str(size)},
+        )
+
+    def verify_presigned(
+        self, key: str, content_type: str, size: int, expires: int, signature: str
+    ) -> bool:
+        """직접 업로드 URL 서명/만료 확인 (선언한 크기 포함)"""
+        if expires < time.time():
+            return False
+        expected = self._signature(key, content_type, size, expires)
+        return hmac.compare_digest(expected, signature)
+
+    def _signature(self, key: str, content_type: str, size: int, expires: int) -> str:
+        message = f"PUT\n{key}\n{content_type}\n{size}\n{expires}".encode()
+        return hmac.new(
+            settings.jwt.secret_key.encode(), message, hashlib.sha256
+        ).hexdigest()
@@ -0,0 +1,358 @@
+"""S3 호환 오브젝트 스토리지 (AWS S3, MinIO 등)
+
+boto3 없이 공용 httpx 클라이언트(app.core.http_client)로 필요한 API
+(PUT/GET/HEAD/DELETE/Copy/ListObjectsV2)만 호출합니다.
+요청 서명은 AWS Signature Version 4, 버킷 주소는 path-style({endpoint}/{bucket}/{key})을
+사용하므로 로컬 MinIO에서도 그대로 동작합니다.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import urllib.parse
+import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import httpx
+
+from app.core.config import StorageS3Config, settings
+from app.core.http_client import get_http_client
+from app.core.storage.base import (
+    PresignedUpload,
+    StorageBackend,
+    StorageError,
+    StorageObjectNotFoundError,
+    StoredObject,
+)
+
+ALGORITHM = "AWS4-HMAC-SHA256"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+S3_NAMESPACE = {"s3": "http://s3.amazonaws.com/doc/2006-03-01/"}
+# touch(같은 키 복사) 시 유지할 객체 헤더 (x-amz-meta-*는 모두 유지)
+PRESERVED_HEADERS = frozenset(
+    {
+        "cache-control",
+        "content-disposition",
+        "content-encoding",
+        "content-language",
+        "content-type",
+        "expires",
+    }
+)
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+def _quote(value: str, safe: str = "-_.~") -> str:
+    return urllib.parse.quote(value, safe=safe)
+
+
+class S3Storage(StorageBackend):
+    """S3 호환 오브젝트 스토리지"""
+
+    name = "s3"
+
+    def __init__(self, config: StorageS3Config):
+        if not config.access_key or not config.secret_key:
+            raise ValueError("S3 접근 키(S3_ACCESS_KEY/S3_SECRET_KEY)가 설정되지 않았습니다")
+        self.config = config
+        self._endpoint = config.endpoint_url.rstrip("/")
+        self._host = urllib.parse.urlsplit(self._endpoint).netloc
+        self._public_base_url = (
+            config.public_base_url or f"{self._endpoint}/{config.bucket}"
+        ).rstrip("/")
+        # 커넥션 풀은 공용 클라이언트를 사용하고, 객체 전송용 타임아웃만 요청마다 지정
+        self._timeout = httpx.Timeout(
+            config.timeout, connect=settings.http_client.connect_timeout
+        )
+
+    # MARK: - Objects
+    async def put_file(
+        self, key: str, path: Path, content_type: str | None = None
+    ) -> None:
+        size = await asyncio.to_thread(lambda: path.stat().st_size)
+        headers = {"content-length": str(size)}
+        if content_type:
+            headers["content-type"] = content_type
+        response = await self._request(
+            "PUT", key, headers=headers, content=self._read_chunks(path)
+        )
+        self._raise_for_status(response, "업로드")
+
+    async def put_bytes(
+        self, key: str, data: bytes, content_type: str | None = None
+    ) -> None:
+        headers = {"content-type": content_type} if content_type else {}
+        response = await self._request("PUT", key, headers=headers, content=data)
+        self._raise_for_status(response, "업로드")
+
+    async def get_file(self, key: str, destination: Path, max_bytes: int) -> int:
+        size = 0
+        async with self._stream("GET", key) as response:
+            if response.status_code == 404:
+                raise StorageObjectNotFoundError(f"객체가 없습니다: {key}")
+            if response.status_code >= 300:
+                await response.aread()
+                self._raise_for_status(response, "다운로드")
+            buffer = await asyncio.to_thread(open, destination, "wb")
+            try:
+                async for chunk in response.aiter_bytes(settings.upload.chunk_size):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise ValueError("파일 크기가 제한을 초과했습니다")
+                    await asyncio.to_thread(buffer.write, chunk)
+            finally:
+                await asyncio.to_thread(buffer.close)
+        return size
+
+    async def stat(self, key: str) -> StoredObject | None:
+        response = await self._request("HEAD", key)
+        if response.status_code == 404:
+            return None
+        self._raise_for_status(response, "조회")
+        return StoredObject(
+            key=key,
+            size=int(response.headers.get("content-length", "0")),
+            modified_at=parsedate_to_datetime(response.headers["last-modified"]),
+        )
+
+    async def touch(self, key: str) -> bool:
+        # 같은 키로 복사하면서 메타데이터를 교체해야 LastModified가 갱신됨
+        # REPLACE는 지정하지 않은 헤더를 지우므로 기존 Content-Type/메타데이터를 그대로 전달
+        head = await self._request("HEAD", key)
+        if head.status_code == 404:
+            return False
+        self._raise_for_status(head, "조회")
+
+        headers = {
+            name: value
+            for name, value in head.headers.items()
+            if name in PRESERVED_HEADERS or name.startswith("x-amz-meta-")
+        }
+        headers["x-amz-copy-source"] = f"/{self.config.bucket}/{_quote(key, '/-_.~')}"
+        headers["x-amz-metadata-directive"] = "REPLACE"
+        response = await self._request("PUT", key, headers=headers)
+        if response.status_code == 404:
+            return False
+        self._raise_for_status(response, "갱신")
+        return True
+
+    async def delete(self, key: str) -> None:
+        response = await self._request("DELETE", key)
+        if response.status_code != 404:
+            self._raise_for_status(response, "삭제")
+
+    async def list(self, prefix: str) -> AsyncIterator[StoredObject]:
+        token: str | None = None
+        while True:
+            query = {"list-type": "2", "prefix": prefix}
+            if token:
+                query["continuation-token"] = token
+            response = await self._request("GET", None, query=query)
+            self._raise_for_status(response, "목록 조회")
+
+            root = ET.fromstring(response.content)
+            for item in root.iterfind("s3:Contents", S3_NAMESPACE):
+                yield StoredObject(
+                    key=item.findtext("s3:Key", "", S3_NAMESPACE),
+                    size=int(item.findtext("s3:Size", "0", S3_NAMESPACE)),
+                    modified_at=datetime.fromisoformat(
+                        item.findtext("s3:LastModified", "", S3_NAMESPACE).replace(
+                            "Z", "+00:00"
+                        )
+                    ),
+                )
+            if root.findtext("s3:IsTruncated", "false", S3_NAMESPACE) != "true":
+                break
+            token = root.findtext("s3:NextContinuationToken", None, S3_NAMESPACE)
+
+    def url(self, key: str) -> str:
+        return f"{self._public_base_url}/{_quote(key, '/-_.~')}"
+
+    def presign_put(
+        self, key: str, content_type: str, size: int, expires_in: int
+    ) -> PresignedUpload:
+        now = datetime.now(timezone.utc)
+        query = {
+            "X-Amz-Algorithm": ALGORITHM,
+            "X-Amz-Credential": f"{self.config.access_key}/{self._scope(now)}",
+            "X-Amz-Date": now.strftime("%Y%m%dT%H%M%SZ"),
+            "X-Amz-Expires": str(expires_in),
+            # Content-Length를 서명해 발급 시 선언한 크기와 다른 본문은 S3가 거부하도록 함
+            "X-Amz-SignedHeaders": "content-length;content-type;host",
+        }
+        headers = {
+            "content-length": str(size),
+            "content-type": content_type,
+            "host": self._host,
+        }
+        signature = self._signature("PUT", key, query, headers, UNSIGNED_PAYLOAD, now)
+        query["X-Amz-Signature"] = signature
+        return PresignedUpload(
+            url=f"{self._object_url(key)}?{self._canonical_query(query)}",
+            headers={"Content-Type": content_type, "Content-Length": str(size)},
+        )
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        return get_http_client()
+
+    async def close(self) -> None:
+        # 공용 클라이언트는 lifespan 종료 시 close_http_client()가 정리
+        return None
+
+    # MARK: - 요청 서명 (SigV4)
+    async def _request(
+        self,
+        method: str,
+        key: str | None,
+        query: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content=None,
+    ) -> httpx.Response:
+        request = self._build_request(method, key, query, headers, content)
+        return await self._client.send(request)
+
+    def _stream(self, method: str, key: str):
+        request = self._build_request(method, key, None, None, None)
+        return _StreamContext(self._client, request)
+
+    def _build_request(
+        self,
+        method: str,
+        key: str | None,
+        query: dict[str, str] | None,
+        headers: dict[str, str] | None,
+        content,
+    ) -> httpx.Request:
+        now = datetime.now(timezone.utc)
+        query = query or {}
+        signed_headers = {
+            **(headers or {}),
+            "host": self._host,
+            "x-amz-date": now.strftime("%Y%m%dT%H%M%SZ"),
+            "x-amz-content-sha256": UNSIGNED_PAYLOAD,
+        }
+        signed_headers.pop("content-length", None)
+        signature = self._signature(
+            method, key, query, signed_headers, UNSIGNED_PAYLOAD, now
+        )
+        request_headers = {
+            **(headers or {}),
+            **signed_headers,
+            "authorization": (
+                f"{ALGORITHM} Credential={self.config.access_key}/{self._scope(now)}, "
+                f"SignedHeaders={';'.join(sorted(signed_headers))}, "
+                f"Signature={signature}"
+            ),
+        }
+        url = self._object_url(key)
+        if query:
+            url = f"{url}?{self._canonical_query(query)}"
+        return self._client.build_request(
+            method, url, headers=request_headers, content=content, timeout=self._timeout
+        )
+
+    def _signature(
+        self,
+        method: str,
+        key: str | None,
+        query: dict[str, str],
+        headers: dict[str, str],
+        payload_hash: str,
+        now: datetime,
+    ) -> str:
+        names = sorted(name.lower() for name in headers)
+        lowered = {name.lower(): value for name, value in headers.items()}
+        canonical_request = "\n".join(
+            [
+                method,
+                self._canonical_uri(key),
+                self._canonical_query(query),
+                "".join(f"{name}:{lowered[name].strip()}\n" for name in names),
+                ";".join(names),
+                payload_hash,
+            ]
+        )
+        string_to_sign = "\n".join(
+            [
+                ALGORITHM,
+                now.strftime("%Y%m%dT%H%M%SZ"),
+                self._scope(now),
+                hashlib.sha256(canonical_request.encode()).hexdigest(),
+            ]
+        )
+        signing_key = _hmac(
+            _hmac(
+                _hmac(
+                    _hmac(
+                        f"AWS4{self.config.secret_key}".encode(),
+                        now.strftime("%Y%m%d"),
+                    ),
+                    self.config.region,
+                ),
+                "s3",
+            ),
+            "aws4_request",
+        )
+        return hmac.new(
+            signing_key, string_to_sign.encode(), hashlib.sha256
+        ).hexdigest()
+
+    def _scope(self, now: datetime) -> str:
+        return f"{now.strftime('%Y%m%d')}/{self.config.region}/s3/aws4_request"
+
+    def _canonical_uri(self, key: str | None) -> str:
+        uri = f"/{self.config.bucket}"
+        if key:
+            uri = f"{uri}/{_quote(key, '/-_.~')}"
+        return uri
+
+    @staticmethod
+    def _canonical_query(query: dict[str, str]) -> str:
+        return "&".join(
+            f"{_quote(name)}={_quote(value)}" for name, value in sorted(query.items())
+        )
+
+    def _object_url(self, key: str | None) -> str:
+        return f"{self._endpoint}{self._canonical_uri(key)}"
+
+    @staticmethod
+    async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+        buffer = await asyncio.to_thread(open, path, "rb")
+        try:
+            while chunk := await asyncio.to_thread(
+                buffer.read, settings.upload.chunk_size
+            ):
+                yield chunk
+        finally:
+            await asyncio.to_thread(buffer.close)
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response, action: str) -> None:
+        if response.status_code >= 300:
+            raise StorageError(
+                f"S3 {action} 실패: {response.status_code} {response.text[:200]}"
+            )
+
+
+class _StreamContext:
+    """서명된 요청을 스트리밍으로 보내고 응답을 닫는 컨텍스트"""
+
+    def __init__(self, client: httpx.AsyncClient, request: httpx.Request):
+        self._client = client
+        self._request = request
+        self._response: httpx.Response | None = None
+
+    async def __aenter__(self) -> httpx.Response:
+        self._response = await self._client.send(self._request, stream=True)
+        return self._response
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._response is not None:
+            await self._response.aclose()
@@ -0,0 +1,162 @@
+"""토큰 블랙리스트 (jti 기반)
+
+로그아웃 등으로 무효화된 토큰의 jti를 Redis에 저장하고,
+각 워커는 블룸 필터로 사본을 들고 있어 대부분의 요청을 Redis 없이 판정합니다.
+- 필터에 없음 → 블랙리스트 아님 (확정)
+- 필터에 있음 → Redis로 확인 (오탐 가능)
+다른 워커의 추가분은 Redis pub/sub으로 전달받고, 만료된 항목을 비우기 위해 주기적으로 재구성합니다.
+
+이전 버전은 토큰 원문을 키로 저장했으므로(blacklist:{token}) 시작 시와 재구성 때마다
+남아 있는 항목을 jti 키로 옮깁니다 (남은 TTL 유지).
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+
+from jose import JWTError, jwt
+
+from app.deps.redis import get_pubsub_redis_client, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis 키 / 채널
+BLACKLIST_KEY_PREFIX = "blacklist:jti"
+BLACKLIST_CHANNEL = "auth:blacklist"
+# 이전 버전 키 (blacklist:{token}, JWT는 항상 "eyJ"로 시작)
+LEGACY_BLACKLIST_PATTERN = "blacklist:eyJ*"
+
+# 블룸 필터 크기 (2^20 비트 = 128KB, 해시 7개 → 10만 건에서 오탐률 약 0.1%)
+BLOOM_BITS = 1 << 20
+BLOOM_HASHES = 7
+
+# 재구성 주기 / 재연결 대기 (초)
+REBUILD_INTERVAL = 60 * 60
+RECONNECT_DELAY = 5
+
+
+class BloomFilter:
+    """고정 크기 블룸 필터 (삭제 미지원)"""
+
+    def __init__(self, bits: int = BLOOM_BITS, hashes: int = BLOOM_HASHES):
+        self._bits = bits
+        self._hashes = hashes
+        self._array = bytearray(bits // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._hashes):
+            yield (h1 + i * h2) % self._bits
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._array[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._array[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class TokenBlacklist:
+    """jti 블랙리스트 (Redis + 워커별 블룸 필터)"""
+
+    def __init__(self):
+        self._filter = BloomFilter()
+        # 동기화 전에는 필터를 신뢰할 수 없으므로 항상 Redis 확인
+        self._ready = False
+
+    def _key(self, jti: str) -> str:
+        return f"{BLACKLIST_KEY_PREFIX}:{jti}"
+
+    # - MARK: 추가 / 확인
+    async def add(self, jti: str, ttl_seconds: int) -> None:
+        """jti를 블랙리스트에 추가하고 다른 워커에 알림"""
+        self._filter.add(jti)
+        redis = await get_redis_client()
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.setex(self._key(jti), max(ttl_seconds, 1), "1")
+            pipe.publish(BLACKLIST_CHANNEL, jti)
+            await pipe.execute()
+
+    async def contains(self, jti: str) -> bool:
+        """jti가 블랙리스트에 있는지 확인"""
+        if self._ready and jti not in self._filter:
+            return False
+        redis = await get_redis_client()
+        return await redis.exists(self._key(jti)) > 0
+
+    # - MARK: 이전 버전 키 이전
+    async def migrate_legacy_entries(self) -> int:
+        """blacklist:{token} 항목을 blacklist:jti:{jti}로 이전 (남은 TTL 유지)
+
+        Returns:
+            이전한 항목 수
+        """
+        redis = await get_redis_client()
+        migrated = 0
+        async for key in redis.scan_iter(match=LEGACY_BLACKLIST_PATTERN, count=1000):
+            ttl = await redis.ttl(key)
+            try:
+                jti = jwt.get_unverified_claims(key[len("blacklist:") :]).get("jti")
+            except JWTError:
+                jti = None
+            # 이전 버전도 항상 TTL과 함께 저장했으므로 TTL이 없으면(-1/-2) 버림
+            if jti and ttl > 0:
+                await redis.setex(self._key(jti), ttl, "1")
+                self._filter.add(jti)
+                migrated += 1
+            await redis.delete(key)
+        if migrated:
+            logger.info(f"이전 버전 토큰 블랙리스트 이전: {migrated}건")
+        return migrated
+
+    # - MARK: 동기화
+    async def _rebuild(self) -> None:
+        """Redis의 현재 블랙리스트로 필터 재구성 (만료된 jti 정리)"""
+        # 롤링 배포 중 이전 버전 워커가 기록한 항목도 반영
+        await self.migrate_legacy_entries()
+        redis = await get_redis_client()
+        bloom = BloomFilter()
+        count = 0
+        pattern = f"{BLACKLIST_KEY_PREFIX}:*"
+        async for key in redis.scan_iter(match=pattern, count=1000):
+            bloom.add(key[len(BLACKLIST_KEY_PREFIX) + 1 :])
+            count += 1
+        self._filter = bloom
+        self._ready = True
+        logger.info(f"토큰 블랙리스트 필터 재구성: {count}건")
+
+    async def run_sync(self) -> None:
+        """pub/sub 구독 및 주기적 재구성 (애플리케이션 시작 시 백그라운드 태스크로 실행)"""
+        while True:
+            try:
+                redis = await get_pubsub_redis_client()
+                async with redis.pubsub() as pubsub:
+                    # 재구성 중 추가되는 항목을 놓치지 않도록 구독을 먼저 시작
+                    await pubsub.subscribe(BLACKLIST_CHANNEL)
+                    await self._rebuild()
+                    rebuilt_at = time.monotonic()
+
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=1.0
+                        )
+                        if message is not None:
+                            self._filter.add(message["data"])
+                        if time.monotonic() - rebuilt_at >= REBUILD_INTERVAL:
+                            await self._rebuild()
+                            rebuilt_at = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._ready = False
+                logger.error(f"토큰 블랙리스트 동기화 오류, 재연결 대기: {e}")
+                await asyncio.sleep(RECONNECT_DELAY)
+
+
+token_blacklist = TokenBlacklist()
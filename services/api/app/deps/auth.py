@@ -1,11 +1,17 @@
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
 
-from app.core.config import settings
+from app.core.exceptions.token_exception import (
+    TokenBlacklistedError,
+    TokenDecodeError,
+    TokenExpiredError,
+    TokenInvalidError,
+)
+from app.core.read_replica import current_user_id
 from app.core.session import TokenManager
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 token_manger = TokenManager()
 
@@ -26,14 +32,19 @@ async def get_current_user_id(
     access_token = credentials.credentials
 
     try:
-        # Access Token 검증
-        payload = jwt.decode(access_token, settings.jwt.secret_key, algorithms=["HS256"])
-        subject = payload.get("sub")
-        if subject is None:
-            raise ValueError("Missing subject")
-        return int(subject)
-
-    except JWTError as exc:
+        # Access Token 검증 (검증된 토큰 캐시 + jti 블랙리스트)
+        user_id = await token_manger.verify_access_token(access_token)
+        # 읽기 라우팅(read-your-writes)에서 사용
+        current_user_id.set(user_id)
+        return user_id
+
+    except TokenBlacklistedError as exc:
+        # 로그아웃 등으로 무효화된 토큰은 갱신하지 않음
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Revoked token"
+        ) from exc
+
+    except (TokenExpiredError, TokenInvalidError, TokenDecodeError) as exc:
         # Access Token 만료 시 Refresh Token으로 갱신 시도
         if refresh_token:
             try:
@@ -46,9 +57,18 @@ async def get_current_user_id(
                 # Response Header에 새 토큰 추가 (미들웨어에서 처리)
                 request.state.new_access_token = new_access_token
 
+                current_user_id.set(user_id)
                 return user_id
 
-            except (HTTPException, TypeError, ValueError):
+            except (
+                HTTPException,
+                TypeError,
+                ValueError,
+                TokenExpiredError,
+                TokenInvalidError,
+                TokenDecodeError,
+                TokenBlacklistedError,
+            ):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Access token expired and refresh token is invalid",
@@ -59,7 +79,19 @@ async def get_current_user_id(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token"
         ) from exc
 
-    except (TypeError, ValueError) as exc:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
-        ) from exc
+
+async def get_optional_user_id(
+        credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+) -> int | None:
+    """Access Token이 유효하면 사용자 ID, 없거나 유효하지 않으면 None (갱신 시도 없음)"""
+    if credentials is None:
+        return None
+    try:
+        return await token_manger.verify_access_token(credentials.credentials)
+    except (
+        TokenBlacklistedError,
+        TokenExpiredError,
+        TokenInvalidError,
+        TokenDecodeError,
+    ):
+        return None
@@ -3,10 +3,13 @@
 import logging
 from collections.abc import AsyncGenerator
 
+from fastapi import Depends
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
+from app.core.read_replica import read_replica_router
+from app.deps.auth import get_optional_user_id
 
 logger = logging.getLogger(__name__)
 
@@ -29,3 +32,12 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             logger.debug("Closing database session")
+
+
+async def get_read_session(
+    user_id: int | None = Depends(get_optional_user_id),
+) -> AsyncGenerator[AsyncSession, None]:
+    """조회 전용 세션 (가능하면 읽기 복제본, 최근 쓰기/복제 지연 시 primary)"""
+    session_factory = await read_replica_router.session_factory(user_id)
+    async with session_factory() as session:
+        yield session
@@ -2,6 +2,9 @@
 
 경로 패턴: container.{feature}_feature.{use_case}()
 예시: container.auth_feature.oauth_use_case()
+
+세션/Redis는 RequestScope로 바인딩합니다 (전역 override 없음).
+provider는 async 함수로 두어 FastAPI가 스레드풀을 거치지 않고 이벤트 루프에서 바로 호출합니다.
 """
 
 from fastapi import Depends
@@ -9,231 +12,266 @@ from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.container import container
+from app.core.containers.request_scope import RequestScope
 from app.core.database import get_session
+from app.deps.database import get_read_session
 from app.deps.redis import get_redis
 
 
-def get_fcm_service():
+async def get_fcm_service():
     """FCM Service 싱글톤 반환"""
     return container.core.fcm_service()
 
 
-def get_random_profile_image_service():
+async def get_random_profile_image_service():
     """랜덤 프로필 이미지 서비스 의존성 주입"""
     return container.core.random_profile_image_service()
 
 
 # Artist Use Cases
-def get_artist_use_case(session: AsyncSession = Depends(get_session)):
+async def get_artist_use_case(session: AsyncSession = Depends(get_read_session)):
     """Get Artist UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.artist_feature.get_artist_use_case()
 
 
-def get_artists_use_case(session: AsyncSession = Depends(get_session)):
+async def get_artists_use_case(session: AsyncSession = Depends(get_read_session)):
     """Get Artists UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.artist_feature.get_artists_use_case()
 
 
-def get_schedule_by_id_use_case(session: AsyncSession = Depends(get_session)):
+async def get_schedule_by_id_use_case(session: AsyncSession = Depends(get_read_session)):
     """Get Schedule By Id UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.artist_feature.get_schedule_by_id_use_case()
 
 
-def get_schedules_use_case(session: AsyncSession = Depends(get_session)):
+# 월별 스케줄 버킷은 캐시 미스 때 읽은 값을 MONTH_TTL 동안 저장하므로
+# 복제 지연이 캐시에 굳지 않도록 primary에서 읽음 (대부분의 요청은 캐시 적중)
+async def get_schedules_use_case(session: AsyncSession = Depends(get_session)):
     """Get Schedules UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.artist_feature.get_schedules_use_case()
 
 
-def create_artist_suggestion_use_case(session: AsyncSession = Depends(get_session)):
+async def get_schedule_months_use_case(
+    session: AsyncSession = Depends(get_session),
+):
+    """Get Schedule Months UseCase 생성"""
+    with RequestScope(session):
+        return container.artist_feature.get_schedule_months_use_case()
+
+
+async def create_artist_suggestion_use_case(session: AsyncSession = Depends(get_session)):
     """Create Artist Suggestion UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.artist_feature.create_artist_suggestion_use_case()
 
 
-def get_suggestion_by_id_use_case(session: AsyncSession = Depends(get_session)):
+async def get_suggestion_by_id_use_case(session: AsyncSession = Depends(get_session)):
     """Get Suggestion By Id UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.artist_feature.get_suggestion_by_id_use_case()
 
 
-def get_suggestions_use_case(session: AsyncSession = Depends(get_session)):
+async def get_suggestions_use_case(session: AsyncSession = Depends(get_session)):
     """Get Suggestions UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.artist_feature.get_suggestions_use_case()
 
 
-def get_artist_ranking_use_case(session: AsyncSession = Depends(get_session)):
+async def get_artist_ranking_use_case(session: AsyncSession = Depends(get_read_session)):
     """Get Artist Ranking UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.artist_feature.get_artist_ranking_use_case()
 
 
-def get_suggestions_by_artist_name_use_case(
+async def get_suggestions_by_artist_name_use_case(
     session: AsyncSession = Depends(get_session),
 ):
     """Get Suggestions By Artist Name UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.artist_feature.get_suggestions_by_artist_name_use_case()
 
 
 # User Use Cases
-def get_user_use_case(session: AsyncSession = Depends(get_session)):
+async def get_user_use_case(session: AsyncSession = Depends(get_session)):
     """User UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.user_feature.user_use_case()
 
 
-def get_user_artist_use_case(session: AsyncSession = Depends(get_session)):
+async def get_user_artist_use_case(session: AsyncSession = Depends(get_session)):
     """User Artist UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.user_feature.user_artist_use_case()
 
 
-def get_block_user_use_case(session: AsyncSession = Depends(get_session)):
+async def get_block_user_use_case(session: AsyncSession = Depends(get_session)):
     """Block User UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.user_feature.block_user_use_case()
 
 
-def get_user_notification_use_case(session: AsyncSession = Depends(get_session)):
+async def get_user_notification_use_case(session: AsyncSession = Depends(get_session)):
     """User Notification UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.user_feature.user_notification_use_case()
 
 
 # Tendency
-def get_tendency_use_case(session: AsyncSession = Depends(get_session)):
+async def get_tendency_use_case(session: AsyncSession = Depends(get_session)):
     """Tendency UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.tendency_feature.tendency_use_case()
 
 
 # Session
-def get_session_use_case(session: AsyncSession = Depends(get_session)):
+async def get_session_use_case(session: AsyncSession = Depends(get_session)):
     """Session UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.session_feature.session_use_case()
 
 
 # Report
-def get_report_use_case(session: AsyncSession = Depends(get_session)):
+async def get_report_use_case(session: AsyncSession = Depends(get_session)):
     """Report UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.report_feature.report_use_case()
 
 
 # Location
-def get_location_use_case(session: AsyncSession = Depends(get_session)):
+async def get_location_use_case(session: AsyncSession = Depends(get_session)):
     """Location UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.location_feature.location_use_case()
 
 
+# Upload
+async def get_upload_use_case():
+    """Upload UseCase 생성"""
+    return container.upload_feature.upload_use_case()
+
+
 # Notification
-def get_notification_use_case(session: AsyncSession = Depends(get_session)):
+async def get_notification_use_case(session: AsyncSession = Depends(get_session)):
     """Notification UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
+        return container.notification_feature.notification_use_case()
+
+
+async def get_notification_query_use_case(
+    session: AsyncSession = Depends(get_read_session),
+):
+    """Notification UseCase 생성 (조회 전용, 읽기 복제본)"""
+    with RequestScope(session):
         return container.notification_feature.notification_use_case()
 
 
 # Follow
-def get_follow_use_case(session: AsyncSession = Depends(get_session)):
+async def get_follow_use_case(session: AsyncSession = Depends(get_session)):
     """Follow UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
+        return container.follow_feature.follow_use_case()
+
+
+async def get_follow_query_use_case(session: AsyncSession = Depends(get_read_session)):
+    """Follow UseCase 생성 (조회 전용, 읽기 복제본)"""
+    with RequestScope(session):
         return container.follow_feature.follow_use_case()
 
 
 # OAuth UseCase
-def get_oauth_use_case(session: AsyncSession = Depends(get_session)):
+async def get_oauth_use_case(session: AsyncSession = Depends(get_session)):
     """OAuth UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.auth_feature.oauth_use_case()
 
 
 # Pod Services & UseCases
-def get_like_notification_service(session: AsyncSession = Depends(get_session)):
+async def get_like_notification_service(session: AsyncSession = Depends(get_session)):
     """Like Notification Service 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.pod_feature.like_notification_service()
 
 
-def get_review_notification_service(session: AsyncSession = Depends(get_session)):
+async def get_review_notification_service(session: AsyncSession = Depends(get_session)):
     """Review Notification Service 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.pod_feature.review_notification_service()
 
 
-def get_review_dto_service(session: AsyncSession = Depends(get_session)):
+async def get_review_dto_service(session: AsyncSession = Depends(get_session)):
     """Review DTO Service 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.pod_feature.review_dto_service()
 
 
-def get_application_notification_service(session: AsyncSession = Depends(get_session)):
+async def get_application_notification_service(session: AsyncSession = Depends(get_session)):
     """Application Notification Service 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.pod_feature.application_notification_service()
 
 
-def get_application_dto_service(session: AsyncSession = Depends(get_session)):
+async def get_application_dto_service(session: AsyncSession = Depends(get_session)):
     """Application DTO Service 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.pod_feature.application_dto_service()
 
 
-def get_application_use_case(session: AsyncSession = Depends(get_session)):
+async def get_application_use_case(session: AsyncSession = Depends(get_session)):
     """Application UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.pod_feature.application_use_case()
 
 
-def get_like_use_case(session: AsyncSession = Depends(get_session)):
+async def get_like_use_case(session: AsyncSession = Depends(get_session)):
     """Like UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.pod_feature.like_use_case()
 
 
-def get_review_use_case(session: AsyncSession = Depends(get_session)):
+async def get_review_use_case(session: AsyncSession = Depends(get_session)):
     """Review UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.pod_feature.review_use_case()
 
 
-def get_pod_query_use_case(session: AsyncSession = Depends(get_session)):
+async def get_pod_query_use_case(session: AsyncSession = Depends(get_read_session)):
     """Pod Query UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session):
         return container.pod_feature.pod_query_use_case()
 
 
-def get_pod_use_case(session: AsyncSession = Depends(get_session)):
+async def get_pod_use_case(
+    session: AsyncSession = Depends(get_session),
+    redis: Redis = Depends(get_redis),
+):
     """Pod UseCase 생성"""
-    with container.core.session.override(session):
+    with RequestScope(session, redis):
         return container.pod_feature.pod_use_case()
 
 
-def get_websocket_service():
+async def get_websocket_service():
     """WebSocket Service 싱글톤 반환"""
     return container.core.websocket_service()
 
 
 # Chat UseCases
-def get_chat_use_case(
+async def get_chat_use_case(
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),
 ):
     """Chat UseCase 생성"""
-    with container.core.session.override(session), container.core.redis.override(redis):
+    with RequestScope(session, redis):
         return container.chat_feature.chat_use_case()
 
 
-def get_chat_room_use_case(
+async def get_chat_room_use_case(
     session: AsyncSession = Depends(get_session),
     redis: Redis = Depends(get_redis),
 ):
     """ChatRoom UseCase 생성"""
-    with container.core.session.override(session), container.core.redis.override(redis):
+    with RequestScope(session, redis):
         return container.chat_feature.chat_room_use_case()
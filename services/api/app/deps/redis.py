@@ -1,27 +1,97 @@
-"""Redis 클라이언트 관리 및 의존성 주입"""
+"""Redis 클라이언트 관리 및 의존성 주입
 
+요청/응답용과 pub/sub 구독용 클라이언트는 별도 풀을 사용합니다.
+구독은 연결을 계속 점유하므로, 같은 풀을 쓰면 일반 명령이 쓸 연결이 줄어듭니다.
+"""
+
+import asyncio
+import logging
+import time
 from collections.abc import AsyncGenerator
 
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from app.core.config import settings
+from app.core.metrics import (
+    REDIS_POOL_IN_USE,
+    REDIS_POOL_TIMEOUTS,
+    REDIS_POOL_WAIT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
 
 _redis_client: Redis | None = None
+_pubsub_client: Redis | None = None
+
+
+class InstrumentedBlockingConnectionPool(BlockingConnectionPool):
+    """연결 획득 대기 시간을 기록하는 블로킹 풀 (가득 차면 pool_timeout까지 대기)"""
+
+    def __init__(self, *args, pool_name: str = "default", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_name = pool_name
+        REDIS_POOL_IN_USE.labels(pool=pool_name).set_function(
+            lambda: len(getattr(self, "_in_use_connections", ()))
+        )
+
+    async def get_connection(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await super().get_connection(*args, **kwargs)
+        except RedisConnectionError as e:
+            if isinstance(e.__cause__, asyncio.TimeoutError):
+                REDIS_POOL_TIMEOUTS.labels(pool=self.pool_name).inc()
+            raise
+        finally:
+            REDIS_POOL_WAIT_SECONDS.labels(pool=self.pool_name).observe(
+                time.perf_counter() - started
+            )
+
+
+def _create_client(
+    pool_name: str, max_connections: int, socket_timeout: float | None
+) -> Redis:
+    config = settings.redis
+    pool = InstrumentedBlockingConnectionPool.from_url(
+        config.get_url(),
+        pool_name=pool_name,
+        max_connections=max_connections,
+        timeout=config.pool_timeout,
+        socket_timeout=socket_timeout,
+        socket_connect_timeout=config.socket_connect_timeout,
+        health_check_interval=config.health_check_interval,
+        encoding="utf-8",
+        decode_responses=True,
+    )
+    return Redis.from_pool(pool)
 
 
 async def get_redis_client() -> Redis:
     """Redis 클라이언트 반환 (일반 함수에서 직접 사용)"""
     global _redis_client
     if _redis_client is None:
-        _redis_client = Redis.from_url(
-            settings.redis.get_url(),
-            encoding="utf-8",
-            decode_responses=True,
-            max_connections=10,
+        _redis_client = _create_client(
+            "default",
+            settings.redis.max_connections,
+            settings.redis.socket_timeout,
         )
     return _redis_client
 
 
+async def get_pubsub_redis_client() -> Redis:
+    """pub/sub 구독용 Redis 클라이언트 반환
+
+    구독 연결은 메시지를 기다리며 오래 유휴 상태로 있으므로 socket_timeout을 두지 않습니다.
+    """
+    global _pubsub_client
+    if _pubsub_client is None:
+        _pubsub_client = _create_client(
+            "pubsub", settings.redis.pubsub_max_connections, None
+        )
+    return _pubsub_client
+
+
 async def get_redis() -> AsyncGenerator[Redis, None]:
     """Redis 의존성 주입용 (FastAPI Depends에서 사용)"""
     client = await get_redis_client()
@@ -31,9 +101,27 @@ async def get_redis() -> AsyncGenerator[Redis, None]:
         pass
 
 
+async def ping_redis() -> bool:
+    """시작 시 연결 확인 (실패해도 애플리케이션은 계속 실행)"""
+    try:
+        client = await get_redis_client()
+        await client.ping()
+        logger.info(
+            f"Redis 연결 확인: {settings.redis.host}:{settings.redis.port}"
+            f"/{settings.redis.db}"
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Redis 연결 실패: {e}")
+        return False
+
+
 async def close_redis():
     """Redis 연결 종료"""
-    global _redis_client
+    global _redis_client, _pubsub_client
     if _redis_client is not None:
-        await _redis_client.close()
+        await _redis_client.aclose()
         _redis_client = None
+    if _pubsub_client is not None:
+        await _pubsub_client.aclose()
+        _pubsub_client = None
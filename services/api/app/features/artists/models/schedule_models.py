@@ -3,7 +3,16 @@
 import enum
 
 from app.core.database import Base
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -66,6 +75,11 @@ class ArtistSchedule(Base):
         "ScheduleContent", back_populates="schedule", cascade="all, delete-orphan"
     )
 
+    # 아티스트별 월 캘린더 조회 (artist_id = ? AND start_time 범위)
+    __table_args__ = (
+        Index("ix_artist_schedules_artist_id_start_time", "artist_id", "start_time"),
+    )
+
     def __repr__(self):
         return f"<ArtistSchedule(id={self.id}, artist='{self.artist_ko_name}', title='{self.title}')>"
 
@@ -1,18 +1,34 @@
 from typing import List
 
 from app.features.artists.models import Artist, ArtistUnit
+from app.features.artists.services.artist_catalog import (
+    ArtistCatalog,
+    CatalogArtist,
+    CatalogUnit,
+    artist_catalog,
+)
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 
 class ArtistRepository:
-    def __init__(self, session: AsyncSession):
+    """아티스트 조회 (카탈로그 스냅샷이 있으면 메모리에서, 없으면 DB에서)
+
+    스냅샷에서 반환하는 CatalogArtist는 Artist와 같은 속성명을 가진 읽기 전용 객체입니다.
+    """
+
+    def __init__(self, session: AsyncSession, catalog: ArtistCatalog | None = None):
         self._session = session
+        self._catalog = catalog or artist_catalog
 
     # - MARK: unit_id로 아티스트 조회
-    async def get_by_unit_id(self, unit_id: int) -> Artist | None:
+    async def get_by_unit_id(self, unit_id: int) -> Artist | CatalogArtist | None:
         """unit_id로 아티스트 찾기"""
+        snapshot = self._catalog.snapshot
+        if snapshot is not None:
+            return snapshot.artists_by_unit_id.get(unit_id)
+
         result = await self._session.execute(
             select(Artist)
             .options(selectinload(Artist.images), selectinload(Artist.names))
@@ -21,8 +37,12 @@ class ArtistRepository:
         return result.scalar_one_or_none()
 
     # - MARK: artist_id로 아티스트 조회
-    async def get_by_id(self, artist_id: int) -> Artist | None:
+    async def get_by_id(self, artist_id: int) -> Artist | CatalogArtist | None:
         """artist_id로 아티스트 찾기"""
+        snapshot = self._catalog.snapshot
+        if snapshot is not None:
+            return snapshot.artists.get(artist_id)
+
         result = await self._session.execute(
             select(Artist)
             .options(selectinload(Artist.images), selectinload(Artist.names))
@@ -31,8 +51,12 @@ class ArtistRepository:
         return result.scalar_one_or_none()
 
     # - MARK: 이름으로 아티스트 조회
-    async def get_by_name(self, name: str) -> Artist | None:
+    async def get_by_name(self, name: str) -> Artist | CatalogArtist | None:
         """이름으로 아티스트 찾기"""
+        snapshot = self._catalog.snapshot
+        if snapshot is not None:
+            return snapshot.artists_by_name.get(name)
+
         result = await self._session.execute(
             select(Artist)
             .options(selectinload(Artist.images), selectinload(Artist.names))
@@ -41,11 +65,16 @@ class ArtistRepository:
         return result.scalar_one_or_none()
 
     # - MARK: ID 목록으로 아티스트 조회
-    async def get_by_ids(self, artist_ids: List[int]) -> List[Artist]:
+    async def get_by_ids(self, artist_ids: List[int]) -> List[Artist | CatalogArtist]:
         """ID 목록으로 아티스트 목록 조회"""
         if not artist_ids:
             return []
-        
+
+        snapshot = self._catalog.snapshot
+        if snapshot is not None:
+            found = (snapshot.artists.get(artist_id) for artist_id in artist_ids)
+            return [artist for artist in found if artist is not None]
+
         # 관계 데이터를 미리 로드하여 lazy loading 방지
         query = (
             select(Artist)
@@ -60,8 +89,19 @@ class ArtistRepository:
     # - MARK: 아티스트 목록 조회
     async def get_all(
         self, page: int = 1, size: int = 20, is_active: bool = True
-    ) -> tuple[List[Artist], int]:
+    ) -> tuple[List[Artist | CatalogArtist], int]:
         """아티스트 목록 조회 (ArtistUnit을 기준으로 각 unit의 artist_id에 해당하는 대표 아티스트만 반환)"""
+        snapshot = self._catalog.snapshot
+        if snapshot is not None:
+            units = snapshot.units_by_active.get(is_active, ())
+            offset = (page - 1) * size
+            artists = [
+                snapshot.artists[unit.artist_id]
+                for unit in units[offset : offset + size]
+                if unit.artist_id in snapshot.artists
+            ]
+            return artists, len(units)
+
         # ArtistUnit을 기준으로 조회 (is_active 필터 적용)
         artist_units, total_count = await self.get_artist_units_with_names(
             page=page, size=size, is_active=is_active
@@ -99,8 +139,14 @@ class ArtistRepository:
     # - MARK: ArtistUnit 목록 조회
     async def get_artist_units_with_names(
         self, page: int = 1, size: int = 20, is_active: bool = True
-    ) -> tuple[List[ArtistUnit], int]:
+    ) -> tuple[List[ArtistUnit | CatalogUnit], int]:
         """ArtistUnit과 연결된 Artist 이름을 조회"""
+        snapshot = self._catalog.snapshot
+        if snapshot is not None:
+            units = snapshot.units_by_active.get(is_active, ())
+            offset = (page - 1) * size
+            return list(units[offset : offset + size]), len(units)
+
         # ArtistUnit 조회 (artist_id가 있는 것만)
         query = (
             select(ArtistUnit)
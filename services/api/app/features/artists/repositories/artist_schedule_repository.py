@@ -1,9 +1,18 @@
+from datetime import datetime, timezone
+
 from app.features.artists.models import ArtistSchedule
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 
+def month_start_millis(year: int, month: int) -> int:
+    """해당 월 1일 0시(UTC)의 epoch 밀리초 (start_time과 같은 단위)"""
+    # 13월 → 다음 해 1월
+    year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+    return int(datetime(year, month, 1, tzinfo=timezone.utc).timestamp() * 1000)
+
+
 class ArtistScheduleRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -33,24 +42,33 @@ class ArtistScheduleRepository:
         schedule_type: int | None = None,
     ) -> list[ArtistSchedule]:
         """스케줄 목록 조회 (월별)"""
-        from datetime import datetime
-
-        # 해당 월의 시작일과 종료일 계산
-        start_of_month = datetime(year, month, 1)
-        if month == 12:
-            end_of_month = datetime(year + 1, 1, 1)
-        else:
-            end_of_month = datetime(year, month + 1, 1)
+        return await self.get_schedules_in_range(
+            start_time=month_start_millis(year, month),
+            end_time=month_start_millis(year, month + 1),
+            artist_id=artist_id,
+            unit_id=unit_id,
+            schedule_type=schedule_type,
+        )
 
+    # - MARK: 기간별 스케줄 목록 조회
+    async def get_schedules_in_range(
+        self,
+        start_time: int,
+        end_time: int,
+        artist_id: int | None = None,
+        unit_id: int | None = None,
+        schedule_type: int | None = None,
+    ) -> list[ArtistSchedule]:
+        """start_time이 [start_time, end_time) 범위인 스케줄 조회 (밀리초, 시간순)"""
         # 기본 쿼리
         query = select(ArtistSchedule).options(
             selectinload(ArtistSchedule.members), selectinload(ArtistSchedule.contents)
         )
 
-        # 필터 조건 추가
+        # 필터 조건 추가 (artist_id + start_time은 복합 인덱스 사용)
         conditions = [
-            ArtistSchedule.start_time >= start_of_month,
-            ArtistSchedule.start_time < end_of_month,
+            ArtistSchedule.start_time >= start_time,
+            ArtistSchedule.start_time < end_time,
         ]
         if artist_id is not None:
             conditions.append(ArtistSchedule.artist_id == artist_id)
@@ -62,9 +80,7 @@ class ArtistScheduleRepository:
         query = query.where(and_(*conditions))
 
         # 정렬 (시간순)
-        query = query.order_by(ArtistSchedule.start_time)
+        query = query.order_by(ArtistSchedule.start_time, ArtistSchedule.id)
 
         result = await self._session.execute(query)
-        schedules = list(result.scalars().all())
-
-        return schedules
+        return list(result.scalars().all())
@@ -1,11 +1,16 @@
 from fastapi import Depends, Query
 
 from app.common.schemas import BaseResponse
-from app.deps.providers import get_schedule_by_id_use_case, get_schedules_use_case
+from app.deps.providers import (
+    get_schedule_by_id_use_case,
+    get_schedule_months_use_case,
+    get_schedules_use_case,
+)
 from app.features.artists.routers._base import ArtistSchedulerController
-from app.features.artists.schemas import ArtistScheduleDto
+from app.features.artists.schemas import ArtistScheduleDto, ArtistScheduleMonthDto
 from app.features.artists.use_cases.artist_schedule_use_cases import (
     GetScheduleByIdUseCase,
+    GetScheduleMonthsUseCase,
     GetSchedulesUseCase,
 )
 
@@ -29,6 +34,27 @@ class ArtistScheduleRouter:
         result = await use_case.execute(year, month, artist_id, unit_id, schedule_type)
         return BaseResponse.ok(result, message_ko="아티스트 스케줄 목록 조회 성공")
 
+    # /{schedule_id}보다 먼저 등록해야 "months"가 ID로 해석되지 않음
+    @staticmethod
+    @ArtistSchedulerController.ROUTER.get(
+        "/months",
+        response_model=BaseResponse[list[ArtistScheduleMonthDto]],
+        description="아티스트 스케줄 여러 달 조회 (year-month부터 months개월, 월별로 묶어서 반환)",
+    )
+    async def get_artist_schedule_months(
+            year: int = Query(..., ge=2000, le=2100, description="시작 년도"),
+            month: int = Query(..., ge=1, le=12, description="시작 월 (1~12)"),
+            months: int = Query(3, ge=1, le=6, description="조회할 개월 수"),
+            artist_id: int | None = Query(None, description="아티스트 ID 필터"),
+            unit_id: int | None = Query(None, description="아티스트 유닛 ID 필터"),
+            schedule_type: int | None = Query(None, description="스케줄 유형 필터"),
+            use_case: GetScheduleMonthsUseCase = Depends(get_schedule_months_use_case),
+    ):
+        result = await use_case.execute(
+            year, month, months, artist_id, unit_id, schedule_type
+        )
+        return BaseResponse.ok(result, message_ko="아티스트 스케줄 월별 조회 성공")
+
     @staticmethod
     @ArtistSchedulerController.ROUTER.get(
         "/{schedule_id}",
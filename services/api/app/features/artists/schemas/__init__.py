@@ -13,6 +13,7 @@ from .artist_schemas import (
 from .schedule_schemas import (
     ArtistScheduleCreateRequest,
     ArtistScheduleDto,
+    ArtistScheduleMonthDto,
     ScheduleContentCreateRequest,
     ScheduleContentDto,
     ScheduleMemberCreateRequest,
@@ -37,6 +38,7 @@ __all__ = [
     "UpdateArtistImageRequest",
     # 아티스트 스케줄
     "ArtistScheduleDto",
+    "ArtistScheduleMonthDto",
     "ArtistScheduleCreateRequest",
     "ScheduleMemberDto",
     "ScheduleMemberCreateRequest",
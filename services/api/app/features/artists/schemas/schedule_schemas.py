@@ -89,6 +89,18 @@ class ArtistScheduleDto(BaseModel):
     }
 
 
+class ArtistScheduleMonthDto(BaseModel):
+    """월별 아티스트 스케줄 DTO"""
+
+    year: int = Field(description="년도")
+    month: int = Field(description="월 (1~12)")
+    schedules: List[ArtistScheduleDto] = Field(default_factory=list)
+
+    model_config = {
+        "populate_by_name": True,
+    }
+
+
 class ArtistScheduleCreateRequest(BaseModel):
     """아티스트 스케줄 생성 요청"""
 
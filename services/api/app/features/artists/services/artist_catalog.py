@@ -0,0 +1,220 @@
+"""아티스트 카탈로그 (워커별 메모리 스냅샷)
+
+유닛/아티스트/이름/이미지는 스크래핑 서비스의 동기화(sync_from_blip_and_mvp) 때만 바뀌므로
+각 워커가 전체를 메모리에 올려두고 ArtistRepository의 조회를 DB 없이 처리합니다.
+- 동기화가 끝나면 스크래핑 서비스가 Redis 버전 키를 올리고, 워커는 주기적으로 버전을 확인해 재적재
+- 버전 키 갱신이 누락되는 경우를 대비해 일정 주기마다 무조건 재적재
+- 적재 전(시작 직후, Redis/DB 오류)에는 snapshot이 None이라 Repository가 DB로 폴백
+
+스냅샷은 불변 객체이고 통째로 교체하므로 조회 중에 재적재되어도 일관된 결과를 반환합니다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+from shared.utils.cache_version import ARTIST_CATALOG_VERSION_KEY
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.database import get_batch_session
+from app.deps.redis import get_redis_client
+from app.features.artists.models import Artist, ArtistUnit
+
+logger = logging.getLogger(__name__)
+
+# 버전 확인 / 무조건 재적재 / 오류 후 재시도 주기 (초)
+VERSION_CHECK_INTERVAL = 10
+RELOAD_INTERVAL = 60 * 60
+RETRY_DELAY = 5
+
+
+# MARK: - 스냅샷 구조 (ORM 모델과 같은 속성명 → ArtistDto.model_validate 그대로 사용)
+@dataclass(frozen=True, slots=True)
+class CatalogImage:
+    id: int
+    artist_id: int
+    path: str | None
+    file_id: str | None
+    is_animatable: bool
+    size: str | None
+    unit_id: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogName:
+    id: int
+    artist_id: int
+    code: str
+    name: str
+    unit_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogArtist:
+    id: int
+    name: str
+    unit_id: int
+    blip_unit_id: int
+    blip_artist_id: int | None
+    images: tuple[CatalogImage, ...]
+    names: tuple[CatalogName, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogUnit:
+    id: int
+    name: str
+    artist_id: int
+    type: str | None
+    is_filter: bool
+    is_active: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogSnapshot:
+    """카탈로그 스냅샷 (version: 적재 시점의 Redis 버전)"""
+
+    version: int
+    artists: dict[int, CatalogArtist]
+    artists_by_unit_id: dict[int, CatalogArtist]
+    artists_by_name: dict[str, CatalogArtist]
+    # artist_id가 있는 유닛을 is_active별로 id 순 정렬 (페이지네이션은 슬라이스)
+    units_by_active: dict[bool, tuple[CatalogUnit, ...]]
+
+
+def _to_catalog_artist(artist: Artist) -> CatalogArtist:
+    return CatalogArtist(
+        id=artist.id,
+        name=artist.name,
+        unit_id=artist.unit_id,
+        blip_unit_id=artist.blip_unit_id,
+        blip_artist_id=artist.blip_artist_id,
+        images=tuple(
+            CatalogImage(
+                id=image.id,
+                artist_id=image.artist_id,
+                path=image.path,
+                file_id=image.file_id,
+                is_animatable=bool(image.is_animatable),
+                size=image.size,
+                unit_id=image.unit_id,
+            )
+            for image in sorted(artist.images, key=lambda image: image.id)
+        ),
+        names=tuple(
+            CatalogName(
+                id=name.id,
+                artist_id=name.artist_id,
+                code=name.code,
+                name=name.name,
+                unit_id=name.unit_id,
+            )
+            for name in sorted(artist.names, key=lambda name: name.id)
+        ),
+    )
+
+
+async def load_snapshot(session: AsyncSession, version: int) -> CatalogSnapshot:
+    """DB에서 카탈로그 전체를 읽어 스냅샷 생성"""
+    artist_result = await session.execute(
+        select(Artist)
+        .options(selectinload(Artist.images), selectinload(Artist.names))
+        .order_by(Artist.id)
+    )
+    artists = {
+        artist.id: _to_catalog_artist(artist) for artist in artist_result.scalars()
+    }
+
+    unit_result = await session.execute(
+        select(ArtistUnit)
+        .where(ArtistUnit.artist_id.isnot(None))
+        .order_by(ArtistUnit.id)
+    )
+    units_by_active: dict[bool, list[CatalogUnit]] = {True: [], False: []}
+    for unit in unit_result.scalars():
+        units_by_active[bool(unit.is_active)].append(
+            CatalogUnit(
+                id=unit.id,
+                name=unit.name,
+                artist_id=unit.artist_id,
+                type=unit.type,
+                is_filter=bool(unit.is_filter),
+                is_active=bool(unit.is_active),
+            )
+        )
+
+    # 같은 unit_id/이름이 여러 개면 id가 가장 작은 아티스트 (setdefault)
+    artists_by_unit_id: dict[int, CatalogArtist] = {}
+    artists_by_name: dict[str, CatalogArtist] = {}
+    for artist in artists.values():
+        artists_by_unit_id.setdefault(artist.unit_id, artist)
+        artists_by_name.setdefault(artist.name, artist)
+
+    return CatalogSnapshot(
+        version=version,
+        artists=artists,
+        artists_by_unit_id=artists_by_unit_id,
+        artists_by_name=artists_by_name,
+        units_by_active={
+            is_active: tuple(units) for is_active, units in units_by_active.items()
+        },
+    )
+
+
+class ArtistCatalog:
+    """워커별 아티스트 카탈로그 (Redis 버전 키로 재적재)"""
+
+    def __init__(self):
+        self._snapshot: CatalogSnapshot | None = None
+        self._loaded_at = 0.0
+
+    @property
+    def snapshot(self) -> CatalogSnapshot | None:
+        """현재 스냅샷 (적재 전이면 None → DB 조회)"""
+        return self._snapshot
+
+    async def _current_version(self) -> int:
+        redis = await get_redis_client()
+        return int(await redis.get(ARTIST_CATALOG_VERSION_KEY) or 0)
+
+    async def reload(self, version: int) -> None:
+        """DB에서 다시 적재 (버전은 적재 전에 읽은 값을 기록해 그 사이 갱신을 놓치지 않음)"""
+        started = time.perf_counter()
+        async for session in get_batch_session():
+            try:
+                snapshot = await load_snapshot(session, version)
+            finally:
+                await session.close()
+        self._snapshot = snapshot
+        self._loaded_at = time.monotonic()
+        logger.info(
+            f"아티스트 카탈로그 적재: version={version}, "
+            f"아티스트 {len(snapshot.artists)}명, "
+            f"활성 유닛 {len(snapshot.units_by_active[True])}개 "
+            f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+        )
+
+    async def run_sync(self) -> None:
+        """버전 확인 및 재적재 (애플리케이션 시작 시 백그라운드 태스크로 실행)"""
+        while True:
+            try:
+                version = await self._current_version()
+                snapshot = self._snapshot
+                if (
+                    snapshot is None
+                    or snapshot.version != version
+                    or time.monotonic() - self._loaded_at >= RELOAD_INTERVAL
+                ):
+                    await self.reload(version)
+                await asyncio.sleep(VERSION_CHECK_INTERVAL)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"아티스트 카탈로그 동기화 오류, 재시도 대기: {e}")
+                await asyncio.sleep(RETRY_DELAY)
+
+
+artist_catalog = ArtistCatalog()
@@ -0,0 +1,79 @@
+"""아티스트 스케줄 캘린더 서비스 - 월별 버킷 조회 (캐시 → DB)"""
+
+from datetime import datetime, timezone
+
+from app.features.artists.repositories.artist_schedule_repository import (
+    ArtistScheduleRepository,
+    month_start_millis,
+)
+from app.features.artists.schemas import ArtistScheduleDto
+from app.features.artists.services.artist_dto_service import ArtistDtoService
+from app.features.artists.services.schedule_cache_service import (
+    Month,
+    ScheduleCacheService,
+)
+
+
+def consecutive_months(year: int, month: int, count: int) -> list[Month]:
+    """year-month부터 count개월 목록 (예: 2025-12, 3 → 2025-12, 2026-01, 2026-02)"""
+    months: list[Month] = []
+    for offset in range(count):
+        index = year * 12 + (month - 1) + offset
+        months.append((index // 12, index % 12 + 1))
+    return months
+
+
+def filter_schedules(
+    schedules: list[ArtistScheduleDto],
+    unit_id: int | None = None,
+    schedule_type: int | None = None,
+) -> list[ArtistScheduleDto]:
+    """버킷(아티스트/월 단위)에서 유닛/유형 필터 적용"""
+    return [
+        schedule
+        for schedule in schedules
+        if (unit_id is None or schedule.unit_id == unit_id)
+        and (schedule_type is None or schedule.type == schedule_type)
+    ]
+
+
+class ArtistScheduleCalendarService:
+    """월별 스케줄 버킷 조회 (캐시에 없는 달만 한 번의 범위 쿼리로 채움)"""
+
+    def __init__(
+        self,
+        schedule_repo: ArtistScheduleRepository,
+        cache: ScheduleCacheService | None = None,
+    ):
+        self._schedule_repo = schedule_repo
+        self._cache = cache or ScheduleCacheService()
+        self._dto_service = ArtistDtoService()
+
+    async def get_months(
+        self, artist_id: int | None, months: list[Month]
+    ) -> dict[Month, list[ArtistScheduleDto]]:
+        """월별 스케줄 (모든 요청 월이 키로 포함, 스케줄 없는 달은 빈 목록)"""
+        version, found = await self._cache.get_months(artist_id, months)
+        missing = [month for month in months if month not in found]
+        if not missing:
+            return found
+
+        first_year, first_month = min(missing)
+        last_year, last_month = max(missing)
+        schedules = await self._schedule_repo.get_schedules_in_range(
+            start_time=month_start_millis(first_year, first_month),
+            end_time=month_start_millis(last_year, last_month + 1),
+            artist_id=artist_id,
+        )
+
+        loaded: dict[Month, list[ArtistScheduleDto]] = {month: [] for month in missing}
+        for schedule in schedules:
+            started = datetime.fromtimestamp(schedule.start_time / 1000, timezone.utc)
+            bucket = loaded.get((started.year, started.month))
+            # 범위 안이지만 캐시에서 이미 찾은 달은 건너뜀
+            if bucket is not None:
+                bucket.append(self._dto_service.to_schedule_dto(schedule))
+
+        if version is not None:
+            await self._cache.set_months(version, artist_id, loaded)
+        return {**found, **loaded}
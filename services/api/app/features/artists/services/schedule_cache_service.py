@@ -0,0 +1,113 @@
+"""아티스트 스케줄 월별 캐시 서비스
+
+(artist_id, 년, 월) 단위로 직렬화한 스케줄 DTO 목록을 Redis에 저장합니다.
+- 키: artist:schedule:v{버전}:{artist_id 또는 all}:{YYYYMM}
+- 스크래핑 서비스가 스케줄을 가져오면(import_schedules_from_json) 버전 키를 올리고,
+  이전 버전의 버킷은 더 이상 조회되지 않다가 TTL로 만료
+- 버전은 워커별로 VERSION_TTL초 동안 재사용 (요청마다 버전 조회 왕복을 하지 않도록)
+
+Redis 오류는 로깅만 하고 호출 측이 DB 조회로 폴백합니다.
+"""
+
+import logging
+import time
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from shared.utils.cache_version import ARTIST_SCHEDULE_VERSION_KEY
+
+from app.deps.redis import get_redis_client
+from app.features.artists.schemas import ArtistScheduleDto
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_KEY_PREFIX = "artist:schedule"
+MONTH_TTL = 24 * 60 * 60
+VERSION_TTL = 10
+
+_schedule_list_adapter = TypeAdapter(list[ArtistScheduleDto])
+
+# 워커 단위로 공유하는 버전 캐시 (version, 만료 시각)
+_version_cache: tuple[int, float] | None = None
+
+Month = tuple[int, int]
+
+
+class ScheduleCacheService:
+    """월별 스케줄 버킷 캐시"""
+
+    def __init__(self, redis: Redis | None = None):
+        self._redis = redis
+
+    async def _client(self) -> Redis:
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        return self._redis
+
+    # ========== 키 생성 헬퍼 ==========
+
+    def _month_key(
+        self, version: int, artist_id: int | None, year: int, month: int
+    ) -> str:
+        scope = artist_id if artist_id is not None else "all"
+        return f"{SCHEDULE_KEY_PREFIX}:v{version}:{scope}:{year:04d}{month:02d}"
+
+    async def _version(self, redis: Redis) -> int:
+        global _version_cache
+        now = time.monotonic()
+        if _version_cache is not None and _version_cache[1] > now:
+            return _version_cache[0]
+        version = int(await redis.get(ARTIST_SCHEDULE_VERSION_KEY) or 0)
+        _version_cache = (version, now + VERSION_TTL)
+        return version
+
+    # ========== 월별 버킷 ==========
+
+    async def get_months(
+        self, artist_id: int | None, months: list[Month]
+    ) -> tuple[int | None, dict[Month, list[ArtistScheduleDto]]]:
+        """캐시된 월별 스케줄 조회
+
+        Returns:
+            (버전, {(년, 월): 스케줄 목록}) - 캐시에 없는 월은 결과에서 빠짐,
+            Redis 오류 시 버전은 None (저장하지 않음)
+        """
+        try:
+            redis = await self._client()
+            version = await self._version(redis)
+            values = await redis.mget(
+                [self._month_key(version, artist_id, *month) for month in months]
+            )
+        except Exception as e:
+            logger.error(
+                f"Redis 스케줄 캐시 조회 실패: artist_id={artist_id}, error={e}"
+            )
+            return None, {}
+
+        found: dict[Month, list[ArtistScheduleDto]] = {}
+        for month, raw in zip(months, values):
+            if raw is not None:
+                found[month] = _schedule_list_adapter.validate_json(raw)
+        return version, found
+
+    async def set_months(
+        self,
+        version: int,
+        artist_id: int | None,
+        buckets: dict[Month, list[ArtistScheduleDto]],
+    ) -> None:
+        """월별 스케줄 저장 (조회 전에 읽은 버전으로 저장해 그 사이 갱신을 덮어쓰지 않음)"""
+        try:
+            redis = await self._client()
+            async with redis.pipeline(transaction=False) as pipe:
+                for (year, month), schedules in buckets.items():
+                    pipe.setex(
+                        self._month_key(version, artist_id, year, month),
+                        MONTH_TTL,
+                        _schedule_list_adapter.dump_json(schedules),
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.error(
+                f"Redis 스케줄 캐시 저장 실패: artist_id={artist_id}, error={e}"
+            )
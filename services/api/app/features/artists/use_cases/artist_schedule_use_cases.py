@@ -4,8 +4,13 @@ from app.features.artists.exceptions import ArtistScheduleNotFoundException
 from app.features.artists.repositories.artist_schedule_repository import (
     ArtistScheduleRepository,
 )
-from app.features.artists.schemas import ArtistScheduleDto
+from app.features.artists.schemas import ArtistScheduleDto, ArtistScheduleMonthDto
 from app.features.artists.services.artist_dto_service import ArtistDtoService
+from app.features.artists.services.artist_schedule_calendar_service import (
+    ArtistScheduleCalendarService,
+    consecutive_months,
+    filter_schedules,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -31,7 +36,7 @@ class GetSchedulesUseCase:
     def __init__(self, session: AsyncSession):
         self._session = session
         self.schedule_repo = ArtistScheduleRepository(session)
-        self.dto_service = ArtistDtoService()
+        self.calendar_service = ArtistScheduleCalendarService(self.schedule_repo)
 
     async def execute(
         self,
@@ -41,13 +46,38 @@ class GetSchedulesUseCase:
         unit_id: int | None = None,
         schedule_type: int | None = None,
     ) -> list[ArtistScheduleDto]:
-        """스케줄 목록 조회 (월별)"""
-        schedules = await self.schedule_repo.get_schedules(
-            year=year,
-            month=month,
-            artist_id=artist_id,
-            unit_id=unit_id,
-            schedule_type=schedule_type,
-        )
-
-        return self.dto_service.to_schedule_dtos(schedules)
+        """스케줄 목록 조회 (월별, 아티스트/월 버킷 캐시 사용)"""
+        buckets = await self.calendar_service.get_months(artist_id, [(year, month)])
+        return filter_schedules(buckets[(year, month)], unit_id, schedule_type)
+
+
+class GetScheduleMonthsUseCase:
+    """여러 달 스케줄 조회 Use Case (캘린더 앞뒤 달 미리 받기)"""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self.schedule_repo = ArtistScheduleRepository(session)
+        self.calendar_service = ArtistScheduleCalendarService(self.schedule_repo)
+
+    async def execute(
+        self,
+        year: int,
+        month: int,
+        months: int,
+        artist_id: int | None = None,
+        unit_id: int | None = None,
+        schedule_type: int | None = None,
+    ) -> list[ArtistScheduleMonthDto]:
+        """year-month부터 months개월 스케줄을 월별로 조회"""
+        month_keys = consecutive_months(year, month, months)
+        buckets = await self.calendar_service.get_months(artist_id, month_keys)
+        return [
+            ArtistScheduleMonthDto(
+                year=bucket_year,
+                month=bucket_month,
+                schedules=filter_schedules(
+                    buckets[(bucket_year, bucket_month)], unit_id, schedule_type
+                ),
+            )
+            for bucket_year, bucket_month in month_keys
+        ]
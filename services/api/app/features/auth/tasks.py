@@ -0,0 +1,24 @@
+"""인증 태스크 - 스케줄러에 등록할 작업들 정의"""
+
+import logging
+
+from app.core.scheduler import Scheduler
+from app.core.session import sweep_refresh_tokens
+
+logger = logging.getLogger(__name__)
+
+
+def register_scheduler_tasks(scheduler: Scheduler) -> None:
+    """스케줄러에 인증 작업들 등록
+
+    그룹:
+        - auth: 리프레시 토큰 정리 및 지표 갱신
+    """
+
+    async def sweep_refresh_token_index() -> None:
+        await sweep_refresh_tokens()
+
+    # 시간별 작업 (1시간마다)
+    scheduler.register_hourly_task(sweep_refresh_token_index, group="auth")
+
+    logger.info("인증 작업이 스케줄러에 등록되었습니다")
@@ -72,8 +72,8 @@ class SessionUseCase:
     # - MARK: 토큰 갱신
     async def refresh_token(self, refresh_token: str) -> CredentialDto:
         """토큰 갱신"""
-        # 1. Refresh token 검증 (Redis 확인 포함)
-        user_id = await self._token_manager.verify_refresh_token(refresh_token)
+        # 1. Refresh token 서명/만료 검증 (Redis 조회 없음)
+        user_id, jti = self._token_manager.decode_refresh_token(refresh_token)
 
         # 2. 유저 존재 및 상태 확인
         user = await self._session_repo.get_user_by_id(user_id)
@@ -83,11 +83,11 @@ class SessionUseCase:
         if user.is_del:
             raise TokenInvalidError("User account has been deleted")
 
-        # 3. 기존 리프레시 토큰 무효화 (Redis에서 삭제)
-        await self._token_manager.revoke_refresh_token(refresh_token)
-
-        # 4. 새 토큰 발급
-        return await self._create_token(user_id)
+        # 3. 기존 리프레시 토큰 소비 + 새 토큰 발급 (Redis 1회, 원자적)
+        return CredentialDto(
+            accessToken=self._token_manager.create_access_token(user_id),
+            refreshToken=await self._token_manager.rotate_refresh_token(user_id, jti),
+        )
 
     # - MARK: 로그아웃
     async def logout(
@@ -1,6 +1,7 @@
 import logging
 
 from app.core.config import settings
+from app.features.chat.enums import MessageType
 from app.features.chat.services.websocket_service import WebSocketService
 from fastapi import APIRouter, Query, WebSocket, status
 from jose import JWTError, jwt
@@ -21,6 +22,48 @@ async def get_user_id_from_token(token: str) -> int | None:
         return None
 
 
+async def _serve_chat_websocket(websocket: WebSocket, room_id: int, user_id: int):
+    """WebSocket 연결 처리
+
+    DB 세션은 연결 검증과 메시지 1건 처리 동안만 열고 바로 반환합니다.
+    대기 중인 소켓은 DB 커넥션을 점유하지 않으므로 동시 접속 수가 풀 크기에 묶이지 않습니다.
+    """
+    from app.core.database import WebSocketSessionLocal
+    from app.deps.providers import get_chat_use_case, get_websocket_service
+    from app.deps.redis import get_redis_client
+
+    redis = await get_redis_client()
+
+    async with WebSocketSessionLocal() as session:
+        chat_use_case = await get_chat_use_case(session=session, redis=redis)
+        authorized = await chat_use_case.authorize_websocket_connection(
+            websocket=websocket,
+            room_id=room_id,
+            user_id=user_id,
+        )
+    if not authorized:
+        return
+
+    async def on_message(message_text: str, message_type: MessageType) -> None:
+        """메시지 수신 시 처리 (메시지마다 새 세션)"""
+        async with WebSocketSessionLocal() as session:
+            chat_use_case = await get_chat_use_case(session=session, redis=redis)
+            await chat_use_case.handle_websocket_message(
+                room_id=room_id,
+                user_id=user_id,
+                message_text=message_text,
+                message_type=message_type,
+            )
+
+    websocket_service = await get_websocket_service()
+    await websocket_service.handle_websocket_connection(
+        websocket=websocket,
+        room_id=room_id,
+        user_id=user_id,
+        on_message=on_message,
+    )
+
+
 # - MARK: WebSocket 채팅 연결
 @router.websocket("/ws/{room_id}")
 async def websocket_endpoint(
@@ -53,18 +96,7 @@ async def websocket_endpoint(
         return
 
     # Chat UseCase를 통해 WebSocket 연결 처리
-    from app.core.database import AsyncSessionLocal
-    from app.deps.providers import get_chat_use_case
-    from app.deps.redis import get_redis_client
-
-    async with AsyncSessionLocal() as session:
-        redis = await get_redis_client()
-        chat_use_case = get_chat_use_case(session=session, redis=redis)
-        await chat_use_case.handle_websocket_connection(
-            websocket=websocket,
-            room_id=room_id,
-            user_id=user_id,
-        )
+    await _serve_chat_websocket(websocket, room_id, user_id)
 
 
 # - MARK: WebSocket 테스트 연결
@@ -78,11 +110,10 @@ async def websocket_test_endpoint(
     WebSocket 테스트 엔드포인트 (인증 없이)
     개발/테스트 목적으로만 사용
     """
-    from app.core.database import AsyncSessionLocal
     from app.deps.providers import get_websocket_service
 
     # 싱글톤 WebSocketService 사용
-    websocket_service = get_websocket_service()
+    websocket_service = await get_websocket_service()
 
     # 채널이 없으면 생성
     channel_metadata = await websocket_service.get_channel_metadata(room_id)
@@ -94,14 +125,4 @@ async def websocket_test_endpoint(
         )
 
     # Chat UseCase를 통해 WebSocket 연결 처리
-    from app.deps.providers import get_chat_use_case
-    from app.deps.redis import get_redis_client
-
-    async with AsyncSessionLocal() as session:
-        redis = await get_redis_client()
-        chat_use_case = get_chat_use_case(session=session, redis=redis)
-        await chat_use_case.handle_websocket_connection(
-            websocket=websocket,
-            room_id=room_id,
-            user_id=user_id,
-        )
+    await _serve_chat_websocket(websocket, room_id, user_id)
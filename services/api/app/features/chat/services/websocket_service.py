@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Set
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Set
 
 from redis.asyncio import Redis
 
@@ -340,7 +340,7 @@ class WebSocketService:
         websocket: WebSocket,
         room_id: int,
         user_id: int,
-        on_message: Callable[[str, MessageType], None],
+        on_message: Callable[[str, MessageType], Awaitable[None]],
     ) -> None:
         """WebSocket 연결 처리 및 메시지 수신 루프"""
         # 채널 메타데이터 확인
@@ -208,27 +208,30 @@ class ChatUseCase:
             chat_room_id, page, size
         )
 
-    # MARK: - WebSocket 연결 처리
-    async def handle_websocket_connection(
+    # MARK: - WebSocket 연결 검증
+    async def authorize_websocket_connection(
         self,
         websocket: WebSocket,
         room_id: int,
         user_id: int,
-    ) -> None:
-        """WebSocket 연결 처리 (비즈니스 로직 검증)"""
+    ) -> bool:
+        """WebSocket 연결 전 채팅방/멤버 검증 및 채널 메타데이터 준비
+
+        검증에 실패하면 소켓을 닫고 False를 반환합니다.
+        """
         # 채팅방 존재 확인
         chat_room = await self._chat_room_repo.get_chat_room_by_id(room_id)
         if not chat_room:
             await websocket.close(code=1003)
             logger.warning(f"채팅방을 찾을 수 없음: room_id={room_id}")
-            return
+            return False
 
         # 사용자가 멤버인지 확인
         member = await self._chat_room_repo.get_member(room_id, user_id)
         if not member or member.left_at:
             await websocket.close(code=1008)
             logger.warning(f"채팅방 접근 거부: room_id={room_id}, user_id={user_id}")
-            return
+            return False
 
         # 채널 메타데이터가 없으면 생성 (WebSocket 연결 전)
         if self._websocket_service:
@@ -250,32 +253,30 @@ class ChatUseCase:
                 )
                 logger.info(f"채널 메타데이터 자동 생성: room_id={room_id}")
 
-        async def on_message(message_text: str, message_type: MessageType) -> None:
-            """메시지 수신 시 처리"""
-            try:
-                await self.send_message(
-                    room_id=room_id,
-                    user_id=user_id,
-                    message=message_text,
-                    message_type=message_type,
-                )
-                # WebSocket에서 메시지 전송 시 commit 필요
-                await self._session.commit()
-            except Exception as e:
-                await self._session.rollback()
-                logger.error(f"WebSocket 메시지 전송 실패: {e}", exc_info=True)
-                # 예외가 발생해도 WebSocket 연결 유지
-
-        # WebSocket 연결 처리
-        if self._websocket_service:
-            await self._websocket_service.handle_websocket_connection(
-                websocket=websocket,
+        return True
+
+    # MARK: - WebSocket 메시지 처리
+    async def handle_websocket_message(
+        self,
+        room_id: int,
+        user_id: int,
+        message_text: str,
+        message_type: MessageType,
+    ) -> None:
+        """WebSocket으로 수신한 메시지 처리 (메시지 1건 = 트랜잭션 1건)"""
+        try:
+            await self.send_message(
                 room_id=room_id,
                 user_id=user_id,
-                on_message=on_message,
+                message=message_text,
+                message_type=message_type,
             )
-        else:
-            logger.error("[WebSocket] websocket_service가 None입니다!")
+            # WebSocket에서 메시지 전송 시 commit 필요
+            await self._session.commit()
+        except Exception as e:
+            await self._session.rollback()
+            logger.error(f"WebSocket 메시지 전송 실패: {e}", exc_info=True)
+            # 예외가 발생해도 WebSocket 연결 유지
 
     # MARK: - WebSocket 서비스 접근자
     def get_websocket_service(self) -> WebSocketService | None:
@@ -1,23 +1,52 @@
 from app.features.follow.repositories.follow_repository import FollowRepository
+from app.features.notifications.services.notification_preference_cache_service import (
+    NotificationPreferenceCacheService,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class FollowNotificationRepository:
     """팔로우 알림 설정 Repository"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        preference_cache: NotificationPreferenceCacheService | None = None,
+    ):
         self._session = session
         self._follow_repo = FollowRepository(session)
+        self._preference_cache = (
+            preference_cache or NotificationPreferenceCacheService()
+        )
 
     # - MARK: 알림 설정 상태 조회
     async def get_notification_status(
         self, follower_id: int, following_id: int
     ) -> bool | None:
-        """특정 팔로우 관계의 알림 설정 상태 조회"""
+        """특정 팔로우 관계의 알림 설정 상태 조회 (캐시 → DB)"""
+        hit, enabled = await self._preference_cache.get_follow_notification(
+            follower_id, following_id
+        )
+        if hit:
+            return enabled
+
         follow = await self._follow_repo.get_follow(follower_id, following_id)
-        if not follow:
-            return None
-        return bool(getattr(follow, "notification_enabled", False))
+        enabled = (
+            bool(getattr(follow, "notification_enabled", False)) if follow else None
+        )
+        await self._preference_cache.set_follow_notification(
+            follower_id, following_id, enabled
+        )
+        return enabled
+
+    # - MARK: 알림 설정 상태 캐시 삭제
+    async def invalidate_notification_status(
+        self, follower_id: int, following_id: int
+    ) -> None:
+        """팔로우 관계/알림 설정 변경 후 캐시 삭제 (커밋 이후에 호출)"""
+        await self._preference_cache.invalidate_follow_notification(
+            follower_id, following_id
+        )
 
     # - MARK: 알림 설정 상태 변경 (커밋 없음)
     async def update_notification_status(
@@ -149,37 +149,48 @@ class FollowNotificationService:
             pod_owner_nickname = pod_owner.nickname or ""
             pod_title = pod.title or ""
 
-            for follower_user, _, _ in followers_data:
-                try:
-                    if follower_user.id is None:
-                        continue
-                    follower_user_id = follower_user.id
-                    follower_fcm_token = (
-                        follower_user.detail.fcm_token if follower_user.detail else None
-                    )
-
-                    if follower_fcm_token:
-                        await self._fcm_service.send_followed_user_created_pod(
-                            token=follower_fcm_token,
-                            nickname=pod_owner_nickname,  # 파티장의 닉네임
-                            party_name=pod_title,
-                            pod_id=pod_id,
-                            db=self._session,
-                            user_id=follower_user_id,
-                            related_user_id=pod_owner_id,
+            # 팔로워 알림은 모아서 일괄 저장 (알림 설정도 한 번에 조회)
+            follower_ids = [
+                follower_user.id
+                for follower_user, _, _ in followers_data
+                if follower_user.id is not None
+            ]
+            async with self._fcm_service.batch_notifications(
+                self._session, user_ids=follower_ids
+            ):
+                for follower_user, _, _ in followers_data:
+                    try:
+                        if follower_user.id is None:
+                            continue
+                        follower_user_id = follower_user.id
+                        follower_fcm_token = (
+                            follower_user.detail.fcm_token
+                            if follower_user.detail
+                            else None
                         )
-                        logger.info(
-                            f"팔로우한 유저 파티 생성 알림 전송 성공: follower_id={follower_user_id}, pod_id={pod_id}"
-                        )
-                    else:
-                        logger.warning(
-                            f"팔로워의 FCM 토큰이 없음: follower_id={follower_user_id}"
+
+                        if follower_fcm_token:
+                            await self._fcm_service.send_followed_user_created_pod(
+                                token=follower_fcm_token,
+                                nickname=pod_owner_nickname,  # 파티장의 닉네임
+                                party_name=pod_title,
+                                pod_id=pod_id,
+                                db=self._session,
+                                user_id=follower_user_id,
+                                related_user_id=pod_owner_id,
+                            )
+                            logger.info(
+                                f"팔로우한 유저 파티 생성 알림 전송 성공: follower_id={follower_user_id}, pod_id={pod_id}"
+                            )
+                        else:
+                            logger.warning(
+                                f"팔로워의 FCM 토큰이 없음: follower_id={follower_user_id}"
+                            )
+                    except Exception as e:
+                        follower_user_id = follower_user.id if follower_user else None
+                        logger.error(
+                            f"팔로워 알림 전송 실패: follower_id={follower_user_id}, error={e}"
                         )
-                except Exception as e:
-                    follower_user_id = follower_user.id if follower_user else None
-                    logger.error(
-                        f"팔로워 알림 전송 실패: follower_id={follower_user_id}, error={e}"
-                    )
 
         except Exception as e:
             logger.error(
@@ -70,6 +70,9 @@ class FollowUseCase:
         """사용자 팔로우"""
         follow = await self._follow_repo.create_follow(follower_id, following_id)
         await self._session.commit()
+        await self._follow_notification_repo.invalidate_notification_status(
+            follower_id, following_id
+        )
 
         if not follow:
             raise FollowFailedException(follower_id, following_id)
@@ -91,6 +94,9 @@ class FollowUseCase:
         """사용자 팔로우 취소"""
         success = await self._follow_repo.delete_follow(follower_id, following_id)
         await self._session.commit()
+        await self._follow_notification_repo.invalidate_notification_status(
+            follower_id, following_id
+        )
 
         if not success:
             raise FollowNotFoundException(follower_id, following_id)
@@ -221,6 +227,9 @@ class FollowUseCase:
             follower_id, following_id, notification_enabled
         )
         await self._session.commit()
+        await self._follow_notification_repo.invalidate_notification_status(
+            follower_id, following_id
+        )
 
         if not follow:
             return None
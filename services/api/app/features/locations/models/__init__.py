@@ -1,5 +1,5 @@
 """Locations feature models"""
 
-from .location_models import Location
+from .location_models import Location, LocationPopularity
 
-__all__ = ["Location"]
+__all__ = ["Location", "LocationPopularity"]
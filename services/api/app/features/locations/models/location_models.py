@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import Column, ForeignKey, Integer, String, Text
 from app.core.database import Base
 
 
@@ -17,3 +17,24 @@ class Location(Base):
 
     def __repr__(self):
         return f"<Location(id={self.id}, main_location='{self.main_location}')>"
+
+
+class LocationPopularity(Base):
+    """지역별 활성 파티 수 (인기 지역 집계용 카운터)"""
+
+    __tablename__ = "location_popularity"
+
+    location_id = Column(
+        Integer,
+        ForeignKey("locations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    pod_count = Column(
+        Integer, nullable=False, default=0, index=True, comment="활성 파티 수"
+    )
+
+    def __repr__(self):
+        return (
+            f"<LocationPopularity(location_id={self.location_id}, "
+            f"pod_count={self.pod_count})>"
+        )
@@ -1,9 +1,11 @@
 import json
-from typing import List, Tuple
+from collections.abc import AsyncIterator
+from typing import Dict, List
 
-from app.features.locations.models import Location
-from app.features.pods.models import Pod
-from sqlalchemy import select, update
+from app.features.locations.models import Location, LocationPopularity
+from app.features.pods.models import Pod, PodDetail
+from sqlalchemy import Row, delete, func, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -74,14 +76,106 @@ class LocationRepository:
         await self._session.delete(location)
         return True
 
-    # - MARK: 파티 주소 조회
-    async def get_pod_addresses(self) -> List[Tuple[str, str | None]]:
-        """모든 활성 파티의 address, sub_address 조회 (PodDetail에서)"""
-        from app.features.pods.models import PodDetail
+    # - MARK: 인기 지역 조회
+    async def get_popular_locations(self, limit: int) -> List[Location]:
+        """활성 파티 수가 많은 순으로 지역 조회 (카운터 테이블 기준)"""
+        result = await self._session.execute(
+            select(Location)
+            .join(LocationPopularity, LocationPopularity.location_id == Location.id)
+            .where(LocationPopularity.pod_count > 0)
+            .order_by(LocationPopularity.pod_count.desc(), Location.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    # - MARK: 지역별 파티 수 증감 (커밋 없음)
+    async def adjust_pod_counts(self, deltas: Dict[int, int]) -> None:
+        """지역별 활성 파티 수 증감 (커밋은 호출 측에서 처리)"""
+        for location_id, delta in deltas.items():
+            if not delta:
+                continue
+            stmt = mysql_insert(LocationPopularity).values(
+                location_id=location_id, pod_count=max(delta, 0)
+            )
+            await self._session.execute(
+                stmt.on_duplicate_key_update(
+                    pod_count=func.greatest(LocationPopularity.pod_count + delta, 0)
+                )
+            )
 
+    # - MARK: 지역별 파티 수 재계산 (커밋 없음)
+    async def recount_pod_counts(self) -> Dict[int, int]:
+        """태깅된 활성 파티 기준으로 카운터 테이블 전체 재작성"""
         result = await self._session.execute(
-            select(PodDetail.address, PodDetail.sub_address)
+            select(PodDetail.location_id, func.count())
             .join(Pod, Pod.id == PodDetail.pod_id)
-            .where(~Pod.is_del)
+            .where(~Pod.is_del, PodDetail.location_id.isnot(None))
+            .group_by(PodDetail.location_id)
         )
-        return result.fetchall()
+        counts = {location_id: count for location_id, count in result.all()}
+
+        # 전체 삭제 후 재삽입 대신 바뀐 지역만 갱신하고 없어진 지역만 삭제
+        stale = delete(LocationPopularity)
+        if counts:
+            stale = stale.where(LocationPopularity.location_id.notin_(counts))
+        await self._session.execute(stale)
+        if counts:
+            stmt = mysql_insert(LocationPopularity).values(
+                [
+                    {"location_id": location_id, "pod_count": count}
+                    for location_id, count in counts.items()
+                ]
+            )
+            await self._session.execute(
+                stmt.on_duplicate_key_update(pod_count=stmt.inserted.pod_count)
+            )
+        return counts
+
+    # - MARK: 파티 지역 조회
+    async def get_pod_location_ids(self, pod_ids: List[int]) -> List[int]:
+        """파티들의 태깅된 지역 ID (태깅되지 않은 파티는 제외)"""
+        if not pod_ids:
+            return []
+        result = await self._session.execute(
+            select(PodDetail.location_id).where(
+                PodDetail.pod_id.in_(pod_ids), PodDetail.location_id.isnot(None)
+            )
+        )
+        return list(result.scalars().all())
+
+    # - MARK: 파티 주소/태그 배치 조회 (재태깅용)
+    async def iter_pod_location_rows(
+        self, batch_size: int
+    ) -> AsyncIterator[List[Row]]:
+        """삭제된 파티를 포함한 모든 파티의 주소/태그를 pod_id 순으로 나눠 조회
+
+        복구 시에도 태그가 맞도록 삭제된 파티도 포함하며, ORM 객체 대신 필요한 컬럼만 읽습니다.
+
+        Yields:
+            (pod_id, address, sub_address, location_id, sub_location) 목록
+        """
+        last_pod_id = 0
+        while True:
+            result = await self._session.execute(
+                select(
+                    PodDetail.pod_id,
+                    PodDetail.address,
+                    PodDetail.sub_address,
+                    PodDetail.location_id,
+                    PodDetail.sub_location,
+                )
+                .where(PodDetail.pod_id > last_pod_id)
+                .order_by(PodDetail.pod_id)
+                .limit(batch_size)
+            )
+            rows = list(result.all())
+            if not rows:
+                return
+            yield rows
+            last_pod_id = rows[-1].pod_id
+
+    # - MARK: 파티 태그 일괄 수정 (커밋 없음)
+    async def update_pod_locations(self, changes: List[dict]) -> None:
+        """pod_id별 location_id/sub_location 일괄 수정 (커밋은 호출 측에서 처리)"""
+        if changes:
+            await self._session.execute(update(PodDetail), changes)
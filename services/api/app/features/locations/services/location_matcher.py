@@ -0,0 +1,103 @@
+"""주소 → 지역 매칭 (세부 지역 이름에 대한 Aho-Corasick 오토마톤)
+
+Location.sub_locations의 각 항목을 "·"로 나눈 이름(예: "홍대·합정" → "홍대", "합정")을
+패턴으로 등록해 두고, 주소 문자열을 한 번만 훑어 포함된 이름을 모두 찾습니다.
+- 여러 이름이 포함되면 가장 긴 이름(더 구체적인 지역)을 선택
+- 길이가 같으면 먼저 등록된 지역(id 순, sub_locations 순)을 선택
+
+주소 하나를 매칭하는 비용은 지역 수와 무관하게 주소 길이에 비례합니다.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Iterable
+
+from app.features.locations.models import Location
+
+
+@dataclass(frozen=True, slots=True)
+class LocationMatch:
+    """주소에서 찾은 지역 (sub_location: 매칭된 sub_locations 항목 원문)"""
+
+    location_id: int
+    main_location: str
+    sub_location: str
+
+
+class LocationMatcher:
+    """세부 지역 이름 매처 (생성 후 불변)"""
+
+    def __init__(self, locations: Iterable[Location]):
+        # 노드별 전이 / 실패 링크 / 노드에서 끝나는(실패 링크 포함) 최선의 패턴 번호
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._best: list[int | None] = [None]
+        # 패턴 번호 → (이름 길이, 매칭 결과)
+        self._patterns: list[tuple[int, LocationMatch]] = []
+
+        for location in sorted(locations, key=lambda location: location.id):
+            for sub_location in json.loads(location.sub_locations or "[]"):
+                match = LocationMatch(
+                    location_id=location.id,
+                    main_location=location.main_location,
+                    sub_location=sub_location,
+                )
+                for part in sub_location.split("·"):
+                    part = part.strip()
+                    if part:
+                        self._add(part, match)
+        self._build_links()
+
+    def _add(self, word: str, match: LocationMatch) -> None:
+        node = 0
+        for char in word:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(None)
+            node = next_node
+        # 같은 이름이 여러 지역에 있으면 먼저 등록된 지역 유지
+        if self._best[node] is None:
+            self._best[node] = len(self._patterns)
+            self._patterns.append((len(word), match))
+
+    def _better(self, a: int | None, b: int | None) -> int | None:
+        if a is None or b is None:
+            return b if a is None else a
+        # 긴 이름 우선, 같으면 먼저 등록된 패턴
+        if self._patterns[a][0] != self._patterns[b][0]:
+            return a if self._patterns[a][0] > self._patterns[b][0] else b
+        return min(a, b)
+
+    def _build_links(self) -> None:
+        # BFS 순서로 실패 링크를 만들고, 실패 링크 쪽의 최선 패턴을 합쳐 둠
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._best[child] = self._better(
+                    self._best[child], self._best[self._fail[child]]
+                )
+                queue.append(child)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._patterns
+
+    def match(self, text: str) -> LocationMatch | None:
+        """text에 포함된 세부 지역 중 가장 구체적인 것 (없으면 None)"""
+        node = 0
+        best: int | None = None
+        for char in text:
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            best = self._better(best, self._best[node])
+        return self._patterns[best][1] if best is not None else None
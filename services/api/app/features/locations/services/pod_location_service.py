@@ -0,0 +1,113 @@
+"""파티 지역 태깅 및 인기 지역 카운터 서비스
+
+파티 생성/주소 수정 시 주소로 지역(main, sub)을 판별해 PodDetail에 기록하고,
+지역별 활성 파티 수(location_popularity)를 같은 트랜잭션에서 증감합니다.
+인기 지역 조회는 카운터 테이블만 읽습니다.
+
+카운터가 어긋나는 경우(지역 정보 변경, 직접 수정한 데이터 등)를 대비해
+rebuild()가 전체 파티를 다시 태깅하고 카운터를 재계산합니다
+(일일 작업 및 지역 정보 변경 후 백그라운드 작업, 워커 간 락으로 한 곳에서만 실행).
+"""
+
+import logging
+import time
+from collections import Counter
+
+from app.features.locations.models import Location
+from app.features.locations.repositories.location_repository import LocationRepository
+from app.features.locations.services.location_matcher import LocationMatcher
+from app.features.pods.models import PodDetail
+
+logger = logging.getLogger(__name__)
+
+# 재태깅 시 한 번에 읽는 파티 수
+REBUILD_BATCH_SIZE = 1000
+
+# 워커 단위로 공유하는 매처 (지역 정보 원문, 매처) - 지역 정보가 같으면 재사용
+_matcher_cache: tuple[tuple, LocationMatcher] | None = None
+
+
+def _matcher_for(locations: list[Location]) -> LocationMatcher:
+    global _matcher_cache
+    key = tuple(
+        sorted(
+            (location.id, location.main_location, location.sub_locations)
+            for location in locations
+        )
+    )
+    if _matcher_cache is None or _matcher_cache[0] != key:
+        _matcher_cache = (key, LocationMatcher(locations))
+    return _matcher_cache[1]
+
+
+def _resolve(
+    matcher: LocationMatcher, address: str, sub_address: str | None
+) -> tuple[int | None, str | None]:
+    """(location_id, sub_location) - address와 sub_address를 합쳐 매칭"""
+    match = matcher.match(f"{address} {sub_address or ''}")
+    if match is None:
+        return None, None
+    return match.location_id, match.sub_location
+
+
+class PodLocationService:
+    """파티 지역 태깅 (커밋은 호출 측에서 처리)"""
+
+    def __init__(self, location_repo: LocationRepository):
+        self._location_repo = location_repo
+
+    async def _matcher(self) -> LocationMatcher:
+        # 지역 테이블은 작아서 매번 읽고, 내용이 바뀐 경우에만 매처를 다시 만듦
+        return _matcher_for(await self._location_repo.get_all_locations())
+
+    # MARK: - 태깅
+    async def assign(self, pod_detail: PodDetail, is_active: bool = True) -> None:
+        """주소로 지역을 판별해 기록 (활성 파티면 이전/새 지역 카운터 증감)"""
+        previous_id = pod_detail.location_id
+        pod_detail.location_id, pod_detail.sub_location = _resolve(
+            await self._matcher(), pod_detail.address, pod_detail.sub_address
+        )
+
+        if is_active and previous_id != pod_detail.location_id:
+            deltas: Counter[int] = Counter()
+            if previous_id is not None:
+                deltas[previous_id] -= 1
+            if pod_detail.location_id is not None:
+                deltas[pod_detail.location_id] += 1
+            await self._location_repo.adjust_pod_counts(deltas)
+
+    # MARK: - 활성 상태 변경
+    async def release(self, pod_ids: list[int]) -> None:
+        """삭제(비활성화)된 파티를 카운터에서 제외"""
+        deltas: Counter[int] = Counter()
+        for location_id in await self._location_repo.get_pod_location_ids(pod_ids):
+            deltas[location_id] -= 1
+        await self._location_repo.adjust_pod_counts(deltas)
+
+    # MARK: - 전체 재계산
+    async def rebuild(self, batch_size: int = REBUILD_BATCH_SIZE) -> dict[int, int]:
+        """모든 파티를 현재 지역 정보로 다시 태깅하고 카운터 재계산
+
+        파티는 batch_size개씩 필요한 컬럼만 읽고, 태그가 바뀐 파티만 수정합니다.
+        """
+        started = time.perf_counter()
+        matcher = await self._matcher()
+
+        retagged = 0
+        async for rows in self._location_repo.iter_pod_location_rows(batch_size):
+            changes = []
+            for pod_id, address, sub_address, location_id, sub_location in rows:
+                tag = _resolve(matcher, address, sub_address)
+                if (location_id, sub_location) != tag:
+                    changes.append(
+                        {"pod_id": pod_id, "location_id": tag[0], "sub_location": tag[1]}
+                    )
+            await self._location_repo.update_pod_locations(changes)
+            retagged += len(changes)
+
+        counts = await self._location_repo.recount_pod_counts()
+        logger.info(
+            f"인기 지역 카운터 재계산: 재태깅 {retagged}건, 지역 {len(counts)}곳 "
+            f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+        )
+        return counts
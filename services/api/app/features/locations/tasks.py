@@ -0,0 +1,74 @@
+"""지역 태스크 - 스케줄러에 등록할 작업들 정의"""
+
+import asyncio
+import logging
+
+from app.core.database import get_batch_session, named_lock
+from app.core.scheduler import Scheduler
+from app.features.locations.repositories.location_repository import LocationRepository
+from app.features.locations.services.pod_location_service import PodLocationService
+
+logger = logging.getLogger(__name__)
+
+# 재계산은 모든 워커의 스케줄러가 동시에 실행하므로 한 워커만 실행하도록 락으로 보호
+REBUILD_LOCK_NAME = "podpod:location_popularity_rebuild"
+# 지역 정보 변경 후 재계산은 진행 중인 재계산이 끝날 때까지 기다림 (일일 작업 타임아웃과 같음)
+REBUILD_LOCK_WAIT = 10 * 60
+
+# 실행 중인 백그라운드 재계산 (태스크가 GC되지 않도록 참조 유지)
+_background_rebuilds: set[asyncio.Task] = set()
+
+
+async def rebuild_location_popularity(lock_timeout: int = 0) -> dict[int, int] | None:
+    """전체 파티 재태깅 및 인기 지역 카운터 재계산 (배치 세션에서 커밋)
+
+    다른 워커가 재계산 중이면 lock_timeout초까지 기다리고, 그래도 얻지 못하면 건너뜁니다.
+
+    Returns:
+        지역별 활성 파티 수 (락을 얻지 못해 건너뛴 경우 None)
+    """
+    async with named_lock(REBUILD_LOCK_NAME, lock_timeout) as locked:
+        if not locked:
+            logger.info("다른 워커가 인기 지역 카운터를 재계산 중이므로 건너뜀")
+            return None
+
+        async for session in get_batch_session():
+            try:
+                service = PodLocationService(LocationRepository(session))
+                counts = await service.rebuild()
+                await session.commit()
+            finally:
+                await session.close()
+        return counts
+
+
+def schedule_location_rebuild() -> None:
+    """지역 정보 변경 후 재계산을 백그라운드로 실행 (요청은 기다리지 않음)"""
+
+    async def run() -> None:
+        try:
+            await rebuild_location_popularity(lock_timeout=REBUILD_LOCK_WAIT)
+        except Exception as e:
+            logger.error(f"인기 지역 카운터 재계산 실패: {e}")
+
+    task = asyncio.create_task(run())
+    _background_rebuilds.add(task)
+    task.add_done_callback(_background_rebuilds.discard)
+
+
+def register_scheduler_tasks(scheduler: Scheduler) -> None:
+    """스케줄러에 지역 작업들 등록
+
+    그룹:
+        - locations: 파티 지역 태그/인기 지역 카운터 보정
+    """
+
+    async def reconcile_location_popularity() -> None:
+        await rebuild_location_popularity()
+
+    # 일일 작업 (증감 누락이나 지역 정보 변경으로 어긋난 카운터 보정)
+    scheduler.register_daily_task(
+        reconcile_location_popularity, group="locations", timeout=10 * 60
+    )
+
+    logger.info("지역 작업이 스케줄러에 등록되었습니다")
@@ -1,18 +1,24 @@
 """Location Use Case - 비즈니스 로직 처리"""
 
 import json
-from collections import defaultdict
 from typing import List
 
 from app.features.locations.repositories.location_repository import LocationRepository
 from app.features.locations.schemas import LocationDto
+from app.features.locations.tasks import schedule_location_rebuild
 from sqlalchemy.ext.asyncio import AsyncSession
 
+POPULAR_LOCATION_LIMIT = 10
+
 
 class LocationUseCase:
     """지역 정보 Use Case"""
 
-    def __init__(self, session: AsyncSession, location_repo: LocationRepository):
+    def __init__(
+        self,
+        session: AsyncSession,
+        location_repo: LocationRepository,
+    ):
         self._session = session
         self._location_repo = location_repo
 
@@ -66,6 +72,8 @@ class LocationUseCase:
         )
         await self._session.commit()
         await self._session.refresh(location)
+        # 지역 정보가 바뀌면 기존 파티 태그와 카운터를 백그라운드에서 다시 계산
+        schedule_location_rebuild()
 
         return self._to_dto(location)
 
@@ -83,6 +91,7 @@ class LocationUseCase:
             return None
 
         await self._session.refresh(location)
+        schedule_location_rebuild()
         return self._to_dto(location)
 
     # - MARK: 지역 정보 삭제
@@ -90,54 +99,17 @@ class LocationUseCase:
         """지역 정보 삭제"""
         result = await self._location_repo.delete_location(location_id)
         await self._session.commit()
+        if result:
+            schedule_location_rebuild()
         return result
 
     # - MARK: 인기 지역 조회
     async def get_popular_locations(self) -> List[LocationDto]:
-        """인기 지역 조회 - 팟티의 address, sub_address에서 지역 매칭하여 카운트"""
-        # 모든 팟티의 address, sub_address 조회
-        pod_addresses = await self._location_repo.get_pod_addresses()
-
-        # 모든 지역 정보 조회
-        locations = await self._location_repo.get_all_locations()
-
-        # 지역별 카운트를 위한 딕셔너리
-        location_counts = defaultdict(int)
-
-        # 각 팟티의 주소에서 지역 매칭
-        for address, sub_address in pod_addresses:
-            # address와 sub_address를 하나의 문자열로 합치기
-            full_address = f"{address} {sub_address or ''}".strip()
-
-            # 각 지역의 sub_locations와 매칭
-            for location in locations:
-                sub_locations = json.loads(location.sub_locations or "[]")
-                for sub_location in sub_locations:
-                    # sub_location을 "·"로 분리하여 각각 확인
-                    sub_parts = sub_location.split("·")
-                    for part in sub_parts:
-                        part = part.strip()
-                        if part and part in full_address:
-                            location_counts[location.main_location] += 1
-                            break
-                    else:
-                        continue
-                    break
-
-        # 카운트 기준으로 정렬하여 상위 10개 선택
-        sorted_locations = sorted(
-            location_counts.items(), key=lambda x: x[1], reverse=True
-        )[:10]
-
-        # LocationDto 형태로 변환
-        popular_locations = []
-        for main_location, _ in sorted_locations:
-            for location in locations:
-                if location.main_location == main_location:
-                    popular_locations.append(self._to_dto(location))
-                    break
-
-        return popular_locations
+        """인기 지역 조회 - 지역별 활성 파티 수 카운터 상위 10개"""
+        locations = await self._location_repo.get_popular_locations(
+            limit=POPULAR_LOCATION_LIMIT
+        )
+        return [self._to_dto(location) for location in locations]
 
     # - MARK: Location -> LocationDto 변환
     def _to_dto(self, location) -> LocationDto:
@@ -52,6 +52,13 @@ class Notification(Base):
         String(20), nullable=False, index=True, default="pod"
     )  # pod, community, notice
 
+    # 알림함 표시용 비정규화 필드 (생성 시점의 값, 목록 조회 시 JOIN 없이 사용)
+    related_user_nickname = Column(String(50), nullable=True)  # 관련 유저 닉네임
+    related_user_profile_image = Column(
+        String(500), nullable=True
+    )  # 관련 유저 프로필 이미지
+    related_pod_title = Column(String(100), nullable=True)  # 관련 파티 제목
+
     # 읽음 상태
     is_read = Column(Boolean, default=False, nullable=False, index=True)  # 읽음 여부
     read_at = Column(DateTime, nullable=True)  # 읽은 시간
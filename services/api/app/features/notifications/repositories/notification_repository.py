@@ -1,17 +1,32 @@
+from collections import Counter
 from datetime import datetime, timezone
 from typing import List
 
 from app.features.notifications.models.notification_models import Notification
-from sqlalchemy import delete, func, select, update
+from app.features.notifications.services.notification_badge_cache_service import (
+    NotificationBadgeCacheService,
+)
+from app.features.pods.models import Pod
+from app.features.users.models import User
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 
 class NotificationRepository:
-    """알림 Repository"""
+    """알림 Repository
 
-    def __init__(self, session: AsyncSession):
+    읽지 않은 알림 개수는 NotificationBadgeCacheService(Redis)에 함께 유지합니다.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        badge_cache: NotificationBadgeCacheService | None = None,
+    ):
         self._session = session
+        self._badge_cache = badge_cache or NotificationBadgeCacheService()
 
     # - MARK: 알림 생성
     async def create_notification(
@@ -27,6 +42,7 @@ class NotificationRepository:
         category: str = "pod",
     ) -> Notification:
         """알림 생성"""
+        projection = await self._get_inbox_projection(related_user_id, related_pod_id)
         notification = Notification(
             user_id=user_id,
             related_user_id=related_user_id,
@@ -37,12 +53,101 @@ class NotificationRepository:
             notification_value=notification_value,
             related_id=related_id,
             category=category,
+            **projection,
         )
         self._session.add(notification)
         await self._session.commit()
         await self._session.refresh(notification)
+        await self._badge_cache.adjust_unread_count(user_id, 1)
         return notification
 
+    # - MARK: 알림 일괄 생성
+    async def bulk_create_notifications(self, rows: List[dict]) -> int:
+        """알림 일괄 생성 (multi-row INSERT 한 번)
+
+        Args:
+            rows: create_notification과 같은 키를 가진 dict 목록
+
+        Returns:
+            생성된 알림 수
+        """
+        if not rows:
+            return 0
+
+        await self._fill_inbox_projections(rows)
+
+        now = datetime.now(timezone.utc)
+        values = [
+            {"category": "pod", "is_read": False, "created_at": now, **row}
+            for row in rows
+        ]
+        await self._session.execute(insert(Notification), values)
+        await self._session.commit()
+
+        for user_id, count in Counter(row["user_id"] for row in rows).items():
+            await self._badge_cache.adjust_unread_count(user_id, count)
+        return len(rows)
+
+    async def _fill_inbox_projections(self, rows: List[dict]) -> None:
+        """일괄 생성할 알림의 비정규화 필드를 IN 쿼리로 채움"""
+        user_ids = {
+            row["related_user_id"]
+            for row in rows
+            if row.get("related_user_id") is not None
+        }
+        pod_ids = {
+            row["related_pod_id"]
+            for row in rows
+            if row.get("related_pod_id") is not None
+        }
+
+        users: dict = {}
+        if user_ids:
+            result = await self._session.execute(
+                select(User.id, User.nickname, User.profile_image).where(
+                    User.id.in_(user_ids)
+                )
+            )
+            users = {row.id: row for row in result.all()}
+
+        pods: dict = {}
+        if pod_ids:
+            result = await self._session.execute(
+                select(Pod.id, Pod.title).where(Pod.id.in_(pod_ids))
+            )
+            pods = {row.id: row.title for row in result.all()}
+
+        for row in rows:
+            user = users.get(row.get("related_user_id"))
+            row["related_user_nickname"] = user.nickname if user else None
+            row["related_user_profile_image"] = user.profile_image if user else None
+            row["related_pod_title"] = pods.get(row.get("related_pod_id"))
+
+    async def _get_inbox_projection(
+        self, related_user_id: int | None, related_pod_id: int | None
+    ) -> dict:
+        """알림함 표시용 비정규화 필드 조회 (관련 유저 닉네임/프로필, 파티 제목)"""
+        projection: dict = {}
+
+        if related_user_id is not None:
+            result = await self._session.execute(
+                select(User.nickname, User.profile_image).where(
+                    User.id == related_user_id
+                )
+            )
+            row = result.first()
+            if row:
+                projection["related_user_nickname"] = row.nickname
+                projection["related_user_profile_image"] = row.profile_image
+
+        if related_pod_id is not None:
+            result = await self._session.execute(
+                select(Pod.title).where(Pod.id == related_pod_id)
+            )
+            projection["related_pod_title"] = result.scalar_one_or_none()
+
+        return projection
+
     # - MARK: ID로 알림 조회
     async def get_by_id(self, notification_id: int) -> Notification | None:
         """ID로 알림 조회"""
@@ -79,6 +184,76 @@ class NotificationRepository:
         result = await self._session.execute(query)
         return list(result.scalars().all())
 
+    # - MARK: 알림함 목록 조회 (비정규화 필드 사용)
+    async def get_user_inbox(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 20,
+        unread_only: bool = False,
+        category: str | None = None,
+    ) -> List[Notification]:
+        """사용자의 알림함 목록 조회
+
+        관계를 로드하지 않고 생성 시점에 저장된 닉네임/파티 제목을 사용합니다.
+        비정규화 필드가 비어 있는 이전 알림은 한 번의 IN 쿼리로 채웁니다.
+        """
+        query = select(Notification).where(Notification.user_id == user_id)
+
+        if unread_only:
+            query = query.where(Notification.is_read.is_(False))
+
+        if category:
+            query = query.where(Notification.category == category)
+
+        query = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
+
+        result = await self._session.execute(query)
+        notifications = list(result.scalars().all())
+
+        await self._fill_missing_projection(notifications)
+        return notifications
+
+    async def _fill_missing_projection(self, notifications: List[Notification]) -> None:
+        """비정규화 필드가 없는 알림의 표시 정보 채우기 (DB에는 반영하지 않음)"""
+        user_ids = {
+            n.related_user_id
+            for n in notifications
+            if n.related_user_id is not None and n.related_user_nickname is None
+        }
+        pod_ids = {
+            n.related_pod_id
+            for n in notifications
+            if n.related_pod_id is not None and n.related_pod_title is None
+        }
+
+        users: dict = {}
+        if user_ids:
+            result = await self._session.execute(
+                select(User.id, User.nickname, User.profile_image).where(
+                    User.id.in_(user_ids)
+                )
+            )
+            users = {row.id: row for row in result.all()}
+
+        pods: dict = {}
+        if pod_ids:
+            result = await self._session.execute(
+                select(Pod.id, Pod.title).where(Pod.id.in_(pod_ids))
+            )
+            pods = {row.id: row.title for row in result.all()}
+
+        # 응답용 값이므로 변경 사항으로 추적하지 않도록 committed value로 설정
+        for n in notifications:
+            user = users.get(n.related_user_id)
+            if user is not None:
+                set_committed_value(n, "related_user_nickname", user.nickname)
+                set_committed_value(
+                    n, "related_user_profile_image", user.profile_image
+                )
+            if n.related_pod_id in pods:
+                set_committed_value(n, "related_pod_title", pods[n.related_pod_id])
+
     # - MARK: 전체 알림 개수 조회
     async def get_total_count(
         self,
@@ -102,8 +277,17 @@ class NotificationRepository:
 
     # - MARK: 읽지 않은 알림 개수 조회
     async def get_unread_count(self, user_id: int) -> int:
-        """읽지 않은 알림 개수 조회"""
-        return await self.get_total_count(user_id, unread_only=True)
+        """읽지 않은 알림 개수 조회 (Redis 캐시 우선, 없으면 DB 조회 후 캐시)
+
+        조회 이후 알림 생성/읽음 처리가 있었으면 DB 값을 캐시하지 않습니다.
+        """
+        cached, version = await self._badge_cache.get_unread_count(user_id)
+        if cached is not None:
+            return cached
+
+        count = await self.get_total_count(user_id, unread_only=True)
+        await self._badge_cache.set_unread_count(user_id, count, version)
+        return count
 
     # - MARK: 알림 읽음 처리
     async def mark_as_read(
@@ -126,6 +310,7 @@ class NotificationRepository:
             notification.is_read = True
             notification.read_at = datetime.now(timezone.utc)
             await self._session.commit()
+            await self._badge_cache.adjust_unread_count(user_id, -1)
             # refresh는 관계를 무효화할 수 있으므로, 관계를 다시 로드하기 위해 다시 쿼리
             query = select(Notification).where(Notification.id == notification_id)
             query = query.options(
@@ -150,6 +335,8 @@ class NotificationRepository:
 
         result = await self._session.execute(stmt)
         await self._session.commit()
+        # 커밋과 캐시 갱신 사이에 생성된 알림을 덮어쓰지 않도록 0으로 저장하지 않고 삭제
+        await self._badge_cache.invalidate(user_id)
         return result.rowcount
 
     # - MARK: 알림 삭제
@@ -160,8 +347,11 @@ class NotificationRepository:
         if not notification or notification.user_id != user_id:
             return False
 
+        was_unread = not notification.is_read
         await self._session.delete(notification)
         await self._session.commit()
+        if was_unread:
+            await self._badge_cache.adjust_unread_count(user_id, -1)
         return True
 
     # - MARK: 읽은 알림 전체 삭제
@@ -176,11 +366,35 @@ class NotificationRepository:
         return result.rowcount
 
     # - MARK: 사용자 관련 알림 삭제
-    async def delete_all_by_user_id(self, user_id: int) -> None:
-        """사용자 ID와 관련된 모든 알림 삭제 (user_id와 related_user_id 모두)"""
+    async def delete_all_by_user_id(self, user_id: int) -> List[int]:
+        """사용자 ID와 관련된 모든 알림 삭제 (user_id와 related_user_id 모두)
+
+        커밋은 호출 측에서 하므로 배지 캐시는 비우지 않습니다.
+        커밋 후 반환된 사용자들로 invalidate_unread_counts를 호출해야 합니다.
+
+        Returns:
+            읽지 않은 알림 수가 바뀐 사용자 ID 목록 (본인 포함)
+        """
+        # 다른 사용자가 받은 읽지 않은 알림도 지워지므로 해당 사용자의 배지도 무효화 대상
+        result = await self._session.execute(
+            select(Notification.user_id)
+            .where(
+                Notification.related_user_id == user_id,
+                Notification.is_read.is_(False),
+            )
+            .distinct()
+        )
+        affected_user_ids = set(result.scalars().all())
+
         await self._session.execute(
             delete(Notification).where(
                 (Notification.user_id == user_id)
                 | (Notification.related_user_id == user_id)
             )
         )
+        return [user_id, *(affected_user_ids - {user_id})]
+
+    # - MARK: 배지 캐시 무효화
+    async def invalidate_unread_counts(self, *user_ids: int) -> None:
+        """읽지 않은 알림 수 캐시 삭제 (커밋 후 호출, 다음 조회 시 다시 계산)"""
+        await self._badge_cache.invalidate(*user_ids)
@@ -1,8 +1,12 @@
 from app.common.schemas import BaseResponse, PageDto
 from app.deps.auth import get_current_user_id
-from app.deps.providers import get_notification_use_case
+from app.deps.providers import (
+    get_notification_query_use_case,
+    get_notification_use_case,
+)
 from app.features.notifications.schemas import (
     NotificationDto,
+    NotificationInboxItemDto,
     NotificationUnreadCountResponse,
 )
 from app.features.notifications.use_cases.notification_use_case import (
@@ -27,7 +31,7 @@ async def get_notifications(
         None, description="카테고리 필터 (pod, community, notice)"
     ),
     current_user_id: int = Depends(get_current_user_id),
-    use_case: NotificationUseCase = Depends(get_notification_use_case),
+    use_case: NotificationUseCase = Depends(get_notification_query_use_case),
 ) -> BaseResponse[PageDto[NotificationDto]]:
     result = await use_case.get_notifications(
         user_id=current_user_id,
@@ -39,6 +43,32 @@ async def get_notifications(
     return BaseResponse.ok(data=result)
 
 
+# - MARK: 알림함 목록 조회 (경량)
+@router.get(
+    "/inbox",
+    response_model=BaseResponse[PageDto[NotificationInboxItemDto]],
+    description="알림함 목록 조회 (관련 유저 닉네임/프로필, 파티 제목만 포함하는 경량 응답)",
+)
+async def get_notification_inbox(
+    page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기 (1~100)"),
+    unread_only: bool = Query(False, description="읽지 않은 알림만 조회할지 여부"),
+    category: str | None = Query(
+        None, description="카테고리 필터 (pod, community, notice)"
+    ),
+    current_user_id: int = Depends(get_current_user_id),
+    use_case: NotificationUseCase = Depends(get_notification_query_use_case),
+) -> BaseResponse[PageDto[NotificationInboxItemDto]]:
+    result = await use_case.get_inbox(
+        user_id=current_user_id,
+        page=page,
+        size=size,
+        unread_only=unread_only,
+        category=category,
+    )
+    return BaseResponse.ok(data=result)
+
+
 # - MARK: 읽지 않은 알림 개수 조회
 @router.get(
     "/unread-count",
@@ -47,6 +77,8 @@ async def get_notifications(
 )
 async def get_unread_count(
     current_user_id: int = Depends(get_current_user_id),
+    # 캐시 미스 때 계산한 값이 배지 캐시에 저장되므로 복제본이 아닌 primary에서 계산
+    # (캐시 적중 시에는 세션이 DB 연결을 맺지 않음)
     use_case: NotificationUseCase = Depends(get_notification_use_case),
 ) -> BaseResponse[NotificationUnreadCountResponse]:
     result = await use_case.get_unread_count(current_user_id)
@@ -4,6 +4,7 @@ from .notification_schemas import (
     # Schemas
     NotificationBase,
     NotificationDto,
+    NotificationInboxItemDto,
     NotificationUnreadCountResponse,
     # Category
     NotificationCategory,
@@ -24,6 +25,7 @@ __all__ = [
     # Schemas
     "NotificationBase",
     "NotificationDto",
+    "NotificationInboxItemDto",
     "NotificationUnreadCountResponse",
     # Category
     "NotificationCategory",
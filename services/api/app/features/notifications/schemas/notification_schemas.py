@@ -67,6 +67,43 @@ class NotificationDto(NotificationBase):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
+class NotificationInboxItemDto(NotificationBase):
+    """알림함 목록 응답 스키마 (경량)
+
+    관련 유저/파티 전체 정보 대신 알림 생성 시점에 저장된 표시용 값만 포함합니다.
+    """
+
+    id: int = Field()
+    related_user_id: int | None = Field(default=None, alias="relatedUserId")
+    related_user_nickname: str | None = Field(
+        default=None, alias="relatedUserNickname"
+    )
+    related_user_profile_image: str | None = Field(
+        default=None, alias="relatedUserProfileImage"
+    )
+    related_pod_id: int | None = Field(default=None, alias="relatedPodId")
+    related_pod_title: str | None = Field(default=None, alias="relatedPodTitle")
+    category: NotificationCategory = Field(
+        description="알림 카테고리 (POD, REVIEW, USER, SYSTEM)",
+    )
+    is_read: bool = Field(alias="isRead")
+    read_at: datetime | None = Field(
+        default=None, alias="readAt", description="읽은 시간 (Optional)"
+    )
+    created_at: datetime = Field(alias="createdAt", description="생성 시간")
+
+    @field_serializer("read_at", "created_at")
+    def serialize_datetime(self, dt: datetime | None, _info) -> int | None:
+        """datetime을 timestamp(밀리초)로 변환"""
+        if dt is None:
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return int(dt.timestamp() * 1000)
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
 class NotificationUnreadCountResponse(BaseModel):
     """읽지 않은 알림 개수 응답"""
 
@@ -95,6 +132,7 @@ __all__ = [
     # Schemas
     "NotificationBase",
     "NotificationDto",
+    "NotificationInboxItemDto",
     "NotificationUnreadCountResponse",
     # Category
     "NotificationCategory",
@@ -6,7 +6,8 @@ Firebase Cloud Messaging을 통한 알림 전송 비즈니스 로직을 담당
 """
 
 import logging
-from datetime import datetime, timezone
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +22,10 @@ from app.core.notifications import (
 from app.features.notifications.repositories.notification_repository import (
     NotificationRepository,
 )
+from app.features.notifications.services.notification_batch_writer import (
+    NotificationBatchWriter,
+    active_batch_writer,
+)
 from app.features.users.repositories import UserNotificationRepository
 
 logger = logging.getLogger(__name__)
@@ -33,6 +38,30 @@ class FCMService:
         """FCM 서비스 초기화"""
         self._fcm_client = fcm_client or get_fcm_client()
 
+    @asynccontextmanager
+    async def batch_notifications(
+        self, db: AsyncSession, user_ids: list[int] | None = None
+    ) -> AsyncIterator[NotificationBatchWriter]:
+        """fan-out 구간의 알림 DB 저장을 일괄 INSERT로 묶음
+
+        블록 안에서 같은 세션으로 전송된 알림은 버퍼에 모였다가
+        배치 크기마다, 그리고 블록이 끝날 때 저장됩니다.
+        user_ids를 넘기면 수신자들의 알림 설정을 한 번에 미리 캐시합니다.
+        """
+        if user_ids:
+            try:
+                await UserNotificationRepository(db).get_preferences(user_ids)
+            except Exception as e:
+                logger.warning(f"알림 설정 일괄 조회 실패: error={e}")
+
+        writer = NotificationBatchWriter(db)
+        token = active_batch_writer.set(writer)
+        try:
+            yield writer
+        finally:
+            active_batch_writer.reset(token)
+            await writer.flush()
+
     async def send_notification(
         self,
         token: str,
@@ -76,11 +105,11 @@ class FCMService:
 
             # 개인 대 개인 팔로우 알림 설정 확인 (USER_FOLLOWED 이벤트인 경우)
             if category == "USER" and data and data.get("value") == "USER_FOLLOWED":
-                from app.features.follow.repositories.follow_repository import (
-                    FollowRepository,
+                from app.features.follow.repositories.follow_notification_repository import (
+                    FollowNotificationRepository,
                 )
 
-                follow_crud = FollowRepository(db)
+                follow_crud = FollowNotificationRepository(db)
                 related_user_id_from_data = data.get("relatedId")
 
                 if related_user_id_from_data:
@@ -167,33 +196,29 @@ class FCMService:
 
             category = notification_type  # notification_type is already the category
 
-            before_create = datetime.now(timezone.utc)
-            logger.info(
-                f"[알림 생성 전] user_id={user_id}, notification_value={notification_value}, "
-                f"현재 시간(UTC): {before_create.isoformat()}"
-            )
+            row = {
+                "user_id": user_id,
+                "related_user_id": related_user_id,
+                "related_pod_id": related_pod_id,
+                "title": title,
+                "body": body,
+                "notification_type": notification_type,
+                "notification_value": notification_value,
+                "related_id": data.get("relatedId"),
+                "category": category,
+            }
+
+            # fan-out 중이면 버퍼에 모았다가 일괄 저장
+            writer = active_batch_writer.get()
+            if writer is not None and writer.db is db:
+                await writer.add(**row)
+                return
 
             notification_repo = NotificationRepository(db)
-            notification = await notification_repo.create_notification(
-                user_id=user_id,
-                related_user_id=related_user_id,
-                related_pod_id=related_pod_id,
-                title=title,
-                body=body,
-                notification_type=notification_type,
-                notification_value=notification_value,
-                related_id=data.get("relatedId"),
-                category=category,
-            )
-
-            created_at_value = getattr(notification, "created_at", None)
-            created_at_str = (
-                created_at_value.isoformat() if created_at_value is not None else "None"
-            )
-            logger.info(
-                f"[알림 생성 후] notification_id={getattr(notification, 'id', 'Unknown')}, "
-                f"user_id={user_id}, notification_value={notification_value}, "
-                f"DB 저장 시간(UTC): {created_at_str}"
+            notification = await notification_repo.create_notification(**row)
+            logger.debug(
+                f"알림 저장: notification_id={notification.id}, "
+                f"user_id={user_id}, notification_value={notification_value}"
             )
         except Exception as db_error:
             logger.error(f"알림 DB 저장 실패: {db_error}")
@@ -0,0 +1,159 @@
+"""
+알림 배지 Redis 캐시 서비스
+사용자별 읽지 않은 알림 개수를 Redis 카운터로 유지하여 배지 조회 시 DB를 거치지 않도록 함
+"""
+
+import logging
+
+from redis.asyncio import Redis
+
+from app.deps.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis 키 prefix
+NOTIFICATION_USER_PREFIX = "notification:user"
+
+# TTL 설정 (초) - 경합으로 인한 오차가 남더라도 하루 안에 DB 기준으로 재계산됨
+UNREAD_COUNT_TTL = 60 * 60 * 24  # 24시간
+
+# 카운터를 바꾸는 쓰기마다 버전을 올려, 그 사이에 DB에서 센 값이 저장되지 않도록 함
+# KEYS: [카운터 키, 버전 키]
+# ARGV: [증감값, 버전 TTL(초)]
+# 키가 있을 때만 증감 (없는 카운터를 임의로 만들지 않음), 0 미만으로 내려가지 않음
+_ADJUST_IF_EXISTS_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+    value = 0
+end
+return value
+"""
+
+# 조회 시점 이후 쓰기가 없었을 때만 DB에서 센 값을 저장
+# KEYS: [카운터 키, 버전 키]
+# ARGV: [개수, 조회 시점의 버전, TTL(초)]
+# 반환: 1 저장 / 0 그 사이 쓰기가 있어 저장하지 않음
+_SET_IF_VERSION_SCRIPT = """
+local version = redis.call('GET', KEYS[2]) or '0'
+if version ~= ARGV[2] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+# 카운터 삭제 + 버전 증가
+# KEYS: [카운터 키, 버전 키]
+# ARGV: [버전 TTL(초)]
+_INVALIDATE_SCRIPT = """
+redis.call('DEL', KEYS[1])
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+return 1
+"""
+
+
+class NotificationBadgeCacheService:
+    """알림 배지(읽지 않은 개수) Redis 캐시 서비스
+
+    카운터가 없으면 None을 반환하고, 호출 측에서 DB 값으로 채웁니다.
+    카운터를 바꾸는 쓰기는 사용자별 버전을 올리므로, DB 조회와 저장 사이에 쓰기가 있었으면
+    조회한 값은 저장되지 않습니다 (오래된 값이 TTL 동안 남지 않도록).
+    캐시 오류는 로깅만 하고 DB 조회로 폴백합니다.
+    """
+
+    def __init__(self, redis: Redis | None = None):
+        self._redis = redis
+
+    async def _client(self) -> Redis:
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        return self._redis
+
+    # ========== 키 생성 헬퍼 ==========
+
+    def _unread_count_key(self, user_id: int) -> str:
+        return f"{NOTIFICATION_USER_PREFIX}:{user_id}:unread"
+
+    def _unread_version_key(self, user_id: int) -> str:
+        return f"{NOTIFICATION_USER_PREFIX}:{user_id}:unread:version"
+
+    # ========== 읽지 않은 알림 개수 ==========
+
+    async def get_unread_count(self, user_id: int) -> tuple[int | None, str | None]:
+        """캐시된 읽지 않은 알림 개수와 현재 버전 조회
+
+        카운터가 없으면 개수는 None이며, DB에서 센 값은 함께 받은 버전으로
+        set_unread_count에 전달해야 합니다. 캐시 오류 시 (None, None)을 반환합니다.
+        """
+        try:
+            redis = await self._client()
+            value, version = await redis.mget(
+                self._unread_count_key(user_id), self._unread_version_key(user_id)
+            )
+            count = int(value) if value is not None else None
+            return count, version or "0"
+        except Exception as e:
+            logger.error(f"Redis 알림 배지 조회 실패: user_id={user_id}, error={e}")
+            return None, None
+
+    async def set_unread_count(
+        self, user_id: int, count: int, version: str | None
+    ) -> None:
+        """읽지 않은 알림 개수 저장 (조회 시점 이후 쓰기가 있었으면 저장하지 않음)"""
+        if version is None:
+            return
+        try:
+            redis = await self._client()
+            await redis.eval(
+                _SET_IF_VERSION_SCRIPT,
+                2,
+                self._unread_count_key(user_id),
+                self._unread_version_key(user_id),
+                max(count, 0),
+                version,
+                UNREAD_COUNT_TTL,
+            )
+        except Exception as e:
+            logger.error(f"Redis 알림 배지 저장 실패: user_id={user_id}, error={e}")
+
+    async def adjust_unread_count(self, user_id: int, delta: int) -> None:
+        """읽지 않은 알림 개수 증감 (캐시된 카운터가 있을 때만)"""
+        try:
+            redis = await self._client()
+            await redis.eval(
+                _ADJUST_IF_EXISTS_SCRIPT,
+                2,
+                self._unread_count_key(user_id),
+                self._unread_version_key(user_id),
+                delta,
+                UNREAD_COUNT_TTL,
+            )
+        except Exception as e:
+            logger.error(f"Redis 알림 배지 갱신 실패: user_id={user_id}, error={e}")
+            await self.invalidate(user_id)
+
+    async def invalidate(self, *user_ids: int) -> None:
+        """카운터 삭제 (다음 조회 시 DB 기준으로 재계산)"""
+        if not user_ids:
+            return
+        try:
+            redis = await self._client()
+            async with redis.pipeline(transaction=False) as pipe:
+                for uid in user_ids:
+                    pipe.eval(
+                        _INVALIDATE_SCRIPT,
+                        2,
+                        self._unread_count_key(uid),
+                        self._unread_version_key(uid),
+                        UNREAD_COUNT_TTL,
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis 알림 배지 삭제 실패: user_ids={user_ids}, error={e}")
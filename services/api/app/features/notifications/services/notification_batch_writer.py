@@ -0,0 +1,95 @@
+"""
+알림 일괄 저장 Writer
+
+여러 사용자에게 알림을 보내는 fan-out 구간에서 알림 행을 모아 두었다가
+multi-row INSERT 한 번으로 저장합니다.
+
+사용 예시:
+    async with fcm_service.batch_notifications(session):
+        for follower in followers:
+            await fcm_service.send_followed_user_created_pod(..., db=session, ...)
+"""
+
+import logging
+from contextvars import ContextVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.features.notifications.repositories.notification_repository import (
+    NotificationRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# 한 번의 INSERT로 저장할 최대 행 수
+NOTIFICATION_BATCH_SIZE = 200
+
+# 현재 태스크에서 활성화된 Writer (FCMService가 싱글톤이므로 태스크 단위로 구분)
+active_batch_writer: ContextVar["NotificationBatchWriter | None"] = ContextVar(
+    "active_notification_batch_writer", default=None
+)
+
+
+class NotificationBatchWriter:
+    """알림 행 버퍼
+
+    행은 전송에 성공한 알림만 추가되며, 배치가 가득 차거나 fan-out이 끝나면 저장됩니다.
+    """
+
+    def __init__(self, db: AsyncSession, batch_size: int = NOTIFICATION_BATCH_SIZE):
+        self.db = db
+        self._batch_size = batch_size
+        self._rows: list[dict] = []
+        self._written = 0
+
+    @property
+    def written(self) -> int:
+        """지금까지 저장된 알림 수"""
+        return self._written
+
+    async def add(
+        self,
+        user_id: int,
+        title: str,
+        body: str,
+        notification_type: str,
+        notification_value: str,
+        related_user_id: int | None = None,
+        related_pod_id: int | None = None,
+        related_id: str | None = None,
+        category: str = "pod",
+    ) -> None:
+        """알림 행 추가 (배치 크기에 도달하면 즉시 저장)"""
+        self._rows.append(
+            {
+                "user_id": user_id,
+                "title": title,
+                "body": body,
+                "notification_type": notification_type,
+                "notification_value": notification_value,
+                "related_user_id": related_user_id,
+                "related_pod_id": related_pod_id,
+                "related_id": related_id,
+                "category": category,
+            }
+        )
+        if len(self._rows) >= self._batch_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """버퍼에 쌓인 알림 저장"""
+        if not self._rows:
+            return 0
+
+        rows, self._rows = self._rows, []
+        try:
+            count = await NotificationRepository(self.db).bulk_create_notifications(
+                rows
+            )
+            self._written += count
+            logger.info(f"알림 일괄 저장: {count}건")
+            return count
+        except Exception as e:
+            logger.error(f"알림 일괄 저장 실패: {len(rows)}건, error={e}")
+            await self.db.rollback()
+            return 0
@@ -4,7 +4,10 @@ from datetime import time
 from typing import TYPE_CHECKING
 
 from app.features.notifications.models import Notification
-from app.features.notifications.schemas import NotificationDto
+from app.features.notifications.schemas import (
+    NotificationDto,
+    NotificationInboxItemDto,
+)
 from app.features.pods.services.pod_dto_service import PodDtoService
 from app.features.users.models import User, UserNotificationSettings
 from app.features.users.schemas import UserDto, UserNotificationSettingsDto
@@ -93,6 +96,26 @@ class NotificationDtoService:
             related_pod=related_pod_dto,
         )
 
+    @classmethod
+    def convert_to_inbox_item(cls, notification: Notification) -> NotificationInboxItemDto:
+        """알림 모델을 알림함 목록용 경량 DTO로 변환 (관계 로드 없음)"""
+        return NotificationInboxItemDto(
+            id=notification.id,
+            title=notification.title,
+            body=notification.body,
+            event=notification.notification_value,
+            related_id=cls._parse_related_id(notification.related_id),
+            related_user_id=notification.related_user_id,
+            related_user_nickname=notification.related_user_nickname,
+            related_user_profile_image=notification.related_user_profile_image,
+            related_pod_id=notification.related_pod_id,
+            related_pod_title=notification.related_pod_title,
+            category=notification.category,
+            is_read=notification.is_read,
+            read_at=notification.read_at,
+            created_at=notification.created_at,
+        )
+
     async def _create_related_user_dto(
         self, notification: Notification
     ) -> UserDto | None:
@@ -0,0 +1,233 @@
+"""
+알림 수신 설정 캐시 서비스
+
+푸시마다 반복되는 알림 설정 / 팔로우 알림 여부 조회를
+프로세스 내 LRU(짧은 TTL)와 Redis 2단계로 캐시합니다.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+from redis.asyncio import Redis
+
+from app.deps.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis 키 prefix
+NOTIFICATION_USER_PREFIX = "notification:user"
+FOLLOW_NOTIFICATION_PREFIX = "notification:follow"
+
+# TTL 설정 (초)
+PREFERENCES_TTL = 60 * 60  # Redis: 1시간 (변경 시 즉시 삭제)
+LOCAL_TTL = 30  # 프로세스 내: 다른 워커의 변경이 늦어도 30초 안에 반영됨
+LOCAL_MAX_SIZE = 10_000
+
+# 팔로우 관계가 없을 때 저장하는 값
+_NO_FOLLOW = "-"
+
+
+@dataclass(frozen=True)
+class NotificationPreferences:
+    """사용자 알림 수신 설정 스냅샷 (설정이 없으면 모두 허용)"""
+
+    pod_enabled: bool = True
+    community_enabled: bool = True
+    notice_enabled: bool = True
+
+    def allows(self, notification_category: str) -> bool:
+        """카테고리별 알림 전송 여부"""
+        category_mapping = {
+            "POD": self.pod_enabled,
+            "COMMUNITY": self.community_enabled,
+            "NOTICE": self.notice_enabled,
+        }
+        return category_mapping.get(notification_category, True)
+
+
+class _LocalTTLCache:
+    """프로세스 내 LRU + TTL 캐시"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: str) -> tuple[bool, object]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: object) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+# 워커 프로세스 전체에서 공유 (Repository는 요청마다 새로 생성되므로 모듈 단위로 보관)
+_local_cache = _LocalTTLCache(LOCAL_MAX_SIZE, LOCAL_TTL)
+
+
+class NotificationPreferenceCacheService:
+    """알림 수신 설정 캐시 서비스
+
+    조회 결과가 없으면 호출 측(Repository)에서 DB 값으로 채웁니다.
+    캐시 오류는 로깅만 하고 DB 조회로 폴백합니다.
+    """
+
+    def __init__(self, redis: Redis | None = None):
+        self._redis = redis
+
+    async def _client(self) -> Redis:
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        return self._redis
+
+    # ========== 키 생성 헬퍼 ==========
+
+    def _preferences_key(self, user_id: int) -> str:
+        return f"{NOTIFICATION_USER_PREFIX}:{user_id}:preferences"
+
+    def _follow_key(self, follower_id: int, following_id: int) -> str:
+        return f"{FOLLOW_NOTIFICATION_PREFIX}:{follower_id}:{following_id}"
+
+    # ========== 알림 설정 ==========
+
+    async def get_preferences(
+        self, user_ids: list[int]
+    ) -> dict[int, NotificationPreferences]:
+        """캐시된 알림 설정 조회 (캐시에 없는 사용자는 결과에서 빠짐)"""
+        found: dict[int, NotificationPreferences] = {}
+        missing: list[int] = []
+        for user_id in dict.fromkeys(user_ids):
+            hit, value = _local_cache.get(self._preferences_key(user_id))
+            if hit:
+                found[user_id] = value  # type: ignore[assignment]
+            else:
+                missing.append(user_id)
+
+        if not missing:
+            return found
+
+        try:
+            redis = await self._client()
+            values = await redis.mget([self._preferences_key(uid) for uid in missing])
+        except Exception as e:
+            logger.error(f"Redis 알림 설정 조회 실패: user_ids={missing}, error={e}")
+            return found
+
+        for user_id, raw in zip(missing, values):
+            if raw is None:
+                continue
+            preferences = NotificationPreferences(**json.loads(raw))
+            _local_cache.set(self._preferences_key(user_id), preferences)
+            found[user_id] = preferences
+        return found
+
+    async def set_preferences(
+        self, preferences_by_user: dict[int, NotificationPreferences]
+    ) -> None:
+        """알림 설정 저장"""
+        if not preferences_by_user:
+            return
+
+        for user_id, preferences in preferences_by_user.items():
+            _local_cache.set(self._preferences_key(user_id), preferences)
+
+        try:
+            redis = await self._client()
+            async with redis.pipeline(transaction=False) as pipe:
+                for user_id, preferences in preferences_by_user.items():
+                    pipe.set(
+                        self._preferences_key(user_id),
+                        json.dumps(asdict(preferences)),
+                        ex=PREFERENCES_TTL,
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis 알림 설정 저장 실패: error={e}")
+
+    async def invalidate_preferences(self, user_id: int) -> None:
+        """알림 설정 캐시 삭제"""
+        _local_cache.delete(self._preferences_key(user_id))
+        try:
+            redis = await self._client()
+            await redis.delete(self._preferences_key(user_id))
+        except Exception as e:
+            logger.error(f"Redis 알림 설정 삭제 실패: user_id={user_id}, error={e}")
+
+    # ========== 팔로우 알림 여부 ==========
+
+    async def get_follow_notification(
+        self, follower_id: int, following_id: int
+    ) -> tuple[bool, bool | None]:
+        """캐시된 팔로우 알림 여부 조회
+
+        Returns:
+            (캐시 적중 여부, 알림 여부 - 팔로우 관계가 없으면 None)
+        """
+        key = self._follow_key(follower_id, following_id)
+        hit, value = _local_cache.get(key)
+        if hit:
+            return True, value  # type: ignore[return-value]
+
+        try:
+            redis = await self._client()
+            raw = await redis.get(key)
+        except Exception as e:
+            logger.error(
+                f"Redis 팔로우 알림 설정 조회 실패: follower_id={follower_id}, "
+                f"following_id={following_id}, error={e}"
+            )
+            return False, None
+
+        if raw is None:
+            return False, None
+
+        enabled = None if raw == _NO_FOLLOW else raw == "1"
+        _local_cache.set(key, enabled)
+        return True, enabled
+
+    async def set_follow_notification(
+        self, follower_id: int, following_id: int, enabled: bool | None
+    ) -> None:
+        """팔로우 알림 여부 저장"""
+        key = self._follow_key(follower_id, following_id)
+        _local_cache.set(key, enabled)
+        try:
+            redis = await self._client()
+            raw = _NO_FOLLOW if enabled is None else ("1" if enabled else "0")
+            await redis.set(key, raw, ex=PREFERENCES_TTL)
+        except Exception as e:
+            logger.error(
+                f"Redis 팔로우 알림 설정 저장 실패: follower_id={follower_id}, "
+                f"following_id={following_id}, error={e}"
+            )
+
+    async def invalidate_follow_notification(
+        self, follower_id: int, following_id: int
+    ) -> None:
+        """팔로우 알림 여부 캐시 삭제"""
+        key = self._follow_key(follower_id, following_id)
+        _local_cache.delete(key)
+        try:
+            redis = await self._client()
+            await redis.delete(key)
+        except Exception as e:
+            logger.error(
+                f"Redis 팔로우 알림 설정 삭제 실패: follower_id={follower_id}, "
+                f"following_id={following_id}, error={e}"
+            )
@@ -11,6 +11,7 @@ from app.features.notifications.repositories.notification_repository import (
 )
 from app.features.notifications.schemas import (
     NotificationDto,
+    NotificationInboxItemDto,
     NotificationUnreadCountResponse,
 )
 from app.features.notifications.services.notification_dto_service import (
@@ -89,9 +90,41 @@ class NotificationUseCase:
             total_count=total_count,
         )
 
+    # MARK: - 알림함 목록 조회 (경량)
+    async def get_inbox(
+        self,
+        user_id: int,
+        page: int = 1,
+        size: int = 20,
+        unread_only: bool = False,
+        category: str | None = None,
+    ) -> PageDto[NotificationInboxItemDto]:
+        """사용자의 알림함 목록 조회 (관련 유저/파티 JOIN 없이 비정규화 필드 사용)"""
+        skip = (page - 1) * size
+        category_upper = category.upper() if category else None
+
+        notifications = await self._notification_repo.get_user_inbox(
+            user_id=user_id,
+            skip=skip,
+            limit=size,
+            unread_only=unread_only,
+            category=category_upper,
+        )
+
+        total_count = await self._notification_repo.get_total_count(
+            user_id=user_id, unread_only=unread_only, category=category_upper
+        )
+
+        return PageDto.create(
+            items=[self._dto_service.convert_to_inbox_item(n) for n in notifications],
+            page=page,
+            size=size,
+            total_count=total_count,
+        )
+
     # MARK: - 읽지 않은 알림 개수 조회
     async def get_unread_count(self, user_id: int) -> NotificationUnreadCountResponse:
-        """읽지 않은 알림 개수 조회"""
+        """읽지 않은 알림 개수 조회 (Redis 캐시 우선)"""
         unread_count = await self._notification_repo.get_unread_count(user_id)
         return NotificationUnreadCountResponse(unread_count=unread_count)
 
@@ -1,6 +1,5 @@
 """애플 OAuth 서비스"""
 
-import base64
 import logging
 import time
 from typing import Any, Dict
@@ -13,6 +12,7 @@ from app.features.oauth.schemas import (
     AppleTokenResponse,
     OAuthUserInfo,
 )
+from app.features.oauth.services.jwks_cache import JWKSCache
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
 from jose.exceptions import JWTClaimsError
@@ -21,11 +21,17 @@ from jose.exceptions import JWTClaimsError
 class AppleOAuthService:
     """애플 OAuth 서비스 (Stateless)"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, http_client: httpx.AsyncClient, jwks_cache: JWKSCache | None = None
+    ) -> None:
         """서비스 초기화"""
+        self._http_client = http_client
         self._apple_public_keys_url = "https://appleid.apple.com/auth/keys"
         self._apple_token_url = "https://appleid.apple.com/auth/token"
         self._apple_issuer = "https://appleid.apple.com"
+        self._jwks_cache = jwks_cache or JWKSCache(
+            self._apple_public_keys_url, http_client=http_client
+        )
 
     # - MARK: 애플 사용자 정보 조회
     async def get_apple_user_info(self, request: AppleLoginRequest) -> OAuthUserInfo:
@@ -57,26 +63,12 @@ class AppleOAuthService:
                 detail=f"Apple token verification failed: {str(e)}",
             ) from e
 
-    # - MARK: Apple 공개키 목록 조회
-    async def _get_apple_public_keys(self) -> Dict[str, Any]:
-        """Apple의 공개키 목록 가져오기"""
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self._apple_public_keys_url)
-                response.raise_for_status()
-                return response.json()
-        except httpx.RequestError as e:
-            raise ValueError(f"Failed to fetch Apple public keys: {str(e)}") from e
-
     # - MARK: Apple ID 토큰 검증
     async def _verify_apple_token(
         self, identity_token: str, audience: str
     ) -> Dict[str, Any]:
         """Apple ID 토큰 검증"""
         try:
-            # Apple 공개키 가져오기
-            public_keys = await self._get_apple_public_keys()
-
             # 토큰 헤더에서 kid (Key ID) 추출
             token_header = jwt.get_unverified_header(identity_token)
             kid = token_header.get("kid")
@@ -84,44 +76,14 @@ class AppleOAuthService:
             if not kid:
                 raise ValueError("No Key ID in token header")
 
-            # 해당하는 공개키 찾기
-            public_key = None
-            for key in public_keys["keys"]:
-                if key["kid"] == kid:
-                    public_key = key
-                    break
-
-            if not public_key:
-                raise ValueError("No matching public key found")
-
-            # 공개키를 PEM 형식으로 변환
-            from cryptography.hazmat.backends import default_backend
-            from cryptography.hazmat.primitives import serialization
-            from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
-
-            def base64url_decode(data: str) -> bytes:
-                missing_padding = len(data) % 4
-                if missing_padding:
-                    data += "=" * (4 - missing_padding)
-                return base64.urlsafe_b64decode(data)
-
-            numbers = RSAPublicNumbers(
-                e=int.from_bytes(base64url_decode(public_key["e"]), "big"),
-                n=int.from_bytes(base64url_decode(public_key["n"]), "big"),
-            )
-            public_key_obj = numbers.public_key(backend=default_backend())
-
-            # PEM 형식으로 변환
-            public_key_pem = public_key_obj.public_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PublicFormat.SubjectPublicKeyInfo,
-            )
+            # 캐시된 Apple 공개키 조회 (모르는 kid면 재조회)
+            public_key = await self._jwks_cache.get_key(kid)
 
             # 토큰 검증
             try:
                 payload = jwt.decode(
                     identity_token,
-                    public_key_pem,
+                    public_key,
                     algorithms=["RS256"],
                     audience=audience,
                     issuer=self._apple_issuer,
@@ -172,17 +134,16 @@ class AppleOAuthService:
                 "redirect_uri": settings.APPLE_REDIRECT_URI,
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self._apple_token_url,
-                    data=token_data,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
+            response = await self._http_client.post(
+                self._apple_token_url,
+                data=token_data,
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
 
-                if response.status_code != 200:
-                    raise ValueError(f"Token exchange failed: {response.text}")
+            if response.status_code != 200:
+                raise ValueError(f"Token exchange failed: {response.text}")
 
-                return AppleTokenResponse(**response.json())
+            return AppleTokenResponse(**response.json())
 
         except httpx.RequestError as e:
             raise ValueError(f"Authorization code exchange failed: {str(e)}") from e
@@ -1,6 +1,5 @@
 """구글 OAuth 서비스"""
 
-import asyncio
 from typing import Any, Dict
 from urllib.parse import urlencode
 
@@ -12,18 +11,26 @@ from app.features.oauth.schemas import (
     GoogleTokenResponse,
     OAuthUserInfo,
 )
+from app.features.oauth.services.jwks_cache import JWKSCache
 from fastapi import HTTPException, status
-from google.auth.transport import requests
-from google.oauth2 import id_token
+from jose import JWTError, jwt
 
 
 class GoogleOAuthService:
     """구글 OAuth 서비스 (Stateless)"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, http_client: httpx.AsyncClient, jwks_cache: JWKSCache | None = None
+    ) -> None:
         """서비스 초기화"""
+        self._http_client = http_client
         self._google_token_url = "https://oauth2.googleapis.com/token"
         self._google_user_info_url = "https://www.googleapis.com/oauth2/v2/userinfo"
+        self._google_certs_url = "https://www.googleapis.com/oauth2/v3/certs"
+        self._google_issuers = ["accounts.google.com", "https://accounts.google.com"]
+        self._jwks_cache = jwks_cache or JWKSCache(
+            self._google_certs_url, http_client=http_client
+        )
 
     # - MARK: 구글 액세스 토큰 조회
     async def get_google_token(self, code: str) -> GoogleTokenResponse:
@@ -43,39 +50,46 @@ class GoogleOAuthService:
             code=code,
         )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self._google_token_url,
-                data=token_params.model_dump(exclude_none=True),
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
+        response = await self._http_client.post(
+            self._google_token_url,
+            data=token_params.model_dump(exclude_none=True),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
 
-            if response.status_code != 200:
-                error_response = BaseResponse.error(
-                    http_status=status.HTTP_401_UNAUTHORIZED,
-                    error_key="GOOGLE_TOKEN_REQUEST_FAILED",
-                    error_code=20002,
-                    message_ko=f"구글 액세스 토큰 요청 실패: {response.text}",
-                    message_en=f"Google access token request failed: {response.text}",
-                    dev_note=f"액세스 토큰 요청 실패: {str(response.text)}",
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=error_response.model_dump(),
-                )
+        if response.status_code != 200:
+            error_response = BaseResponse.error(
+                http_status=status.HTTP_401_UNAUTHORIZED,
+                error_key="GOOGLE_TOKEN_REQUEST_FAILED",
+                error_code=20002,
+                message_ko=f"구글 액세스 토큰 요청 실패: {response.text}",
+                message_en=f"Google access token request failed: {response.text}",
+                dev_note=f"액세스 토큰 요청 실패: {str(response.text)}",
+            )
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=error_response.model_dump(),
+            )
 
-            return GoogleTokenResponse(**response.json())
+        return GoogleTokenResponse(**response.json())
 
     # - MARK: 구글 ID 토큰 검증 및 사용자 정보 조회
     async def verify_google_id_token(self, id_token_str: str) -> OAuthUserInfo:
         """구글 ID 토큰 검증 및 사용자 정보 추출"""
         try:
-            # ID 토큰 검증 (동기 함수를 비동기로 실행)
-            idinfo: Dict[str, Any] = await asyncio.to_thread(
-                id_token.verify_oauth2_token,
+            # 토큰 헤더의 kid로 캐시된 구글 공개키 조회 (모르는 kid면 재조회)
+            kid = jwt.get_unverified_header(id_token_str).get("kid")
+            if not kid:
+                raise ValueError("No Key ID in token header")
+            public_key = await self._jwks_cache.get_key(kid)
+
+            # ID 토큰 검증 (서명, 만료, audience, issuer)
+            idinfo: Dict[str, Any] = jwt.decode(
                 id_token_str,
-                requests.Request(),
-                settings.GOOGLE_CLIENT_ID,
+                public_key,
+                algorithms=["RS256"],
+                audience=settings.GOOGLE_CLIENT_ID,
+                issuer=self._google_issuers,
+                options={"verify_at_hash": False},
             )
 
             # 사용자 정보 추출
@@ -85,7 +99,7 @@ class GoogleOAuthService:
                 email=idinfo.get("email"),
                 image_url=idinfo.get("picture"),
             )
-        except ValueError as e:
+        except (ValueError, JWTError) as e:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=f"Invalid Google ID token: {str(e)}",
@@ -99,36 +113,35 @@ class GoogleOAuthService:
     # - MARK: 구글 사용자 정보 조회
     async def get_google_user_info(self, access_token: str) -> OAuthUserInfo:
         """구글 액세스 토큰으로 사용자 정보 조회"""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    self._google_user_info_url,
-                    headers={
-                        "Authorization": f"Bearer {access_token}",
-                    },
-                )
+        try:
+            response = await self._http_client.get(
+                self._google_user_info_url,
+                headers={
+                    "Authorization": f"Bearer {access_token}",
+                },
+            )
 
-                if response.status_code != 200:
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail=f"Failed to get Google user info: {response.text}",
-                    )
+            if response.status_code != 200:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail=f"Failed to get Google user info: {response.text}",
+                )
 
-                user_info: Dict[str, Any] = response.json()
-                print(f"🔍 DEBUG - Google user info response: {user_info}")
+            user_info: Dict[str, Any] = response.json()
+            print(f"🔍 DEBUG - Google user info response: {user_info}")
 
-                return OAuthUserInfo(
-                    id=str(user_info.get("sub", "")),  # Google은 "sub"을 사용
-                    username=user_info.get("name"),
-                    email=user_info.get("email"),
-                    image_url=user_info.get("picture"),
-                )
+            return OAuthUserInfo(
+                id=str(user_info.get("sub", "")),  # Google은 "sub"을 사용
+                username=user_info.get("name"),
+                email=user_info.get("email"),
+                image_url=user_info.get("picture"),
+            )
 
-            except httpx.RequestError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Google API request failed: {str(e)}",
-                ) from e
+        except httpx.RequestError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Google API request failed: {str(e)}",
+            ) from e
 
     # - MARK: 구글 인증 URL 생성
     def get_auth_url(self) -> str:
@@ -0,0 +1,174 @@
+"""JWKS(공개키 목록) 캐시
+
+Apple / Google ID 토큰 검증에 쓰는 공개키를 kid 단위로 파싱해 보관합니다.
+- 응답의 Cache-Control max-age 동안 재사용
+- 만료가 가까워지면 백그라운드에서 갱신 (요청은 기존 키로 계속 처리)
+- 모르는 kid가 오면 즉시 재조회 (키 교체 대응, 최소 간격 제한)
+"""
+
+import asyncio
+import base64
+import logging
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+import httpx
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
+
+logger = logging.getLogger(__name__)
+
+# (JWKS 본문, max-age 초 또는 None)
+JWKSFetcher = Callable[[str], Awaitable[Tuple[Dict[str, Any], int | None]]]
+
+# 기본값 (초)
+DEFAULT_MAX_AGE = 60 * 60  # Cache-Control이 없을 때 1시간
+REFRESH_AHEAD = 5 * 60  # 만료 5분 전부터 백그라운드 갱신
+MIN_REFETCH_INTERVAL = 60  # 모르는 kid로 인한 재조회 최소 간격
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def _base64url_decode(data: str) -> bytes:
+    missing_padding = len(data) % 4
+    if missing_padding:
+        data += "=" * (4 - missing_padding)
+    return base64.urlsafe_b64decode(data)
+
+
+def parse_max_age(cache_control: str | None) -> int | None:
+    """Cache-Control 헤더에서 max-age 추출"""
+    if not cache_control:
+        return None
+    match = _MAX_AGE_PATTERN.search(cache_control)
+    return int(match.group(1)) if match else None
+
+
+async def fetch_jwks(
+    client: httpx.AsyncClient, url: str
+) -> Tuple[Dict[str, Any], int | None]:
+    """JWKS 엔드포인트 조회"""
+    response = await client.get(url)
+    response.raise_for_status()
+    return response.json(), parse_max_age(response.headers.get("cache-control"))
+
+
+class StaticJWKSFetcher:
+    """고정된 JWKS를 돌려주는 Fetcher (로컬 개발/테스트용 스텁)"""
+
+    def __init__(self, jwks: Dict[str, Any], max_age: int | None = None):
+        self._jwks = jwks
+        self._max_age = max_age
+        self.calls = 0
+
+    async def __call__(self, url: str) -> Tuple[Dict[str, Any], int | None]:
+        self.calls += 1
+        return self._jwks, self._max_age
+
+
+class JWKSCache:
+    """kid → 파싱된 공개키 캐시"""
+
+    def __init__(
+        self,
+        url: str,
+        http_client: httpx.AsyncClient | None = None,
+        fetcher: JWKSFetcher | None = None,
+        default_max_age: int = DEFAULT_MAX_AGE,
+    ):
+        if fetcher is None and http_client is None:
+            raise ValueError("http_client or fetcher is required")
+
+        self._url = url
+        self._http_client = http_client
+        self._fetcher = fetcher or self._fetch_with_http_client
+        self._default_max_age = default_max_age
+        self._keys: Dict[str, Any] = {}
+        self._expires_at = 0.0
+        self._last_fetched_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    # - MARK: 공개키 조회
+    async def get_key(self, kid: str) -> Any:
+        """kid에 해당하는 공개키 반환
+
+        Raises:
+            ValueError: 공개키 목록을 가져오지 못했거나 kid가 없는 경우
+        """
+        now = time.monotonic()
+
+        if not self._keys or now >= self._expires_at:
+            await self._refresh(force=False)
+        elif kid not in self._keys:
+            # 키 교체 직후일 수 있으므로 재조회 (위조된 kid 폭주 대비 간격 제한)
+            if now - self._last_fetched_at >= MIN_REFETCH_INTERVAL:
+                await self._refresh(force=True)
+        elif now >= self._expires_at - REFRESH_AHEAD:
+            self._schedule_background_refresh()
+
+        key = self._keys.get(kid)
+        if key is None:
+            raise ValueError("No matching public key found")
+        return key
+
+    # - MARK: 공개키 갱신
+    async def _refresh(self, force: bool) -> None:
+        async with self._lock:
+            # 대기 중 다른 요청이 이미 갱신했으면 생략
+            now = time.monotonic()
+            if not force and self._keys and now < self._expires_at:
+                return
+            if force and now - self._last_fetched_at < MIN_REFETCH_INTERVAL:
+                return
+
+            try:
+                jwks, max_age = await self._fetcher(self._url)
+            except Exception as e:
+                if self._keys:
+                    # 기존 키로 계속 검증 (다음 요청에서 다시 시도)
+                    logger.warning(
+                        f"JWKS 갱신 실패, 기존 키 사용: url={self._url}, error={e}"
+                    )
+                    self._last_fetched_at = now
+                    return
+                raise ValueError(f"Failed to fetch public keys: {str(e)}") from e
+
+            self._keys = self._parse_keys(jwks)
+            self._last_fetched_at = now
+            self._expires_at = now + (max_age or self._default_max_age)
+            logger.info(
+                f"JWKS 갱신: url={self._url}, keys={len(self._keys)}, "
+                f"max_age={max_age or self._default_max_age}"
+            )
+
+    async def _fetch_with_http_client(
+        self, url: str
+    ) -> Tuple[Dict[str, Any], int | None]:
+        return await fetch_jwks(self._http_client, url)  # type: ignore[arg-type]
+
+    def _schedule_background_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self._refresh(force=True)
+        except Exception as e:
+            logger.warning(f"JWKS 백그라운드 갱신 실패: url={self._url}, error={e}")
+
+    # - MARK: JWK 파싱
+    @staticmethod
+    def _parse_keys(jwks: Dict[str, Any]) -> Dict[str, Any]:
+        """RSA JWK 목록을 cryptography 공개키 객체로 변환"""
+        keys: Dict[str, Any] = {}
+        for jwk in jwks.get("keys", []):
+            if jwk.get("kty") != "RSA" or "kid" not in jwk:
+                continue
+            numbers = RSAPublicNumbers(
+                e=int.from_bytes(_base64url_decode(jwk["e"]), "big"),
+                n=int.from_bytes(_base64url_decode(jwk["n"]), "big"),
+            )
+            keys[jwk["kid"]] = numbers.public_key()
+        return keys
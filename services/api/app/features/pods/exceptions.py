@@ -187,3 +187,14 @@ class InvalidPodTypeException(DomainException):
             format_params={"pod_type": pod_type},
         )
         self.pod_type = pod_type
+
+
+class InvalidMapBoundsException(DomainException):
+    """지도 영역(최소/최대 위경도)이 유효하지 않은 경우"""
+
+    def __init__(self, bounds: str):
+        super().__init__(
+            error_key="INVALID_MAP_BOUNDS",
+            format_params={"bounds": bounds},
+        )
+        self.bounds = bounds
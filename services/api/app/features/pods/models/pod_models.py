@@ -183,6 +183,17 @@ class PodDetail(Base):
     sub_address = Column(String(300), nullable=True)
     x = Column(Float, nullable=True, comment="경도 (longitude)")
     y = Column(Float, nullable=True, comment="위도 (latitude)")
+    # 좌표의 geohash (반경/지도 영역 검색 시 접두사 범위로 후보 조회)
+    geohash = Column(String(12), nullable=True, index=True, comment="좌표 geohash")
+    # 주소로 판별한 지역 (생성/주소 수정 시 태깅, 인기 지역 카운터 기준)
+    location_id = Column(
+        Integer,
+        ForeignKey("locations.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+        comment="지역 ID",
+    )
+    sub_location = Column(String(100), nullable=True, comment="매칭된 세부 지역")
 
     # relations
     pod = relationship("Pod", back_populates="detail")
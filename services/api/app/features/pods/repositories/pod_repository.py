@@ -1,4 +1,5 @@
 import json
+import math
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Any, Dict, List
 
@@ -14,11 +15,19 @@ from app.features.pods.models import (
 )
 from app.features.pods.services.pod_dto_service import PodDtoService
 from app.features.users.models import User, UserBlock
+from app.utils.geo import EARTH_RADIUS_M, BoundingBox, covering_prefixes, encode_geohash
 from sqlalchemy import and_, case, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 
+def _geohash_of(x: float | None, y: float | None) -> str | None:
+    """경도(x)/위도(y)의 geohash (좌표가 없으면 None)"""
+    if x is None or y is None:
+        return None
+    return encode_geohash(y, x)
+
+
 class PodRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
@@ -123,6 +132,7 @@ class PodRepository:
             sub_address=sub_address,
             x=x,
             y=y,
+            geohash=_geohash_of(x, y),
         )
         self._session.add(pod_detail)
         await self._session.flush()
@@ -285,6 +295,7 @@ class PodRepository:
             sub_address=sub_address,
             x=x,
             y=y,
+            geohash=_geohash_of(x, y),
             chat_channel_url=chat_channel_url,
         )
         self._session.add(pod_detail)
@@ -301,6 +312,8 @@ class PodRepository:
         for field, value in fields.items():
             if hasattr(pod_detail, field):
                 setattr(pod_detail, field, value)
+        if "x" in fields or "y" in fields:
+            pod_detail.geohash = _geohash_of(pod_detail.x, pod_detail.y)
 
         await self._session.flush()
         await self._session.refresh(pod_detail)
@@ -398,6 +411,73 @@ class PodRepository:
 
         return self._build_paginated_response(pods, total_count, page, size)
 
+    # - MARK: 위치 기반 파티 조회
+    def _distance_expression(self, lat: float, lon: float):
+        """(lat, lon)에서 파티 좌표까지의 하버사인 거리 (미터, SQL 식)"""
+        d_lat = func.radians(PodDetail.y - lat)
+        d_lon = func.radians(PodDetail.x - lon)
+        a = func.pow(func.sin(d_lat / 2), 2) + (
+            math.cos(math.radians(lat))
+            * func.cos(func.radians(PodDetail.y))
+            * func.pow(func.sin(d_lon / 2), 2)
+        )
+        return 2 * EARTH_RADIUS_M * func.asin(func.least(1.0, func.sqrt(a)))
+
+    async def get_pods_in_area(
+        self,
+        box: BoundingBox,
+        origin: tuple[float, float],
+        radius_m: float | None = None,
+        user_id: int | None = None,
+        selected_artist_id: int | None = None,
+        page: int = 1,
+        size: int = 20,
+    ) -> Dict[str, Any]:
+        """영역 안의 모집 중인 파티를 origin(위도, 경도)에서 가까운 순으로 조회
+
+        geohash 접두사(인덱스 범위)와 위경도 사각형으로 후보를 좁히고,
+        radius_m이 있으면 실제 거리로 한 번 더 거릅니다.
+        items는 (Pod, 거리(미터)) 튜플 목록입니다.
+        """
+        distance = self._distance_expression(*origin)
+
+        conditions = [
+            ~Pod.is_del,
+            Pod.status == PodStatus.RECRUITING,
+            Pod.meeting_date >= datetime.now(timezone.utc).date(),
+            PodDetail.y.between(box.min_lat, box.max_lat),
+            PodDetail.x.between(box.min_lon, box.max_lon),
+        ]
+        prefixes = covering_prefixes(box)
+        if prefixes:
+            conditions.append(
+                or_(*(PodDetail.geohash.like(f"{prefix}%") for prefix in prefixes))
+            )
+        if radius_m is not None:
+            conditions.append(distance <= radius_m)
+        if selected_artist_id:
+            conditions.append(Pod.selected_artist_id == selected_artist_id)
+        if user_id:
+            conditions.append(~Pod.owner_id.in_(self._get_blocked_users_query(user_id)))
+
+        query = (
+            select(Pod, distance.label("distance"))
+            .join(PodDetail, Pod.id == PodDetail.pod_id)
+            .options(selectinload(Pod.detail), selectinload(Pod.images))
+            .where(and_(*conditions))
+        )
+
+        # 전체 개수 조회
+        count_query = select(func.count()).select_from(query.subquery())
+        total_count = (await self._session.execute(count_query)).scalar()
+
+        # 가까운 순 정렬 + 페이지네이션
+        query = query.order_by(distance, Pod.id).offset((page - 1) * size).limit(size)
+        result = await self._session.execute(query)
+        items = [(pod, float(pod_distance)) for pod, pod_distance in result.all()]
+
+        return self._build_paginated_response(items, total_count or 0, page, size)
+
     # - MARK: 요즘 인기 있는 파티 조회
     async def get_trending_pods(
         self, user_id: int, selected_artist_id: int, page: int = 1, size: int = 20
@@ -4,7 +4,13 @@ from app.common.schemas import BaseResponse, PageDto
 from app.deps.auth import get_current_user_id
 from app.deps.pod_form import get_pod_form, get_pod_form_for_update
 from app.deps.providers import get_pod_query_use_case, get_pod_use_case
-from app.features.pods.schemas import PodDetailDto, PodDto, PodForm, PodSearchRequest
+from app.features.pods.schemas import (
+    NearbyPodDto,
+    PodDetailDto,
+    PodDto,
+    PodForm,
+    PodSearchRequest,
+)
 from app.features.pods.use_cases.pod_query_use_case import PodQueryUseCase
 from app.features.pods.use_cases.pod_use_case import PodUseCase
 from fastapi import APIRouter, Body, Depends, File, Query, UploadFile, status
@@ -199,6 +205,78 @@ async def search_pods(
     return BaseResponse.ok(data=result, message_ko="팟 목록 조회 성공")
 
 
+# MARK: - 내 주변 파티 조회
+@router.get(
+    "/nearby",
+    response_model=BaseResponse[PageDto[NearbyPodDto]],
+    description="현재 위치 반경 안의 모집 중인 파티를 가까운 순으로 조회",
+)
+async def get_nearby_pods(
+    latitude: float = Query(..., ge=-90, le=90, description="위도 (latitude)"),
+    longitude: float = Query(..., ge=-180, le=180, description="경도 (longitude)"),
+    radius_km: float = Query(
+        3, alias="radiusKm", gt=0, le=50, description="검색 반경 (km, 최대 50)"
+    ),
+    selected_artist_id: int | None = Query(
+        None, alias="selectedArtistId", description="선택된 아티스트 ID (선택사항)"
+    ),
+    page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기 (1~100)"),
+    current_user_id: int = Depends(get_current_user_id),
+    pod_query_use_case: PodQueryUseCase = Depends(get_pod_query_use_case),
+):
+    result = await pod_query_use_case.get_nearby_pods(
+        user_id=current_user_id,
+        latitude=latitude,
+        longitude=longitude,
+        radius_km=radius_km,
+        selected_artist_id=selected_artist_id,
+        page=page,
+        size=size,
+    )
+    return BaseResponse.ok(
+        data=result,
+        message_ko="주변 파티 목록을 조회했습니다.",
+        message_en="Successfully retrieved nearby pods.",
+    )
+
+
+# MARK: - 지도 영역 파티 조회
+@router.get(
+    "/map",
+    response_model=BaseResponse[PageDto[NearbyPodDto]],
+    description="지도 영역 안의 모집 중인 파티를 영역 중심에서 가까운 순으로 조회",
+)
+async def get_pods_in_bounds(
+    min_latitude: float = Query(..., alias="minLatitude", ge=-90, le=90),
+    min_longitude: float = Query(..., alias="minLongitude", ge=-180, le=180),
+    max_latitude: float = Query(..., alias="maxLatitude", ge=-90, le=90),
+    max_longitude: float = Query(..., alias="maxLongitude", ge=-180, le=180),
+    selected_artist_id: int | None = Query(
+        None, alias="selectedArtistId", description="선택된 아티스트 ID (선택사항)"
+    ),
+    page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기 (1~100)"),
+    current_user_id: int = Depends(get_current_user_id),
+    pod_query_use_case: PodQueryUseCase = Depends(get_pod_query_use_case),
+):
+    result = await pod_query_use_case.get_pods_in_bounds(
+        user_id=current_user_id,
+        min_latitude=min_latitude,
+        min_longitude=min_longitude,
+        max_latitude=max_latitude,
+        max_longitude=max_longitude,
+        selected_artist_id=selected_artist_id,
+        page=page,
+        size=size,
+    )
+    return BaseResponse.ok(
+        data=result,
+        message_ko="지도 영역의 파티 목록을 조회했습니다.",
+        message_en="Successfully retrieved pods in map bounds.",
+    )
+
+
 # - MARK: 파티 상세 조회
 @router.get(
     "/{pod_id}",
@@ -8,6 +8,7 @@ from .application_schemas import (
 from .like_schemas import PodLikeDto
 from .pod_schemas import (
     ImageOrderDto,
+    NearbyPodDto,
     PodDetailDto,
     PodDto,
     PodForm,
@@ -27,6 +28,7 @@ PodDetailDto.model_rebuild()
 __all__ = [
     "ApplyToPodRequest",
     "ImageOrderDto",
+    "NearbyPodDto",
     "PodApplDto",
     "PodDetailDto",
     "PodDto",
@@ -65,6 +65,17 @@ class PodDto(BaseModel):
     }
 
 
+# - MARK: Nearby Pod DTO
+class NearbyPodDto(PodDto):
+    """위치 기반 조회용 파티 DTO (좌표와 기준점까지의 거리 포함)"""
+
+    x: float | None = Field(default=None, description="경도 (longitude)")
+    y: float | None = Field(default=None, description="위도 (latitude)")
+    distance_m: float = Field(
+        ..., alias="distanceMeters", description="기준 위치까지의 거리 (미터)"
+    )
+
+
 # - MARK: Pod Detail DTO
 class PodDetailDto(BaseModel):
     id: int = Field()
@@ -66,31 +66,35 @@ class ReviewNotificationService:
             # 리뷰 작성자 제외 참여자들에게 REVIEW_OTHERS_CREATED 알림 전송
             participants = await self._pod_repo.get_pod_participants(pod_id)
             reviewer_nickname = reviewer.nickname or ""
-            for participant in participants:
-                # 리뷰 작성자 제외
-                if participant.id is not None and participant.id == reviewer_id:
-                    continue
-                # 파티장은 이미 REVIEW_CREATED를 받았으므로 제외
-                if (
-                    participant.id is not None
-                    and pod.owner_id is not None
-                    and participant.id == pod.owner_id
-                ):
-                    continue
+            participant_ids = [p.id for p in participants if p.id is not None]
+            async with self._fcm_service.batch_notifications(
+                self._session, user_ids=participant_ids
+            ):
+                for participant in participants:
+                    # 리뷰 작성자 제외
+                    if participant.id is not None and participant.id == reviewer_id:
+                        continue
+                    # 파티장은 이미 REVIEW_CREATED를 받았으므로 제외
+                    if (
+                        participant.id is not None
+                        and pod.owner_id is not None
+                        and participant.id == pod.owner_id
+                    ):
+                        continue
 
-                try:
-                    if participant.detail and participant.detail.fcm_token:
-                        await self._fcm_service.send_review_others_created(
-                            token=participant.detail.fcm_token,
-                            nickname=reviewer_nickname,
-                            review_id=review_id,
-                            pod_id=pod_id,
-                            db=self._session,
-                            user_id=participant.id,
-                            related_user_id=reviewer_id,
-                        )
-                except Exception:
-                    pass
+                    try:
+                        if participant.detail and participant.detail.fcm_token:
+                            await self._fcm_service.send_review_others_created(
+                                token=participant.detail.fcm_token,
+                                nickname=reviewer_nickname,
+                                review_id=review_id,
+                                pod_id=pod_id,
+                                db=self._session,
+                                user_id=participant.id,
+                                related_user_id=reviewer_id,
+                            )
+                    except Exception:
+                        pass
 
         except Exception:
             # 알림 전송 실패는 무시하고 계속 진행
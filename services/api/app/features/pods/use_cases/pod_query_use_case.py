@@ -9,16 +9,18 @@ from typing import TYPE_CHECKING
 from app.common.schemas import PageDto
 from app.features.pods.exceptions import (
     InvalidDateException,
+    InvalidMapBoundsException,
     InvalidPodTypeException,
     PodNotFoundException,
     SelectedArtistIdRequiredException,
 )
 from app.features.pods.repositories.pod_repository import PodRepository
-from app.features.pods.schemas import PodDetailDto
+from app.features.pods.schemas import NearbyPodDto, PodDetailDto
 from app.features.pods.schemas.pod_schemas import PodDto
 from app.features.pods.services.pod_enrichment_service import PodEnrichmentService
 from app.features.users.exceptions import UserNotFoundException
 from app.features.users.repositories import UserRepository
+from app.utils.geo import BoundingBox
 from sqlalchemy.ext.asyncio import AsyncSession
 
 if TYPE_CHECKING:
@@ -226,6 +228,95 @@ class PodQueryUseCase:
             total_count=result["total_count"],
         )
 
+    # MARK: - 내 주변 파티 조회
+    async def get_nearby_pods(
+        self,
+        user_id: int | None,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        selected_artist_id: int | None = None,
+        page: int = 1,
+        size: int = 20,
+    ) -> PageDto[NearbyPodDto]:
+        """반경 안의 모집 중인 파티를 가까운 순으로 조회"""
+        radius_m = radius_km * 1000
+        result = await self._pod_repo.get_pods_in_area(
+            box=BoundingBox.around(latitude, longitude, radius_m),
+            origin=(latitude, longitude),
+            radius_m=radius_m,
+            user_id=user_id,
+            selected_artist_id=selected_artist_id,
+            page=page,
+            size=size,
+        )
+        return await self._to_nearby_page(result, user_id)
+
+    # MARK: - 지도 영역 파티 조회
+    async def get_pods_in_bounds(
+        self,
+        user_id: int | None,
+        min_latitude: float,
+        min_longitude: float,
+        max_latitude: float,
+        max_longitude: float,
+        selected_artist_id: int | None = None,
+        page: int = 1,
+        size: int = 20,
+    ) -> PageDto[NearbyPodDto]:
+        """지도 영역 안의 모집 중인 파티를 영역 중심에서 가까운 순으로 조회"""
+        if min_latitude > max_latitude or min_longitude > max_longitude:
+            raise InvalidMapBoundsException(
+                f"({min_latitude}, {min_longitude}) ~ ({max_latitude}, {max_longitude})"
+            )
+
+        box = BoundingBox(
+            min_lat=min_latitude,
+            min_lon=min_longitude,
+            max_lat=max_latitude,
+            max_lon=max_longitude,
+        )
+        result = await self._pod_repo.get_pods_in_area(
+            box=box,
+            origin=box.center,
+            user_id=user_id,
+            selected_artist_id=selected_artist_id,
+            page=page,
+            size=size,
+        )
+        return await self._to_nearby_page(result, user_id)
+
+    async def _to_nearby_page(
+        self, result: dict, user_id: int | None
+    ) -> PageDto[NearbyPodDto]:
+        """(Pod, 거리) 페이지 → NearbyPodDto 페이지 (순서 유지)"""
+        pods = {pod.id: (pod, distance) for pod, distance in result["items"]}
+        pod_dtos = await self._enrichment_service.convert_batch(
+            [pod for pod, _ in pods.values()],
+            user_id,
+            include_applications=False,
+            include_reviews=False,
+        )
+
+        items = []
+        for pod_dto in pod_dtos:
+            pod, distance = pods[pod_dto.id]
+            items.append(
+                NearbyPodDto(
+                    **pod_dto.model_dump(),
+                    x=pod.detail.x if pod.detail else None,
+                    y=pod.detail.y if pod.detail else None,
+                    distance_m=distance,
+                )
+            )
+
+        return PageDto.create(
+            items=items,
+            page=result["page"],
+            size=result["page_size"],
+            total_count=result["total_count"],
+        )
+
     # MARK: - 참여한 파티 조회
     async def get_user_joined_pods(
         self, user_id: int, page: int = 1, size: int = 20
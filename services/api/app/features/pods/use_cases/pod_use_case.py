@@ -1,12 +1,12 @@
 """Pod Use Case - 비즈니스 로직 처리"""
 
+import asyncio
 import json
 from datetime import date, time, timezone
-from pathlib import Path
 
-from app.core.config import settings
 from app.features.chat.repositories.chat_room_repository import ChatRoomRepository
 from app.features.follow.use_cases.follow_use_case import FollowUseCase
+from app.features.locations.services.pod_location_service import PodLocationService
 from app.features.pods.exceptions import (
     InvalidDateException,
     InvalidPodStatusException,
@@ -24,7 +24,9 @@ from app.features.pods.services.pod_enrichment_service import PodEnrichmentServi
 from app.features.pods.services.pod_image_service import PodImageService
 from app.features.pods.services.pod_notification_service import PodNotificationService
 from app.features.pods.services.pod_validation_service import PodValidationService
-from app.utils.file_upload import save_upload_file
+from app.features.reminders.services.reminder_queue_service import (
+    ReminderQueueService,
+)
 from fastapi import HTTPException, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -39,12 +41,16 @@ class PodUseCase:
         enrichment_service: PodEnrichmentService,
         notification_service: PodNotificationService,
         follow_use_case: FollowUseCase,
+        reminder_queue: ReminderQueueService,
+        pod_location_service: PodLocationService,
     ):
         self._session = session
         self._pod_repo = pod_repo
         self._enrichment_service = enrichment_service
         self._notification_service = notification_service
         self._follow_use_case = follow_use_case
+        self._reminder_queue = reminder_queue
+        self._pod_location_service = pod_location_service
         # 서비스 초기화
         self._image_service = PodImageService(pod_repo)
 
@@ -123,11 +129,17 @@ class PodUseCase:
                     pass
 
             await self._session.commit()
-            return result
         except Exception:
             await self._session.rollback()
             raise
 
+        # 시작/취소 임박 리마인더 예약
+        if result.id:
+            await self._reminder_queue.schedule_pod(
+                result.id, parsed_meeting_date, parsed_meeting_time
+            )
+        return result
+
     async def _create_pod(
         self,
         owner_id: int,
@@ -147,20 +159,15 @@ class PodUseCase:
         status: PodStatus = PodStatus.RECRUITING,
     ) -> PodDetailDto | None:
         """파티 생성 내부 로직"""
-        thumbnail_url = None
-
-        # 첫 번째 이미지로 thumbnail_url 생성
+        # 이미지 저장 (원본 + 렌디션), 첫 번째 이미지의 썸네일을 파티 썸네일로 사용
+        stored_images: list[tuple[str, str]] = []
         if images:
-            first_image = images[0]
-            try:
-                thumbnail_url = await self._image_service.create_thumbnail_from_image(
-                    first_image
-                )
-            except ValueError:
-                pods_images_dir = Path(settings.UPLOADS_DIR) / "pods" / "images"
-                thumbnail_url = await save_upload_file(
-                    first_image, str(pods_images_dir)
+            stored_images = list(
+                await asyncio.gather(
+                    *(self._image_service.store_image(image) for image in images)
                 )
+            )
+        thumbnail_url = stored_images[0][1] if stored_images else None
 
         # 파티 생성 (채팅방 포함)
         pod = await self._pod_repo.create_pod_with_chat(
@@ -185,34 +192,23 @@ class PodUseCase:
         if not pod:
             raise PodNotFoundException(0)
 
-        # 여러 이미지 저장
-        if images:
-            pods_images_dir = Path(settings.UPLOADS_DIR) / "pods" / "images"
-            for index, image in enumerate(images):
-                image_url = await save_upload_file(image, str(pods_images_dir))
-
-                # 각 이미지의 썸네일 생성
-                image_thumbnail_url = None
-                try:
-                    image_thumbnail_url = (
-                        await self._image_service.create_thumbnail_from_image(image)
-                    )
-                except ValueError:
-                    image_thumbnail_url = image_url
-
-                # PodImage 저장
-                await self._pod_repo.add_pod_image(
-                    pod_id=pod.id,
-                    image_url=image_url,
-                    thumbnail_url=image_thumbnail_url,
-                    display_order=index,
-                )
+        # PodImage 저장
+        for index, (image_url, image_thumbnail_url) in enumerate(stored_images):
+            await self._pod_repo.add_pod_image(
+                pod_id=pod.id,
+                image_url=image_url,
+                thumbnail_url=image_thumbnail_url,
+                display_order=index,
+            )
 
         # Pod 모델을 PodDetailDto로 변환
         if pod:
             await self._session.refresh(
                 pod, ["detail", "images", "applications", "reviews"]
             )
+            # 주소로 지역 태깅 및 인기 지역 카운터 반영
+            if pod.detail:
+                await self._pod_location_service.assign(pod.detail)
             return await self._enrichment_service.enrich(pod, owner_id)
         return None
 
@@ -313,11 +309,19 @@ class PodUseCase:
                 )
 
             await self._session.commit()
-            return result
         except Exception:
             await self._session.rollback()
             raise
 
+        # 미팅 일시가 바뀌었으면 리마인더 재예약
+        if "meeting_date" in pod_update_fields:
+            await self._reminder_queue.schedule_pod(
+                pod_id,
+                pod_update_fields["meeting_date"],
+                pod_update_fields["meeting_time"],
+            )
+        return result
+
     async def _update_pod_with_images(
         self,
         pod_id: int,
@@ -373,20 +377,10 @@ class PodUseCase:
                             and order_item.file_index in new_images_dict
                         ):
                             image = new_images_dict[order_item.file_index]
-                            pods_images_dir = (
-                                Path(settings.UPLOADS_DIR) / "pods" / "images"
-                            )
-                            image_url = await save_upload_file(
-                                image, str(pods_images_dir)
-                            )
-
-                            image_thumbnail_url = None
-                            try:
-                                image_thumbnail_url = await self._image_service.create_thumbnail_from_image(
-                                    image
-                                )
-                            except ValueError:
-                                image_thumbnail_url = image_url
+                            (
+                                image_url,
+                                image_thumbnail_url,
+                            ) = await self._image_service.store_image(image)
 
                             await self._pod_repo.add_pod_image(
                                 pod_id=pod_id,
@@ -417,16 +411,9 @@ class PodUseCase:
             thumbnail_url = None
 
             for index, image in enumerate(new_images):
-                pods_images_dir = Path(settings.UPLOADS_DIR) / "pods" / "images"
-                image_url = await save_upload_file(image, str(pods_images_dir))
-
-                image_thumbnail_url = None
-                try:
-                    image_thumbnail_url = (
-                        await self._image_service.create_thumbnail_from_image(image)
-                    )
-                except ValueError:
-                    image_thumbnail_url = image_url
+                image_url, image_thumbnail_url = await self._image_service.store_image(
+                    image
+                )
 
                 await self._pod_repo.add_pod_image(
                     pod_id=pod_id,
@@ -453,7 +440,17 @@ class PodUseCase:
 
         # PodDetail 업데이트
         if pod_detail_update_fields:
-            await self._pod_repo.update_pod_detail(pod_id, **pod_detail_update_fields)
+            pod_detail = await self._pod_repo.update_pod_detail(
+                pod_id, **pod_detail_update_fields
+            )
+            # 주소가 바뀌었으면 지역 다시 태깅
+            if pod_detail and (
+                "address" in pod_detail_update_fields
+                or "sub_address" in pod_detail_update_fields
+            ):
+                await self._pod_location_service.assign(
+                    pod_detail, is_active=not pod.is_del
+                )
 
         # 파티 정보 다시 조회하여 DTO로 변환
         updated_pod = await self._pod_repo.get_pod_by_id(pod_id)
@@ -516,11 +513,15 @@ class PodUseCase:
             )
 
             await self._session.commit()
-            return await self._enrichment_service.enrich(updated_pod, user_id)
         except Exception:
             await self._session.rollback()
             raise
 
+        # 종료/취소된 파티는 리마인더 예약 해제
+        if status in (PodStatus.CLOSED, PodStatus.CANCELED):
+            await self._reminder_queue.cancel_pod(pod_id)
+        return await self._enrichment_service.enrich(updated_pod, user_id)
+
     # MARK: - 파티 삭제
     async def delete_pod(self, pod_id: int, current_user_id: int) -> None:
         """파티 삭제"""
@@ -556,15 +557,18 @@ class PodUseCase:
             # 파티 상태를 CANCELED로 변경
             await self._pod_repo.update_pod_status(pod_id, PodStatus.CANCELED)
 
-            # 파티 비활성화 (소프트 삭제)
-            if pod:
+            # 파티 비활성화 (소프트 삭제) 및 인기 지역 카운터에서 제외
+            if pod and not pod.is_del:
                 setattr(pod, "is_del", True)
+                await self._pod_location_service.release([pod_id])
 
             await self._session.commit()
         except Exception:
             await self._session.rollback()
             raise
 
+        await self._reminder_queue.cancel_pod(pod_id)
+
     # MARK: - 파티 나가기
     async def leave_pod(
         self, pod_id: int, user_id: str | None, current_user_id: int
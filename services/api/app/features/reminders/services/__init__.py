@@ -1,6 +1,7 @@
 """리마인더 서비스들"""
 
+from .reminder_queue_service import ReminderQueueService
 from .reminder_service import ReminderService
 from .status_update_service import StatusUpdateService
 
-__all__ = ["ReminderService", "StatusUpdateService"]
+__all__ = ["ReminderQueueService", "ReminderService", "StatusUpdateService"]
@@ -0,0 +1,154 @@
+"""리마인더 큐 서비스 - Redis sorted set 기반 파티 리마인더 예약
+
+파티 생성/수정/취소 시점에 알림 발송 시각을 score로 하여 예약하고,
+스케줄러는 발송 시각이 지난 이벤트만 꺼내 처리합니다.
+
+꺼낸 이벤트는 바로 지우지 않고 처리 중 큐(score: 임대 만료 시각)로 옮깁니다.
+알림 전송이 끝난 뒤 ack로 지우며, 워커 종료/타임아웃으로 ack되지 않은 이벤트는
+임대가 만료되면 예약 큐로 되돌려 다시 처리합니다.
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# Redis 키
+POD_REMINDER_QUEUE_KEY = "reminder:pod:queue"
+POD_REMINDER_PROCESSING_KEY = "reminder:pod:processing"
+
+# 미팅 시작 몇 시간 전에 알림을 보낼지 (시작 임박 / 취소 임박 공통)
+REMIND_BEFORE = timedelta(hours=1)
+
+# 한 번에 꺼낼 최대 이벤트 수
+POP_BATCH_SIZE = 100
+
+# 처리 중 이벤트 임대 시간 (1분 작업 타임아웃보다 길어야 함)
+CLAIM_LEASE = timedelta(minutes=5)
+
+# 발송 시각이 지난 이벤트를 처리 중 큐로 옮김
+# KEYS: [예약 큐, 처리 중 큐]
+# ARGV: [현재 시각, 임대 만료 시각, 최대 개수]
+# 반환: 옮긴 pod_id 목록
+_CLAIM_DUE_SCRIPT = """
+local members = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[3])
+for _, member in ipairs(members) do
+    redis.call('ZREM', KEYS[1], member)
+    redis.call('ZADD', KEYS[2], ARGV[2], member)
+end
+return members
+"""
+
+# 임대가 만료된 처리 중 이벤트를 예약 큐로 되돌림 (그 사이 다시 예약된 항목은 유지)
+# KEYS: [예약 큐, 처리 중 큐]
+# ARGV: [현재 시각, 최대 개수]
+# 반환: 되돌린 이벤트 수
+_REQUEUE_EXPIRED_SCRIPT = """
+local members = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, member in ipairs(members) do
+    redis.call('ZREM', KEYS[2], member)
+    redis.call('ZADD', KEYS[1], 'NX', ARGV[1], member)
+end
+return #members
+"""
+
+
+class ReminderQueueService:
+    """파티 리마인더 예약 큐
+
+    member는 pod_id, score는 알림 발송 시각(UTC epoch)입니다.
+    발송 시점의 파티 상태에 따라 시작 임박(확정) 또는 취소 임박(모집 중) 알림이 결정됩니다.
+    꺼낸 이벤트는 ack 전까지 처리 중 큐에 남아 있어 최소 한 번 전송됩니다.
+    """
+
+    def __init__(self, redis: Redis):
+        self._redis = redis
+
+    @staticmethod
+    def fire_at(meeting_date: date, meeting_time: time) -> datetime:
+        """미팅 일시로부터 알림 발송 시각 계산"""
+        meeting_datetime = datetime.combine(
+            meeting_date, meeting_time, tzinfo=timezone.utc
+        )
+        return meeting_datetime - REMIND_BEFORE
+
+    async def schedule_pod(
+        self, pod_id: int, meeting_date: date | None, meeting_time: time | None
+    ) -> None:
+        """파티 리마인더 예약 (이미 있으면 발송 시각 갱신)"""
+        if meeting_date is None or meeting_time is None:
+            return
+
+        try:
+            fire_at = self.fire_at(meeting_date, meeting_time)
+            await self._redis.zadd(
+                POD_REMINDER_QUEUE_KEY, {str(pod_id): fire_at.timestamp()}
+            )
+            logger.debug(f"파티 리마인더 예약: pod_id={pod_id}, fire_at={fire_at}")
+        except Exception as e:
+            logger.error(f"파티 리마인더 예약 실패: pod_id={pod_id}, error={e}")
+
+    async def cancel_pod(self, pod_id: int) -> None:
+        """파티 리마인더 예약 취소"""
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.zrem(POD_REMINDER_QUEUE_KEY, str(pod_id))
+                pipe.zrem(POD_REMINDER_PROCESSING_KEY, str(pod_id))
+                await pipe.execute()
+            logger.debug(f"파티 리마인더 예약 취소: pod_id={pod_id}")
+        except Exception as e:
+            logger.error(f"파티 리마인더 예약 취소 실패: pod_id={pod_id}, error={e}")
+
+    async def claim_due(
+        self, now: datetime | None = None, limit: int = POP_BATCH_SIZE
+    ) -> list[int]:
+        """발송 시각이 지난 파티 ID를 처리 중 큐로 옮기고 반환
+
+        한 번의 스크립트로 옮기므로 여러 워커가 동시에 폴링해도
+        같은 이벤트가 중복 처리되지 않습니다. 처리가 끝나면 ack를 호출해야 합니다.
+        """
+        now = now or datetime.now(timezone.utc)
+        members = await self._redis.eval(
+            _CLAIM_DUE_SCRIPT,
+            2,
+            POD_REMINDER_QUEUE_KEY,
+            POD_REMINDER_PROCESSING_KEY,
+            now.timestamp(),
+            (now + CLAIM_LEASE).timestamp(),
+            limit,
+        )
+        return [int(member) for member in members or []]
+
+    async def ack(self, pod_ids: list[int]) -> None:
+        """처리가 끝난 파티 ID를 처리 중 큐에서 제거"""
+        if not pod_ids:
+            return
+
+        await self._redis.zrem(
+            POD_REMINDER_PROCESSING_KEY, *[str(pod_id) for pod_id in pod_ids]
+        )
+
+    async def requeue_expired(
+        self, now: datetime | None = None, limit: int = POP_BATCH_SIZE
+    ) -> int:
+        """임대가 만료된 처리 중 이벤트를 예약 큐로 되돌림
+
+        Returns:
+            되돌린 이벤트 수
+        """
+        now = now or datetime.now(timezone.utc)
+        requeued = int(
+            await self._redis.eval(
+                _REQUEUE_EXPIRED_SCRIPT,
+                2,
+                POD_REMINDER_QUEUE_KEY,
+                POD_REMINDER_PROCESSING_KEY,
+                now.timestamp(),
+                limit,
+            )
+        )
+        if requeued:
+            logger.warning(f"처리되지 않은 파티 리마인더 재예약: {requeued}개")
+        return requeued
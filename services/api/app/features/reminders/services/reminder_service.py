@@ -7,6 +7,9 @@ from app.features.notifications.event import NotificationEvent
 from app.features.notifications.models import Notification
 from app.features.notifications.services.fcm_service import FCMService
 from app.features.pods.models import Pod, PodLike, PodMember, PodRating, PodStatus
+from app.features.reminders.services.reminder_queue_service import (
+    ReminderQueueService,
+)
 from app.features.users.models import User
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -122,11 +125,12 @@ class ReminderService:
     async def send_review_reminders(self, db: AsyncSession):
         """리뷰 유도 알림 전송 (1일 전, 1주일 전)"""
         try:
-            # 1일 전 모임 리뷰 알림
-            await self._send_day_review_reminders(db)
+            async with self.fcm_service.batch_notifications(db):
+                # 1일 전 모임 리뷰 알림
+                await self._send_day_review_reminders(db)
 
-            # 1주일 전 모임 리뷰 리마인드 (미작성자만)
-            await self._send_week_review_reminders(db)
+                # 1주일 전 모임 리뷰 리마인드 (미작성자만)
+                await self._send_week_review_reminders(db)
 
         except Exception as e:
             logger.error(f"리뷰 리마인더 전송 중 오류: {e}")
@@ -254,33 +258,6 @@ class ReminderService:
 
     # ==================== 시작 임박 알림 ====================
 
-    async def send_start_soon_reminders(self, db: AsyncSession):
-        """파티 시작 1시간 전 알림"""
-        try:
-            now = datetime.now(timezone.utc)
-            one_hour_later = now + timedelta(hours=ReminderConstants.START_SOON_HOURS)
-
-            # 1시간 후 시작하는 확정된 파티 조회
-            query = select(Pod).where(
-                and_(
-                    Pod.meeting_date == now.date(),
-                    Pod.meeting_time >= now.time(),
-                    Pod.meeting_time <= one_hour_later.time(),
-                    func.upper(Pod.status) == PodStatus.COMPLETED.value.upper(),
-                )
-            )
-
-            result = await db.execute(query)
-            starting_soon_pods = result.scalars().all()
-
-            logger.info(f"파티 시작 임박 알림 대상: {len(starting_soon_pods)}개")
-
-            for pod in starting_soon_pods:
-                await self._send_start_soon_to_participants(db, pod)
-
-        except Exception as e:
-            logger.error(f"시작 임박 알림 전송 중 오류: {e}")
-
     async def _send_start_soon_to_participants(self, db: AsyncSession, pod: Pod):
         """참여자들에게 시작 임박 알림 전송"""
         try:
@@ -340,11 +317,12 @@ class ReminderService:
     async def send_deadline_reminders(self, db: AsyncSession):
         """마감 임박 알림 전송"""
         try:
-            # 파티장에게 인원 부족 알림
-            await self._send_low_attendance_reminders(db)
+            async with self.fcm_service.batch_notifications(db):
+                # 파티장에게 인원 부족 알림
+                await self._send_low_attendance_reminders(db)
 
-            # 좋아요한 파티 마감 임박 알림
-            await self._send_saved_pod_deadline_reminders(db)
+                # 좋아요한 파티 마감 임박 알림
+                await self._send_saved_pod_deadline_reminders(db)
 
         except Exception as e:
             logger.error(f"마감 임박 알림 전송 중 오류: {e}")
@@ -519,57 +497,141 @@ class ReminderService:
         except Exception as e:
             logger.error(f"좋아요 파티 마감 알림 처리 실패: pod_id={pod.id}, error={e}")
 
-    # ==================== 취소 임박 알림 ====================
+    # ==================== 예약 큐 기반 시작/취소 임박 알림 ====================
 
-    async def send_canceled_soon_reminders(self, db: AsyncSession):
-        """파티 취소 임박 알림 (1시간 안에 시작하는 모집 중 파티)"""
-        try:
-            now = datetime.now(timezone.utc)
-            one_hour_later = now + timedelta(hours=ReminderConstants.START_SOON_HOURS)
+    async def send_due_pod_reminders(
+        self, db: AsyncSession, queue: ReminderQueueService
+    ) -> int:
+        """예약 큐에서 발송 시각이 된 파티를 꺼내 시작/취소 임박 알림 전송
 
-            canceling_soon_pods = await self._get_canceling_soon_pods(
-                db, now, one_hour_later
-            )
+        파티 상태에 따라 분기합니다.
+        - COMPLETED: 참여자 전체에게 시작 임박 알림
+        - RECRUITING: 파티장에게 취소 임박 알림
 
-            logger.info(f"취소 임박 알림 대상: {len(canceling_soon_pods)}개")
+        꺼낸 파티는 알림 배치가 끝난 뒤에 ack합니다. 도중에 실패하거나 타임아웃되면
+        임대 만료 후 다음 실행에서 다시 처리되며, 중복 전송은 _has_sent_reminder로 막습니다.
 
-            for pod in canceling_soon_pods:
-                await self._send_canceled_soon_to_owner(db, pod)
+        Returns:
+            처리한 파티 수
+        """
+        await queue.requeue_expired()
 
-        except Exception as e:
-            logger.error(f"취소 임박 알림 전송 중 오류: {e}")
+        pod_ids = await queue.claim_due()
+        if not pod_ids:
+            return 0
 
-    async def _get_canceling_soon_pods(
-        self, db: AsyncSession, now: datetime, deadline: datetime
-    ) -> list[Pod]:
-        """취소 임박 파티 조회 (1시간 이내 시작하는 모집 중 파티)"""
-        today = now.date()
-        tomorrow = today + timedelta(days=1)
+        now = datetime.now(timezone.utc)
+        one_hour_later = now + timedelta(hours=ReminderConstants.START_SOON_HOURS)
 
-        query = select(Pod).where(
+        result = await db.execute(select(Pod).where(Pod.id.in_(pod_ids)))
+        pods = result.scalars().all()
+
+        logger.info(f"예약 리마인더 처리 대상: {len(pods)}개")
+
+        async with self.fcm_service.batch_notifications(db):
+            for pod in pods:
+                meeting_date = getattr(pod, "meeting_date", None)
+                meeting_time = getattr(pod, "meeting_time", None)
+                if meeting_date is None or meeting_time is None:
+                    continue
+
+                # 다운타임 등으로 늦게 꺼낸 이벤트는 기존 윈도우 기준으로 걸러냄
+                meeting_datetime = datetime.combine(
+                    meeting_date, meeting_time, tzinfo=timezone.utc
+                )
+                if not now < meeting_datetime <= one_hour_later:
+                    continue
+
+                if pod.status == PodStatus.COMPLETED:
+                    await self._send_start_soon_to_participants(db, pod)
+                elif pod.status == PodStatus.RECRUITING:
+                    await self._send_canceled_soon_to_owner(db, pod)
+
+        await queue.ack(pod_ids)
+
+        return len(pods)
+
+    async def _get_reminded_pod_ids(
+        self, db: AsyncSession, pod_ids: list[int]
+    ) -> set[int]:
+        """최근 시작/취소 임박 알림을 보낸 파티 ID"""
+        if not pod_ids:
+            return set()
+
+        check_time = datetime.now(timezone.utc) - timedelta(
+            hours=ReminderConstants.DUPLICATE_CHECK_HOURS
+        )
+        query = select(Notification.related_pod_id, Notification.related_id).where(
             and_(
-                or_(Pod.meeting_date == today, Pod.meeting_date == tomorrow),
-                func.upper(Pod.status) == PodStatus.RECRUITING.value.upper(),
+                Notification.notification_value.in_(
+                    [
+                        NotificationEvent.POD_STARTING_SOON.value,
+                        NotificationEvent.POD_CANCELED_SOON.value,
+                    ]
+                ),
+                Notification.created_at >= check_time,
+                or_(
+                    Notification.related_pod_id.in_(pod_ids),
+                    Notification.related_id.in_([str(pod_id) for pod_id in pod_ids]),
+                ),
             )
         )
 
         result = await db.execute(query)
-        all_pods = result.scalars().all()
+        reminded: set[int] = set()
+        for related_pod_id, related_id in result.all():
+            if related_pod_id is not None:
+                reminded.add(related_pod_id)
+            elif related_id and related_id.isdigit():
+                reminded.add(int(related_id))
+        return reminded
+
+    async def sync_pod_reminder_queue(
+        self, db: AsyncSession, queue: ReminderQueueService
+    ) -> None:
+        """예약 큐 보정 - 오늘/내일 미팅인 진행 중 파티를 다시 예약
+
+        Redis 초기화나 배포 이전에 생성된 파티처럼
+        생성/수정 시점에 예약되지 않은 파티를 채워 넣습니다.
+        발송 시각이 이미 지났거나 시작/취소 임박 알림을 보낸 파티는 다시 예약하지 않습니다.
+        """
+        try:
+            now = datetime.now(timezone.utc)
+            today = now.date()
+            tomorrow = today + timedelta(days=1)
 
-        canceling_soon = []
-        for pod in all_pods:
-            meeting_date = getattr(pod, "meeting_date", None)
-            meeting_time = getattr(pod, "meeting_time", None)
-            if meeting_date is None or meeting_time is None:
-                continue
+            query = select(Pod.id, Pod.meeting_date, Pod.meeting_time).where(
+                and_(
+                    or_(Pod.meeting_date == today, Pod.meeting_date == tomorrow),
+                    Pod.status.in_([PodStatus.RECRUITING, PodStatus.COMPLETED]),
+                )
+            )
 
-            meeting_datetime = datetime.combine(
-                meeting_date, meeting_time, tzinfo=timezone.utc
+            result = await db.execute(query)
+            rows = [
+                (pod_id, meeting_date, meeting_time)
+                for pod_id, meeting_date, meeting_time in result.all()
+                if meeting_date is not None
+                and meeting_time is not None
+                and ReminderQueueService.fire_at(meeting_date, meeting_time) > now
+            ]
+            notified = await self._get_reminded_pod_ids(
+                db, [pod_id for pod_id, _, _ in rows]
             )
-            if now < meeting_datetime <= deadline:
-                canceling_soon.append(pod)
 
-        return canceling_soon
+            scheduled = 0
+            for pod_id, meeting_date, meeting_time in rows:
+                if pod_id in notified:
+                    continue
+                await queue.schedule_pod(pod_id, meeting_date, meeting_time)
+                scheduled += 1
+
+            logger.info(f"파티 리마인더 예약 보정 완료: {scheduled}개")
+
+        except Exception as e:
+            logger.error(f"파티 리마인더 예약 보정 중 오류: {e}")
+
+    # ==================== 취소 임박 알림 ====================
 
     async def _send_canceled_soon_to_owner(self, db: AsyncSession, pod: Pod):
         """파티장에게 취소 임박 알림 전송"""
@@ -6,6 +6,8 @@ from datetime import date, datetime, timezone
 from sqlalchemy import and_, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.features.locations.repositories.location_repository import LocationRepository
+from app.features.locations.services.pod_location_service import PodLocationService
 from app.features.pods.models import Pod, PodStatus
 
 logger = logging.getLogger(__name__)
@@ -109,7 +111,8 @@ class StatusUpdateService:
 
             logger.info(f"취소 처리 대상 파티: {len(unconfirmed_pods)}개")
 
-            # 각 파티 취소 처리
+            # 각 파티 취소 처리 (새로 삭제되는 파티는 인기 지역 카운터에서 제외)
+            released_pod_ids: list[int] = []
             for pod in unconfirmed_pods:
                 try:
                     pod_status_value = (
@@ -126,6 +129,8 @@ class StatusUpdateService:
                         continue
 
                     # 상태 변경 및 소프트 삭제
+                    if not pod.is_del:
+                        released_pod_ids.append(pod.id)
                     pod.status = PodStatus.CANCELED
                     pod.is_del = True
 
@@ -138,6 +143,9 @@ class StatusUpdateService:
                 except Exception as e:
                     logger.error(f"파티 취소 처리 실패: pod_id={pod.id}, error={e}")
 
+            await PodLocationService(LocationRepository(session)).release(
+                released_pod_ids
+            )
             await session.commit()
             logger.info(f"파티 취소 처리 완료: {len(unconfirmed_pods)}개")
 
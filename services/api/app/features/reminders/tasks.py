@@ -4,11 +4,15 @@
 """
 
 import logging
+from typing import Awaitable, Callable
 
-from app.core.database import get_session
+from app.core.database import get_batch_session
 from app.core.scheduler import Scheduler
+from app.deps.redis import get_redis_client
 
-from .services import ReminderService, StatusUpdateService
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .services import ReminderQueueService, ReminderService, StatusUpdateService
 
 logger = logging.getLogger(__name__)
 
@@ -18,44 +22,90 @@ def create_services() -> tuple[ReminderService, StatusUpdateService]:
     return ReminderService(), StatusUpdateService()
 
 
-def register_scheduler_tasks(scheduler: Scheduler) -> None:
-    """스케줄러에 리마인더 작업들 등록"""
-    reminder_service, status_update_service = create_services()
+def _with_session(
+    job: Callable[[AsyncSession], Awaitable[None]], name: str
+) -> Callable[[], Awaitable[None]]:
+    """작업별로 독립된 DB 세션을 열어 실행하는 콜백 생성
 
-    # 일일 작업 (매일 오전 10시)
-    async def daily_tasks() -> None:
-        """일일 작업: 상태 업데이트 + 리뷰 알림 + 마감 알림"""
-        async for session in get_session():
+    그룹 간 작업이 동시에 실행되므로 세션을 공유하지 않습니다.
+    """
+
+    async def task() -> None:
+        async for session in get_batch_session():
             try:
-                await status_update_service.update_completed_pods_to_closed(session)
-                await reminder_service.send_review_reminders(session)
-                await reminder_service.send_deadline_reminders(session)
+                await job(session)
             finally:
                 await session.close()
 
+    task.__name__ = name
+    return task
+
+
+async def _get_reminder_queue() -> ReminderQueueService:
+    """스케줄러용 리마인더 큐 생성"""
+    return ReminderQueueService(await get_redis_client())
+
+
+def register_scheduler_tasks(scheduler: Scheduler) -> None:
+    """스케줄러에 리마인더 작업들 등록
+
+    그룹:
+        - status: 파티 상태 업데이트
+        - review: 완료된 파티 종료 처리 후 리뷰 유도 알림 (종료 처리가 먼저 끝나야 함)
+        - deadline: 마감 임박 알림
+        - reminder_queue: 예약 큐 기반 시작/취소 임박 알림
+    """
+    reminder_service, status_update_service = create_services()
+
+    async def send_due_pod_reminders(session: AsyncSession) -> None:
+        await reminder_service.send_due_pod_reminders(
+            session, await _get_reminder_queue()
+        )
+
+    async def sync_pod_reminder_queue(session: AsyncSession) -> None:
+        await reminder_service.sync_pod_reminder_queue(
+            session, await _get_reminder_queue()
+        )
+
+    # 일일 작업 (매일 오전 10시)
+    # 리뷰 유도 알림은 종료 처리된 파티 기준이므로 같은 그룹에서 순서대로 실행
+    scheduler.register_daily_task(
+        _with_session(
+            status_update_service.update_completed_pods_to_closed,
+            "close_completed_pods",
+        ),
+        group="review",
+    )
+    scheduler.register_daily_task(
+        _with_session(reminder_service.send_review_reminders, "review_reminders"),
+        group="review",
+    )
+    scheduler.register_daily_task(
+        _with_session(reminder_service.send_deadline_reminders, "deadline_reminders"),
+        group="deadline",
+    )
+
     # 시간별 작업 (1시간마다)
-    async def hourly_tasks() -> None:
-        """시간별 작업: 마감 알림"""
-        async for session in get_session():
-            try:
-                await reminder_service.send_deadline_reminders(session)
-            finally:
-                await session.close()
+    scheduler.register_hourly_task(
+        _with_session(reminder_service.send_deadline_reminders, "deadline_reminders"),
+        group="deadline",
+    )
+    scheduler.register_hourly_task(
+        _with_session(sync_pod_reminder_queue, "sync_pod_reminder_queue"),
+        group="reminder_queue",
+    )
 
     # 빈번한 작업 (5분마다)
-    async def frequent_tasks() -> None:
-        """빈번한 작업: 상태 업데이트 + 시작/취소 임박 알림"""
-        async for session in get_session():
-            try:
-                await status_update_service.run_all_updates(session)
-                await reminder_service.send_start_soon_reminders(session)
-                await reminder_service.send_canceled_soon_reminders(session)
-            finally:
-                await session.close()
+    scheduler.register_frequent_task(
+        _with_session(status_update_service.run_all_updates, "status_updates"),
+        group="status",
+    )
 
-    # 스케줄러에 등록
-    scheduler.register_daily_task(daily_tasks)
-    scheduler.register_hourly_task(hourly_tasks)
-    scheduler.register_frequent_task(frequent_tasks)
+    # 1분 작업: 발송 시각이 된 예약 리마인더만 처리
+    scheduler.register_minutely_task(
+        _with_session(send_due_pod_reminders, "due_pod_reminders"),
+        group="reminder_queue",
+        timeout=50,
+    )
 
     logger.info("리마인더 작업이 스케줄러에 등록되었습니다")
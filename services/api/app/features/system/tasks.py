@@ -0,0 +1,78 @@
+"""시스템 태스크 - 스케줄러에 등록할 작업들 정의"""
+
+import logging
+from collections import Counter
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_batch_session, named_lock
+from app.core.scheduler import Scheduler
+from app.deps.redis import get_redis_client
+from app.features.artists.models import ArtistImage
+from app.features.chat.models import ChatRoom
+from app.features.notifications.models import Notification
+from app.features.pods.models import Pod, PodDetail, PodImage
+from app.features.users.models import User
+from app.utils.content_store import (
+    CONTENT_DIR,
+    extract_content_hash,
+    sweep_unreferenced,
+)
+
+logger = logging.getLogger(__name__)
+
+# 정리 작업은 모든 워커의 스케줄러가 동시에 실행하므로 한 워커만 실행하도록 락으로 보호
+SWEEP_LOCK_NAME = "podpod:content_store_sweep"
+
+# 내용 주소 저장소의 파일을 참조하는 URL 컬럼
+CONTENT_REFERENCE_COLUMNS = (
+    Pod.thumbnail_url,
+    PodDetail.image_url,
+    PodImage.image_url,
+    PodImage.thumbnail_url,
+    User.profile_image,
+    ArtistImage.path,
+    ChatRoom.cover_url,
+    Notification.related_user_profile_image,
+)
+
+
+async def count_content_references(session: AsyncSession) -> Counter[str]:
+    """해시별 참조 수 집계 (참조 컬럼 전체 기준)"""
+    refcounts: Counter[str] = Counter()
+    for column in CONTENT_REFERENCE_COLUMNS:
+        result = await session.execute(
+            select(column).where(column.like(f"%/{CONTENT_DIR}/%"))
+        )
+        for url in result.scalars():
+            content_hash = extract_content_hash(url)
+            if content_hash:
+                refcounts[content_hash] += 1
+    return refcounts
+
+
+def register_scheduler_tasks(scheduler: Scheduler) -> None:
+    """스케줄러에 시스템 작업들 등록
+
+    그룹:
+        - storage: 참조되지 않는 이미지 파일 정리
+    """
+
+    async def sweep_content_store() -> None:
+        async with named_lock(SWEEP_LOCK_NAME, 0) as locked:
+            if not locked:
+                logger.info("다른 워커가 이미지 저장소를 정리 중이므로 건너뜀")
+                return
+
+            async for session in get_batch_session():
+                try:
+                    refcounts = await count_content_references(session)
+                finally:
+                    await session.close()
+            await sweep_unreferenced(set(refcounts), await get_redis_client())
+
+    # 일일 작업 (파일 시스템 전체를 훑으므로 타임아웃을 넉넉하게)
+    scheduler.register_daily_task(sweep_content_store, group="storage", timeout=30 * 60)
+
+    logger.info("시스템 작업이 스케줄러에 등록되었습니다")
@@ -1,21 +1,59 @@
 """성향 테스트 점수 계산 서비스"""
 
-from typing import Any, Dict, List
+import logging
+from typing import Any, Dict, List, Mapping, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 덕메 타입 (한글 → 결과 타입), 순서는 동점일 때의 우선순위
+TENDENCY_TYPE_MAPPING = {
+    "안방덕메": "QUIET_MATE",
+    "인싸덕메": "TOGETHER_MATE",
+    "올출덕메": "FIELD_MATE",
+    "순례덕메": "PILGRIM_MATE",
+    "서폿덕메": "SUPPORT_MATE",
+    "금손덕메": "CREATIVE_MATE",
+}
+
+# (question_id, answer_id) → (덕메 타입, 점수)
+AnswerScores = Mapping[Tuple[int, int], Tuple[str, int]]
 
 
 class TendencyCalculationService:
     """성향 테스트 점수 계산 로직을 처리하는 서비스"""
 
+    # - MARK: 설문 컴파일
+    @staticmethod
+    def compile_answer_scores(
+        survey_questions: List[Dict[str, Any]],
+    ) -> Dict[Tuple[int, int], Tuple[str, int]]:
+        """설문 질문 리스트를 (question_id, answer_id) 조회 테이블로 변환"""
+        answer_scores: Dict[Tuple[int, int], Tuple[str, int]] = {}
+        for question in survey_questions:
+            for answer in question.get("answers", []):
+                tendency_type = answer["tendencyType"]
+                if tendency_type not in TENDENCY_TYPE_MAPPING:
+                    logger.warning(
+                        f"알 수 없는 덕메 타입 무시: question_id={question['id']}, "
+                        f"answer_id={answer['id']}, tendency_type={tendency_type}"
+                    )
+                    continue
+                # 같은 키가 여러 번 나오면 처음 것 사용 (기존 순차 탐색과 동일)
+                answer_scores.setdefault(
+                    (question["id"], answer["id"]), (tendency_type, answer["score"])
+                )
+        return answer_scores
+
     # - MARK: 성향 테스트 점수 계산
     async def calculate_tendency_score(
-        self, answers: Dict[int, int], survey_questions: List[Dict[str, Any]]
+        self, answers: Dict[int, int], answer_scores: AnswerScores
     ) -> Dict[str, Any]:
         """
         성향 테스트 답변을 받아서 점수를 계산하고 결과를 반환
 
         Args:
             answers: {question_id: answer_id} 형태의 답변 딕셔너리
-            survey_questions: 설문 질문 리스트
+            answer_scores: compile_answer_scores로 만든 조회 테이블
 
         Returns:
             {
@@ -33,59 +71,22 @@ class TendencyCalculationService:
             }
         """
         # 점수 초기화
-        scores = {
-            "안방덕메": 0,
-            "인싸덕메": 0,
-            "올출덕메": 0,
-            "순례덕메": 0,
-            "서폿덕메": 0,
-            "금손덕메": 0,
-        }
+        scores = dict.fromkeys(TENDENCY_TYPE_MAPPING, 0)
 
-        # 각 답변에 대해 점수 계산
+        # 답변마다 한 번의 조회로 점수 누적 (설문에 없는 질문/답변은 무시)
         for question_id, answer_id in answers.items():
-            question = next(
-                (q for q in survey_questions if q["id"] == question_id), None
-            )
-            if not question:
-                continue
+            entry = answer_scores.get((question_id, answer_id))
+            if entry is not None:
+                tendency_type, score = entry
+                scores[tendency_type] += score
 
-            answer = next(
-                (a for a in question["answers"] if a["id"] == answer_id), None
-            )
-            if not answer:
-                continue
-
-            # 해당 덕메 타입에 점수 추가
-            tendency_type = answer["tendencyType"]
-            score = answer["score"]
-            scores[tendency_type] += score
-
-        # 총점 계산
-        total_score = sum(scores.values())
-
-        # 가장 높은 점수의 덕메 타입을 결과로 선택
-        max_score = max(scores.values())
-        result_types = [
-            tendency_type
-            for tendency_type, score in scores.items()
-            if score == max_score
-        ]
-
-        # 결과 타입 매핑 (한글 -> 영문)
-        type_mapping = {
-            "안방덕메": "QUIET_MATE",
-            "인싸덕메": "TOGETHER_MATE",
-            "올출덕메": "FIELD_MATE",
-            "순례덕메": "PILGRIM_MATE",
-            "서폿덕메": "SUPPORT_MATE",
-            "금손덕메": "CREATIVE_MATE",
-        }
+        # 가장 높은 점수의 덕메 타입을 결과로 선택 (동점이면 먼저 나온 타입)
+        result_type = max(scores, key=scores.__getitem__)
 
         # 결과 반환
         return {
-            "tendency_type": type_mapping.get(result_types[0], "QUIET_MATE"),
-            "total_score": total_score,
+            "tendency_type": TENDENCY_TYPE_MAPPING[result_type],
+            "total_score": sum(scores.values()),
             "scores": scores,
             "answers": answers,
         }
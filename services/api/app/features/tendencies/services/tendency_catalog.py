@@ -0,0 +1,140 @@
+"""성향 테스트 카탈로그 (워커별 메모리 캐시)
+
+설문과 결과(TendencyResult)는 운영 중에 거의 바뀌지 않으므로 워커마다 컴파일해 둡니다.
+- 설문: 응답 DTO와 (질문 ID, 답변 ID) → (덕메 타입, 점수) 조회 테이블
+- 결과: 타입별 TendencyResultDto / 제출 응답용 TendencyDto
+CHECK_INTERVAL초가 지난 뒤 첫 요청이 설문/결과 행을 다시 읽어 버전(내용 해시)을 비교하고,
+바뀐 경우에만 다시 컴파일합니다 (DB를 직접 수정해도 CHECK_INTERVAL 안에 반영).
+
+컴파일 결과는 불변 객체이고 통째로 교체하므로 요청 사이에 공유해도 안전합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+
+from app.features.tendencies.models import TendencyResult, TendencySurvey
+from app.features.tendencies.repositories import TendencyRepository
+from app.features.tendencies.schemas import (
+    TendencyDto,
+    TendencyResultDto,
+    TendencySurveyDto,
+)
+from app.features.tendencies.services.tendency_calculation_service import (
+    AnswerScores,
+    TendencyCalculationService,
+)
+from app.features.tendencies.services.tendency_dto_service import TendencyDtoService
+
+logger = logging.getLogger(__name__)
+
+# 버전 확인 주기 (초)
+CHECK_INTERVAL = 60
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTendencySurvey:
+    """컴파일된 설문/결과 (survey: 설문이 없으면 None)"""
+
+    version: str
+    survey: TendencySurveyDto | None
+    answer_scores: AnswerScores
+    results: dict[str, TendencyResultDto]
+    tendencies: dict[str, TendencyDto]
+
+
+def _version_of(survey: TendencySurvey | None, results: list[TendencyResult]) -> str:
+    """설문/결과 내용의 해시 (행이 추가/수정/삭제되면 바뀜)"""
+    payload = json.dumps(
+        [
+            [survey.id, survey.survey_data] if survey else None,
+            [
+                [result.id, result.type, result.description, result.tendency_info]
+                for result in results
+            ],
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def compile_survey(
+    survey: TendencySurvey | None, results: list[TendencyResult], version: str
+) -> CompiledTendencySurvey:
+    """응답 DTO와 점수 조회 테이블 생성"""
+    survey_dto = TendencySurveyDto.from_survey_data(survey) if survey else None
+    result_dtos = {
+        result.type: TendencyResultDto.model_validate(result, from_attributes=True)
+        for result in results
+    }
+    return CompiledTendencySurvey(
+        version=version,
+        survey=survey_dto,
+        answer_scores=(
+            TendencyCalculationService.compile_answer_scores(survey_dto.questions)
+            if survey_dto
+            else {}
+        ),
+        results=result_dtos,
+        tendencies={
+            tendency_type: TendencyDto(
+                type=tendency_type,
+                description=result.description,
+                tendency_info=TendencyDtoService.convert_to_info_dto(
+                    result.tendency_info
+                ),
+            )
+            for tendency_type, result in result_dtos.items()
+        },
+    )
+
+
+class TendencyCatalog:
+    """워커별 성향 테스트 카탈로그"""
+
+    def __init__(self):
+        self._compiled: CompiledTendencySurvey | None = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._compiled is not None
+            and time.monotonic() - self._checked_at < CHECK_INTERVAL
+        )
+
+    async def get(self, tendency_repo: TendencyRepository) -> CompiledTendencySurvey:
+        """컴파일된 설문/결과 (확인 주기가 지났으면 요청 세션으로 버전 확인)"""
+        if self._is_fresh():
+            return self._compiled
+
+        # 동시에 만료된 요청들은 한 번만 다시 읽음
+        async with self._lock:
+            if self._is_fresh():
+                return self._compiled
+
+            survey = await tendency_repo.get_tendency_survey()
+            results = sorted(
+                await tendency_repo.get_all_tendency_results(),
+                key=lambda result: result.id,
+            )
+            version = _version_of(survey, results)
+            if self._compiled is None or self._compiled.version != version:
+                started = time.perf_counter()
+                self._compiled = compile_survey(survey, results, version)
+                logger.info(
+                    f"성향 테스트 카탈로그 컴파일: version={version[:8]}, "
+                    f"답변 {len(self._compiled.answer_scores)}개, "
+                    f"결과 {len(results)}개 "
+                    f"({(time.perf_counter() - started) * 1000:.1f}ms)"
+                )
+            self._checked_at = time.monotonic()
+            return self._compiled
+
+
+tendency_catalog = TendencyCatalog()
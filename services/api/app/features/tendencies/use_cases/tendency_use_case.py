@@ -17,7 +17,11 @@ from app.features.tendencies.schemas import (
 from app.features.tendencies.services.tendency_calculation_service import (
     TendencyCalculationService,
 )
-from app.features.tendencies.services.tendency_dto_service import TendencyDtoService
+from app.features.tendencies.services.tendency_catalog import (
+    CompiledTendencySurvey,
+    TendencyCatalog,
+    tendency_catalog,
+)
 from app.features.users.models import User
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -31,80 +35,65 @@ class TendencyUseCase:
         session: AsyncSession,
         tendency_repo: TendencyRepository,
         calculation_service: TendencyCalculationService,
+        catalog: TendencyCatalog | None = None,
     ):
         self._session = session
         self._tendency_repo = tendency_repo
         self._calculation_service = calculation_service
+        self._catalog = catalog or tendency_catalog
+
+    async def _compiled(self) -> CompiledTendencySurvey:
+        """메모리에 컴파일된 설문/결과 (버전이 바뀐 경우에만 다시 적재)"""
+        return await self._catalog.get(self._tendency_repo)
 
     # - MARK: 성향 테스트 제출 및 결과 반환
     async def submit_tendency_test(
         self, user_id: int, request: SubmitTendencyTestRequest
     ) -> TendencyDto:
         """성향 테스트 제출 및 결과 반환"""
-        # 설문 데이터 조회
-        survey_data = await self.get_tendency_survey()
+        # 컴파일된 설문 조회
+        compiled = await self._compiled()
+        if compiled.survey is None:
+            raise TendencySurveyNotFoundException()
 
         # 답변을 딕셔너리 형태로 변환
         answers_dict = {answer.question_id: answer.id for answer in request.answers}
 
-        # 점수 계산 (계산 서비스 사용)
+        # 점수 계산 (질문/답변 ID 조회 테이블 사용)
         calculation_result = await self._calculation_service.calculate_tendency_score(
-            answers_dict, survey_data.questions
+            answers_dict, compiled.answer_scores
         )
+        tendency_type = calculation_result["tendency_type"]
 
         # 결과 저장 (커밋 포함)
-        await self.save_user_tendency_result(
-            user_id, calculation_result["tendency_type"], answers_dict
-        )
-
-        # TendencyResult 조회
-        tendency_result = await self.get_tendency_result(
-            calculation_result["tendency_type"]
-        )
-        if not tendency_result:
-            raise TendencyResultNotFoundException(calculation_result["tendency_type"])
-
-        # TendencyDto 생성
-        tendency_info_dict = getattr(tendency_result, "tendency_info", {})
-        description = getattr(tendency_result, "description", "")
+        await self.save_user_tendency_result(user_id, tendency_type, answers_dict)
 
-        return TendencyDto(
-            type=calculation_result["tendency_type"],
-            description=description,
-            tendency_info=TendencyDtoService.convert_to_info_dto(tendency_info_dict),
-        )
+        # 결과 타입별로 미리 만들어 둔 응답
+        tendency = compiled.tendencies.get(tendency_type)
+        if not tendency:
+            raise TendencyResultNotFoundException(tendency_type)
+        return tendency
 
     # - MARK: 모든 성향 테스트 결과 조회
     async def get_tendency_results(self) -> List[TendencyResultDto]:
         """모든 성향 테스트 결과 조회"""
-        tendency_results = await self._tendency_repo.get_all_tendency_results()
-
-        return [
-            TendencyResultDto.model_validate(result, from_attributes=True)
-            for result in tendency_results
-        ]
+        compiled = await self._compiled()
+        return list(compiled.results.values())
 
     # - MARK: 특정 성향 테스트 결과 조회
     async def get_tendency_result(self, tendency_type: str) -> TendencyResultDto | None:
         """특정 성향 테스트 결과 조회"""
-        tendency_result = await self._tendency_repo.get_tendency_result_by_type(
-            tendency_type
-        )
-
-        if not tendency_result:
-            return None
-
-        return TendencyResultDto.model_validate(tendency_result, from_attributes=True)
+        compiled = await self._compiled()
+        return compiled.results.get(tendency_type)
 
     # - MARK: 성향 테스트 설문 조회
     async def get_tendency_survey(self) -> TendencySurveyDto:
         """성향 테스트 설문 조회"""
-        survey = await self._tendency_repo.get_tendency_survey()
-
-        if not survey:
+        compiled = await self._compiled()
+        if compiled.survey is None:
             raise TendencySurveyNotFoundException()
 
-        return TendencySurveyDto.from_survey_data(survey)
+        return compiled.survey
 
     # - MARK: 사용자 성향 테스트 결과 조회
     async def get_user_tendency_result(
@@ -0,0 +1,17 @@
+"""
+Uploads 도메인 전용 Exception 클래스
+
+이 모듈은 Uploads 도메인에서 발생할 수 있는 비즈니스 로직 예외를 정의합니다.
+각 예외는 app/core/exceptions.py의 DomainException을 상속받아
+app/core/error_codes.py (Google Sheets)에서 에러 정보를 자동으로 가져옵니다.
+"""
+
+from app.core.exceptions import DomainException
+
+
+class UploadNotFoundException(DomainException):
+    """직접 업로드한 객체가 없는 경우 (업로드하지 않았거나 이미 정리됨)"""
+
+    def __init__(self, key: str):
+        super().__init__(error_key="UPLOAD_NOT_FOUND", format_params={"key": key})
+        self.key = key
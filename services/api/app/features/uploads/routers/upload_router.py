@@ -0,0 +1,75 @@
+from app.common.schemas import BaseResponse
+from app.deps.auth import get_current_user_id
+from app.deps.providers import get_upload_use_case
+from app.features.uploads.schemas import (
+    CompleteUploadRequest,
+    PresignedUploadDto,
+    PresignUploadRequest,
+    UploadedImageDto,
+)
+from app.features.uploads.use_cases import UploadUseCase
+from fastapi import APIRouter, Depends, Header, Query, Request, status
+from fastapi.responses import Response
+
+router = APIRouter(prefix="/uploads", tags=["uploads"])
+
+
+# - MARK: 직접 업로드 URL 발급
+@router.post(
+    "/presigned",
+    response_model=BaseResponse[PresignedUploadDto],
+    description="이미지를 저장소에 직접 올릴 수 있는 서명된 URL 발급",
+)
+async def create_presigned_upload(
+    request: PresignUploadRequest,
+    current_user_id: int = Depends(get_current_user_id),
+    use_case: UploadUseCase = Depends(get_upload_use_case),
+):
+    result = use_case.create_presigned_upload(
+        current_user_id, request.content_type, request.size
+    )
+    return BaseResponse.ok(data=result)
+
+
+# - MARK: 직접 업로드 완료
+@router.post(
+    "/complete",
+    response_model=BaseResponse[UploadedImageDto],
+    description="직접 업로드한 이미지를 검증하고 원본/렌디션 URL 반환",
+)
+async def complete_upload(
+    request: CompleteUploadRequest,
+    current_user_id: int = Depends(get_current_user_id),
+    use_case: UploadUseCase = Depends(get_upload_use_case),
+):
+    result = await use_case.complete_upload(current_user_id, request.key)
+    return BaseResponse.ok(data=result)
+
+
+# - MARK: 직접 업로드 수신 (로컬 저장소)
+@router.put(
+    "/direct",
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+)
+async def receive_direct_upload(
+    request: Request,
+    key: str = Query(...),
+    size: int = Query(..., gt=0),
+    expires: int = Query(...),
+    signature: str = Query(...),
+    content_type: str = Header(...),
+    content_length: int | None = Header(None),
+    use_case: UploadUseCase = Depends(get_upload_use_case),
+):
+    # 서명된 URL 자체가 인증 수단 (S3 pre-signed PUT과 동일)
+    await use_case.receive_direct_upload(
+        key,
+        content_type,
+        size,
+        expires,
+        signature,
+        content_length,
+        request.stream(),
+    )
+    return Response(status_code=status.HTTP_200_OK)
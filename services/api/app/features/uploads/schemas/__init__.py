@@ -0,0 +1,15 @@
+"""Uploads feature schemas"""
+
+from .upload_schemas import (
+    CompleteUploadRequest,
+    PresignedUploadDto,
+    PresignUploadRequest,
+    UploadedImageDto,
+)
+
+__all__ = [
+    "CompleteUploadRequest",
+    "PresignedUploadDto",
+    "PresignUploadRequest",
+    "UploadedImageDto",
+]
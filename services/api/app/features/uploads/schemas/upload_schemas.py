@@ -0,0 +1,52 @@
+"""직접 업로드 관련 스키마들"""
+
+from pydantic import BaseModel, Field
+
+
+# - MARK: Presign Upload Request
+class PresignUploadRequest(BaseModel):
+    """직접 업로드 URL 발급 요청"""
+
+    content_type: str = Field(
+        alias="contentType", description="업로드할 파일의 Content-Type (image/*)"
+    )
+    size: int = Field(gt=0, description="업로드할 파일 크기 (bytes)")
+
+    model_config = {"populate_by_name": True}
+
+
+# - MARK: Presigned Upload DTO
+class PresignedUploadDto(BaseModel):
+    """직접 업로드 URL (method/headers 그대로 본문을 전송)"""
+
+    key: str = Field(description="업로드 키 (완료 요청 시 전달)")
+    upload_url: str = Field(alias="uploadUrl", description="업로드 URL")
+    method: str = Field(default="PUT", description="HTTP 메서드")
+    headers: dict[str, str] = Field(
+        default_factory=dict, description="요청에 포함해야 하는 헤더"
+    )
+    expires_in: int = Field(alias="expiresIn", description="URL 유효 시간 (초)")
+
+    model_config = {"populate_by_name": True}
+
+
+# - MARK: Complete Upload Request
+class CompleteUploadRequest(BaseModel):
+    """직접 업로드 완료 요청"""
+
+    key: str = Field(description="발급받은 업로드 키")
+
+    model_config = {"populate_by_name": True}
+
+
+# - MARK: Uploaded Image DTO
+class UploadedImageDto(BaseModel):
+    """등록된 이미지 URL"""
+
+    image_url: str = Field(alias="imageUrl", description="원본 이미지 URL")
+    thumbnail_url: str = Field(alias="thumbnailUrl", description="썸네일 URL")
+    renditions: dict[str, dict[str, str]] = Field(
+        default_factory=dict, description="렌디션별/포맷별 URL"
+    )
+
+    model_config = {"populate_by_name": True}
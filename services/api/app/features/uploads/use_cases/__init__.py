@@ -0,0 +1,5 @@
+"""Upload Use Cases"""
+
+from .upload_use_case import UploadUseCase
+
+__all__ = ["UploadUseCase"]
@@ -0,0 +1,121 @@
+"""Upload Use Case - 클라이언트 직접 업로드 처리
+
+1. presign: 저장소(S3/로컬)에 바로 PUT할 수 있는 서명된 URL 발급 (incoming/{user_id}/...)
+2. 클라이언트가 URL로 이미지 본문을 직접 전송 (API 서버를 거치지 않음)
+3. complete: 업로드된 객체를 검증하고 내용 주소 저장소(cas/)에 원본/렌디션 등록
+"""
+
+import uuid
+from collections.abc import AsyncIterator
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.storage import (
+    LocalStorage,
+    StorageBackend,
+    StorageObjectNotFoundError,
+)
+from app.features.uploads.exceptions import UploadNotFoundException
+from app.features.uploads.schemas import PresignedUploadDto, UploadedImageDto
+from app.utils.content_store import INCOMING_DIR, store_original, store_renditions
+from app.utils.file_upload import (
+    IMAGE_EXTENSIONS,
+    get_file_size_string,
+    save_upload_stream,
+    spooled_object,
+)
+
+# 직접 업로드를 허용하는 Content-Type
+ALLOWED_CONTENT_TYPES = {f"image/{image_format}" for image_format in IMAGE_EXTENSIONS}
+
+
+class UploadUseCase:
+    """직접 업로드 Use Case"""
+
+    def __init__(self, storage: StorageBackend):
+        self._storage = storage
+
+    # - MARK: 업로드 URL 발급
+    def create_presigned_upload(
+        self, user_id: int, content_type: str, size: int
+    ) -> PresignedUploadDto:
+        """직접 업로드 URL 발급
+
+        형식/크기는 발급 시점에 확인하고, 선언한 크기는 서명에 포함되어
+        저장소가 다른 크기의 본문을 거부합니다 (S3: Content-Length 서명).
+        """
+        if content_type not in ALLOWED_CONTENT_TYPES:
+            raise ValueError("지원하지 않는 이미지 형식입니다")
+        max_bytes = settings.upload.max_bytes
+        if size > max_bytes:
+            raise ValueError(
+                f"파일 크기는 {get_file_size_string(max_bytes)}를 초과할 수 없습니다"
+            )
+
+        key = f"{INCOMING_DIR}/{user_id}/{uuid.uuid4().hex}"
+        expires_in = settings.storage.presign_expires_seconds
+        presigned = self._storage.presign_put(key, content_type, size, expires_in)
+        return PresignedUploadDto(
+            key=key,
+            upload_url=presigned.url,
+            method=presigned.method,
+            headers=presigned.headers,
+            expires_in=expires_in,
+        )
+
+    # - MARK: 업로드 완료 (이미지 등록)
+    async def complete_upload(self, user_id: int, key: str) -> UploadedImageDto:
+        """직접 업로드한 이미지를 검증하고 원본/렌디션을 등록
+
+        이미지가 아니거나 크기를 초과하면 ValueError, 다른 사용자의 키면 403,
+        업로드되지 않았거나 이미 정리된 키면 UploadNotFoundException(404).
+        등록이 끝난 incoming 객체는 삭제합니다 (실패 시 정리 작업이 유예 후 삭제).
+        """
+        if not key.startswith(f"{INCOMING_DIR}/{user_id}/") or ".." in key:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="업로드 키에 대한 권한이 없습니다",
+            )
+
+        try:
+            async with spooled_object(key, require_image=True) as upload:
+                renditions = await store_renditions(upload)
+                image_url = await store_original(upload)
+        except StorageObjectNotFoundError:
+            raise UploadNotFoundException(key)
+        await self._storage.delete(key)
+
+        return UploadedImageDto(
+            image_url=image_url,
+            thumbnail_url=renditions["thumbnail"]["jpeg"],
+            renditions=renditions,
+        )
+
+    # - MARK: 직접 업로드 수신 (로컬 저장소)
+    async def receive_direct_upload(
+        self,
+        key: str,
+        content_type: str,
+        size: int,
+        expires: int,
+        signature: str,
+        content_length: int | None,
+        chunks: AsyncIterator[bytes],
+    ) -> None:
+        """로컬 저장소용 서명된 PUT 수신 (S3는 저장소가 직접 받으므로 404)
+
+        발급 시 선언한 크기(서명에 포함)를 넘는 본문은 받지 않습니다.
+        """
+        if not isinstance(self._storage, LocalStorage):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        if not self._storage.verify_presigned(
+            key, content_type, size, expires, signature
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="업로드 URL이 유효하지 않거나 만료되었습니다",
+            )
+        if content_length is not None and content_length != size:
+            raise ValueError("파일 크기가 업로드 URL 발급 시 크기와 다릅니다")
+        await save_upload_stream(chunks, key, content_type, max_bytes=size)
@@ -1,5 +1,9 @@
 from datetime import datetime
 
+from app.features.notifications.services.notification_preference_cache_service import (
+    NotificationPreferenceCacheService,
+    NotificationPreferences,
+)
 from app.features.users.models import UserNotificationSettings
 from app.features.users.schemas import UpdateUserNotificationSettingsRequest
 from sqlalchemy import select
@@ -9,8 +13,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 class UserNotificationRepository:
     """사용자 알림 설정 Repository"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        preference_cache: NotificationPreferenceCacheService | None = None,
+    ):
         self._session = session
+        self._preference_cache = (
+            preference_cache or NotificationPreferenceCacheService()
+        )
 
     # - MARK: 알림 설정 조회
     async def get_by_user_id(self, user_id: int) -> UserNotificationSettings | None:
@@ -82,26 +93,51 @@ class UserNotificationRepository:
 
         return settings
 
+    # - MARK: 알림 수신 설정 일괄 조회
+    async def get_preferences(
+        self, user_ids: list[int]
+    ) -> dict[int, NotificationPreferences]:
+        """사용자별 알림 수신 설정 조회 (캐시 → DB, 설정이 없으면 기본값)"""
+        preferences = await self._preference_cache.get_preferences(user_ids)
+        missing = [uid for uid in dict.fromkeys(user_ids) if uid not in preferences]
+        if not missing:
+            return preferences
+
+        result = await self._session.execute(
+            select(
+                UserNotificationSettings.user_id,
+                UserNotificationSettings.pod_enabled,
+                UserNotificationSettings.community_enabled,
+                UserNotificationSettings.notice_enabled,
+            ).where(UserNotificationSettings.user_id.in_(missing))
+        )
+        loaded = {
+            row.user_id: NotificationPreferences(
+                pod_enabled=bool(row.pod_enabled),
+                community_enabled=bool(row.community_enabled),
+                notice_enabled=bool(row.notice_enabled),
+            )
+            for row in result.all()
+        }
+        for user_id in missing:
+            loaded.setdefault(user_id, NotificationPreferences())
+
+        await self._preference_cache.set_preferences(loaded)
+        preferences.update(loaded)
+        return preferences
+
+    # - MARK: 알림 수신 설정 캐시 삭제
+    async def invalidate_preferences(self, user_id: int) -> None:
+        """알림 설정 변경 후 캐시 삭제 (커밋 이후에 호출)"""
+        await self._preference_cache.invalidate_preferences(user_id)
+
     # - MARK: 알림 전송 여부 확인
     async def should_send_notification(
         self, user_id: int, notification_category: str
     ) -> bool:
         """알림 전송 여부 확인"""
-        settings = await self.get_by_user_id(user_id)
-        if not settings:
-            return True  # 설정이 없으면 기본적으로 전송
-
-        # 카테고리별 설정 확인
-        category_mapping = {
-            "POD": settings.pod_enabled,
-            "COMMUNITY": settings.community_enabled,
-            "NOTICE": settings.notice_enabled,
-        }
-
-        if notification_category not in category_mapping:
-            return True
-
-        return bool(category_mapping[notification_category])
+        preferences = await self.get_preferences([user_id])
+        return preferences[user_id].allows(notification_category)
 
     # - MARK: 사용자 알림 설정 삭제
     async def delete_by_user_id(self, user_id: int) -> None:
@@ -113,3 +149,4 @@ class UserNotificationRepository:
                 UserNotificationSettings.user_id == user_id
             )
         )
+        await self._preference_cache.invalidate_preferences(user_id)
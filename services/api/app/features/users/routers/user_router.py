@@ -13,7 +13,7 @@ from app.common.schemas import BaseResponse, PageDto
 from app.deps.auth import get_current_user_id
 from app.deps.providers import (
     get_block_user_use_case,
-    get_follow_use_case,
+    get_follow_query_use_case,
     get_user_use_case,
 )
 from app.features.auth.schemas import SignUpRequest
@@ -28,6 +28,7 @@ from app.features.users.schemas import (
 )
 from app.features.users.use_cases.block_user_use_case import BlockUserUseCase
 from app.features.users.use_cases.user_use_case import UserUseCase
+from app.utils.content_store import reference_content_url
 from app.utils.file_upload import upload_profile_image
 
 
@@ -49,7 +50,7 @@ class UserBaseRouter:
             page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
             size: int = Query(20, ge=1, le=100, description="페이지 크기 (1~100)"),
             current_user_id: int = Depends(get_current_user_id),
-            follow_use_case: FollowUseCase = Depends(get_follow_use_case),
+            follow_use_case: FollowUseCase = Depends(get_follow_query_use_case),
             block_user_use_case: BlockUserUseCase = Depends(get_block_user_use_case),
     ):
         """사용자 목록 조회"""
@@ -138,6 +139,8 @@ class UserBaseRouter:
                 raise ImageUploadException(message=f"이미지 업로드 실패: {str(e)}")
         # 경로가 제공된 경우
         elif profile_image_path:
+            # 저장소의 기존 파일을 다시 참조하면 정리 대상에서 제외되도록 수정 시각 갱신
+            await reference_content_url(profile_image_path)
             profile_image_url = profile_image_path
 
         # UpdateProfileRequest 생성
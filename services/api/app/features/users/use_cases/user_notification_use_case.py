@@ -67,6 +67,7 @@ class UserNotificationUseCase:
         # 트랜잭션 커밋
         await self._session.commit()
         await self._session.refresh(updated_settings)
+        await self._notification_repo.invalidate_preferences(user_id)
 
         # DTO 변환은 notification_dto_service에서 처리
         return self._notification_dto_service.convert_notification_settings_to_dto(
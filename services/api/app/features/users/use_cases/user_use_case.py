@@ -289,7 +289,9 @@ class UserUseCase:
             await self._pod_repo.delete_all_members_by_user_id(user_id)
 
             # 6. 알림 삭제 (user_id와 related_user_id 모두)
-            await self._notification_repo.delete_all_by_user_id(user_id)
+            badge_user_ids = await self._notification_repo.delete_all_by_user_id(
+                user_id
+            )
 
             # 7. 알림 설정 삭제
             await self._user_notification_repo.delete_by_user_id(user_id)
@@ -317,6 +319,9 @@ class UserUseCase:
             await self._session.rollback()
             raise
 
+        # 커밋 전에 비우면 동시 조회가 이전 개수를 다시 캐시할 수 있으므로 커밋 후 무효화
+        await self._notification_repo.invalidate_unread_counts(*badge_user_ids)
+
     # - MARK: UserDetailDto 데이터 준비
     async def _prepare_user_dto_data(
         self, user: User, current_user_id: int | None = None
@@ -1,90 +1,147 @@
-"""API 요청/응답 로깅 미들웨어"""
+"""API 요청/응답 로깅 미들웨어 (순수 ASGI)
 
+BaseHTTPMiddleware와 달리 요청/응답 본문을 메모리에 모으지 않고 그대로 흘려보냅니다.
+- 요청 본문은 허용된 Content-Type에 한해 앞부분(body_max_bytes)만 복사해 기록
+- 민감한 헤더는 마스킹
+- 성공 요청은 샘플링 (오류/느린 요청은 항상 기록)
+"""
+
+import random
 import time
 import uuid
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.core.config import RequestLoggingConfig, settings
 from app.core.logger import get_logger
 
 logger = get_logger("api")
 
+REDACTED = "[REDACTED]"
+BODY_METHODS = {"POST", "PUT", "PATCH"}
+
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """API 요청/응답을 로깅하는 미들웨어"""
 
-    async def dispatch(self, request: Request, call_next):
-        # 요청 시작 시간
-        start_time = time.time()
+    def __init__(self, app: ASGIApp, config: RequestLoggingConfig | None = None):
+        self.app = app
+        self.config = config or settings.request_logging
+        self._redact_headers = {h.lower() for h in self.config.redact_headers}
+        self._body_content_types = {c.lower() for c in self.config.body_content_types}
+        self._skip_paths = set(self.config.skip_paths)
 
-        # 요청 ID 생성
-        request_id = str(uuid.uuid4())
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self._skip_paths:
+            await self.app(scope, receive, send)
+            return
 
-        # 요청 본문 읽기 (POST, PUT, PATCH 요청의 경우)
-        request_body = None
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.body()
-                if body:
-                    request_body = body.decode("utf-8")
-            except Exception:
-                request_body = "Failed to read request body"
-
-        # 요청 정보 로깅
-        logger.info(
-            f"요청 시작: {request.method} {request.url.path}",
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "endpoint": request.url.path,
-                "query_params": str(request.query_params),
-                "headers": dict(request.headers),
-                "request_body": request_body,
-                "client_ip": request.client.host if request.client else None,
-                "user_agent": request.headers.get("user-agent"),
-            },
-        )
+        # 요청 시작 시간 / 요청 ID
+        start_time = time.perf_counter()
+        request_id = str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope["headers"]
+        }
+
+        # 요청 본문 일부 복사 (앱에는 원본 그대로 전달)
+        body_buffer: bytearray | None = None
+        body_size = 0
+        if scope["method"] in BODY_METHODS and self._should_capture_body(headers):
+            body_buffer = bytearray()
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_size
+            message = await receive()
+            if body_buffer is not None and message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                body_size += len(chunk)
+                remaining = self.config.body_max_bytes - len(body_buffer)
+                if remaining > 0:
+                    body_buffer.extend(chunk[:remaining])
+            return message
+
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # 응답 헤더에 요청 ID 추가
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
 
-        # 응답 처리
         try:
-            response = await call_next(request)
-
-            # 응답 시간 계산
-            duration = time.time() - start_time
-
-            # 응답 정보 로깅
-            logger.info(
-                f"요청 완료: {request.method} {request.url.path}",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "endpoint": request.url.path,
-                    "status_code": response.status_code,
-                    "duration": duration,
-                    "response_size": response.headers.get("content-length"),
-                },
-            )
-
-            # 응답 헤더에 요청 ID 추가
-            response.headers["X-Request-ID"] = request_id
-
-            return response
-
+            await self.app(scope, receive_wrapper, send_wrapper)
         except Exception as e:
             # 에러 발생 시 로깅
-            duration = time.time() - start_time
-
             logger.error(
-                f"요청 실패: {request.method} {request.url.path}",
+                f"요청 실패: {scope['method']} {scope['path']}",
                 extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "endpoint": request.url.path,
-                    "duration": duration,
+                    **self._request_extra(scope, headers, request_id),
+                    "request_body": self._format_body(body_buffer, body_size),
+                    "duration": time.perf_counter() - start_time,
                     "error": str(e),
                 },
                 exc_info=True,
             )
-
             raise
+
+        duration = time.perf_counter() - start_time
+        if not self._should_log(status_code, duration):
+            return
+
+        # 응답 정보 로깅
+        logger.info(
+            f"요청 완료: {scope['method']} {scope['path']}",
+            extra={
+                **self._request_extra(scope, headers, request_id),
+                "request_body": self._format_body(body_buffer, body_size),
+                "status_code": status_code,
+                "duration": duration,
+                "response_size": response_size,
+            },
+        )
+
+    # - MARK: 기록 여부 / 형식
+    def _should_capture_body(self, headers: dict[str, str]) -> bool:
+        content_type = headers.get("content-type", "")
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        return media_type in self._body_content_types
+
+    def _should_log(self, status_code: int, duration: float) -> bool:
+        if status_code >= 400 or duration >= self.config.slow_request_seconds:
+            return True
+        sample_rate = self.config.success_sample_rate
+        return sample_rate >= 1.0 or random.random() < sample_rate
+
+    def _request_extra(
+        self, scope: Scope, headers: dict[str, str], request_id: str
+    ) -> dict:
+        client = scope.get("client")
+        return {
+            "request_id": request_id,
+            "method": scope["method"],
+            "endpoint": scope["path"],
+            "query_params": scope.get("query_string", b"").decode("latin-1"),
+            "headers": {
+                key: REDACTED if key in self._redact_headers else value
+                for key, value in headers.items()
+            },
+            "client_ip": client[0] if client else None,
+            "user_agent": headers.get("user-agent"),
+        }
+
+    def _format_body(self, body_buffer: bytearray | None, body_size: int) -> str | None:
+        if not body_buffer:
+            return None
+        body = body_buffer.decode("utf-8", errors="replace")
+        if body_size > len(body_buffer):
+            body += f"... (truncated, {body_size} bytes)"
+        return body
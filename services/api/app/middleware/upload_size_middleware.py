@@ -0,0 +1,105 @@
+"""multipart 업로드 요청 크기 제한 미들웨어 (순수 ASGI)
+
+Starlette의 multipart 파서는 본문 전체를 받아 임시 파일에 기록한 뒤에야 UploadFile을 넘기므로,
+파일별 크기 검사(spooled_upload)만으로는 수 GB 요청도 끝까지 받은 뒤 거절하게 됩니다.
+이 미들웨어는 파싱 전에 요청 단위로 막습니다.
+- Content-Length가 상한을 넘으면 본문을 읽지 않고 413 응답
+- Content-Length가 없으면(chunked) 받은 크기를 세다가 상한을 넘는 순간 413 응답 후 수신 중단
+"""
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.schemas import BaseResponse
+from app.core.config import settings
+from app.core.exceptions.registry import get_error_info
+from app.core.logger import get_logger
+
+logger = get_logger("api")
+
+BODY_METHODS = {"POST", "PUT", "PATCH"}
+
+
+def _too_large_response() -> JSONResponse:
+    error = get_error_info("REQUEST_BODY_TOO_LARGE")
+    response = BaseResponse(
+        data=None,
+        error_key=error.error_key,
+        error_code=error.code,
+        http_status=error.http_status,
+        message_ko=error.message_ko,
+        message_en=error.message_en,
+        dev_note=error.dev_note,
+    )
+    return JSONResponse(
+        status_code=error.http_status, content=response.model_dump(by_alias=True)
+    )
+
+
+class UploadSizeLimitMiddleware:
+    """multipart/form-data 요청 본문이 상한을 넘으면 파싱 전에 413으로 거절"""
+
+    def __init__(self, app: ASGIApp, max_bytes: int | None = None):
+        self.app = app
+        self.max_bytes = max_bytes or settings.upload.max_request_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in BODY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        content_type = headers.get(b"content-type", b"").decode("latin-1").lower()
+        if not content_type.startswith("multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        # 잘못된 Content-Length는 서버(uvicorn)가 앱에 전달하기 전에 거절
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > self.max_bytes:
+                logger.warning(
+                    f"업로드 요청 거절 (Content-Length={content_length!r}, "
+                    f"상한={self.max_bytes}): {scope['path']}"
+                )
+                await _too_large_response()(scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+            return
+
+        # Content-Length 없음: 받은 크기를 세다가 넘으면 응답 후 앱에는 연결 종료로 전달
+        received = 0
+        rejected = False
+        response_started = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    rejected = True
+                    logger.warning(
+                        f"업로드 요청 거절 (수신 {received}바이트, "
+                        f"상한={self.max_bytes}): {scope['path']}"
+                    )
+                    if not response_started:
+                        await _too_large_response()(scope, receive, send_original)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def send_original(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        async def send_wrapper(message: Message) -> None:
+            # 413을 보낸 뒤에는 앱의 응답을 버림
+            if rejected:
+                return
+            await send_original(message)
+
+        await self.app(scope, receive_wrapper, send_wrapper)
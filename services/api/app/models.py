@@ -22,7 +22,7 @@ from app.features.chat.models import (
 from app.features.follow.models import Follow
 
 # Locations
-from app.features.locations.models import Location
+from app.features.locations.models import Location, LocationPopularity
 
 # Notifications
 from app.features.notifications.models import Notification
@@ -66,6 +66,7 @@ __all__ = [
     "Follow",
     # Locations
     "Location",
+    "LocationPopularity",
     # Notifications
     "Notification",
     # Chat
@@ -1,12 +1,7 @@
 """
 유틸리티 함수들
-"""
-
-from .form_parser import FormParser, parse_form_to_model, get_form_field, get_form_file
 
-__all__ = [
-    "FormParser",
-    "parse_form_to_model",
-    "get_form_field",
-    "get_form_file",
-]
+이미지 처리 워커 프로세스가 app.utils.image_worker를 import할 때 이 파일도 실행되므로
+하위 모듈을 여기서 re-export하지 않습니다 (form_parser 등은 fastapi를 import함).
+각 모듈에서 직접 import하세요 (예: from app.utils.form_parser import FormParser).
+"""
@@ -0,0 +1,219 @@
+"""내용 주소 기반(content-addressed) 이미지 저장소
+
+업로드 파일을 SHA-256으로 저장해 같은 이미지는 한 번만 저장/인코딩합니다.
+- 원본: cas/{해시 앞 2자리}/{해시}.{확장자}
+- 렌디션: cas/{해시 앞 2자리}/{해시}.{렌디션}_{가로}x{세로}_q{품질}.{확장자}
+  (규격이 파일명에 들어가므로 렌디션 설정을 바꾸면 새로 생성됨)
+
+키는 저장소(app.core.storage, 로컬/S3) 기준입니다.
+참조는 DB의 URL 컬럼으로만 관리하고, sweep_unreferenced가 어디에서도 참조하지 않는
+해시의 파일을 정리합니다. 재사용(중복 업로드, 기존 URL 지정) 시에는 수정 시각을 갱신해
+아직 커밋되지 않은 참조가 정리 대상이 되지 않도록 합니다.
+
+정리는 두 단계입니다. 한 번의 실행에서는 후보로 표시만 하고, 다음 실행에서도
+참조가 없고 표시 이후 수정되지 않은 파일만 삭제 직전에 다시 확인한 뒤 삭제합니다.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.core.metrics import CONTENT_STORE_DEDUP_HITS, CONTENT_STORE_SWEPT_FILES
+from app.core.storage import get_storage
+from app.utils.file_upload import (
+    IMAGE_EXTENSIONS,
+    SpooledUpload,
+    content_type_of,
+    spool_dir,
+)
+from app.utils.image_pipeline import render_image, rendition_specs
+from app.utils.image_worker import FORMAT_EXTENSIONS, RenditionSpec
+
+logger = logging.getLogger(__name__)
+
+CONTENT_DIR = "cas"
+INCOMING_DIR = "incoming"  # 클라이언트 직접 업로드 (등록 전)
+# 정리 후보 (field: 키, value: 후보로 표시한 시각)
+SWEEP_CANDIDATES_KEY = "content_store:sweep_candidates"
+_CONTENT_URL_PATTERN = re.compile(r"/cas/[0-9a-f]{2}/([0-9a-f]{64})")
+_CONTENT_KEY_PATTERN = re.compile(r"/(cas/[0-9a-f]{2}/[0-9a-f]{64}[^/?#]*)")
+_HASH_LENGTH = 64
+
+
+# MARK: - Keys
+def original_key(upload: SpooledUpload) -> str:
+    """원본 파일 키 (확장자는 시그니처로 판별한 포맷 → 파일명 순)"""
+    if upload.image_format:
+        extension = IMAGE_EXTENSIONS[upload.image_format]
+    else:
+        extension = Path(upload.filename or "").suffix.lower()
+    return f"{CONTENT_DIR}/{upload.sha256[:2]}/{upload.sha256}{extension}"
+
+
+def rendition_key(content_hash: str, spec: RenditionSpec, fmt: str) -> str:
+    """렌디션 파일 키"""
+    return (
+        f"{CONTENT_DIR}/{content_hash[:2]}/{content_hash}.{spec.name}"
+        f"_{spec.max_width}x{spec.max_height}_q{spec.quality}.{FORMAT_EXTENSIONS[fmt]}"
+    )
+
+
+def extract_content_hash(url: str | None) -> str | None:
+    """URL/경로에서 내용 해시 추출 (저장소 밖의 파일이면 None)"""
+    if not url:
+        return None
+    match = _CONTENT_URL_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+def extract_content_key(url: str | None) -> str | None:
+    """URL/경로에서 저장소 키 추출 (저장소 밖의 파일이면 None)"""
+    if not url:
+        return None
+    match = _CONTENT_KEY_PATTERN.search(url)
+    return match.group(1) if match else None
+
+
+# MARK: - Store
+async def reference_content_url(url: str | None) -> bool:
+    """기존 URL을 다시 참조할 때 수정 시각 갱신 (정리 대상에서 제외)
+
+    Returns:
+        저장소의 파일이 존재하면 True (저장소 밖의 URL이면 False)
+    """
+    key = extract_content_key(url)
+    if key is None:
+        return False
+    return await get_storage().touch(key)
+
+
+async def store_original(upload: SpooledUpload) -> str:
+    """임시 파일을 저장소에 저장하고 URL 반환 (같은 내용이 있으면 재사용)"""
+    storage = get_storage()
+    key = original_key(upload)
+    if await storage.touch(key):
+        CONTENT_STORE_DEDUP_HITS.labels(kind="original").inc()
+    else:
+        await storage.put_file(key, upload.path, content_type_of(upload))
+    return storage.url(key)
+
+
+async def store_renditions(upload: SpooledUpload) -> dict[str, dict[str, str]]:
+    """설정된 렌디션을 생성해 저장하고 URL 반환 (이미 있으면 디코딩 없이 재사용)
+
+    이미지가 아니거나 손상된 경우 ValueError를 발생시킵니다.
+
+    Returns:
+        {렌디션: {포맷: URL}} (예: {"thumbnail": {"jpeg": ..., "webp": ...}})
+    """
+    storage = get_storage()
+    specs = rendition_specs()
+    formats = settings.image.formats
+    keys = {
+        spec.name: {fmt: rendition_key(upload.sha256, spec, fmt) for fmt in formats}
+        for spec in specs
+    }
+    all_keys = [key for by_format in keys.values() for key in by_format.values()]
+
+    if all(await asyncio.gather(*(storage.touch(key) for key in all_keys))):
+        CONTENT_STORE_DEDUP_HITS.labels(kind="rendition").inc()
+    else:
+        # 디코딩/인코딩은 프로세스 풀에서 실행 (워커가 임시 파일을 직접 읽음)
+        rendered = await render_image(str(upload.path))
+        await asyncio.gather(
+            *(
+                storage.put_bytes(key, rendered.files[name][fmt], f"image/{fmt}")
+                for name, by_format in keys.items()
+                for fmt, key in by_format.items()
+            )
+        )
+
+    return {
+        name: {fmt: storage.url(key) for fmt, key in by_format.items()}
+        for name, by_format in keys.items()
+    }
+
+
+# MARK: - Sweep
+def _sweep_spool_dir(directory: Path, older_than: float) -> int:
+    """비정상 종료로 남은 업로드 임시 파일 정리"""
+    deleted = 0
+    if not directory.exists():
+        return deleted
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.stat().st_mtime <= older_than:
+            Path(entry.path).unlink(missing_ok=True)
+            deleted += 1
+    return deleted
+
+
+async def sweep_unreferenced(referenced: set[str], redis: Redis) -> int:
+    """참조되지 않는 해시의 파일 삭제 (유예 시간 이내에 쓰인/재사용된 파일은 제외)
+
+    참조가 없는 파일은 먼저 후보로 표시하고, 다음 실행에서도 참조가 없고
+    표시 이후 수정(재사용)되지 않았으면 삭제 직전에 다시 조회해 확인한 뒤 삭제합니다.
+    등록되지 않고 유예 시간이 지난 직접 업로드(incoming/)도 함께 삭제합니다.
+
+    Returns:
+        삭제한 파일 수
+    """
+    storage = get_storage()
+    grace = settings.upload.orphan_grace_seconds
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(seconds=grace)
+
+    marked = {
+        key: float(marked_at)
+        for key, marked_at in (await redis.hgetall(SWEEP_CANDIDATES_KEY)).items()
+    }
+    candidates: dict[str, float] = {}
+
+    deleted = deleted_bytes = 0
+    async for stored in storage.list(f"{CONTENT_DIR}/"):
+        content_hash = stored.key.rsplit("/", 1)[-1][:_HASH_LENGTH]
+        if content_hash in referenced or stored.modified_at > cutoff:
+            continue
+
+        marked_at = marked.get(stored.key)
+        if marked_at is None or stored.modified_at.timestamp() > marked_at:
+            candidates[stored.key] = now.timestamp()
+            continue
+
+        # 목록 조회 이후 재사용(touch)되었을 수 있으므로 삭제 직전에 다시 확인
+        current = await storage.stat(stored.key)
+        if current is None or current.modified_at.timestamp() > marked_at:
+            continue
+        await storage.delete(stored.key)
+        deleted += 1
+        deleted_bytes += current.size
+
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.delete(SWEEP_CANDIDATES_KEY)
+        if candidates:
+            pipe.hset(SWEEP_CANDIDATES_KEY, mapping=candidates)
+        await pipe.execute()
+
+    incoming_deleted = 0
+    async for stored in storage.list(f"{INCOMING_DIR}/"):
+        if stored.modified_at <= cutoff:
+            await storage.delete(stored.key)
+            incoming_deleted += 1
+
+    spool_deleted = await asyncio.to_thread(
+        _sweep_spool_dir, spool_dir(), time.time() - grace
+    )
+    CONTENT_STORE_SWEPT_FILES.inc(deleted)
+    logger.info(
+        f"이미지 저장소 정리: 참조 해시 {len(referenced)}개, "
+        f"삭제 {deleted}개 ({deleted_bytes / (1024 * 1024):.1f}MB), "
+        f"삭제 후보 {len(candidates)}개, "
+        f"미등록 직접 업로드 {incoming_deleted}개, 업로드 임시 파일 {spool_deleted}개"
+    )
+    return deleted
@@ -1,65 +1,253 @@
+"""파일 업로드 유틸리티
+
+업로드 파일은 통째로 메모리에 읽지 않고 청크 단위로 임시 파일에 복사합니다.
+- 복사하면서 크기를 세고 SHA-256을 계산 (상한을 넘는 순간 중단)
+- 첫 청크의 시그니처로 이미지 포맷 확인 (디코딩 없이)
+- 임시 파일은 UPLOADS_DIR 안에 두어 로컬 저장소에는 복사 없이 rename
+- 저장은 app.core.storage 백엔드(로컬/S3)를 통해 수행
+요청당 메모리 사용량은 파일 크기가 아니라 청크 크기(settings.upload.chunk_size)로 제한됩니다.
+"""
+
+import asyncio
+import hashlib
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
 
 from fastapi import UploadFile
 
 from app.core.config import settings
+from app.core.storage import get_storage
 
+# 포맷별 파일 시그니처 (파일 앞부분)
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
+IMAGE_EXTENSIONS = {"jpeg": ".jpg", "png": ".png", "gif": ".gif", "webp": ".webp"}
 
-async def save_upload_file(upload_file: UploadFile, destination: str) -> str:
-    """파일을 서버에 저장하고 파일 경로를 반환"""
-    try:
-        # 파일 확장자 추출
-        file_extension = (
-            Path(upload_file.filename).suffix if upload_file.filename else ""
-        )
 
-        # 고유한 파일명 생성
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
+@dataclass
+class SpooledUpload:
+    """임시 파일로 복사된 업로드 파일"""
 
-        # 업로드 디렉토리 생성
-        upload_dir = Path(destination)
-        upload_dir.mkdir(parents=True, exist_ok=True)
+    path: Path
+    size: int
+    sha256: str
+    image_format: str | None
+    filename: str | None
 
-        # 파일 저장 경로
-        file_path = upload_dir / unique_filename
 
-        # 파일 저장
-        with open(file_path, "wb") as buffer:
-            content = await upload_file.read()
-            buffer.write(content)
+def sniff_image_format(header: bytes) -> str | None:
+    """파일 앞부분의 시그니처로 이미지 포맷 판별 (판별 불가 시 None)"""
+    for signature, image_format in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return image_format
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    return None
 
-        # 파일 포인터를 다시 처음으로 되돌리기
+
+def content_type_of(upload: SpooledUpload) -> str | None:
+    """시그니처로 판별한 포맷의 Content-Type"""
+    return f"image/{upload.image_format}" if upload.image_format else None
+
+
+def _write_chunk(buffer: BinaryIO, hasher, chunk: bytes) -> None:
+    hasher.update(chunk)
+    buffer.write(chunk)
+
+
+def _inspect_file(path: Path) -> tuple[str, str | None]:
+    """파일의 SHA-256과 시그니처로 판별한 이미지 포맷"""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as buffer:
+        header = buffer.read(settings.upload.chunk_size)
+        hasher.update(header)
+        while chunk := buffer.read(settings.upload.chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest(), sniff_image_format(header)
+
+
+def spool_dir() -> Path:
+    """업로드 임시 파일 디렉토리 (로컬 저장소와 같은 파일시스템)"""
+    return Path(settings.UPLOADS_DIR) / ".tmp"
+
+
+def _new_spool_path() -> Path:
+    directory = spool_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{uuid.uuid4().hex}.part"
+
+
+@asynccontextmanager
+async def spooled_upload(
+    upload_file: UploadFile,
+    max_bytes: int | None = None,
+    require_image: bool = False,
+) -> AsyncIterator[SpooledUpload]:
+    """업로드 파일을 청크 단위로 임시 파일에 복사
+
+    크기 초과, 빈 파일, (require_image일 때) 이미지가 아닌 파일은 ValueError를 발생시킵니다.
+    컨텍스트를 벗어나면 임시 파일은 삭제됩니다 (로컬 저장소로 옮긴 경우 제외).
+
+    이 시점에는 multipart 파서가 본문을 이미 모두 받은 뒤이므로, 여기서의 크기 검사는
+    파일별 상한 확인입니다. 큰 요청을 본문 수신 전에 막는 것은
+    UploadSizeLimitMiddleware(요청 단위 상한)가 담당합니다.
+    """
+    max_bytes = max_bytes or settings.upload.max_bytes
+    size_limit = get_file_size_string(max_bytes)
+
+    # 크기를 이미 알고 있으면 (multipart 파싱 시 기록) 임시 파일로 다시 복사하기 전에 거절
+    if upload_file.size is not None and upload_file.size > max_bytes:
+        raise ValueError(f"파일 크기는 {size_limit}를 초과할 수 없습니다")
+
+    tmp_path = _new_spool_path()
+
+    hasher = hashlib.sha256()
+    size = 0
+    image_format = None
+    try:
         await upload_file.seek(0)
+        buffer = await asyncio.to_thread(open, tmp_path, "wb")
+        try:
+            while chunk := await upload_file.read(settings.upload.chunk_size):
+                if size == 0:
+                    image_format = sniff_image_format(chunk)
+                    if require_image and image_format is None:
+                        raise ValueError("지원하지 않는 이미지 형식입니다")
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError(f"파일 크기는 {size_limit}를 초과할 수 없습니다")
+                await asyncio.to_thread(_write_chunk, buffer, hasher, chunk)
+        finally:
+            await asyncio.to_thread(buffer.close)
+
+        if size == 0:
+            raise ValueError("파일이 비어있습니다")
 
-        # 파일 URL 반환 (환경별 nginx 설정에 맞춰 경로 생성)
-        # destination에서 uploads 이후 경로 추출
-        upload_dir_path = Path(destination)
-        uploads_dir_path = Path(settings.UPLOADS_DIR)
+        # 파일 포인터를 다시 처음으로 되돌리기
+        await upload_file.seek(0)
 
-        # 상대 경로 계산 (uploads 디렉토리 기준)
+        yield SpooledUpload(
+            path=tmp_path,
+            size=size,
+            sha256=hasher.hexdigest(),
+            image_format=image_format,
+            filename=upload_file.filename,
+        )
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+@asynccontextmanager
+async def spooled_object(
+    key: str,
+    max_bytes: int | None = None,
+    require_image: bool = False,
+) -> AsyncIterator[SpooledUpload]:
+    """저장소 객체(클라이언트 직접 업로드)를 임시 파일로 내려받기
+
+    검증 기준과 정리 방식은 spooled_upload와 같습니다.
+    """
+    max_bytes = max_bytes or settings.upload.max_bytes
+    tmp_path = _new_spool_path()
+    try:
         try:
-            relative_path = upload_dir_path.relative_to(uploads_dir_path)
-            
-            # 환경별 nginx 경로 설정
-            if settings.ENVIRONMENT in ["staging", "stg"]:
-                # staging: /stg/uploads/...
-                return f"/stg/uploads/{relative_path}/{unique_filename}"
-            elif settings.ENVIRONMENT in ["production", "prod"]:
-                # production: /uploads/...
-                return f"/uploads/{relative_path}/{unique_filename}"
-            else:
-                # local/development: /uploads/...
-                return f"/uploads/{relative_path}/{unique_filename}"
+            size = await get_storage().get_file(key, tmp_path, max_bytes)
         except ValueError:
-            # 상대 경로 계산 실패 시 기본 경로 사용
-            if settings.ENVIRONMENT in ["staging", "stg"]:
-                return f"/stg/uploads/{unique_filename}"
-            elif settings.ENVIRONMENT in ["production", "prod"]:
-                return f"/uploads/{unique_filename}"
-            else:
-                return f"/uploads/{unique_filename}"
+            raise ValueError(
+                f"파일 크기는 {get_file_size_string(max_bytes)}를 초과할 수 없습니다"
+            )
+        if size == 0:
+            raise ValueError("파일이 비어있습니다")
+
+        sha256, image_format = await asyncio.to_thread(_inspect_file, tmp_path)
+        if require_image and image_format is None:
+            raise ValueError("지원하지 않는 이미지 형식입니다")
+
+        yield SpooledUpload(
+            path=tmp_path,
+            size=size,
+            sha256=sha256,
+            image_format=image_format,
+            filename=Path(key).name,
+        )
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+async def save_upload_stream(
+    chunks: AsyncIterator[bytes],
+    key: str,
+    content_type: str | None = None,
+    max_bytes: int | None = None,
+) -> int:
+    """요청 본문 스트림을 임시 파일에 복사한 뒤 저장소에 저장하고 크기 반환
+
+    로컬 저장소의 직접 업로드(서명된 PUT)에서 사용합니다.
+    """
+    max_bytes = max_bytes or settings.upload.max_bytes
+    tmp_path = _new_spool_path()
+    size = 0
+    try:
+        buffer = await asyncio.to_thread(open, tmp_path, "wb")
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ValueError(
+                        f"파일 크기는 {get_file_size_string(max_bytes)}를 초과할 수 없습니다"
+                    )
+                await asyncio.to_thread(buffer.write, chunk)
+        finally:
+            await asyncio.to_thread(buffer.close)
+
+        if size == 0:
+            raise ValueError("파일이 비어있습니다")
+
+        await get_storage().put_file(key, tmp_path, content_type)
+        return size
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def storage_key(destination: str | Path, filename: str) -> str:
+    """UPLOADS_DIR 기준 디렉토리 + 파일명을 저장소 키로 변환"""
+    try:
+        relative_dir = Path(destination).relative_to(settings.UPLOADS_DIR).as_posix()
+    except ValueError:
+        # 상대 경로 계산 실패 시 루트에 저장
+        return filename
+    return filename if relative_dir == "." else f"{relative_dir}/{filename}"
 
+
+async def save_spooled_file(upload: SpooledUpload, destination: str) -> str:
+    """임시 파일을 저장소의 destination 아래에 저장하고 파일 URL을 반환"""
+    # 파일 확장자 (파일명 → 시그니처로 판별한 포맷 순)
+    file_extension = Path(upload.filename).suffix if upload.filename else ""
+    if not file_extension and upload.image_format:
+        file_extension = IMAGE_EXTENSIONS[upload.image_format]
+
+    # 고유한 파일명 생성
+    key = storage_key(destination, f"{uuid.uuid4()}{file_extension}")
+
+    # 파일 저장 (로컬: 같은 파일시스템 안에서 rename, S3: 스트리밍 업로드)
+    storage = get_storage()
+    await storage.put_file(key, upload.path, content_type_of(upload))
+    return storage.url(key)
+
+
+async def save_upload_file(upload_file: UploadFile, destination: str) -> str:
+    """파일을 서버에 저장하고 파일 경로를 반환"""
+    try:
+        async with spooled_upload(upload_file) as upload:
+            return await save_spooled_file(upload, destination)
     except Exception as e:
         raise Exception(f"파일 업로드 실패: {str(e)}")
 
@@ -136,18 +324,12 @@ async def upload_artist_image(image: UploadFile) -> dict:
     if not is_valid_image_file(image):
         raise ValueError("유효하지 않은 이미지 파일입니다")
 
-    # 파일 크기 검증 (10MB 제한)
-    content = await image.read()
-    file_size = len(content)
-    if file_size > 10 * 1024 * 1024:  # 10MB
-        raise ValueError("이미지 파일 크기는 10MB를 초과할 수 없습니다")
+    from app.utils.content_store import store_original
 
-    # 파일 포인터를 다시 처음으로
-    await image.seek(0)
-
-    # 파일 저장 (환경별 uploads 디렉토리 사용)
-    artists_dir = Path(settings.UPLOADS_DIR) / "artists"
-    file_path = await save_upload_file(image, str(artists_dir))
+    # 임시 파일로 복사 (크기 제한/이미지 시그니처 검증) 후 내용 주소 저장소에 저장
+    async with spooled_upload(image, require_image=True) as upload:
+        file_size = upload.size
+        file_path = await store_original(upload)
 
     # 파일 ID 생성 (UUID)
     file_id = str(uuid.uuid4())
@@ -174,17 +356,10 @@ async def upload_profile_image(image: UploadFile) -> str:
     if not is_valid_image_file(image):
         raise ValueError("유효하지 않은 이미지 파일입니다")
 
-    # 파일 크기 검증 (10MB 제한)
-    content = await image.read()
-    file_size = len(content)
-    if file_size > 10 * 1024 * 1024:  # 10MB
-        raise ValueError("이미지 파일 크기는 10MB를 초과할 수 없습니다")
-
-    # 파일 포인터를 다시 처음으로
-    await image.seek(0)
+    from app.utils.content_store import store_original
 
-    # 파일 저장 (환경별 uploads 디렉토리 사용)
-    profiles_dir = Path(settings.UPLOADS_DIR) / "users" / "profiles"
-    file_path = await save_upload_file(image, str(profiles_dir))
+    # 임시 파일로 복사 (크기 제한/이미지 시그니처 검증) 후 내용 주소 저장소에 저장
+    async with spooled_upload(image, require_image=True) as upload:
+        file_path = await store_original(upload)
 
     return file_path
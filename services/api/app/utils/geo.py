@@ -0,0 +1,124 @@
+"""좌표 유틸리티 - geohash 인코딩, 범위 검색 셀 계산, 거리 계산
+
+파티 좌표(PodDetail.x=경도, y=위도)를 geohash로 함께 저장해 B-tree 인덱스로 후보를 좁히고,
+실제 거리(하버사인, DB에서 계산)로 거르고 정렬합니다.
+- 같은 접두사의 geohash는 같은 셀 안에 있으므로 LIKE '접두사%'가 인덱스 범위 검색이 됨
+- 검색 영역(반경의 외접 사각형, 지도 영역)을 덮는 셀 목록은 셀 수가 MAX_COVER_CELLS 이하인
+  가장 작은 셀 크기로 계산
+
+날짜 변경선(±180°)을 넘는 영역은 지원하지 않습니다 (경도 범위를 잘라서 사용).
+"""
+
+import math
+from dataclasses import dataclass
+
+# 저장 정밀도 (9자리 ≈ 4.8m x 4.8m 셀)
+GEOHASH_PRECISION = 9
+# 검색 영역을 덮는 셀(= LIKE 범위) 최대 개수
+MAX_COVER_CELLS = 16
+EARTH_RADIUS_M = 6_371_000
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+@dataclass(frozen=True, slots=True)
+class BoundingBox:
+    """위경도 사각형 (도 단위)"""
+
+    min_lat: float
+    min_lon: float
+    max_lat: float
+    max_lon: float
+
+    @classmethod
+    def around(cls, lat: float, lon: float, radius_m: float) -> "BoundingBox":
+        """중심에서 radius_m 안의 점을 모두 포함하는 사각형"""
+        angle = radius_m / EARTH_RADIUS_M
+        lat_delta = math.degrees(angle)
+        # 원이 닿는 최대 경도 차 (극을 포함하면 전체 경도)
+        sin_angle = math.sin(angle)
+        cos_lat = math.cos(math.radians(lat))
+        lon_delta = (
+            math.degrees(math.asin(sin_angle / cos_lat))
+            if sin_angle < cos_lat
+            else 180.0
+        )
+        return cls(
+            min_lat=max(lat - lat_delta, -90.0),
+            min_lon=max(lon - lon_delta, -180.0),
+            max_lat=min(lat + lat_delta, 90.0),
+            max_lon=min(lon + lon_delta, 180.0),
+        )
+
+    @property
+    def center(self) -> tuple[float, float]:
+        """(위도, 경도)"""
+        return (self.min_lat + self.max_lat) / 2, (self.min_lon + self.max_lon) / 2
+
+
+def encode_geohash(lat: float, lon: float, precision: int = GEOHASH_PRECISION) -> str:
+    """위경도 → geohash (경도/위도 비트를 번갈아 5비트씩 base32)"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars: list[str] = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        value, value_range = (lon, lon_range) if even else (lat, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            value_range[0] = mid
+        else:
+            bits <<= 1
+            value_range[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def _cell_size(precision: int) -> tuple[float, float]:
+    """precision 자리 셀의 (위도 폭, 경도 폭)"""
+    total_bits = precision * 5
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def _cell_index(value: float, offset: float, step: float, count: int) -> int:
+    return min(int((value + offset) // step), count - 1)
+
+
+def covering_prefixes(box: BoundingBox, max_cells: int = MAX_COVER_CELLS) -> list[str]:
+    """box를 덮는 geohash 접두사 목록 (셀이 너무 많아지면 빈 목록 → 접두사 조건 생략)"""
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_step, lon_step = _cell_size(precision)
+        lat_cells = round(180.0 / lat_step)
+        lon_cells = round(360.0 / lon_step)
+        rows = range(
+            _cell_index(box.min_lat, 90.0, lat_step, lat_cells),
+            _cell_index(box.max_lat, 90.0, lat_step, lat_cells) + 1,
+        )
+        cols = range(
+            _cell_index(box.min_lon, 180.0, lon_step, lon_cells),
+            _cell_index(box.max_lon, 180.0, lon_step, lon_cells) + 1,
+        )
+        if len(rows) * len(cols) > max_cells:
+            continue
+        # 각 셀의 중심점을 인코딩하면 그 셀의 geohash
+        return [
+            encode_geohash(
+                (row + 0.5) * lat_step - 90.0,
+                (col + 0.5) * lon_step - 180.0,
+                precision,
+            )
+            for row in rows
+            for col in cols
+        ]
+    return []
+
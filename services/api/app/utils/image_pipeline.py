@@ -0,0 +1,109 @@
+"""이미지 처리 파이프라인
+
+디코딩/리사이즈/인코딩은 CPU 작업이라 이벤트 루프에서 실행하면 다른 요청이 멈춥니다.
+- 디코딩/인코딩: 프로세스 풀에서 실행 (GIL 회피, 워커 수 = settings.image.process_workers)
+- 렌디션: 한 번 디코딩해서 설정된 모든 렌디션(thumbnail/feed/full)을 JPEG + WebP로 생성
+- 저장: 인코딩 결과(bytes)를 저장소 백엔드(app.core.storage)에 기록
+
+사용법:
+    rendered = await render_image(image_path)
+    await get_storage().put_bytes(key, rendered.files["thumbnail"]["jpeg"])
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.core.config import settings
+from app.core.metrics import IMAGE_PROCESS_FAILURES, IMAGE_PROCESS_SECONDS
+from app.utils.image_worker import (
+    RenderedImage,
+    RenditionSpec,
+    render_renditions,
+)
+
+logger = logging.getLogger(__name__)
+
+_executor: ProcessPoolExecutor | None = None
+
+
+# MARK: - Process Pool
+def get_image_executor() -> ProcessPoolExecutor:
+    """이미지 처리용 프로세스 풀 반환 (첫 사용 시 생성)
+
+    워커는 spawn으로 띄웁니다. fork는 로깅 큐 스레드/DB 풀 등
+    부모 프로세스 상태를 그대로 복사해 교착이 생길 수 있습니다.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.image.process_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info(
+            f"이미지 처리 프로세스 풀 생성: workers={settings.image.process_workers}"
+        )
+    return _executor
+
+
+def shutdown_image_executor() -> None:
+    """이미지 처리 프로세스 풀 종료"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def rendition_specs(names: list[str] | None = None) -> list[RenditionSpec]:
+    """설정된 렌디션 규격 (names가 주어지면 해당 렌디션만)"""
+    renditions = settings.image.renditions
+    selected = names if names is not None else list(renditions)
+    return [
+        RenditionSpec(
+            name=name,
+            max_width=renditions[name].max_width,
+            max_height=renditions[name].max_height,
+            quality=renditions[name].quality,
+        )
+        for name in selected
+    ]
+
+
+# MARK: - Render
+async def render_image(
+    source: bytes | str, renditions: list[str] | None = None
+) -> RenderedImage:
+    """프로세스 풀에서 이미지를 디코딩하고 렌디션을 인코딩
+
+    source는 이미지 바이트 또는 파일 경로입니다.
+    이미지가 아니거나 손상된 경우 ValueError를 발생시킵니다.
+    """
+    global _executor
+    executor = get_image_executor()
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    try:
+        return await loop.run_in_executor(
+            executor,
+            render_renditions,
+            source,
+            rendition_specs(renditions),
+            settings.image.formats,
+        )
+    except BrokenProcessPool:
+        # 워커가 비정상 종료(OOM 등)되면 풀을 버리고 다음 요청에서 새로 생성
+        IMAGE_PROCESS_FAILURES.labels(reason="pool_broken").inc()
+        logger.error("이미지 처리 프로세스 풀이 손상되어 재생성합니다")
+        if _executor is executor:
+            _executor = None
+        executor.shutdown(wait=False)
+        raise
+    except (OSError, ValueError, SyntaxError) as e:
+        # PIL은 손상된 이미지에 OSError/SyntaxError(UnidentifiedImageError 포함)를 발생
+        IMAGE_PROCESS_FAILURES.labels(reason="invalid").inc()
+        raise ValueError(f"이미지 파일을 읽을 수 없습니다: {e}") from e
+    finally:
+        IMAGE_PROCESS_SECONDS.observe(time.perf_counter() - started)
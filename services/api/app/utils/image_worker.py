@@ -0,0 +1,85 @@
+"""이미지 디코딩/인코딩 작업 (프로세스 풀 워커에서 실행)
+
+이 모듈은 워커 프로세스에서 import 되므로 PIL 외의 무거운 의존성(settings, DB 등)을
+가져오지 않습니다. 함께 실행되는 app/__init__.py와 app/utils/__init__.py도 가볍게 유지해야 하며
+(app.utils는 하위 모듈을 re-export하지 않음), 인자와 반환값은 모두 pickle 가능한 값이어야 합니다.
+"""
+
+import io
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from PIL import Image, ImageOps
+
+# 포맷별 파일 확장자
+FORMAT_EXTENSIONS = {"jpeg": "jpg", "webp": "webp"}
+
+
+class RenditionSpec(NamedTuple):
+    """렌디션 규격 (긴 변 기준으로 비율을 유지하며 축소, 확대는 하지 않음)"""
+
+    name: str
+    max_width: int
+    max_height: int
+    quality: int
+
+
+@dataclass
+class RenderedImage:
+    """렌더링 결과 (회전 반영 후 디코딩 크기 + 렌디션별/포맷별 인코딩된 바이트)"""
+
+    width: int
+    height: int
+    files: dict[str, dict[str, bytes]] = field(default_factory=dict)
+    sizes: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+
+def render_renditions(
+    source: bytes | str, specs: list[RenditionSpec], formats: list[str]
+) -> RenderedImage:
+    """한 번 디코딩해서 모든 렌디션을 모든 포맷으로 인코딩
+
+    source는 이미지 바이트 또는 파일 경로입니다.
+    큰 렌디션부터 만들고, 그 결과를 다음(더 작은) 렌디션의 입력으로 재사용합니다.
+    """
+    if not specs:
+        raise ValueError("렌디션이 지정되지 않았습니다")
+    unknown = [fmt for fmt in formats if fmt not in FORMAT_EXTENSIONS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 이미지 포맷: {unknown}")
+
+    ordered = sorted(
+        specs, key=lambda spec: spec.max_width * spec.max_height, reverse=True
+    )
+    largest = max(ordered[0].max_width, ordered[0].max_height)
+
+    stream = io.BytesIO(source) if isinstance(source, bytes) else source
+    with Image.open(stream) as opened:
+        # JPEG는 필요한 크기까지만 축소 디코딩 (회전 전이므로 정사각형 기준으로 요청)
+        opened.draft("RGB", (largest, largest))
+        # EXIF 회전 정보 반영
+        img = ImageOps.exif_transpose(opened)
+        # JPEG/WebP 공통으로 저장할 수 있는 모드로 변환
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+
+    result = RenderedImage(width=img.width, height=img.height)
+    current = img
+    for spec in ordered:
+        resized = current.copy()
+        resized.thumbnail((spec.max_width, spec.max_height), Image.Resampling.LANCZOS)
+        result.files[spec.name] = {
+            fmt: _encode(resized, fmt, spec.quality) for fmt in formats
+        }
+        result.sizes[spec.name] = resized.size
+        current = resized
+    return result
+
+
+def _encode(img: Image.Image, fmt: str, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    if fmt == "jpeg":
+        img.save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    else:
+        img.save(buffer, "WEBP", quality=quality, method=4)
+    return buffer.getvalue()
@@ -0,0 +1,64 @@
+"""업로드 파일 서빙 (StaticFiles 확장)
+
+운영 환경은 nginx가 UPLOADS_DIR을 직접 서빙하고(settings.upload.serve_mode = "nginx"),
+앱이 서빙하는 경우(로컬 개발 등)에도 nginx 설정과 같은 캐시 정책을 적용합니다.
+- 내용 주소 파일(cas/): 파일명이 내용 해시라 바뀌지 않으므로 파일명 기반 강한 ETag +
+  1년 immutable (중복 업로드 시 수정 시각이 갱신되어도 ETag는 그대로)
+- 그 외 파일: 짧은 max-age + 수정 시각 기반 ETag로 재검증
+- 조건부 GET(If-None-Match/If-Modified-Since → 304)과 Range(206)는 Starlette가 처리
+- 업로드 임시 파일(.tmp/)과 등록 전 직접 업로드(incoming/)는 노출하지 않음
+"""
+
+import os
+from pathlib import Path
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+
+from app.core.config import settings
+from app.utils.content_store import CONTENT_DIR, INCOMING_DIR
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+PRIVATE_DIRS = {".tmp", INCOMING_DIR}
+
+
+def mutable_cache_control() -> str:
+    """내용 주소가 아닌 파일의 Cache-Control"""
+    return f"public, max-age={settings.upload.mutable_max_age}"
+
+
+class UploadStaticFiles(StaticFiles):
+    """캐시 헤더를 붙여 업로드 파일을 서빙하는 StaticFiles"""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if path.split("/", 1)[0] in PRIVATE_DIRS:
+            raise HTTPException(status_code=404)
+        return await super().get_response(path, scope)
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        path = Path(full_path)
+        # cas/{해시 앞 2자리}/{파일명}
+        if path.parent.parent.name == CONTENT_DIR:
+            headers = {
+                "etag": f'"{path.name}"',
+                "cache-control": IMMUTABLE_CACHE_CONTROL,
+            }
+        else:
+            headers = {"cache-control": mutable_cache_control()}
+
+        response = FileResponse(
+            full_path, status_code=status_code, headers=headers, stat_result=stat_result
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -13,7 +13,7 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from app.api.v1.router import api_router  # noqa: E402
 from app.core.config import settings  # noqa: E402
-from app.core.database import init_db  # noqa: E402
+from app.core.database import dispose_engines, init_db  # noqa: E402
 from app.core.exceptions import (  # noqa: E402
     register_exception_handlers,
     BusinessException,
@@ -23,14 +23,22 @@ from app.core.exceptions import (  # noqa: E402
     validation_exception_handler,
     value_error_handler,
 )
+from app.core.http_client import close_http_client  # noqa: E402
 from app.core.logger import setup_logging  # noqa: E402
 from app.core.startup import startup_events, sync_startup_events  # noqa: E402
+from app.core.storage import close_storage  # noqa: E402
+from app.core.storage.local import url_prefix  # noqa: E402
+from app.deps.redis import close_redis  # noqa: E402
+from app.utils.image_pipeline import shutdown_image_executor  # noqa: E402
+from app.utils.static_files import UploadStaticFiles  # noqa: E402
 from app.middleware.logging_middleware import LoggingMiddleware  # noqa: E402
+from app.middleware.upload_size_middleware import (  # noqa: E402
+    UploadSizeLimitMiddleware,
+)
 from fastapi import FastAPI, HTTPException  # noqa: E402
 from fastapi.exceptions import RequestValidationError  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
 from fastapi.security import HTTPBearer  # noqa: E402
-from fastapi.staticfiles import StaticFiles  # noqa: E402
 from prometheus_fastapi_instrumentator import Instrumentator  # noqa: E402
 from starlette.exceptions import HTTPException as StarletteHTTPException  # noqa: E402
 
@@ -60,6 +68,11 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    await close_http_client()
+    await close_storage()
+    await dispose_engines()
+    await close_redis()
+    shutdown_image_executor()
     logger.info("Application shutdown")
 
 
@@ -101,6 +114,9 @@ app.add_middleware(
     ],
 )
 
+# 업로드 요청 크기 제한 (multipart 파싱 전에 거절)
+app.add_middleware(UploadSizeLimitMiddleware)
+
 # 로깅 미들웨어 추가
 app.add_middleware(LoggingMiddleware)
 
@@ -130,10 +146,13 @@ register_exception_handlers(app)
 # 정적 파일 서빙 설정
 # 환경별 uploads 디렉토리 사용 (config.py에서 설정됨)
 UPLOADS_DIR = settings.UPLOADS_DIR
-BASE_DIR = Path(__file__).resolve().parent
 
-app.mount("/uploads", StaticFiles(directory=UPLOADS_DIR), name="uploads")
-app.mount("/static", StaticFiles(directory=str(BASE_DIR)), name="static")
+# S3 저장소는 버킷/CDN이, serve_mode가 nginx면 nginx가 직접 서빙하므로
+# 로컬 저장소 + app 모드일 때만 마운트 (캐시 헤더는 nginx 설정과 동일)
+if settings.storage.backend == "local" and settings.upload.serve_mode == "app":
+    app.mount(
+        url_prefix(), UploadStaticFiles(directory=UPLOADS_DIR), name="uploads"
+    )
 
 # API 라우터 포함
 app.include_router(api_router, prefix="/api/v1")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+기존 데이터베이스에 스키마 보정 적용
+
+애플리케이션 시작 시 init_db가 같은 작업을 수행하지만, 배포 전에 미리 적용하거나
+큰 테이블의 ALTER/backfill을 서비스 시작과 분리하고 싶을 때 사용합니다.
+등록된 단계는 app/core/schema_migrations.py의 SCHEMA_STEPS를 참고하세요.
+
+사용법:
+    CONFIG_FILE=deploy/config/config.local.yaml \\
+        python scripts/apply_schema_migrations.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import app.models  # noqa: E402, F401 (create_all을 위해 모든 모델 등록)
+from app.core.database import Base, dispose_engines, engine  # noqa: E402
+from app.core.schema_migrations import apply_schema_migrations  # noqa: E402
+
+
+async def main() -> None:
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            applied = await apply_schema_migrations(conn)
+    finally:
+        await dispose_engines()
+
+    if not applied:
+        print("적용할 단계가 없습니다 (최신 상태)")
+        return
+    print(f"{len(applied)}개 단계 적용")
+    for name in applied:
+        print(f"  {name}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
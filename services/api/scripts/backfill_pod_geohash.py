@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+파티 좌표 geohash 컬럼 추가 및 기존 행 채우기
+
+pod_details.geohash 컬럼과 인덱스가 없으면 추가하고(app/core/schema_migrations.py),
+좌표는 있지만 geohash가 비어 있는 파티를 모두 채웁니다.
+애플리케이션 시작 시 init_db도 컬럼을 새로 추가할 때 같은 backfill을 수행하지만,
+큰 테이블에서는 배포 전에 이 스크립트로 미리 적용하는 것을 권장합니다.
+여러 번 실행해도 안전합니다 (비어 있는 행만 채움).
+
+사용법:
+    CONFIG_FILE=deploy/config/config.local.yaml \\
+        python scripts/backfill_pod_geohash.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import app.models  # noqa: E402, F401 (create_all을 위해 모든 모델 등록)
+from app.core.database import Base, dispose_engines, engine  # noqa: E402
+from app.core.schema_migrations import (  # noqa: E402
+    apply_schema_migrations,
+    backfill_pod_geohash,
+)
+
+
+async def main() -> None:
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            applied = await apply_schema_migrations(conn)
+            # 컬럼이 이미 있던 경우에도 비어 있는 행 채우기
+            filled = await backfill_pod_geohash(conn)
+    finally:
+        await dispose_engines()
+
+    if "pod_details.geohash" in applied:
+        print("pod_details.geohash 컬럼 및 인덱스 추가")
+    print(f"비어 있던 geohash {filled}건 추가로 채움")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
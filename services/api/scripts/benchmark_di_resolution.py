@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+요청당 의존성 주입(DI) 비용 마이크로벤치마크
+
+비교 대상:
+1. 이전 방식: 동기 provider (FastAPI 스레드풀 경유) + 전역 컨테이너 override/reset
+   + 레포지토리를 주입할 때마다 새로 생성
+2. 현재 방식: async provider (이벤트 루프에서 직접 호출) + RequestScope(ContextVar)
+   + 그래프 안에서 레포지토리 공유
+
+DB/Redis에는 접속하지 않습니다 (세션/클라이언트 객체만 생성).
+서버와 같은 환경변수(CONFIG_FILE 등)로 실행해야 설정을 불러올 수 있습니다.
+
+사용법:
+    CONFIG_FILE=deploy/config/config.local.yaml \\
+        python scripts/benchmark_di_resolution.py [반복 횟수]
+"""
+
+import asyncio
+import sys
+import time
+import timeit
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from anyio import to_thread  # noqa: E402
+from redis.asyncio import Redis  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from app.core.container import container  # noqa: E402
+from app.core.containers.request_scope import RequestScope  # noqa: E402
+
+# (이름, provider 경로) - 가벼운 조회부터 큰 그래프까지
+TARGETS = {
+    "artists (read)": lambda: container.artist_feature.get_artists_use_case,
+    "pod query": lambda: container.pod_feature.pod_query_use_case,
+    "pod (write)": lambda: container.pod_feature.pod_use_case,
+    "user": lambda: container.user_feature.user_use_case,
+}
+
+
+def resolve_with_override(provider, session, redis):
+    core = container.core
+    with core.session.override(session), core.redis.override(redis):
+        return provider()
+
+
+def resolve_with_scope(provider, session, redis):
+    with RequestScope(session, redis):
+        return provider()
+
+
+def bench_resolve(number: int, session, redis) -> None:
+    print(f"\n[그래프 생성만] 반복 {number:,}회")
+    print(f"{'target':<18}{'override µs':>14}{'scope µs':>12}{'speedup':>10}")
+    for name, get_provider in TARGETS.items():
+        provider = get_provider()
+        before = min(
+            timeit.repeat(
+                lambda: resolve_with_override(provider, session, redis),
+                number=number,
+                repeat=5,
+            )
+        )
+        after = min(
+            timeit.repeat(
+                lambda: resolve_with_scope(provider, session, redis),
+                number=number,
+                repeat=5,
+            )
+        )
+        print(
+            f"{name:<18}{before / number * 1e6:>14.2f}"
+            f"{after / number * 1e6:>12.2f}{before / after:>9.1f}x"
+        )
+
+
+async def bench_request_path(number: int, session, redis) -> None:
+    """FastAPI가 provider를 호출하는 방식까지 포함 (동기 = 스레드풀, async = 직접 await)"""
+    provider = container.pod_feature.pod_query_use_case
+
+    async def async_provider():
+        return resolve_with_scope(provider, session, redis)
+
+    started = time.perf_counter()
+    for _ in range(number):
+        await to_thread.run_sync(resolve_with_override, provider, session, redis)
+    before = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(number):
+        await async_provider()
+    after = time.perf_counter() - started
+
+    print(f"\n[요청 경로 포함: pod query] 반복 {number:,}회")
+    print(f"{'sync + threadpool + override':<32}{before / number * 1e6:>10.2f} µs")
+    print(f"{'async + RequestScope':<32}{after / number * 1e6:>10.2f} µs")
+    print(f"{'speedup':<32}{before / after:>9.1f}x")
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    session = AsyncSession()
+    redis = Redis()
+
+    bench_resolve(number, session, redis)
+    asyncio.run(bench_request_path(number, session, redis))
+
+
+if __name__ == "__main__":
+    main()
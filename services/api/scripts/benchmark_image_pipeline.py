@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+이미지 파이프라인 처리량 벤치마크 (코어당 처리량)
+
+비교 대상:
+1. 이전 방식: 이벤트 루프에서 직접 디코딩 + 썸네일 1장(JPEG)만 생성
+2. 현재 방식: 프로세스 풀에서 한 번 디코딩 + 설정된 모든 렌디션 x 포맷(JPEG/WebP) 생성
+   (워커 수를 1, 2, 4 ... CPU 수까지 늘려가며 측정)
+
+파일은 쓰지 않습니다 (디코딩/인코딩만 측정).
+서버와 같은 환경변수(CONFIG_FILE 등)로 실행해야 렌디션 설정을 불러올 수 있습니다.
+
+사용법:
+    CONFIG_FILE=deploy/config/config.local.yaml \\
+        python scripts/benchmark_image_pipeline.py [이미지 수] [가로x세로]
+"""
+
+import io
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.utils.image_pipeline import rendition_specs  # noqa: E402
+from app.utils.image_worker import RenditionSpec, render_renditions  # noqa: E402
+
+
+def make_sample_jpeg(width: int, height: int) -> bytes:
+    """휴대폰 사진 크기의 샘플 JPEG 생성 (단색보다 압축이 덜 되도록 패턴을 그림)"""
+    img = Image.new("RGB", (width, height))
+    draw = ImageDraw.Draw(img)
+    for y in range(0, height, 16):
+        for x in range(0, width, 16):
+            draw.rectangle(
+                (x, y, x + 15, y + 15),
+                fill=((x * 7) % 256, (y * 5) % 256, ((x + y) * 3) % 256),
+            )
+    buffer = io.BytesIO()
+    img.save(buffer, "JPEG", quality=92)
+    return buffer.getvalue()
+
+
+def legacy_thumbnail(data: bytes) -> bytes:
+    """이전 PodImageService와 같은 처리 (썸네일 JPEG 1장)"""
+    img = Image.open(io.BytesIO(data))
+    img.thumbnail((300, 300), Image.Resampling.LANCZOS)
+    if img.mode in ("RGBA", "P"):
+        img = img.convert("RGB")
+    buffer = io.BytesIO()
+    img.save(buffer, "JPEG", quality=85, optimize=True)
+    return buffer.getvalue()
+
+
+def bench_legacy(sample: bytes, count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        legacy_thumbnail(sample)
+    return time.perf_counter() - started
+
+
+def bench_pool(
+    sample: bytes,
+    count: int,
+    workers: int,
+    specs: list[RenditionSpec],
+    formats: list[str],
+) -> float:
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        # 워커 기동/import 비용은 제외
+        warmup = [
+            executor.submit(render_renditions, sample, specs, formats)
+            for _ in range(workers)
+        ]
+        for future in warmup:
+            future.result()
+        started = time.perf_counter()
+        futures = [
+            executor.submit(render_renditions, sample, specs, formats)
+            for _ in range(count)
+        ]
+        for future in futures:
+            future.result()
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    width, height = (
+        map(int, sys.argv[2].split("x")) if len(sys.argv) > 2 else (4032, 3024)
+    )
+    sample = make_sample_jpeg(width, height)
+    specs = rendition_specs()
+    formats = settings.image.formats
+    cpu_count = os.cpu_count() or 1
+
+    print(
+        f"샘플: {width}x{height} JPEG ({len(sample) / 1024:.0f}KB), "
+        f"이미지 {count}장, CPU {cpu_count}개"
+    )
+    print(f"렌디션: {[spec.name for spec in specs]} x 포맷: {formats}")
+
+    elapsed = bench_legacy(sample, count)
+    print("\n[이전: 썸네일 JPEG 1장, 이벤트 루프에서 실행]")
+    print(f"{'':<12}{count / elapsed:>10.2f} img/s  (루프가 {elapsed:.2f}s 동안 멈춤)")
+
+    print(f"\n[현재: 렌디션 {len(specs) * len(formats)}개, 프로세스 풀]")
+    print(f"{'workers':<12}{'img/s':>10}{'img/s/core':>14}")
+    workers = 1
+    while workers <= cpu_count:
+        elapsed = bench_pool(sample, count, workers, specs, formats)
+        throughput = count / elapsed
+        print(f"{workers:<12}{throughput:>10.2f}{throughput / workers:>14.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+JWT 액세스 토큰 검증 비용 마이크로벤치마크
+
+비교 대상:
+1. python-jose jwt.decode (현재 서버에서 사용하는 백엔드)
+2. PyJWT jwt.decode (설치된 경우)
+3. hmac 직접 검증 (HS256 서명 + exp 확인만 수행하는 최소 구현)
+4. TokenManager.verify_access_token 캐시 적중 경로 (토큰 전체 SHA-256 + LRU 조회)
+
+사용법:
+    python scripts/benchmark_jwt_decode.py [반복 횟수]
+
+블랙리스트 확인은 Redis 상태에 따라 달라지므로 측정에서 제외합니다.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import sys
+import time
+import timeit
+import uuid
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+SECRET_KEY = "benchmark-secret-key"
+ALGORITHM = "HS256"
+
+
+def _b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def make_token() -> str:
+    from jose import jwt
+
+    now = time.time()
+    return jwt.encode(
+        {
+            "sub": "12345",
+            "iat": now,
+            "exp": int(now) + 1800,
+            "jti": str(uuid.uuid4()),
+            "type": "access",
+        },
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+
+def decode_with_hmac(token: str) -> dict:
+    signing_input, _, signature = token.rpartition(".")
+    expected = hmac.new(
+        SECRET_KEY.encode(), signing_input.encode(), hashlib.sha256
+    ).digest()
+    if not hmac.compare_digest(expected, _b64url_decode(signature)):
+        raise ValueError("invalid signature")
+    payload = json.loads(_b64url_decode(signing_input.split(".")[1]))
+    if payload["exp"] <= time.time():
+        raise ValueError("expired")
+    return payload
+
+
+def build_cases(token: str) -> dict:
+    from jose import jwt as jose_jwt
+
+    cases = {
+        "python-jose": lambda: jose_jwt.decode(
+            token, SECRET_KEY, algorithms=[ALGORITHM]
+        ),
+        "hmac (stdlib)": lambda: decode_with_hmac(token),
+    }
+
+    try:
+        import jwt as pyjwt
+
+        cases["PyJWT"] = lambda: pyjwt.decode(
+            token, SECRET_KEY, algorithms=[ALGORITHM]
+        )
+    except ImportError:
+        print("PyJWT 미설치 - 건너뜀")
+
+    # 캐시 적중 경로: app.core.session의 키/캐시를 그대로 사용
+    # (요청마다 토큰 전체의 SHA-256을 계산한 뒤 LRU 조회 + 만료 확인)
+    from app.core.session import _token_cache_key, _VerifiedToken, _VerifiedTokenCache
+
+    cache = _VerifiedTokenCache()
+    cache.set(
+        _token_cache_key(token),
+        _VerifiedToken(user_id=12345, jti=None, exp=time.time() + 1800),
+    )
+
+    def cached_lookup():
+        verified = cache.get(_token_cache_key(token))
+        if verified is None or verified.exp <= time.time():
+            raise ValueError("cache miss or expired")
+        return verified.user_id
+
+    cases["verified cache hit"] = cached_lookup
+    return cases
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    token = make_token()
+
+    print(f"반복 횟수: {number:,}")
+    print(f"{'backend':<22}{'µs/op':>10}{'ops/s':>14}")
+    for name, func in build_cases(token).items():
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        per_op = best / number
+        print(f"{name:<22}{per_op * 1e6:>10.2f}{1 / per_op:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
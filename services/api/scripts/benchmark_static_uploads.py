@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+업로드 파일 서빙 부하 측정 (전체 GET / 조건부 GET / Range)
+
+같은 파일 URL에 동시 요청을 보내 요청 종류별 처리량과 지연 시간을 측정합니다.
+앱(upload.serve_mode = app)과 nginx 직접 서빙의 URL을 각각 넣어 비교합니다.
+
+요청 종류:
+1. full: 일반 GET (200, 본문 전체)
+2. conditional: 첫 응답의 ETag로 If-None-Match (304, 본문 없음)
+3. range: Range: bytes=0-65535 (206, 앞부분만)
+
+사용법:
+    python scripts/benchmark_static_uploads.py <파일 URL> [요청 수] [동시 요청 수]
+
+예시:
+    # 앱이 서빙 (uvicorn main:app)
+    python scripts/benchmark_static_uploads.py \\
+        http://localhost:8000/uploads/cas/ab/ab12....thumbnail_300x300_q85.jpg
+    # nginx가 서빙
+    python scripts/benchmark_static_uploads.py \\
+        https://dev.sp-podpod.com/uploads/cas/ab/ab12....thumbnail_300x300_q85.jpg
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+
+RANGE_HEADER = "bytes=0-65535"
+
+
+async def run(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict[str, str],
+    expected_status: int,
+    total: int,
+    concurrency: int,
+) -> tuple[float, list[float], int]:
+    """요청 total개를 concurrency개씩 동시에 보내고 (소요 시간, 지연 목록, 실패 수) 반환"""
+    latencies: list[float] = []
+    failures = 0
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining, failures
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get(url, headers=headers)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != expected_status:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, failures
+
+
+def report(name: str, elapsed: float, latencies: list[float], failures: int) -> None:
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{name:<12} {len(latencies) / elapsed:>9.1f} req/s  "
+        f"평균 {statistics.mean(latencies) * 1000:>7.2f}ms  "
+        f"p95 {p95 * 1000:>7.2f}ms  실패 {failures}"
+    )
+
+
+async def main() -> None:
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    url = sys.argv[1]
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        first = await client.get(url)
+        first.raise_for_status()
+        etag = first.headers.get("etag")
+        print(f"URL: {url}")
+        print(f"크기: {len(first.content)} bytes")
+        print(f"ETag: {etag}")
+        print(f"Cache-Control: {first.headers.get('cache-control')}")
+        print(f"Accept-Ranges: {first.headers.get('accept-ranges')}")
+        print(f"요청 {total}개, 동시 {concurrency}개")
+        print("-" * 72)
+
+        cases = [("full", {}, 200), ("range", {"Range": RANGE_HEADER}, 206)]
+        if etag:
+            cases.insert(1, ("conditional", {"If-None-Match": etag}, 304))
+        else:
+            print("ETag가 없어 조건부 GET은 건너뜁니다")
+
+        for name, headers, expected_status in cases:
+            elapsed, latencies, failures = await run(
+                client, url, headers, expected_status, total, concurrency
+            )
+            report(name, elapsed, latencies, failures)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+업로드 파일 nginx location 설정 생성
+
+settings(UPLOADS_DIR, 업로드 URL 경로, 캐시 시간)로 deploy/nginx/conf.d/uploads-{profile}.conf를
+생성합니다. 서버 설정(deploy/nginx/podpod-conf/*.conf)에서 include하면 nginx가
+UPLOADS_DIR을 sendfile로 직접 서빙하므로 이미지 요청이 Python 워커를 점유하지 않습니다.
+(조건부 GET/Range는 nginx 정적 파일 처리가 기본 지원)
+
+캐시 정책은 앱이 서빙할 때(app.utils.static_files)와 같습니다.
+- {prefix}/cas/: 파일명이 내용 해시라 바뀌지 않으므로 1년 + immutable
+- 그 외: settings.upload.mutable_max_age
+- {prefix}/.tmp/, {prefix}/incoming/: 업로드 임시 파일/등록 전 직접 업로드라 404
+
+설정을 바꾼 뒤에는 설정 파일에서 upload.serve_mode를 nginx로 두고 nginx를 reload합니다.
+
+사용법:
+    PROFILE=production CONFIG_FILE=deploy/config/config.prod.yaml \\
+        python scripts/generate_nginx_uploads_conf.py [출력 디렉토리]
+"""
+
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+REPO_ROOT = PROJECT_ROOT.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+DEFAULT_OUTPUT_DIR = REPO_ROOT / "deploy" / "nginx" / "conf.d"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def render_conf(
+    profile: str, prefix: str, uploads_dir: str, mutable_max_age: int
+) -> str:
+    """업로드 location 설정 생성 (prefix 예: /uploads, /stg/uploads)"""
+    prefix = prefix.rstrip("/")
+    uploads_dir = uploads_dir.rstrip("/")
+    return f"""\
+# 자동 생성 파일 - 직접 수정하지 말고 scripts/generate_nginx_uploads_conf.py로 다시 생성하세요
+# {profile} 업로드 ({uploads_dir})
+
+# 업로드 임시 파일/등록 전 직접 업로드는 노출하지 않음
+location ^~ {prefix}/.tmp/ {{
+    return 404;
+}}
+
+location ^~ {prefix}/incoming/ {{
+    return 404;
+}}
+
+# 내용 주소 파일: 파일명이 내용 해시라 바뀌지 않음 (1년 + immutable)
+location ^~ {prefix}/cas/ {{
+    alias {uploads_dir}/cas/;
+    autoindex off;
+
+    sendfile on;
+    tcp_nopush on;
+    etag on;
+    add_header Cache-Control "{IMMUTABLE_CACHE_CONTROL}";
+
+    # 피드 썸네일처럼 같은 파일을 반복 요청하므로 파일 디스크립터/stat 결과를 캐시
+    open_file_cache max=10000 inactive=5m;
+    open_file_cache_valid 10m;
+    open_file_cache_min_uses 2;
+
+    access_log off;
+}}
+
+# 그 외 업로드 파일 (랜덤 프로필 이미지, 이전 방식의 uuid 파일명 등)
+location ^~ {prefix}/ {{
+    alias {uploads_dir}/;
+    autoindex off;
+
+    sendfile on;
+    tcp_nopush on;
+    etag on;
+    add_header Cache-Control "public, max-age={mutable_max_age}";
+}}
+"""
+
+
+def main() -> None:
+    from app.core.config import settings
+    from app.core.storage.local import url_prefix
+
+    output_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR
+    output_path = output_dir / f"uploads-{settings.ENVIRONMENT}.conf"
+    output_path.write_text(
+        render_conf(
+            settings.ENVIRONMENT,
+            url_prefix(),
+            settings.UPLOADS_DIR,
+            settings.upload.mutable_max_age,
+        )
+    )
+    print(f"생성 완료: {output_path}")
+    print(f"서버 설정에 추가: include conf.d/{output_path.name};")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+파티 지역 태그 및 인기 지역 카운터 재계산
+
+pod_details.location_id/sub_location 컬럼과 location_popularity 테이블을 추가한 뒤
+기존 파티를 한 번 태깅할 때 사용합니다 (이후에는 일일 작업이 같은 보정을 수행).
+컬럼/테이블은 init_db가 먼저 추가합니다 (app/core/schema_migrations.py).
+
+사용법:
+    CONFIG_FILE=deploy/config/config.local.yaml \\
+        python scripts/rebuild_location_popularity.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import app.models  # noqa: E402, F401 (관계 설정을 위해 모든 모델 등록)
+from app.core.database import dispose_engines, init_db  # noqa: E402
+from app.features.locations.tasks import (  # noqa: E402
+    REBUILD_LOCK_WAIT,
+    rebuild_location_popularity,
+)
+
+
+async def main() -> None:
+    # location_popularity 테이블 생성 및 pod_details 컬럼 추가 (이미 있으면 무시)
+    await init_db()
+    try:
+        # 실행 중인 일일 작업이 있으면 끝날 때까지 기다림
+        counts = await rebuild_location_popularity(lock_timeout=REBUILD_LOCK_WAIT)
+    finally:
+        await dispose_engines()
+
+    if counts is None:
+        print("다른 워커가 재계산 중이어서 락을 얻지 못했습니다")
+        return
+
+    print(f"지역 {len(counts)}곳, 활성 파티 {sum(counts.values())}건 집계")
+    for location_id, count in sorted(counts.items(), key=lambda item: -item[1]):
+        print(f"  location_id={location_id}: {count}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
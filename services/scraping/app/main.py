@@ -13,6 +13,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.database import init_db
+from shared.utils.cache_version import get_redis_url
 
 from app.routers import artist_router
 
@@ -47,6 +48,8 @@ app.include_router(artist_router.router, prefix="/api/v1")
 async def startup_event():
     """앱 시작 시 실행"""
     logger.info("🚀 Scraping Service Starting...")
+    # 동기화 후 API 서버 캐시 버전을 올릴 Redis가 없으면 무효화가 전달되지 않으므로 시작하지 않음
+    get_redis_url()
     await init_db()
     logger.info("✅ Database initialized")
 
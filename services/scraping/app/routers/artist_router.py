@@ -2,6 +2,7 @@ import json
 import os
 import sys
 from pathlib import Path as PathLib
+from typing import Optional
 
 # 프로젝트 루트를 Python path에 추가 (메인 API의 app 모듈 접근용)
 project_root = PathLib(__file__).parent.parent.parent.parent.parent
@@ -20,7 +21,6 @@ from fastapi import (
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
-from app.repositories.artist_repository import ArtistRepository
 from app.services.artist_service import ArtistService
 from shared.utils.file_upload import upload_artist_image
 
@@ -42,7 +42,7 @@ async def create_artist_image(
 ):
     """아티스트에 새로운 이미지를 생성합니다."""
     try:
-        artist_crud = ArtistRepository(db)
+        service = ArtistService(db)
         image_data = {}
 
         # 이미지 파일이 제공된 경우
@@ -77,7 +77,7 @@ async def create_artist_image(
                 detail="생성할 데이터가 없습니다.",
             )
 
-        success, message, created_image = await artist_crud.create_artist_image(
+        success, message, created_image = await service.create_artist_image(
             artist_id, image_data
         )
 
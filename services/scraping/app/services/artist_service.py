@@ -1,8 +1,14 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.artist_repository import ArtistRepository
+from shared.models import ArtistImage
+from shared.utils.cache_version import (
+    ARTIST_CATALOG_VERSION_KEY,
+    ARTIST_SCHEDULE_VERSION_KEY,
+    bump_cache_version,
+)
 from ..repositories.artist_schedule_repository import ArtistScheduleRepository
 
 
@@ -14,11 +20,29 @@ class ArtistService:
     # - MARK: (내부용) BLIP+MVP 병합 동기화
     async def sync_blip_and_mvp(self) -> dict:
         """BLIP 전체 데이터와 MVP 이름 목록을 병합하여 DB에 동기화"""
-        return await self.artist_crud.sync_from_blip_and_mvp()
+        result = await self.artist_crud.sync_from_blip_and_mvp()
+        # 커밋 이후 API 서버의 아티스트 카탈로그 캐시 재적재
+        await bump_cache_version(ARTIST_CATALOG_VERSION_KEY)
+        return result
+
+    # - MARK: 아티스트 이미지 생성
+    async def create_artist_image(
+        self, artist_id: int, image_data: Dict[str, Any]
+    ) -> Tuple[bool, str, Optional[ArtistImage]]:
+        """아티스트 이미지 생성 (성공 시 커밋 이후 카탈로그 캐시 재적재)"""
+        success, message, created_image = await self.artist_crud.create_artist_image(
+            artist_id, image_data
+        )
+        if success:
+            await bump_cache_version(ARTIST_CATALOG_VERSION_KEY)
+        return success, message, created_image
 
     # - MARK: (내부용) JSON에서 스케줄 가져오기
     async def import_schedules_from_json(
         self, schedule_data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """JSON 데이터에서 스케줄 가져오기"""
-        return await self.schedule_crud.import_schedules_from_json(schedule_data)
+        result = await self.schedule_crud.import_schedules_from_json(schedule_data)
+        # API 서버의 월별 스케줄 캐시 무효화
+        await bump_cache_version(ARTIST_SCHEDULE_VERSION_KEY)
+        return result
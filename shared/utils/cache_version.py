@@ -0,0 +1,47 @@
+"""API 서버 캐시 버전 키
+
+스크래핑 서비스가 DB를 갱신한 뒤 버전을 올리면 API 서버가 해당 캐시를 다시 적재합니다.
+스크래핑 서비스는 REDIS_URL 환경 변수로 API 서버와 같은 Redis(같은 db 번호)에 연결해야 합니다.
+API 서버가 읽지 않는 db로 조용히 올리지 않도록 기본값은 두지 않습니다 (local/dev: 3, stg/prod: 2).
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# 아티스트 카탈로그 (유닛/아티스트/이름/이미지)
+ARTIST_CATALOG_VERSION_KEY = "artist:catalog:version"
+# 아티스트 스케줄 월별 캘린더
+ARTIST_SCHEDULE_VERSION_KEY = "artist:schedule:version"
+
+
+def get_redis_url() -> str:
+    """캐시 버전을 올릴 Redis URL (REDIS_URL이 없으면 RuntimeError)"""
+    url = os.getenv("REDIS_URL")
+    if not url:
+        raise RuntimeError(
+            "REDIS_URL 환경 변수가 설정되지 않았습니다 "
+            "(API 서버와 같은 Redis/db 번호, 예: redis://localhost:6379/3)"
+        )
+    return url
+
+
+async def bump_cache_version(key: str) -> int | None:
+    """캐시 버전 증가 (REDIS_URL 미설정/Redis 오류는 로깅만 하고 None 반환)"""
+    from redis.asyncio import Redis
+
+    try:
+        url = get_redis_url()
+    except RuntimeError as e:
+        logger.error(f"캐시 버전 갱신 건너뜀: key={key}, error={e}")
+        return None
+
+    redis = Redis.from_url(url)
+    try:
+        return await redis.incr(key)
+    except Exception as e:
+        logger.error(f"캐시 버전 갱신 실패: key={key}, error={e}")
+        return None
+    finally:
+        await redis.aclose()